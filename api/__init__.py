@@ -4,5 +4,9 @@ API client layer for Discord Bot v2.0
 HTTP client for communicating with the database API.
 """
 from .client import APIClient, get_api_client, get_global_client, cleanup_global_client
+from .policy import RequestPolicy, RetryPolicy, CircuitBreaker, CircuitState
 
-__all__ = ['APIClient', 'get_api_client', 'get_global_client', 'cleanup_global_client']
\ No newline at end of file
+__all__ = [
+    'APIClient', 'get_api_client', 'get_global_client', 'cleanup_global_client',
+    'RequestPolicy', 'RetryPolicy', 'CircuitBreaker', 'CircuitState'
+]
\ No newline at end of file
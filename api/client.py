@@ -4,14 +4,17 @@ API client for Discord Bot v2.0
 Modern aiohttp-based HTTP client for communicating with the database API.
 Provides connection pooling, proper error handling, and session management.
 """
+import asyncio
+import copy
 import aiohttp
 import logging
 from typing import Optional, List, Dict, Any, Union
 from urllib.parse import urljoin, quote
 from contextlib import asynccontextmanager
 
+from api.policy import RequestPolicy
 from config import get_config
-from exceptions import APIException
+from exceptions import APIException, APIUnavailableException
 
 logger = logging.getLogger(f'{__name__}.APIClient')
 
@@ -26,15 +29,25 @@ class APIClient:
     - Standardized v3 API usage
     - Comprehensive error handling
     - Debug logging with response truncation
+    - Single-flight coalescing of identical concurrent GET requests
+    - Retry with jittered backoff and per-endpoint circuit breakers (see api.policy)
     """
     
-    def __init__(self, base_url: Optional[str] = None, api_token: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_token: Optional[str] = None,
+        coalesce_gets: bool = True,
+        policy: Optional[RequestPolicy] = None
+    ):
         """
         Initialize API client with configuration.
         
         Args:
             base_url: Override default database URL from config
             api_token: Override default API token from config
+            coalesce_gets: Share one in-flight request between identical concurrent GETs
+            policy: Retry/circuit breaker policy (built from config max_retries by default)
             
         Raises:
             ValueError: If required configuration is missing
@@ -43,6 +56,16 @@ class APIClient:
         self.base_url = base_url or config.db_url
         self.api_token = api_token or config.api_token
         self._session: Optional[aiohttp.ClientSession] = None
+        self.connect_timeout = config.default_timeout
+        self.policy = policy or RequestPolicy.from_config(config)
+        
+        # Single-flight GET coalescing: URL -> in-flight request task, and the
+        # futures of the callers waiting on it (each resolved with its own copy)
+        self.coalesce_gets = coalesce_gets
+        self._inflight_gets: Dict[str, asyncio.Task] = {}
+        self._inflight_waiters: Dict[str, List[asyncio.Future]] = {}
+        self.issued_requests = 0
+        self.coalesced_requests = 0
         
         if not self.base_url:
             raise ValueError("DB_URL must be configured")
@@ -112,7 +135,7 @@ class APIClient:
                 use_dns_cache=True
             )
             
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
+            timeout = aiohttp.ClientTimeout(total=30, connect=self.connect_timeout)
             
             self._session = aiohttp.ClientSession(
                 headers=self.headers,
@@ -149,6 +172,123 @@ class APIClient:
         url = self._build_url(endpoint, api_version, object_id)
         url = self._add_params(url, params)
         
+        if not self.coalesce_gets:
+            self.issued_requests += 1
+            return await self._get_with_policy(url, endpoint, object_id, params, timeout)
+        
+        task = self._inflight_gets.get(url)
+        if task is not None:
+            # Identical request already in flight - wait on its result instead
+            self.coalesced_requests += 1
+            logger.debug(f"Coalesced GET: {endpoint} id: {object_id} params: {params}")
+            waiter = asyncio.get_running_loop().create_future()
+            self._inflight_waiters[url].append(waiter)
+            return await waiter
+        
+        self.issued_requests += 1
+        task = asyncio.ensure_future(self._get_with_policy(url, endpoint, object_id, params, timeout))
+        self._inflight_gets[url] = task
+        self._inflight_waiters[url] = []
+        # Registered before any caller awaits the task, so it runs before any of them resume
+        task.add_done_callback(lambda t: self._release_inflight_get(url, t))
+        
+        # Shield so a cancelled caller doesn't cancel the request other callers share
+        return await asyncio.shield(task)
+    
+    def _release_inflight_get(self, url: str, task: asyncio.Task) -> None:
+        """
+        Remove a finished GET from the in-flight table and resolve its followers.
+
+        Each follower gets its own copy of the response, taken before the
+        leader (which keeps the original) can resume and mutate it.
+        """
+        waiters = []
+        if self._inflight_gets.get(url) is task:
+            del self._inflight_gets[url]
+            waiters = self._inflight_waiters.pop(url, [])
+        
+        for waiter in waiters:
+            if waiter.done():
+                continue  # Follower was cancelled
+            if task.cancelled():
+                waiter.cancel()
+            elif task.exception() is not None:
+                waiter.set_exception(task.exception())
+            else:
+                waiter.set_result(copy.deepcopy(task.result()))
+        
+        # Mark exception as retrieved in case every waiting caller was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _get_with_policy(
+        self,
+        url: str,
+        endpoint: str,
+        object_id: Optional[Union[int, str]] = None,
+        params: Optional[List[tuple]] = None,
+        timeout: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Run a GET through the retry/circuit breaker policy."""
+        return await self.policy.execute(
+            'GET', endpoint,
+            lambda: self._execute_get(url, endpoint, object_id, params, timeout)
+        )
+    
+    def get_request_stats(self) -> Dict[str, int]:
+        """
+        Get GET request coalescing counters.
+        
+        Returns:
+            Dictionary with issued, coalesced and in-flight request counts
+        """
+        return {
+            'issued': self.issued_requests,
+            'coalesced': self.coalesced_requests,
+            'in_flight': len(self._inflight_gets),
+            'retries': self.policy.retries
+        }
+    
+    def get_circuit_states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get circuit breaker state per endpoint family.
+        
+        Returns:
+            Dictionary of endpoint family -> breaker status
+        """
+        return self.policy.get_breaker_states()
+    
+    @staticmethod
+    def _status_error(status: int, message: str) -> APIException:
+        """Build the exception for an error status, flagging 5xx as transient."""
+        if status >= 500:
+            return APIUnavailableException(message)
+        return APIException(message)
+    
+    async def _execute_get(
+        self,
+        url: str,
+        endpoint: str,
+        object_id: Optional[Union[int, str]] = None,
+        params: Optional[List[tuple]] = None,
+        timeout: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Perform a single GET round trip against a fully built URL.
+        
+        Args:
+            url: Complete request URL including query parameters
+            endpoint: API endpoint (for logging)
+            object_id: Optional object ID (for logging)
+            params: Query parameters (for logging)
+            timeout: Request timeout override
+            
+        Returns:
+            JSON response data or None for 404
+            
+        Raises:
+            APIException: For HTTP errors or network issues
+        """
         await self._ensure_session()
         
         try:
@@ -169,7 +309,7 @@ class APIClient:
                 elif response.status >= 400:
                     error_text = await response.text()
                     logger.error(f"API error {response.status}: {url} - {error_text}")
-                    raise APIException(f"API request failed with status {response.status}: {error_text}")
+                    raise self._status_error(response.status, f"API request failed with status {response.status}: {error_text}")
                 
                 data = await response.json()
                 
@@ -183,9 +323,17 @@ class APIClient:
                 
                 return data
                 
-        except aiohttp.ClientError as e:
+        except APIException:
+            raise
+        except aiohttp.ClientResponseError as e:
             logger.error(f"HTTP client error for {url}: {e}")
             raise APIException(f"Network error: {e}")
+        except aiohttp.ClientError as e:
+            logger.error(f"HTTP client error for {url}: {e}")
+            raise APIUnavailableException(f"Network error: {e}")
+        except asyncio.TimeoutError as e:
+            logger.error(f"Timeout for GET {url}: {e}")
+            raise APIUnavailableException(f"API call failed: {e}")
         except Exception as e:
             logger.error(f"Unexpected error in GET {url}: {e}")
             raise APIException(f"API call failed: {e}")
@@ -214,6 +362,19 @@ class APIClient:
         """
         url = self._build_url(endpoint, api_version)
         
+        return await self.policy.execute(
+            'POST', endpoint,
+            lambda: self._execute_post(url, endpoint, data, timeout)
+        )
+    
+    async def _execute_post(
+        self,
+        url: str,
+        endpoint: str,
+        data: Dict[str, Any],
+        timeout: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Perform a single POST round trip against a fully built URL."""
         await self._ensure_session()
         
         try:
@@ -231,7 +392,7 @@ class APIClient:
                 elif response.status not in [200, 201]:
                     error_text = await response.text()
                     logger.error(f"POST error {response.status}: {url} - {error_text}")
-                    raise APIException(f"POST request failed with status {response.status}: {error_text}")
+                    raise self._status_error(response.status, f"POST request failed with status {response.status}: {error_text}")
                 
                 result = await response.json()
                 
@@ -245,9 +406,17 @@ class APIClient:
                 
                 return result
                 
-        except aiohttp.ClientError as e:
+        except APIException:
+            raise
+        except aiohttp.ClientResponseError as e:
             logger.error(f"HTTP client error for POST {url}: {e}")
             raise APIException(f"Network error: {e}")
+        except aiohttp.ClientError as e:
+            logger.error(f"HTTP client error for POST {url}: {e}")
+            raise APIUnavailableException(f"Network error: {e}")
+        except asyncio.TimeoutError as e:
+            logger.error(f"Timeout for POST {url}: {e}")
+            raise APIUnavailableException(f"POST failed: {e}")
         except Exception as e:
             logger.error(f"Unexpected error in POST {url}: {e}")
             raise APIException(f"POST failed: {e}")
@@ -278,6 +447,20 @@ class APIClient:
         """
         url = self._build_url(endpoint, api_version, object_id)
         
+        return await self.policy.execute(
+            'PUT', endpoint,
+            lambda: self._execute_put(url, endpoint, data, object_id, timeout)
+        )
+    
+    async def _execute_put(
+        self,
+        url: str,
+        endpoint: str,
+        data: Dict[str, Any],
+        object_id: Optional[Union[int, str]] = None,
+        timeout: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Perform a single PUT round trip against a fully built URL."""
         await self._ensure_session()
         
         try:
@@ -298,15 +481,23 @@ class APIClient:
                 elif response.status not in [200, 201]:
                     error_text = await response.text()
                     logger.error(f"PUT error {response.status}: {url} - {error_text}")
-                    raise APIException(f"PUT request failed with status {response.status}: {error_text}")
+                    raise self._status_error(response.status, f"PUT request failed with status {response.status}: {error_text}")
                 
                 result = await response.json()
                 logger.debug(f"PUT Response: {str(result)[:1200]}{'...' if len(str(result)) > 1200 else ''}")
                 return result
                 
-        except aiohttp.ClientError as e:
+        except APIException:
+            raise
+        except aiohttp.ClientResponseError as e:
             logger.error(f"HTTP client error for PUT {url}: {e}")
             raise APIException(f"Network error: {e}")
+        except aiohttp.ClientError as e:
+            logger.error(f"HTTP client error for PUT {url}: {e}")
+            raise APIUnavailableException(f"Network error: {e}")
+        except asyncio.TimeoutError as e:
+            logger.error(f"Timeout for PUT {url}: {e}")
+            raise APIUnavailableException(f"PUT failed: {e}")
         except Exception as e:
             logger.error(f"Unexpected error in PUT {url}: {e}")
             raise APIException(f"PUT failed: {e}")
@@ -347,6 +538,21 @@ class APIClient:
             params = [(k, '' if v is None else str(v)) for k, v in data.items()]
             url = self._add_params(url, params)
 
+        return await self.policy.execute(
+            'PATCH', endpoint,
+            lambda: self._execute_patch(url, endpoint, data, object_id, timeout, use_query_params)
+        )
+
+    async def _execute_patch(
+        self,
+        url: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        object_id: Optional[Union[int, str]] = None,
+        timeout: Optional[int] = None,
+        use_query_params: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Perform a single PATCH round trip against a fully built URL."""
         await self._ensure_session()
 
         try:
@@ -374,15 +580,23 @@ class APIClient:
                 elif response.status not in [200, 201]:
                     error_text = await response.text()
                     logger.error(f"PATCH error {response.status}: {url} - {error_text}")
-                    raise APIException(f"PATCH request failed with status {response.status}: {error_text}")
+                    raise self._status_error(response.status, f"PATCH request failed with status {response.status}: {error_text}")
 
                 result = await response.json()
                 logger.debug(f"PATCH Response: {str(result)[:1200]}{'...' if len(str(result)) > 1200 else ''}")
                 return result
 
-        except aiohttp.ClientError as e:
+        except APIException:
+            raise
+        except aiohttp.ClientResponseError as e:
             logger.error(f"HTTP client error for PATCH {url}: {e}")
             raise APIException(f"Network error: {e}")
+        except aiohttp.ClientError as e:
+            logger.error(f"HTTP client error for PATCH {url}: {e}")
+            raise APIUnavailableException(f"Network error: {e}")
+        except asyncio.TimeoutError as e:
+            logger.error(f"Timeout for PATCH {url}: {e}")
+            raise APIUnavailableException(f"PATCH failed: {e}")
         except Exception as e:
             logger.error(f"Unexpected error in PATCH {url}: {e}")
             raise APIException(f"PATCH failed: {e}")
@@ -411,6 +625,19 @@ class APIClient:
         """
         url = self._build_url(endpoint, api_version, object_id)
         
+        return await self.policy.execute(
+            'DELETE', endpoint,
+            lambda: self._execute_delete(url, endpoint, object_id, timeout)
+        )
+    
+    async def _execute_delete(
+        self,
+        url: str,
+        endpoint: str,
+        object_id: Optional[Union[int, str]] = None,
+        timeout: Optional[int] = None
+    ) -> bool:
+        """Perform a single DELETE round trip against a fully built URL."""
         await self._ensure_session()
         
         try:
@@ -431,14 +658,22 @@ class APIClient:
                 elif response.status not in [200, 204]:
                     error_text = await response.text()
                     logger.error(f"DELETE error {response.status}: {url} - {error_text}")
-                    raise APIException(f"DELETE request failed with status {response.status}: {error_text}")
+                    raise self._status_error(response.status, f"DELETE request failed with status {response.status}: {error_text}")
                 
                 logger.debug(f"DELETE successful: {url}")
                 return True
                 
-        except aiohttp.ClientError as e:
+        except APIException:
+            raise
+        except aiohttp.ClientResponseError as e:
             logger.error(f"HTTP client error for DELETE {url}: {e}")
             raise APIException(f"Network error: {e}")
+        except aiohttp.ClientError as e:
+            logger.error(f"HTTP client error for DELETE {url}: {e}")
+            raise APIUnavailableException(f"Network error: {e}")
+        except asyncio.TimeoutError as e:
+            logger.error(f"Timeout for DELETE {url}: {e}")
+            raise APIUnavailableException(f"DELETE failed: {e}")
         except Exception as e:
             logger.error(f"Unexpected error in DELETE {url}: {e}")
             raise APIException(f"DELETE failed: {e}")
@@ -0,0 +1,278 @@
+"""
+Request policies for Discord Bot v2.0
+
+Retry with jittered exponential backoff and per-endpoint-family circuit breakers
+for APIClient requests. Only transient failures (5xx responses, timeouts and
+connection errors) are retried or counted against a breaker; client errors
+such as 400/401/404 pass straight through.
+"""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar
+
+from exceptions import APIUnavailableException, CircuitOpenException
+
+logger = logging.getLogger(f'{__name__}.RequestPolicy')
+
+T = TypeVar('T')
+
+# Methods that are safe to repeat without side effects beyond the first call
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({'GET', 'PUT', 'DELETE'})
+
+
+@dataclass
+class RetryPolicy:
+    """Retry settings for transient API failures."""
+    max_retries: int = 3
+    base_delay: float = 0.5       # Seconds before the first retry (before jitter)
+    max_delay: float = 8.0        # Cap on any single backoff delay
+    retry_methods: FrozenSet[str] = field(default_factory=lambda: IDEMPOTENT_METHODS)
+
+    def should_retry(self, method: str, attempt: int) -> bool:
+        """
+        Check whether a failed attempt may be retried.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            True if another attempt is allowed
+        """
+        return method.upper() in self.retry_methods and attempt < self.max_retries
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Get the delay before the next attempt using "full jitter" backoff.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            Delay in seconds, uniformly drawn from [0, min(max_delay, base_delay * 2^attempt)]
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"        # Requests flow normally
+    OPEN = "open"            # Requests fail fast until the recovery timeout passes
+    HALF_OPEN = "half_open"  # A single probe request is allowed through
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single endpoint family.
+
+    Opens after `failure_threshold` consecutive transient failures, rejects
+    requests for `recovery_timeout` seconds, then half-opens and lets one probe
+    through. A successful probe closes the circuit; a failed one re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self.total_failures = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving OPEN -> HALF_OPEN once the recovery timeout has passed."""
+        if self._state == CircuitState.OPEN and self._opened_at is not None:
+            if self._clock() - self._opened_at >= self.recovery_timeout:
+                self._state = CircuitState.HALF_OPEN
+                self._probe_in_flight = False
+                logger.info(f"Circuit '{self.name}' half-open - probing API recovery")
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit will half-open (0 if not open)."""
+        if self.state != CircuitState.OPEN or self._opened_at is None:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (self._clock() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, reserving the probe slot when half-open."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot without recording an outcome (e.g. cancelled request)."""
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy API."""
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"Circuit '{self.name}' closed - API recovered")
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a transient failure, opening the circuit if the threshold is reached."""
+        self.total_failures += 1
+        self._consecutive_failures += 1
+        self._probe_in_flight = False
+
+        if self._state == CircuitState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            if self._state != CircuitState.OPEN:
+                self.times_opened += 1
+                logger.warning(
+                    f"Circuit '{self.name}' opened after {self._consecutive_failures} consecutive failures"
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+
+    def status(self) -> Dict[str, Any]:
+        """Snapshot of breaker state for health reporting."""
+        return {
+            'state': self.state.value,
+            'consecutive_failures': self._consecutive_failures,
+            'total_failures': self.total_failures,
+            'times_opened': self.times_opened,
+            'retry_after': round(self.retry_after(), 1)
+        }
+
+
+class RequestPolicy:
+    """
+    Combines a RetryPolicy with per-endpoint-family circuit breakers.
+
+    An endpoint family is the first path segment of the endpoint, so
+    'players', 'players/search' and 'players/123' share one breaker.
+    """
+
+    def __init__(
+        self,
+        retry_policy: Optional[RetryPolicy] = None,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize request policy.
+
+        Args:
+            retry_policy: Retry settings (defaults to RetryPolicy())
+            failure_threshold: Consecutive transient failures before a breaker opens
+            recovery_timeout: Seconds an open breaker waits before probing
+            sleep: Awaitable sleep used between retries (injectable for tests)
+            clock: Monotonic clock used by breakers (injectable for tests)
+        """
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._sleep = sleep
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.retries = 0
+
+    @classmethod
+    def from_config(cls, config) -> 'RequestPolicy':
+        """Build a policy from BotConfig retry settings."""
+        return cls(retry_policy=RetryPolicy(max_retries=config.max_retries))
+
+    @staticmethod
+    def endpoint_family(endpoint: str) -> str:
+        """Get the breaker family name for an endpoint."""
+        if endpoint.startswith(('http://', 'https://')) or '/api/' in endpoint:
+            return 'external'
+        return endpoint.strip('/').split('/', 1)[0] or 'root'
+
+    def breaker_for(self, endpoint: str) -> CircuitBreaker:
+        """Get (or create) the circuit breaker for an endpoint's family."""
+        family = self.endpoint_family(endpoint)
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                family,
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+                clock=self._clock
+            )
+            self._breakers[family] = breaker
+        return breaker
+
+    async def execute(self, method: str, endpoint: str, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a request under the retry and circuit breaker rules.
+
+        Args:
+            method: HTTP method (decides whether retries are allowed)
+            endpoint: API endpoint (decides which breaker applies)
+            operation: Zero-argument callable performing one attempt
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            CircuitOpenException: If the endpoint's breaker rejects the request
+            APIUnavailableException: If the final attempt failed transiently
+            APIException: For non-transient failures (never retried)
+        """
+        breaker = self.breaker_for(endpoint)
+        attempt = 0
+
+        while True:
+            if not breaker.allow_request():
+                raise CircuitOpenException(
+                    f"Database API unavailable for '{breaker.name}' - "
+                    f"retry in {breaker.retry_after():.0f}s"
+                )
+
+            try:
+                result = await operation()
+            except asyncio.CancelledError:
+                breaker.release_probe()
+                raise
+            except APIUnavailableException as e:
+                breaker.record_failure()
+                if not self.retry_policy.should_retry(method, attempt):
+                    raise
+
+                delay = self.retry_policy.backoff_delay(attempt)
+                attempt += 1
+                self.retries += 1
+                logger.warning(
+                    f"{method} {endpoint} failed transiently ({e}) - "
+                    f"retry {attempt}/{self.retry_policy.max_retries} in {delay:.2f}s"
+                )
+                await self._sleep(delay)
+                continue
+            except Exception:
+                # Non-transient errors (4xx, bad payloads) still mean the API answered
+                breaker.record_success()
+                raise
+
+            breaker.record_success()
+            return result
+
+    def get_breaker_states(self) -> Dict[str, Dict[str, Any]]:
+        """Get status of every breaker that has seen traffic."""
+        return {name: breaker.status() for name, breaker in sorted(self._breakers.items())}
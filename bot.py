@@ -82,6 +82,7 @@ class SBABot(commands.Bot):
         )
         
         self.logger = logging.getLogger('discord_bot_v2')
+        self.warmup_report = None
     
     async def setup_hook(self):
         """Called when the bot is starting up."""
@@ -90,6 +91,9 @@ class SBABot(commands.Bot):
         # Load command packages
         await self._load_command_packages()
         
+        # Preload hot caches so the first interactions aren't cold
+        await self._warm_caches()
+        
         # Initialize cleanup tasks
         await self._setup_background_tasks()
         
@@ -170,6 +174,28 @@ class SBABot(commands.Bot):
         else:
             self.logger.warning(f"⚠️  Command loading completed with issues: {total_successful} successful, {total_failed} failed")
     
+    async def _warm_caches(self):
+        """Preload teams, current state, standings and season players within the warm-up budget."""
+        config = get_config()
+        if not config.cache_warmup_enabled:
+            self.logger.info("Cache warm-up disabled")
+            return
+
+        try:
+            from utils.cache_warmup import default_warmup_loaders, warm_caches
+
+            self.warmup_report = await warm_caches(
+                default_warmup_loaders(config.sba_season),
+                budget=config.cache_warmup_budget
+            )
+            if self.warmup_report.errors or self.warmup_report.pending:
+                self.logger.warning(f"⚠️  Cache warm-up incomplete: {self.warmup_report.summary()}")
+            else:
+                self.logger.info(f"✅ Cache warm-up complete: {self.warmup_report.summary()}")
+
+        except Exception as e:
+            self.logger.error(f"❌ Cache warm-up failed: {e}", exc_info=True)
+    
     async def _setup_background_tasks(self):
         """Initialize background tasks for the bot."""
         try:
@@ -194,6 +220,10 @@ class SBABot(commands.Bot):
             self.live_scorebug_tracker = setup_scorebug_tracker(self)
             self.logger.info("✅ Live scorebug tracker started")
 
+            # Resume draft sheet writes queued before the last shutdown
+            from services.draft_sheet_service import get_draft_sheet_service
+            get_draft_sheet_service().resume_pending()
+
             self.logger.info("✅ Background tasks initialized successfully")
 
         except Exception as e:
@@ -355,6 +385,14 @@ class SBABot(commands.Bot):
             except Exception as e:
                 self.logger.error(f"Error stopping live scorebug tracker: {e}")
 
+        # Flush queued draft sheet writes
+        try:
+            from services.draft_sheet_service import get_draft_sheet_service
+            await get_draft_sheet_service().close()
+            self.logger.info("Draft sheet write queue flushed")
+        except Exception as e:
+            self.logger.error(f"Error flushing draft sheet write queue: {e}")
+
         # Call parent close method
         await super().close()
         self.logger.info("Bot shutdown complete")
@@ -372,6 +410,8 @@ async def health_command(interaction: discord.Interaction):
     try:
         # Check API connectivity
         api_status = "✅ Connected"
+        request_stats = None
+        circuit_states = {}
         try:
             client = await get_global_client()
             # Test API with a simple request
@@ -384,6 +424,25 @@ async def health_command(interaction: discord.Interaction):
             logger.error(f"API health check failed: {e}")
             api_status = f"❌ Error: {str(e)}"
         
+        try:
+            client = await get_global_client()
+            request_stats = client.get_request_stats()
+            circuit_states = client.get_circuit_states()
+        except Exception as e:
+            logger.error(f"API client stats unavailable: {e}")
+        
+        # In-memory /dropadd, /ilmove and /trade sessions
+        builder_stats = {}
+        try:
+            from services.transaction_builder import get_transaction_builder_stats
+            from services.trade_builder import get_trade_builder_stats
+            builder_stats = {
+                'Transactions': get_transaction_builder_stats(),
+                'Trades': get_trade_builder_stats()
+            }
+        except Exception as e:
+            logger.error(f"Builder session stats unavailable: {e}")
+        
         # Bot health info
         guild_count = len(bot.guilds)
         
@@ -397,6 +456,42 @@ async def health_command(interaction: discord.Interaction):
         embed.add_field(name="Guilds", value=str(guild_count), inline=True)
         embed.add_field(name="Latency", value=f"{bot.latency*1000:.1f}ms", inline=True)
         
+        if request_stats:
+            embed.add_field(
+                name="API Requests",
+                value=(
+                    f"{request_stats['issued']} issued / {request_stats['coalesced']} coalesced / "
+                    f"{request_stats['retries']} retried"
+                ),
+                inline=True
+            )
+        
+        if builder_stats:
+            embed.add_field(
+                name="Builder Sessions",
+                value="\n".join(
+                    f"{name}: {stats['live']} live (~{stats['approx_bytes'] / 1024:.0f} KB), "
+                    f"{stats['evictions']} evicted"
+                    for name, stats in builder_stats.items()
+                ),
+                inline=True
+            )
+        
+        if bot.warmup_report:
+            embed.add_field(name="Cache Warm-up", value=bot.warmup_report.summary(), inline=False)
+        
+        if circuit_states:
+            unhealthy = [
+                f"`{name}`: {status['state']} (retry in {status['retry_after']:.0f}s)"
+                for name, status in circuit_states.items()
+                if status['state'] != 'closed'
+            ]
+            embed.add_field(
+                name="Circuit Breakers",
+                value="\n".join(unhealthy) if unhealthy else f"✅ All closed ({len(circuit_states)} endpoints)",
+                inline=False
+            )
+        
         if bot.user:
             embed.set_footer(text=f"Bot: {bot.user.name}", icon_url=bot.user.display_avatar.url)
         
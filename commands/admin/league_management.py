@@ -16,6 +16,7 @@ from utils.decorators import logged_command
 from utils.permissions import league_admin_only
 from views.embeds import EmbedColors, EmbedTemplate
 from services.league_service import league_service
+from services.roster_audit import roster_audit_service
 from services.transaction_service import transaction_service
 from tasks.transaction_freeze import resolve_contested_transactions
 
@@ -561,6 +562,104 @@ class LeagueManagementCommands(commands.Cog):
         await processing_msg.edit(content=None, embed=embed)
 
 
+    @app_commands.command(
+        name="admin-roster-audit",
+        description="[ADMIN] Check every team's current and projected roster legality"
+    )
+    @app_commands.describe(
+        week="Week whose pending transactions are projected (defaults to next week)"
+    )
+    @league_admin_only()
+    @logged_command("/admin-roster-audit")
+    async def admin_roster_audit(
+        self,
+        interaction: discord.Interaction,
+        week: Optional[int] = None
+    ):
+        """Audit roster legality for every team, including pending transactions."""
+        await interaction.response.defer()
+
+        current = await league_service.get_current_state()
+        if not current:
+            await interaction.followup.send(
+                "❌ Could not retrieve current league state.",
+                ephemeral=True
+            )
+            return
+
+        target_week = week if week is not None else current.week + 1
+        report = await roster_audit_service.audit_league(current.season, target_week)
+
+        illegal = report.illegal_teams
+        if not report.projection_available:
+            embed = EmbedTemplate.warning(
+                title="Roster Audit",
+                description=f"Pending transactions could not be loaded, so only current rosters were checked. "
+                            f"{len(illegal)} of {len(report.teams)} teams have roster issues."
+            )
+        elif illegal:
+            embed = EmbedTemplate.warning(
+                title="Roster Audit",
+                description=f"{len(illegal)} of {len(report.teams)} teams have roster issues."
+            )
+        else:
+            embed = EmbedTemplate.success(
+                title="Roster Audit",
+                description=f"All {len(report.teams)} teams have legal rosters."
+            )
+
+        embed.add_field(
+            name="Audit Scope",
+            value=f"**Season:** {report.season}\n"
+                  f"**Projected Week:** {report.week}\n"
+                  f"**Pending Moves Applied:** {report.transactions_applied}",
+            inline=False
+        )
+
+        if not report.projection_available:
+            embed.add_field(
+                name="Projection Unavailable",
+                value=report.transactions_error[:1024],
+                inline=False
+            )
+
+        if illegal:
+            lines = []
+            for audit in illegal:
+                if audit.error:
+                    lines.append(f"• **{audit.team.abbrev}**: {audit.error}")
+                    continue
+                if audit.current and not audit.current.is_legal:
+                    lines.append(f"• **{audit.team.abbrev}** (current): {audit.current.errors[0]}")
+                if audit.projected and not audit.projected.is_legal:
+                    lines.append(f"• **{audit.team.abbrev}** (week {report.week}): {audit.projected.errors[0]}")
+
+            # Limit to first 15 lines to stay within the field size
+            display_lines = lines[:15]
+            if len(lines) > 15:
+                display_lines.append(f"... and {len(lines) - 15} more")
+
+            embed.add_field(
+                name="Illegal Rosters",
+                value="\n".join(display_lines)[:1024],
+                inline=False
+            )
+
+        if report.unmatched_moves:
+            display_moves = report.unmatched_moves[:10]
+            if len(report.unmatched_moves) > 10:
+                display_moves.append(f"... and {len(report.unmatched_moves) - 10} more")
+
+            embed.add_field(
+                name="Moves Not Matching Current Rosters",
+                value="\n".join(f"• {move}" for move in display_moves)[:1024],
+                inline=False
+            )
+
+        embed.set_footer(text=f"Requested by {interaction.user.display_name}")
+        await interaction.followup.send(embed=embed)
+
+
 async def setup(bot: commands.Bot):
     """Load the league management commands cog."""
     await bot.add_cog(LeagueManagementCommands(bot))
@@ -4,7 +4,7 @@ Admin Management Commands
 Administrative commands for league management and bot maintenance.
 """
 import asyncio
-from typing import List, Dict, Any
+from typing import List
 
 import discord
 from discord.ext import commands
@@ -19,6 +19,9 @@ from views.embeds import EmbedColors, EmbedTemplate
 from services.league_service import league_service
 from services.transaction_service import transaction_service
 from services.player_service import player_service
+from services.transaction_executor import ExecutionReport, get_transaction_executor
+from services.transaction_journal import TransactionJournal
+from models.transaction import Transaction
 
 
 class AdminCommands(commands.Cog):
@@ -134,7 +137,7 @@ class AdminCommands(commands.Cog):
             value="**`/admin-season <season>`** - Set current season\n"
                   "**`/admin-announce <message>`** - Send announcement to channel\n"
                   "**`/admin-maintenance <on/off>`** - Toggle maintenance mode\n"
-                  "**`/admin-process-transactions [week]`** - Manually process weekly transactions",
+                  "**`/admin-process-transactions [week] [refetch]`** - Manually process weekly transactions",
             inline=False
         )
         
@@ -620,14 +623,16 @@ class AdminCommands(commands.Cog):
         description="[ADMIN] Manually process all transactions for the current week (or specified week)"
     )
     @app_commands.describe(
-        week="Week number to process (optional, defaults to current week)"
+        week="Week number to process (optional, defaults to current week)",
+        refetch="Fetch the week's moves fresh instead of resuming an interrupted run's saved plan"
     )
     @league_admin_only()
     @logged_command("/admin-process-transactions")
     async def admin_process_transactions(
         self,
         interaction: discord.Interaction,
-        week: int | None = None
+        week: int | None = None,
+        refetch: bool = False
     ):
         """
         Manually process all transactions for the current week.
@@ -635,11 +640,16 @@ class AdminCommands(commands.Cog):
         This is a fallback mechanism if the Monday morning task fails to run.
         It will:
         1. Get all non-frozen, non-cancelled transactions for the specified week
-        2. Execute each transaction by updating player rosters via the API
+           (or replay an interrupted run from the week's transaction journal,
+           unless `refetch` is set)
+        2. Execute each transaction by updating player rosters via the API,
+           skipping updates the journal shows as already applied
         3. Report success/failure counts
 
         Args:
             week: Optional week number to process. If not provided, uses current week.
+            refetch: Always read the week's moves from the API, so moves cancelled or
+                     added since an interrupted run are respected.
         """
         await interaction.response.defer()
 
@@ -662,16 +672,63 @@ class AdminCommands(commands.Cog):
                 requested_by=str(interaction.user)
             )
 
-            # Get all non-frozen, non-cancelled transactions for the target week using service layer
-            transactions = await transaction_service.get_all_items(params=[
-                ('season', str(target_season)),
-                ('week_start', str(target_week)),
-                ('week_end', str(target_week)),
-                ('frozen', 'false'),
-                ('cancelled', 'false')
-            ])
+            journal = TransactionJournal.for_week(target_season, target_week)
+            if journal.is_resumable and not refetch:
+                # An earlier run for this week was interrupted - its plan is replayed
+                self.logger.info(
+                    f"Resuming journaled run for week {target_week}",
+                    already_applied=journal.applied_count
+                )
 
-            if not transactions:
+            # Create initial status embed
+            processing_embed = EmbedTemplate.loading(
+                title="Processing Transactions",
+                description=f"Processing transactions for Week {target_week}..."
+            )
+            processing_embed.add_field(
+                name="Progress",
+                value="Starting...",
+                inline=False
+            )
+
+            status_message = await interaction.followup.send(embed=processing_embed)
+
+            async def report_progress(progress: ExecutionReport):
+                # Update progress every 5 transactions or on last transaction
+                if progress.completed % 5 == 0 or progress.completed == progress.total:
+                    processing_embed.set_field_at(
+                        0,
+                        name="Progress",
+                        value=f"Processed {progress.completed}/{progress.total} transactions\n"
+                              f"✅ Successful: {progress.succeeded + progress.skipped}\n"
+                              f"❌ Failed: {progress.failed}",
+                        inline=False
+                    )
+                    await status_message.edit(embed=processing_embed) # type: ignore
+
+            async def fetch_transactions() -> List[Transaction]:
+                # Get all non-frozen, non-cancelled transactions for the target week using service layer
+                transactions = await transaction_service.get_all_items(params=[
+                    ('season', str(target_season)),
+                    ('week_start', str(target_week)),
+                    ('week_end', str(target_week)),
+                    ('frozen', 'false'),
+                    ('cancelled', 'false')
+                ])
+                self.logger.info(f"Found {len(transactions)} transactions to process for week {target_week}")
+                return transactions
+
+            # Execute player roster updates (bounded concurrency, rate limited, journaled).
+            # The journal's lock keeps this from running alongside the freeze task.
+            report = await get_transaction_executor().execute_journaled(
+                journal,
+                fetch_transactions,
+                self._execute_transaction,
+                progress=report_progress,
+                resume=not refetch
+            )
+
+            if report.total == 0:
                 embed = EmbedTemplate.info(
                     title="No Transactions to Process",
                     description=f"No non-frozen, non-cancelled transactions found for Week {target_week}"
@@ -686,73 +743,21 @@ class AdminCommands(commands.Cog):
                     inline=False
                 )
 
-                await interaction.followup.send(embed=embed)
+                await status_message.edit(embed=embed) # type: ignore
                 return
 
-            # Count total transactions
-            total_count = len(transactions)
-
-            self.logger.info(f"Found {total_count} transactions to process for week {target_week}")
-
-            # Process each transaction
-            success_count = 0
-            failure_count = 0
-            errors: List[Dict[str, Any]] = []
-
-            # Create initial status embed
-            processing_embed = EmbedTemplate.loading(
-                title="Processing Transactions",
-                description=f"Processing {total_count} transactions for Week {target_week}..."
-            )
-            processing_embed.add_field(
-                name="Progress",
-                value="Starting...",
-                inline=False
-            )
-
-            status_message = await interaction.followup.send(embed=processing_embed)
-
-            for idx, transaction in enumerate(transactions, start=1):
-                try:
-                    # Execute player roster update via service layer
-                    await self._execute_player_update(
-                        player_id=transaction.player.id,
-                        new_team_id=transaction.newteam.id,
-                        player_name=transaction.player.name
-                    )
-
-                    success_count += 1
-
-                    # Update progress every 5 transactions or on last transaction
-                    if idx % 5 == 0 or idx == total_count:
-                        processing_embed.set_field_at(
-                            0,
-                            name="Progress",
-                            value=f"Processed {idx}/{total_count} transactions\n"
-                                  f"✅ Successful: {success_count}\n"
-                                  f"❌ Failed: {failure_count}",
-                            inline=False
-                        )
-                        await status_message.edit(embed=processing_embed) # type: ignore
-
-                    # Rate limiting: 100ms delay between requests
-                    await asyncio.sleep(0.1)
-
-                except Exception as e:
-                    failure_count += 1
-                    error_info = {
-                        'player': transaction.player.name,
-                        'player_id': transaction.player.id,
-                        'new_team': transaction.newteam.abbrev,
-                        'error': str(e)
-                    }
-                    errors.append(error_info)
+            total_count = report.total
+            success_count = report.succeeded + report.skipped
+            failure_count = report.failed
 
+            for moveid, failures in report.failures.items():
+                for failure in failures:
                     self.logger.error(
-                        f"Failed to execute transaction for {error_info['player']}",
-                        player_id=error_info['player_id'],
-                        new_team=error_info['new_team'],
-                        error=e
+                        f"Failed to execute transaction for {failure.transaction.player.name}",
+                        moveid=moveid,
+                        player_id=failure.transaction.player.id,
+                        new_team=failure.transaction.newteam.abbrev,
+                        error=failure.error
                     )
 
             # Create completion embed
@@ -776,24 +781,30 @@ class AdminCommands(commands.Cog):
                 name="Processing Summary",
                 value=f"**Total Transactions:** {total_count}\n"
                       f"**✅ Successful:** {success_count}\n"
-                      f"**❌ Failed:** {failure_count}\n"
+                      + (f"**↩️ Applied by earlier run:** {report.skipped}\n" if report.skipped else "")
+                      + f"**❌ Failed:** {failure_count}\n"
                       f"**Week:** {target_week}\n"
                       f"**Season:** {target_season}",
                 inline=False
             )
 
-            # Add error details if there were failures
-            if errors:
+            # Add error details if there were failures, grouped by transaction
+            if report.failures:
                 error_text = ""
-                for error in errors[:5]:  # Show first 5 errors
-                    error_text += f"• **{error['player']}** → {error['new_team']}: {error['error'][:50]}\n"
+                failed_moves = list(report.failures.items())
+                for moveid, failures in failed_moves[:5]:  # Show first 5 failed transactions
+                    moves = ", ".join(
+                        f"{failure.transaction.player.name} → {failure.transaction.newteam.abbrev}"
+                        for failure in failures
+                    )
+                    error_text += f"• `{moveid}`: **{moves}**: {failures[0].error[:50]}\n"
 
-                if len(errors) > 5:
-                    error_text += f"\n... and {len(errors) - 5} more errors"
+                if len(failed_moves) > 5:
+                    error_text += f"\n... and {len(failed_moves) - 5} more failed transactions"
 
                 completion_embed.add_field(
                     name="Errors",
-                    value=error_text,
+                    value=error_text[:1024],
                     inline=False
                 )
 
@@ -829,6 +840,14 @@ class AdminCommands(commands.Cog):
 
             await interaction.followup.send(embed=embed, ephemeral=True)
 
+    async def _execute_transaction(self, transaction: Transaction) -> bool:
+        """Apply one move's player update (TransactionExecutor callback)."""
+        return await self._execute_player_update(
+            player_id=transaction.player.id,
+            new_team_id=transaction.newteam.id,
+            player_name=transaction.player.name
+        )
+
     async def _execute_player_update(
         self,
         player_id: int,
@@ -9,7 +9,7 @@ import discord
 from discord.ext import commands
 
 from config import get_config
-from services.draft_pick_service import draft_pick_service
+from services.draft_board import draft_board
 from utils.logging import get_contextual_logger
 from utils.decorators import logged_command
 from utils.permissions import requires_team
@@ -57,10 +57,9 @@ class DraftBoardCommands(commands.Cog):
             return
 
         # Get picks for this round
-        picks = await draft_pick_service.get_picks_by_round(
+        picks = await draft_board.get_picks_by_round(
             config.sba_season,
-            round_number,
-            include_taken=True
+            round_number
         )
 
         if not picks:
@@ -182,7 +182,9 @@ class DraftListCommands(commands.Cog):
             config.sba_season,
             team.id,
             player_obj.id,
-            rank
+            rank,
+            player=player_obj,
+            team=team
         )
 
         if not updated_list:
@@ -13,6 +13,7 @@ from discord.ext import commands
 
 from config import get_config
 from services.draft_service import draft_service
+from services.draft_board import draft_board
 from services.draft_pick_service import draft_pick_service
 from services.draft_sheet_service import get_draft_sheet_service
 from services.player_service import player_service
@@ -293,7 +294,8 @@ class DraftPicksCog(commands.Cog):
         # Execute pick (using pick_to_use which may be current or skipped pick)
         updated_pick = await draft_pick_service.update_pick_selection(
             pick_to_use.id,
-            player_obj.id
+            player_obj.id,
+            player=player_obj
         )
 
         if not updated_pick:
@@ -313,7 +315,7 @@ class DraftPicksCog(commands.Cog):
         if not updated_player:
             self.logger.error(f"Failed to update player {player_obj.id} team")
 
-        # Write pick to Google Sheets (fire-and-forget with notification on failure)
+        # Queue pick for Google Sheets (written in the background, notification on failure)
         await self._write_pick_to_sheets(
             draft_data=draft_data,
             pick=pick_to_use,
@@ -405,7 +407,10 @@ class DraftPicksCog(commands.Cog):
         guild: Optional[discord.Guild]
     ):
         """
-        Write pick to Google Sheets (fire-and-forget with ping channel notification on failure).
+        Queue pick for Google Sheets (write-behind, with ping channel notification on failure).
+
+        The sheet service writes queued picks in the background and retries
+        failed writes; the notification is posted only once it gives up.
 
         Args:
             draft_data: Current draft configuration
@@ -416,37 +421,35 @@ class DraftPicksCog(commands.Cog):
         """
         config = get_config()
 
+        async def notify_failure(reason: str = "Sheet write failed after retries"):
+            await self._notify_sheet_failure(
+                guild=guild,
+                channel_id=draft_data.ping_channel,
+                pick_overall=pick.overall,
+                player_name=player.name,
+                reason=reason
+            )
+
         try:
             draft_sheet_service = get_draft_sheet_service()
-            success = await draft_sheet_service.write_pick(
+            queued = draft_sheet_service.enqueue_pick(
                 season=config.sba_season,
                 overall=pick.overall,
                 orig_owner_abbrev=pick.origowner.abbrev if pick.origowner else team.abbrev,
                 owner_abbrev=team.abbrev,
                 player_name=player.name,
-                swar=player.wara
+                swar=player.wara,
+                on_failure=notify_failure
             )
 
-            if not success:
-                # Write failed - notify in ping channel
-                await self._notify_sheet_failure(
-                    guild=guild,
-                    channel_id=draft_data.ping_channel,
-                    pick_overall=pick.overall,
-                    player_name=player.name,
-                    reason="Sheet write returned failure"
-                )
+            if not queued:
+                # Sheet writes unavailable - notify in ping channel
+                await notify_failure(reason="Sheet write returned failure")
 
         except Exception as e:
-            self.logger.warning(f"Failed to write pick to sheets: {e}")
+            self.logger.warning(f"Failed to queue pick for sheets: {e}")
             # Notify in ping channel
-            await self._notify_sheet_failure(
-                guild=guild,
-                channel_id=draft_data.ping_channel,
-                pick_overall=pick.overall,
-                player_name=player.name,
-                reason=str(e)
-            )
+            await notify_failure(reason=str(e))
 
     async def _notify_sheet_failure(
         self,
@@ -504,7 +507,7 @@ class DraftPicksCog(commands.Cog):
                 return
 
             # Get the new current pick
-            next_pick = await draft_pick_service.get_pick(
+            next_pick = await draft_board.get_pick(
                 config.sba_season,
                 updated_draft_data.currentpick
             )
@@ -514,9 +517,9 @@ class DraftPicksCog(commands.Cog):
                 return
 
             # Get recent picks (last 5 completed)
-            recent_picks = await draft_pick_service.get_recent_picks(
+            recent_picks = await draft_board.get_recent_picks(
                 config.sba_season,
-                updated_draft_data.currentpick - 1,  # Start from previous pick
+                updated_draft_data.currentpick,  # Picks before the new current pick
                 limit=5
             )
 
@@ -7,7 +7,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
-from services.scorebug_service import ScorebugData, ScorebugService
+from services.scorebug_snapshots import scorebug_snapshots
 from services.team_service import team_service
 from utils.logging import get_contextual_logger
 from utils.decorators import logged_command
@@ -24,7 +24,8 @@ class ScorebugCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.logger = get_contextual_logger(f'{__name__}.ScorebugCommands')
-        self.scorebug_service = ScorebugService()
+        # Shares the snapshot store's reader (and its Sheets client) with the live tracker
+        self.scorebug_service = scorebug_snapshots.service
         self.scorecard_tracker = ScorecardTracker()
         self.logger.info("ScorebugCommands cog initialized")
 
@@ -59,9 +60,9 @@ class ScorebugCommands(commands.Cog):
             # Try to open the scorecard to validate it
             scorecard = await self.scorebug_service.open_scorecard(url)
 
-            # Verify it has a Scorebug tab
+            # Verify it has a Scorebug tab (and seed the snapshot /scorebug serves from)
             try:
-                scorebug_data = await self.scorebug_service.read_scorebug_data(url, full_length=False)
+                scorebug_data = await scorebug_snapshots.refresh(url)
             except SheetsException:
                 embed = EmbedTemplate.error(
                     title="Invalid Scorecard",
@@ -102,7 +103,7 @@ class ScorebugCommands(commands.Cog):
                     f"**Status:** Live tracking enabled\n"
                     f"**Scorecard:** {scorecard_link}\n\n"
                     f"Anyone can now run `/scorebug` in this channel to see the current score.\n"
-                    f"The scorebug will also update in the live scores channel every 3 minutes."
+                    f"The scorebug will also update in the live scores channel while the game is live."
                 )
             )
 
@@ -181,10 +182,8 @@ class ScorebugCommands(commands.Cog):
                 content="📊 Reading scorebug..."
             )
 
-            scorebug_data = await self.scorebug_service.read_scorebug_data(
-                sheet_url,
-                full_length=full_length
-            )
+            # Served from a recent snapshot, or joins a read already in flight
+            scorebug_data = await scorebug_snapshots.get(sheet_url)
 
             # Get team data
             away_team = None
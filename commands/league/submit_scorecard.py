@@ -58,11 +58,11 @@ class SubmitScorecardCommands(commands.Cog):
         Submit scorecard with full transaction rollback support.
 
         Workflow:
-        1. Validate scorecard access and version
+        1. Validate scorecard access and version (all sheet data is read in one request)
         2. Extract game metadata
         3. Check permissions (user must own one of the teams)
         4. Handle duplicate games (with confirmation)
-        5. Read play and decision data
+        5. Attach play and decision data to the game
         6. Submit data with transaction rollback on errors
         7. Post results to news channel
         8. Recalculate standings
@@ -93,8 +93,9 @@ class SubmitScorecardCommands(commands.Cog):
                 )
                 return
 
-            # Read setup data
-            setup_data = await self.sheets_service.read_setup_data(scorecard)
+            # Read setup, plays, box score and pitching decisions in one Sheets request
+            bundle = await self.sheets_service.read_scorecard_bundle(scorecard)
+            setup_data = bundle.setup
 
             # Validate scorecard version
             if setup_data['version'] != current.bet_week:
@@ -225,12 +226,8 @@ class SubmitScorecardCommands(commands.Cog):
 
             game_id = scheduled_game.id
 
-            # Phase 6: Read Scorecard Data
-            await interaction.edit_original_response(
-                content="📊 Reading play-by-play data..."
-            )
-
-            plays_data = await self.sheets_service.read_playtable_data(scorecard)
+            # Phase 6: Prepare Play-by-Play Data (read with the setup data)
+            plays_data = bundle.plays
 
             # Add game_id to each play
             for play in plays_data:
@@ -257,8 +254,8 @@ class SubmitScorecardCommands(commands.Cog):
                 )
                 return
 
-            # Phase 8: Read Box Score
-            box_score = await self.sheets_service.read_box_score(scorecard)
+            # Phase 8: Box Score (read with the setup data)
+            box_score = bundle.box_score
 
             # Phase 9: PATCH Game
             await interaction.edit_original_response(
@@ -286,8 +283,8 @@ class SubmitScorecardCommands(commands.Cog):
                 )
                 return
 
-            # Phase 10: Read Pitching Decisions
-            decisions_data = await self.sheets_service.read_pitching_decisions(scorecard)
+            # Phase 10: Pitching Decisions (read with the setup data)
+            decisions_data = bundle.decisions
 
             # Add game metadata to each decision
             for decision in decisions_data:
@@ -10,6 +10,7 @@ from discord.ext import commands
 
 from config import get_config
 
+from services.player_index import player_index
 from services.player_service import player_service
 from services.stats_service import stats_service
 from utils.logging import get_contextual_logger
@@ -26,8 +27,12 @@ async def player_name_autocomplete(
         return []
 
     try:
-        # Use the dedicated search endpoint to get matching players
-        players = await player_service.search_players(current, limit=25, season=get_config().sba_season)
+        # Resolve locally from the player index; fall back to the search endpoint
+        season = get_config().sba_season
+        if player_index.is_ready(season):
+            players = player_index.search(current, limit=25)
+        else:
+            players = await player_service.search_players(current, limit=25, season=season)
 
         # Convert to discord choices, limiting to 25 (Discord's max)
         choices = []
@@ -3,7 +3,8 @@ Trade Commands
 
 Interactive multi-team trade builder with real-time validation and elegant UX.
 """
-from typing import Optional
+import asyncio
+from typing import Optional, Set
 
 import discord
 from discord.ext import commands
@@ -21,6 +22,8 @@ from services.trade_builder import (
     get_trade_builder_by_team,
     clear_trade_builder,
     clear_trade_builder_by_team,
+    add_trade_eviction_callback,
+    remove_trade_eviction_callback,
 )
 from services.player_service import player_service
 from models.team import RosterType
@@ -40,6 +43,41 @@ class TradeCommands(commands.Cog):
         self.channel_tracker = TradeChannelTracker()
         self.channel_manager = TradeChannelManager(self.channel_tracker)
 
+        # Delete the channels of trades abandoned long enough to be evicted
+        self._channel_cleanup_tasks: Set[asyncio.Task] = set()
+        add_trade_eviction_callback(self._on_trade_evicted)
+
+    def cog_unload(self):
+        """Stop cleaning up channels for evicted trades."""
+        remove_trade_eviction_callback(self._on_trade_evicted)
+
+    def _on_trade_evicted(self, trade_key: str, builder: TradeBuilder, reason: str) -> None:
+        """Schedule deletion of an evicted trade's discussion channel."""
+        trade_id = builder.trade_id
+        if not self.channel_tracker.get_channel_by_trade_id(trade_id):
+            return
+
+        if builder.awaiting_acceptance:
+            # GMs may still be negotiating in the channel; leave it for them to close
+            self.logger.warning(f"Keeping channel for trade {trade_id} evicted ({reason}) while awaiting acceptance")
+            return
+
+        guild = self.bot.get_guild(get_config().guild_id)
+        if guild is None:
+            self.logger.warning(f"Guild unavailable, leaving channel for evicted trade {trade_id}")
+            return
+
+        try:
+            task = asyncio.get_running_loop().create_task(
+                self.channel_manager.delete_trade_channel(guild=guild, trade_id=trade_id)
+            )
+        except RuntimeError:
+            self.logger.warning(f"No event loop to delete channel for evicted trade {trade_id}")
+            return
+        self._channel_cleanup_tasks.add(task)
+        task.add_done_callback(self._channel_cleanup_tasks.discard)
+        self.logger.info(f"Deleting channel for trade {trade_id} evicted ({reason})")
+
     # Create the trade command group
     trade_group = app_commands.Group(name="trade", description="Multi-team trade management")
 
@@ -86,6 +86,17 @@ class BotConfig(BaseSettings):
 
     # Google Sheets settings
     sheets_credentials_path: str = "/app/data/major-domo-service-creds.json"
+    sheets_rate_limit: float = 1.0  # Sustained background sheet reads per second
+    sheets_rate_burst: int = 5  # Reads allowed back-to-back before the rate applies
+
+    # Live scorebug refresh (live-sba-scores channel and voice channel statuses)
+    scorebug_max_concurrency: int = 4  # Scorecard reads in flight at once
+    scorebug_read_timeout: float = 20.0  # Seconds before a single scorecard read is abandoned
+    scorebug_snapshot_ttl: int = 60  # Seconds /scorebug serves the last read instead of re-reading
+    scorebug_poll_base_interval: int = 180  # Seconds between reads of a typical game
+    scorebug_poll_min_interval: int = 60  # Fastest a late, close, changing game is read
+    scorebug_poll_max_interval: int = 600  # Slowest a game that hasn't changed is read
+    scorebug_poll_budget: float = 20.0  # Scorecard reads per minute across all games
 
     # Draft Sheet settings (for writing picks to Google Sheets)
     # Sheet IDs can be overridden via environment variables: DRAFT_SHEET_KEY_12, DRAFT_SHEET_KEY_13, etc.
@@ -100,6 +111,33 @@ class BotConfig(BaseSettings):
     # Optional Redis caching settings
     redis_url: str = ""  # Empty string means no Redis caching
     redis_cache_ttl: int = 300  # 5 minutes default TTL
+
+    # In-process (L1) cache in front of Redis - holds constructed model objects.
+    # Unset follows Redis (on whenever redis_url is set); true/false forces it
+    cache_local_enabled: Optional[bool] = None
+    cache_local_max_entries: int = 2048
+
+    # League Current state snapshot (stale-while-revalidate)
+    current_state_ttl: int = 30  # Seconds a snapshot is served without refreshing
+    current_state_max_stale: int = 300  # Older snapshots are refreshed before returning
+
+    # Startup cache warm-up (teams, current state, standings, season players)
+    cache_warmup_enabled: bool = True
+    cache_warmup_budget: float = 8.0  # Seconds setup_hook waits before moving on
+
+    # Weekly transaction processing (freeze/thaw and /admin-process-transactions)
+    transaction_max_concurrency: int = 4  # Player updates in flight at once
+    transaction_rate_limit: float = 10.0  # Sustained player updates per second
+    transaction_rate_burst: int = 5  # Updates allowed back-to-back before the rate applies
+    transaction_journal_dir: str = "data/transaction_journal"  # Must be writable (data/ is mounted read-only in compose)
+
+    # Roster and pending-move data shared by transaction/trade builder validation
+    validation_context_ttl: int = 60  # Seconds a team's validation data is reused
+
+    # Interactive /dropadd, /ilmove and /trade sessions held in memory (per registry)
+    builder_idle_ttl: int = 3600  # Seconds an untouched session is kept
+    builder_max_entries: int = 200  # Sessions kept before the least recently used is evicted
+    builder_max_bytes: int = 32 * 1024 * 1024  # Approximate memory ceiling
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -16,6 +16,16 @@ class APIException(BotException):
     pass
 
 
+class APIUnavailableException(APIException):
+    """Raised for transient API failures (5xx responses, timeouts, connection errors)."""
+    pass
+
+
+class CircuitOpenException(APIUnavailableException):
+    """Raised when a request is rejected because the endpoint's circuit breaker is open."""
+    pass
+
+
 class PlayerNotFoundError(BotException):
     """Raised when a requested player cannot be found."""
     pass
@@ -141,72 +141,63 @@ class Team(SBABaseModel):
         # Unknown pattern, return as-is
         return self.abbrev
 
-    async def major_league_affiliate(self) -> 'Team':
+    async def _resolve_affiliate(self, roster_type: RosterType, affiliate_abbrev: str, label: str) -> 'Team':
         """
-        Get the major league team for this organization via API call.
-
-        Returns:
-            Team instance representing the major league affiliate
+        Resolve an affiliate from the organization registry.
 
-        Raises:
-            APIException: If the affiliate team cannot be found
+        Falls back to an API lookup by abbreviation if the registry cannot be
+        loaded or does not know this team.
         """
+        from services.organization_registry import organization_registry
         from services.team_service import team_service
 
-        base_abbrev = self._get_base_abbrev()
-        if base_abbrev == self.abbrev:
-            return self  # Already the major league team
+        if affiliate_abbrev == self.abbrev:
+            return self
 
-        team = await team_service.get_team_by_abbrev(base_abbrev, self.season)
+        organization = await organization_registry.get_organization(self.abbrev, self.season)
+        if organization is not None:
+            team = organization.team_for(roster_type)
+        else:
+            team = await team_service.get_team_by_abbrev(affiliate_abbrev, self.season)
         if team is None:
-            raise ValueError(f"Major league affiliate not found for team {self.abbrev} (looking for {base_abbrev})")
+            raise ValueError(f"{label} affiliate not found for team {self.abbrev} (looking for {affiliate_abbrev})")
         return team
 
-    async def minor_league_affiliate(self) -> 'Team':
+    async def major_league_affiliate(self) -> 'Team':
         """
-        Get the minor league team for this organization via API call.
+        Get the major league team for this organization.
 
         Returns:
-            Team instance representing the minor league affiliate
+            Team instance representing the major league affiliate
 
         Raises:
-            APIException: If the affiliate team cannot be found
+            ValueError: If the affiliate team cannot be found
         """
-        from services.team_service import team_service
+        return await self._resolve_affiliate(RosterType.MAJOR_LEAGUE, self._get_base_abbrev(), "Major league")
 
-        base_abbrev = self._get_base_abbrev()
-        mil_abbrev = f"{base_abbrev}MIL"
+    async def minor_league_affiliate(self) -> 'Team':
+        """
+        Get the minor league team for this organization.
 
-        if mil_abbrev == self.abbrev:
-            return self  # Already the minor league team
+        Returns:
+            Team instance representing the minor league affiliate
 
-        team = await team_service.get_team_by_abbrev(mil_abbrev, self.season)
-        if team is None:
-            raise ValueError(f"Minor league affiliate not found for team {self.abbrev} (looking for {mil_abbrev})")
-        return team
+        Raises:
+            ValueError: If the affiliate team cannot be found
+        """
+        return await self._resolve_affiliate(RosterType.MINOR_LEAGUE, f"{self._get_base_abbrev()}MIL", "Minor league")
 
     async def injured_list_affiliate(self) -> 'Team':
         """
-        Get the injured list team for this organization via API call.
+        Get the injured list team for this organization.
 
         Returns:
             Team instance representing the injured list affiliate
 
         Raises:
-            APIException: If the affiliate team cannot be found
+            ValueError: If the affiliate team cannot be found
         """
-        from services.team_service import team_service
-
-        base_abbrev = self._get_base_abbrev()
-        il_abbrev = f"{base_abbrev}IL"
-
-        if il_abbrev == self.abbrev:
-            return self  # Already the injured list team
-
-        team = await team_service.get_team_by_abbrev(il_abbrev, self.season)
-        if team is None:
-            raise ValueError(f"Injured list affiliate not found for team {self.abbrev} (looking for {il_abbrev})")
-        return team
+        return await self._resolve_affiliate(RosterType.INJURED_LIST, f"{self._get_base_abbrev()}IL", "Injured list")
 
     def is_same_organization(self, other_team: 'Team') -> bool:
         """
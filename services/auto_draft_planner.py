@@ -0,0 +1,168 @@
+"""
+Auto-draft planner for Discord Bot v2.0
+
+Works out, while a team is on the clock, which players from its draft list an
+auto-draft could take: the draft list and roster are fetched once, cap space is
+checked against a DraftCapState, and availability is checked against the draft
+board's set of drafted players. When the pick expires the monitor only has to
+re-filter the ranked candidates for players taken since and perform the writes.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from models.draft_pick import DraftPick
+from models.player import Player
+from utils.draft_helpers import DraftCapState
+
+logger = logging.getLogger(f'{__name__}.AutoDraftPlanner')
+
+
+@dataclass
+class AutoDraftPlan:
+    """Ranked auto-draft candidates for one pick."""
+    season: int
+    overall: int
+    team_id: int
+    list_size: int
+    list_version: Optional[int]
+    built_at: float
+    candidates: List[Player] = field(default_factory=list)
+    skipped: Dict[int, str] = field(default_factory=dict)
+
+    def available_candidates(self, taken: Set[int]) -> List[Player]:
+        """Get the candidates not drafted since the plan was built, in draft list order."""
+        return [player for player in self.candidates if player.id not in taken]
+
+
+class AutoDraftPlanner:
+    """Builds and holds the auto-draft plan for the pick on the clock."""
+
+    # Plans older than this are rebuilt before use
+    MAX_AGE = 45
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._plan: Optional[AutoDraftPlan] = None
+        self._building: Dict[Tuple[int, int, int], asyncio.Task] = {}
+
+    def clear(self) -> None:
+        """Forget the current plan."""
+        self._plan = None
+
+    async def get_plan(self, season: int, pick: DraftPick, refresh: bool = False) -> Optional[AutoDraftPlan]:
+        """
+        Get a current plan for a pick, building one if needed.
+
+        Concurrent callers for the same pick share one build, so the monitor can
+        start planning when a team goes on the clock and the expiry handler
+        simply waits for that result.
+
+        Args:
+            season: Draft season
+            pick: Pick to auto-draft (owner required)
+            refresh: Rebuild even if the held plan is still current
+
+        Returns:
+            AutoDraftPlan, or None if the roster couldn't be loaded
+        """
+        key = (season, pick.overall, pick.owner_id)
+        if not refresh and self._is_current(self._plan, key):
+            return self._plan
+
+        building = self._building.get(key)
+        if building is None:
+            building = asyncio.create_task(self._build_and_store(season, pick))
+            self._building[key] = building
+            building.add_done_callback(lambda _: self._building.pop(key, None))
+        return await asyncio.shield(building)
+
+    def _is_current(self, plan: Optional[AutoDraftPlan], key: Tuple[int, int, int]) -> bool:
+        from services.draft_list_service import draft_list_service
+
+        if plan is None or (plan.season, plan.overall, plan.team_id) != key:
+            return False
+        if self._clock() - plan.built_at >= self.MAX_AGE:
+            return False
+        # Draft list edited through the bot since the plan was built
+        return draft_list_service.list_version(plan.season, plan.team_id) == plan.list_version
+
+    async def _build_and_store(self, season: int, pick: DraftPick) -> Optional[AutoDraftPlan]:
+        try:
+            plan = await self.build_plan(season, pick)
+        except Exception as e:
+            logger.error(f"Error planning auto-draft for pick #{pick.overall}: {e}")
+            return None
+        if plan is not None:
+            self._plan = plan
+        return plan
+
+    async def build_plan(self, season: int, pick: DraftPick) -> Optional[AutoDraftPlan]:
+        """
+        Rank the legal candidates from a team's draft list.
+
+        Args:
+            season: Draft season
+            pick: Pick to plan for (owner required)
+
+        Returns:
+            AutoDraftPlan, or None if the roster couldn't be loaded
+        """
+        from config import get_config
+        from services.draft_board import draft_board
+        from services.draft_list_service import draft_list_service
+        from services.team_service import team_service
+
+        config = get_config()
+        team_id = pick.owner_id
+
+        draft_list, roster = await asyncio.gather(
+            draft_list_service.get_team_list(season, team_id),
+            team_service.get_team_roster(team_id, 'current')
+        )
+
+        if not roster:
+            logger.error(f"Could not get roster for team {team_id}")
+            return None
+
+        # Checked against the owning team's own cap, as /draft does (not the league default)
+        cap_state = DraftCapState(roster, pick.owner)
+        taken = draft_board.drafted_player_ids()
+
+        plan = AutoDraftPlan(
+            season=season,
+            overall=pick.overall,
+            team_id=team_id,
+            list_size=len(draft_list),
+            list_version=draft_list_service.list_version(season, team_id),
+            built_at=self._clock()
+        )
+
+        for entry in draft_list:
+            player = entry.player
+            if player is None:
+                continue
+
+            # Still a free agent and not selected on the board
+            if player.team_id != config.free_agent_team_id or player.id in taken:
+                plan.skipped[player.id] = "not available"
+                continue
+
+            is_valid, projected_total, _ = cap_state.check(player.wara)
+            if not is_valid:
+                plan.skipped[player.id] = f"over cap ({projected_total:.2f})"
+                continue
+
+            plan.candidates.append(player)
+
+        logger.debug(
+            f"Auto-draft plan for pick #{pick.overall} (team {team_id}): "
+            f"{len(plan.candidates)} candidates, {len(plan.skipped)} skipped"
+        )
+        return plan
+
+
+# Global planner instance
+auto_draft_planner = AutoDraftPlanner()
@@ -6,7 +6,7 @@ Provides common CRUD operations and error handling for all data services.
 import logging
 import hashlib
 import json
-from typing import Optional, Type, TypeVar, Generic, Dict, Any, List, Tuple
+from typing import Optional, Type, TypeVar, Generic, Dict, Any, List, Tuple, Callable, Iterable
 
 from api.client import get_global_client, APIClient
 from models.base import SBABaseModel
@@ -76,26 +76,46 @@ class BaseService(Generic[T]):
         
         return self.cache.cache_key("sba", f"{self.endpoint}_{key_hash}")
     
-    async def _get_cached_items(self, cache_key: str) -> Optional[List[T]]:
+    async def _get_cached_items(
+        self,
+        cache_key: str,
+        tags_for: Optional[Callable[[List[T]], Iterable[str]]] = None
+    ) -> Optional[List[T]]:
         """
         Get cached list of model items.
         
         Args:
             cache_key: Cache key to lookup
+            tags_for: Optional callable giving the L1 tags for items promoted from Redis
             
         Returns:
             List of model instances or None if not cached
         """
+        # L1: already-constructed models, no Redis round trip or validation
+        local_items = self.cache.get_local(cache_key)
+        if local_items is not None:
+            return list(local_items)
+        
         try:
-            cached_data = await self.cache.get(cache_key)
+            cached_data, remaining_ttl = await self.cache.get_with_ttl(cache_key)
             if cached_data and isinstance(cached_data, list):
-                return [self.model_class.from_api_data(item) for item in cached_data]
+                items = [self.model_class.from_api_data(item) for item in cached_data]
+                # Promote to L1 so it expires together with the Redis entry
+                tags = tags_for(items) if tags_for else ()
+                self.cache.set_local(cache_key, items, remaining_ttl, tags)
+                return list(items)
         except Exception as e:
             logger.warning(f"Error deserializing cached data for {cache_key}: {e}")
         
         return None
     
-    async def _cache_items(self, cache_key: str, items: List[T], ttl: Optional[int] = None) -> None:
+    async def _cache_items(
+        self,
+        cache_key: str,
+        items: List[T],
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = ()
+    ) -> None:
         """
         Cache list of model items.
         
@@ -103,14 +123,18 @@ class BaseService(Generic[T]):
             cache_key: Cache key to store under
             items: List of model instances to cache
             ttl: Optional TTL override
+            tags: Cache tags to register the entry under
         """
         if not items:
             return
+        
+        tags = tuple(tags)
+        self.cache.set_local(cache_key, list(items), ttl, tags)
             
         try:
             # Convert to JSON-serializable format
             cache_data = [item.model_dump() for item in items]
-            await self.cache.set(cache_key, cache_data, ttl)
+            await self.cache.set(cache_key, cache_data, ttl, tags)
         except Exception as e:
             logger.warning(f"Error caching items for {cache_key}: {e}")
     
@@ -0,0 +1,220 @@
+"""
+Draft board for Discord Bot v2.0
+
+In-memory copy of a season's draft picks, built from one
+get_picks_with_players() call and updated on every selection or clear made
+through DraftPickService. Answers "next unfilled pick", recent/upcoming picks
+and picks by round locally.
+
+Each lookup helper falls back to the equivalent DraftPickService query when the
+board cannot be loaded. The board is rebuilt after MAX_AGE seconds as a safety
+net against changes made outside the bot. Change callbacks run after every
+rebuild, selection or clear, so copies of state the draft affects (such as
+team draft lists) can be dropped.
+"""
+import asyncio
+import bisect
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from models.draft_pick import DraftPick
+from models.player import Player
+
+logger = logging.getLogger(f'{__name__}.DraftBoard')
+
+# Called with the season after the board is rebuilt or a pick changes
+ChangeCallback = Callable[[int], None]
+
+
+class DraftBoard:
+    """Season draft picks keyed by overall number, with a sorted index of unfilled picks."""
+
+    # Rebuild from the API after this many seconds
+    MAX_AGE = 300
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._load_lock = asyncio.Lock()
+        self._callbacks: List[ChangeCallback] = []
+        self.clear()
+
+    def add_change_callback(self, callback: ChangeCallback) -> None:
+        """Register a callback run after each board change."""
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def remove_change_callback(self, callback: ChangeCallback) -> None:
+        """Unregister a change callback."""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def _notify(self, season: int) -> None:
+        for callback in list(self._callbacks):
+            try:
+                callback(season)
+            except Exception as e:
+                logger.error(f"Draft board change callback failed for season {season}: {e}")
+
+    def clear(self) -> None:
+        """Drop the board so the next lookup reloads it."""
+        self.season: Optional[int] = None
+        self._loaded_at = 0.0
+        self._picks: Dict[int, DraftPick] = {}
+        self._unfilled: List[int] = []
+
+    def is_loaded(self, season: int) -> bool:
+        """Check whether the board holds a fresh copy of a season."""
+        return self.season == season and self._clock() - self._loaded_at < self.MAX_AGE
+
+    async def ensure_loaded(self, season: int) -> bool:
+        """
+        Load the season's picks if the board doesn't hold a fresh copy.
+
+        Args:
+            season: Draft season
+
+        Returns:
+            True if the board can answer lookups for the season
+        """
+        if self.is_loaded(season):
+            return True
+
+        async with self._load_lock:
+            if self.is_loaded(season):
+                return True
+            try:
+                from services.draft_pick_service import draft_pick_service
+                picks = await draft_pick_service.get_picks_with_players(season)
+            except Exception as e:
+                logger.warning(f"Could not load draft board for season {season}: {e}")
+                return False
+
+            if not picks:
+                return False
+
+            self.clear()
+            self.season = season
+            for pick in picks:
+                self._picks[pick.overall] = pick
+            self._unfilled = sorted(pick.overall for pick in picks if pick.player_id is None)
+            self._loaded_at = self._clock()
+            logger.info(
+                f"Loaded draft board for season {season}: {len(self._picks)} picks, "
+                f"{len(self._unfilled)} unfilled"
+            )
+            self._notify(season)
+            return True
+
+    def apply_pick(self, pick: DraftPick, player: Optional[Player] = None) -> None:
+        """
+        Record a selection or clear returned by the API.
+
+        Nested owner and player objects missing from the API response are kept
+        from the board's copy (or taken from `player`) so announcements can
+        still render names.
+
+        Args:
+            pick: Updated pick from a PATCH response
+            player: Selected player, if the caller has it
+        """
+        if self.season != pick.season:
+            self._notify(pick.season)
+            return
+
+        existing = self._picks.get(pick.overall)
+        updates = {}
+        if existing is not None:
+            if pick.owner is None and existing.owner is not None and existing.owner.id == pick.owner_id:
+                updates['owner'] = existing.owner
+            if (pick.origowner is None and existing.origowner is not None
+                    and existing.origowner.id == pick.origowner_id):
+                updates['origowner'] = existing.origowner
+
+        if pick.player_id is not None and pick.player is None:
+            if player is not None and player.id == pick.player_id:
+                updates['player'] = player
+            elif existing is not None and existing.player is not None and existing.player.id == pick.player_id:
+                updates['player'] = existing.player
+
+        self._picks[pick.overall] = pick.model_copy(update=updates) if updates else pick
+
+        position = bisect.bisect_left(self._unfilled, pick.overall)
+        is_listed = position < len(self._unfilled) and self._unfilled[position] == pick.overall
+        if pick.player_id is None and not is_listed:
+            self._unfilled.insert(position, pick.overall)
+        elif pick.player_id is not None and is_listed:
+            del self._unfilled[position]
+
+        self._notify(pick.season)
+
+    # Local lookups (board must be loaded)
+
+    def get(self, overall: int) -> Optional[DraftPick]:
+        """Get a pick by overall number."""
+        return self._picks.get(overall)
+
+    def next_unfilled(self, after_overall: int) -> Optional[DraftPick]:
+        """Get the first unfilled pick after an overall number."""
+        position = bisect.bisect_right(self._unfilled, after_overall)
+        if position < len(self._unfilled):
+            return self._picks[self._unfilled[position]]
+        return None
+
+    def recent(self, before_overall: int, limit: int = 5) -> List[DraftPick]:
+        """Get the last `limit` filled picks before an overall number, most recent first."""
+        picks = []
+        overall = before_overall - 1
+        while overall >= 1 and len(picks) < limit:
+            pick = self._picks.get(overall)
+            if pick is not None and pick.player_id is not None:
+                picks.append(pick)
+            overall -= 1
+        return picks
+
+    def drafted_player_ids(self) -> Set[int]:
+        """Get the IDs of every player already selected on the board."""
+        return {pick.player_id for pick in self._picks.values() if pick.player_id is not None}
+
+    def upcoming(self, after_overall: int, limit: int = 5) -> List[DraftPick]:
+        """Get the next `limit` picks after an overall number, in draft order."""
+        overalls = sorted(o for o in self._picks if o > after_overall)[:limit]
+        return [self._picks[o] for o in overalls]
+
+    def by_round(self, round_num: int) -> List[DraftPick]:
+        """Get every pick in a round, in draft order."""
+        return sorted((p for p in self._picks.values() if p.round == round_num), key=lambda p: p.overall)
+
+    # Lookups with API fallback
+
+    async def get_pick(self, season: int, overall: int) -> Optional[DraftPick]:
+        """Board-backed equivalent of DraftPickService.get_pick."""
+        from services.draft_pick_service import draft_pick_service
+        if await self.ensure_loaded(season) and overall in self._picks:
+            return self._picks[overall]
+        return await draft_pick_service.get_pick(season, overall)
+
+    async def get_recent_picks(self, season: int, before_overall: int, limit: int = 5) -> List[DraftPick]:
+        """Board-backed recent picks (filled picks before `before_overall`)."""
+        from services.draft_pick_service import draft_pick_service
+        if await self.ensure_loaded(season):
+            return self.recent(before_overall, limit)
+        return await draft_pick_service.get_recent_picks(season, before_overall - 1, limit=limit)
+
+    async def get_upcoming_picks(self, season: int, after_overall: int, limit: int = 5) -> List[DraftPick]:
+        """Board-backed equivalent of DraftPickService.get_upcoming_picks."""
+        from services.draft_pick_service import draft_pick_service
+        if await self.ensure_loaded(season):
+            return self.upcoming(after_overall, limit)
+        return await draft_pick_service.get_upcoming_picks(season, after_overall, limit=limit)
+
+    async def get_picks_by_round(self, season: int, round_num: int) -> List[DraftPick]:
+        """Board-backed equivalent of DraftPickService.get_picks_by_round (taken picks included)."""
+        from services.draft_pick_service import draft_pick_service
+        if await self.ensure_loaded(season):
+            return self.by_round(round_num)
+        return await draft_pick_service.get_picks_by_round(season, round_num, include_taken=True)
+
+
+# Global board instance
+draft_board = DraftBoard()
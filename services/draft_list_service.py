@@ -2,23 +2,117 @@
 Draft list service for Discord Bot v2.0
 
 Handles team draft list (auto-draft queue) operations. NO CACHING - lists change frequently.
+
+Each team's list is also kept locally as an ordered, versioned TeamDraftList.
+Mutations edit that local order and flush it with one POST: no GET beforehand
+while the local copy is fresh, no POST when nothing moved, and no verification
+GET when the entries are already known. Edits made while a flush is in flight
+are coalesced into the next flush. Every local copy for a season is dropped
+whenever the draft board changes (a pick is made or cleared, or the board is
+rebuilt), since a pick removes the player from other teams' lists server-side
+and the next bulk replace would otherwise put them back.
 """
+import asyncio
 import logging
-from typing import Optional, List
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from services.base_service import BaseService
+from services.draft_board import draft_board
 from models.draft_list import DraftList
+from models.player import Player
+from models.team import Team
 from exceptions import APIException
 
 logger = logging.getLogger(f'{__name__}.DraftListService')
 
 
+@dataclass
+class TeamDraftList:
+    """
+    Local ordered copy of one team's draft list.
+
+    `order` is the list of player IDs by rank; `version` increments on every
+    local edit and `synced_version` records the last version POSTed.
+    """
+    season: int
+    team_id: int
+    order: List[int] = field(default_factory=list)
+    entries: Dict[int, DraftList] = field(default_factory=dict)
+    synced_ranks: Dict[int, int] = field(default_factory=dict)
+    loaded_at: float = 0.0
+    version: int = 0
+    synced_version: int = 0
+    flush_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @classmethod
+    def from_entries(cls, season: int, team_id: int, entries: List[DraftList], loaded_at: float) -> 'TeamDraftList':
+        state = cls(season=season, team_id=team_id, loaded_at=loaded_at)
+        state.replace(entries)
+        return state
+
+    @property
+    def dirty(self) -> bool:
+        return self.version > self.synced_version
+
+    def replace(self, entries: List[DraftList]) -> None:
+        """Adopt entries read from (or echoed by) the API as the synced state."""
+        ordered = sorted(entries, key=lambda e: e.rank)
+        self.order = [e.player_id for e in ordered]
+        self.entries = {e.player_id: e for e in ordered}
+        self.synced_ranks = {player_id: rank for rank, player_id in enumerate(self.order, start=1)}
+        self.synced_version = self.version
+
+    def index_of(self, player_id: int) -> Optional[int]:
+        try:
+            return self.order.index(player_id)
+        except ValueError:
+            return None
+
+    def set_order(self, order: List[int]) -> None:
+        """Apply a local edit."""
+        self.order = order
+        self.version += 1
+
+    def rank_delta(self) -> Tuple[Dict[int, int], Set[int]]:
+        """
+        Compare the local order against the last synced ranks.
+
+        Returns:
+            (player_id -> new rank for entries added or moved, player IDs removed)
+        """
+        changed = {
+            player_id: rank
+            for rank, player_id in enumerate(self.order, start=1)
+            if self.synced_ranks.get(player_id) != rank
+        }
+        removed = set(self.synced_ranks) - set(self.order)
+        return changed, removed
+
+    def ranked_entries(self) -> Optional[List[DraftList]]:
+        """
+        Get the list as DraftList entries with current ranks.
+
+        Returns:
+            Entries in rank order, or None if an entry's player/team objects aren't known locally
+        """
+        result = []
+        for rank, player_id in enumerate(self.order, start=1):
+            entry = self.entries.get(player_id)
+            if entry is None:
+                return None
+            result.append(entry if entry.rank == rank else entry.model_copy(update={'rank': rank}))
+        return result
+
+
 class DraftListService(BaseService[DraftList]):
     """
     Service for draft list operations.
 
     IMPORTANT: This service does NOT use caching decorators because draft lists
-    change as users add/remove players from their auto-draft queues.
+    change as users add/remove players from their auto-draft queues. Reads always
+    hit the API; only mutations start from the local copy (see TeamDraftList).
 
     API QUIRK: GET endpoint returns items under 'picks' key, not 'draftlist'.
     POST endpoint expects items under 'draft_list' key.
@@ -31,11 +125,31 @@ class DraftListService(BaseService[DraftList]):
     - Clear entire draft list
     """
 
+    # Mutations reload the list from the API once the local copy is older than this
+    STATE_MAX_AGE = 120
+
     def __init__(self):
         """Initialize draft list service."""
         super().__init__(DraftList, 'draftlist')
+        self._lists: Dict[Tuple[int, int], TeamDraftList] = {}
+        self._clock = time.monotonic
         logger.debug("DraftListService initialized")
 
+    def invalidate(self, season: Optional[int] = None, team_id: Optional[int] = None) -> None:
+        """Drop local list copies (one team, one season, or all) so the next mutation reloads from the API."""
+        if season is None:
+            self._lists.clear()
+        elif team_id is None:
+            for key in [key for key in self._lists if key[0] == season]:
+                del self._lists[key]
+        else:
+            self._lists.pop((season, team_id), None)
+
+    def list_version(self, season: int, team_id: int) -> Optional[int]:
+        """Get the local edit version of a team's list (None if not held locally)."""
+        state = self._lists.get((season, team_id))
+        return state.version if state is not None else None
+
     def _extract_items_and_count_from_response(self, data):
         """
         Override to handle API quirk: GET returns 'picks' instead of 'draftlist'.
@@ -46,8 +160,6 @@ class DraftListService(BaseService[DraftList]):
         Returns:
             Tuple of (items list, total count)
         """
-        from typing import Any, Dict, List, Tuple
-
         if isinstance(data, list):
             return data, len(data)
 
@@ -65,6 +177,107 @@ class DraftListService(BaseService[DraftList]):
         # Fallback to standard extraction
         return super()._extract_items_and_count_from_response(data)
 
+    async def _fetch_team_list(self, season: int, team_id: int) -> List[DraftList]:
+        """GET a team's list, sorted by rank. Raises on API errors."""
+        params = [
+            ('season', str(season)),
+            ('team_id', str(team_id))
+            # NOTE: API does not support 'sort' param - results must be sorted client-side
+        ]
+
+        entries = await self.get_all_items(params=params)
+
+        # Sort by rank client-side (API doesn't support sort parameter)
+        entries.sort(key=lambda e: e.rank)
+
+        state = self._lists.get((season, team_id))
+        if state is None:
+            self._lists[(season, team_id)] = TeamDraftList.from_entries(season, team_id, entries, self._clock())
+        elif not state.dirty:
+            state.replace(entries)
+            state.loaded_at = self._clock()
+
+        return entries
+
+    async def _get_state(self, season: int, team_id: int) -> TeamDraftList:
+        """Get the local copy of a team's list, loading it if missing or stale."""
+        state = self._lists.get((season, team_id))
+        if state is not None and (state.dirty or self._clock() - state.loaded_at < self.STATE_MAX_AGE):
+            return state
+
+        await self._fetch_team_list(season, team_id)
+        return self._lists[(season, team_id)]
+
+    def _entries_from_response(self, response: Any) -> Optional[List[DraftList]]:
+        """Parse a POST response that echoes the list back; None if it doesn't."""
+        if not isinstance(response, (dict, list)):
+            return None
+        items, _ = self._extract_items_and_count_from_response(response)
+        try:
+            return [DraftList.from_api_data(item) for item in items if isinstance(item, dict)]
+        except Exception as e:
+            logger.debug(f"Draft list POST response is not a list echo: {e}")
+            return None
+
+    async def _flush(self, state: TeamDraftList) -> bool:
+        """
+        POST the local order if it differs from the last synced ranks.
+
+        Edits applied while an earlier flush holds the lock are sent together
+        by the first waiter; later waiters find nothing left to send.
+
+        Returns:
+            True if the server holds the local order
+        """
+        async with state.flush_lock:
+            if not state.dirty:
+                return True
+
+            version = state.version
+            order = list(state.order)
+            changed, removed = state.rank_delta()
+            if not changed and not removed:
+                state.synced_version = version
+                return True
+
+            draft_list_entries = [
+                {
+                    'season': state.season,
+                    'team_id': state.team_id,
+                    'player_id': player_id,
+                    'rank': rank
+                }
+                for rank, player_id in enumerate(order, start=1)
+            ]
+
+            # POST entire list (API only supports bulk replacement)
+            payload = {
+                'count': len(draft_list_entries),
+                'draft_list': draft_list_entries
+            }
+
+            try:
+                client = await self.get_client()
+                response = await client.post(self.endpoint, payload)
+            except Exception:
+                # Server state is unknown now - reload on next use
+                self.invalidate(state.season, state.team_id)
+                raise
+
+            logger.debug(
+                f"Flushed draft list v{version} for team {state.team_id}: "
+                f"{len(changed)} rank changes, {len(removed)} removals"
+            )
+
+            state.synced_ranks = {player_id: rank for rank, player_id in enumerate(order, start=1)}
+            state.synced_version = version
+
+            echoed = self._entries_from_response(response)
+            if echoed and not state.dirty and {e.player_id for e in echoed} == set(order):
+                state.replace(echoed)
+
+            return True
+
     async def get_team_list(
         self,
         season: int,
@@ -73,7 +286,8 @@ class DraftListService(BaseService[DraftList]):
         """
         Get team's draft list ordered by rank.
 
-        NOT cached - teams update their lists frequently during draft.
+        NOT cached - teams update their lists frequently during draft. The result
+        also refreshes the local copy used by mutations.
 
         Args:
             season: Draft season
@@ -83,17 +297,7 @@ class DraftListService(BaseService[DraftList]):
             List of DraftList entries ordered by rank (1 = highest priority)
         """
         try:
-            params = [
-                ('season', str(season)),
-                ('team_id', str(team_id))
-                # NOTE: API does not support 'sort' param - results must be sorted client-side
-            ]
-
-            entries = await self.get_all_items(params=params)
-
-            # Sort by rank client-side (API doesn't support sort parameter)
-            entries.sort(key=lambda e: e.rank)
-
+            entries = await self._fetch_team_list(season, team_id)
             logger.debug(f"Found {len(entries)} draft list entries for team {team_id}")
             return entries
 
@@ -106,91 +310,61 @@ class DraftListService(BaseService[DraftList]):
         season: int,
         team_id: int,
         player_id: int,
-        rank: Optional[int] = None
+        rank: Optional[int] = None,
+        player: Optional[Player] = None,
+        team: Optional[Team] = None
     ) -> Optional[List[DraftList]]:
         """
         Add player to team's draft list.
 
         If rank is not provided, adds to end of list.
 
-        NOTE: The API uses bulk replacement - we get the full list, add the new entry,
-        and POST the entire updated list back.
+        NOTE: The API uses bulk replacement - the new entry is inserted into the
+        local order and the entire list is POSTed back. The list is only read
+        back afterwards if the new entry's player/team objects aren't known.
 
         Args:
             season: Draft season
             team_id: Team ID
             player_id: Player ID to add
             rank: Priority rank (1 = highest), None = add to end
+            player: Player being added (avoids reading the list back)
+            team: Team owning the list (avoids reading the list back)
 
         Returns:
             Full updated draft list or None if operation failed
         """
         try:
-            # Get current list
-            current_list = await self.get_team_list(season, team_id)
-
-            # If rank not provided, add to end
-            if rank is None:
-                rank = len(current_list) + 1
-
-            # Create new entry data
-            new_entry_data = {
-                'season': season,
-                'team_id': team_id,
-                'player_id': player_id,
-                'rank': rank
-            }
+            state = await self._get_state(season, team_id)
 
-            # Build complete list for bulk replacement
-            draft_list_entries = []
-
-            # Add existing entries, adjusting ranks if inserting in middle
-            for entry in current_list:
-                if entry.rank >= rank:
-                    # Shift down entries at or after insertion point
-                    draft_list_entries.append({
-                        'season': entry.season,
-                        'team_id': entry.team_id,
-                        'player_id': entry.player_id,
-                        'rank': entry.rank + 1
-                    })
-                else:
-                    # Keep existing rank for entries before insertion point
-                    draft_list_entries.append({
-                        'season': entry.season,
-                        'team_id': entry.team_id,
-                        'player_id': entry.player_id,
-                        'rank': entry.rank
-                    })
-
-            # Add new entry
-            draft_list_entries.append(new_entry_data)
-
-            # Sort by rank for consistency
-            draft_list_entries.sort(key=lambda x: x['rank'])
-
-            # POST entire list (bulk replacement)
-            client = await self.get_client()
-            payload = {
-                'count': len(draft_list_entries),
-                'draft_list': draft_list_entries
-            }
+            if state.index_of(player_id) is None:
+                # If rank not provided, add to end
+                position = len(state.order) if rank is None else min(max(rank - 1, 0), len(state.order))
+                order = list(state.order)
+                order.insert(position, player_id)
 
-            logger.debug(f"Posting draft list for team {team_id}: {len(draft_list_entries)} entries")
-            response = await client.post(self.endpoint, payload)
-            logger.debug(f"POST response: {response}")
+                if player is not None and team is not None and player.id == player_id:
+                    state.entries[player_id] = DraftList(season=season, rank=position + 1, team=team, player=player)
 
-            # Verify by fetching the list back (API returns full objects)
-            verification = await self.get_team_list(season, team_id)
-            logger.debug(f"Verification: found {len(verification)} entries after POST")
+                state.set_order(order)
+                await self._flush(state)
+            else:
+                logger.warning(f"Player {player_id} already in team {team_id} draft list")
+
+            updated = state.ranked_entries()
+            if updated is None:
+                # Verify by fetching the list back (API returns full objects)
+                updated = await self._fetch_team_list(season, team_id)
+                logger.debug(f"Verification: found {len(updated)} entries after POST")
 
             # Verify the player was added
-            if not any(entry.player_id == player_id for entry in verification):
+            added = next((entry for entry in updated if entry.player_id == player_id), None)
+            if added is None:
                 logger.error(f"Player {player_id} not found in list after POST - operation may have failed")
                 return None
 
-            logger.info(f"Added player {player_id} to team {team_id} draft list at rank {rank}")
-            return verification  # Return full updated list
+            logger.info(f"Added player {player_id} to team {team_id} draft list at rank {added.rank}")
+            return updated  # Return full updated list
 
         except Exception as e:
             logger.error(f"Error adding player {player_id} to draft list: {e}")
@@ -223,7 +397,8 @@ class DraftListService(BaseService[DraftList]):
         """
         Remove specific player from team's draft list.
 
-        Uses bulk replacement pattern - gets full list, removes player, POSTs updated list.
+        Uses bulk replacement pattern - removes the player from the local order,
+        re-normalizes ranks and POSTs the updated list.
 
         Args:
             season: Draft season
@@ -234,38 +409,18 @@ class DraftListService(BaseService[DraftList]):
             True if player was found and removed
         """
         try:
-            # Get team's list
-            current_list = await self.get_team_list(season, team_id)
+            state = await self._get_state(season, team_id)
 
             # Check if player is in list
-            player_found = any(entry.player_id == player_id for entry in current_list)
-            if not player_found:
+            if state.index_of(player_id) is None:
                 logger.warning(f"Player {player_id} not found in team {team_id} draft list")
                 return False
 
-            # Build new list without the player, adjusting ranks
-            draft_list_entries = []
-            new_rank = 1
-            for entry in current_list:
-                if entry.player_id != player_id:
-                    draft_list_entries.append({
-                        'season': entry.season,
-                        'team_id': entry.team_id,
-                        'player_id': entry.player_id,
-                        'rank': new_rank
-                    })
-                    new_rank += 1
-
-            # POST updated list (bulk replacement)
-            client = await self.get_client()
-            payload = {
-                'count': len(draft_list_entries),
-                'draft_list': draft_list_entries
-            }
+            state.set_order([pid for pid in state.order if pid != player_id])
+            state.entries.pop(player_id, None)
+            await self._flush(state)
 
-            await client.post(self.endpoint, payload)
             logger.info(f"Removed player {player_id} from team {team_id} draft list")
-
             return True
 
         except Exception as e:
@@ -291,16 +446,23 @@ class DraftListService(BaseService[DraftList]):
         """
         try:
             # Check if list is already empty
-            entries = await self.get_team_list(season, team_id)
-            if not entries:
+            state = await self._get_state(season, team_id)
+            if not state.order:
                 logger.debug(f"No draft list entries to clear for team {team_id}")
                 return True
 
-            entry_count = len(entries)
+            entry_count = len(state.order)
 
             # Use DELETE endpoint: /draftlist/team/{team_id}
-            client = await self.get_client()
-            await client.delete(f"{self.endpoint}/team/{team_id}")
+            async with state.flush_lock:
+                try:
+                    client = await self.get_client()
+                    await client.delete(f"{self.endpoint}/team/{team_id}")
+                except Exception:
+                    self.invalidate(season, team_id)
+                    raise
+                state.version += 1
+                state.replace([])
 
             logger.info(f"Cleared {entry_count} draft list entries for team {team_id}")
 
@@ -319,7 +481,8 @@ class DraftListService(BaseService[DraftList]):
         """
         Reorder team's draft list.
 
-        Uses bulk replacement pattern - builds new list with updated ranks and POSTs it.
+        Uses bulk replacement pattern - applies the new order locally and POSTs
+        it. Nothing is sent if no rank changes.
 
         Args:
             season: Draft season
@@ -330,35 +493,17 @@ class DraftListService(BaseService[DraftList]):
             True if reordering succeeded
         """
         try:
-            # Get current list
-            entries = await self.get_team_list(season, team_id)
+            state = await self._get_state(season, team_id)
 
-            # Build mapping of player_id -> entry
-            entry_map = {e.player_id: e for e in entries}
-
-            # Build new list in specified order
-            draft_list_entries = []
-            for new_rank, player_id in enumerate(new_order, start=1):
-                if player_id not in entry_map:
+            order = []
+            for player_id in new_order:
+                if state.index_of(player_id) is None:
                     logger.warning(f"Player {player_id} not in draft list, skipping")
                     continue
+                order.append(player_id)
 
-                entry = entry_map[player_id]
-                draft_list_entries.append({
-                    'season': entry.season,
-                    'team_id': entry.team_id,
-                    'player_id': entry.player_id,
-                    'rank': new_rank
-                })
-
-            # POST reordered list (bulk replacement)
-            client = await self.get_client()
-            payload = {
-                'count': len(draft_list_entries),
-                'draft_list': draft_list_entries
-            }
-
-            await client.post(self.endpoint, payload)
+            state.set_order(order)
+            await self._flush(state)
             logger.info(f"Reordered draft list for team {team_id}")
 
             return True
@@ -367,6 +512,33 @@ class DraftListService(BaseService[DraftList]):
             logger.error(f"Error reordering draft list for team {team_id}: {e}")
             return False
 
+    async def _move_entry(self, season: int, team_id: int, player_id: int, offset: int) -> bool:
+        """Swap a player with its neighbour `offset` places away and flush."""
+        state = await self._get_state(season, team_id)
+
+        # Find player's current position
+        index = state.index_of(player_id)
+        if index is None:
+            logger.warning(f"Player {player_id} not found in draft list")
+            return False
+
+        target = index + offset
+        if target < 0:
+            logger.debug(f"Player {player_id} already at top of draft list")
+            return False
+        if target >= len(state.order):
+            logger.debug(f"Player {player_id} already at bottom of draft list")
+            return False
+
+        order = list(state.order)
+        order[index], order[target] = order[target], order[index]
+        state.set_order(order)
+        await self._flush(state)
+
+        direction = "up" if offset < 0 else "down"
+        logger.info(f"Moved player {player_id} {direction} to rank {target + 1}")
+        return True
+
     async def move_entry_up(
         self,
         season: int,
@@ -376,7 +548,7 @@ class DraftListService(BaseService[DraftList]):
         """
         Move player up one position in draft list (higher priority).
 
-        Uses bulk replacement pattern - swaps ranks and POSTs updated list.
+        Uses bulk replacement pattern - swaps ranks locally and POSTs updated list.
 
         Args:
             season: Draft season
@@ -387,63 +559,7 @@ class DraftListService(BaseService[DraftList]):
             True if move succeeded
         """
         try:
-            entries = await self.get_team_list(season, team_id)
-
-            # Find player's current position
-            current_entry = None
-            for entry in entries:
-                if entry.player_id == player_id:
-                    current_entry = entry
-                    break
-
-            if not current_entry:
-                logger.warning(f"Player {player_id} not found in draft list")
-                return False
-
-            if current_entry.rank == 1:
-                logger.debug(f"Player {player_id} already at top of draft list")
-                return False
-
-            # Find entry above (rank - 1)
-            above_entry = next((e for e in entries if e.rank == current_entry.rank - 1), None)
-            if not above_entry:
-                logger.error(f"Could not find entry above rank {current_entry.rank}")
-                return False
-
-            # Build new list with swapped ranks
-            draft_list_entries = []
-            for entry in entries:
-                if entry.player_id == current_entry.player_id:
-                    # Move this player up
-                    new_rank = current_entry.rank - 1
-                elif entry.player_id == above_entry.player_id:
-                    # Move above player down
-                    new_rank = above_entry.rank + 1
-                else:
-                    # Keep existing rank
-                    new_rank = entry.rank
-
-                draft_list_entries.append({
-                    'season': entry.season,
-                    'team_id': entry.team_id,
-                    'player_id': entry.player_id,
-                    'rank': new_rank
-                })
-
-            # Sort by rank
-            draft_list_entries.sort(key=lambda x: x['rank'])
-
-            # POST updated list (bulk replacement)
-            client = await self.get_client()
-            payload = {
-                'count': len(draft_list_entries),
-                'draft_list': draft_list_entries
-            }
-
-            await client.post(self.endpoint, payload)
-            logger.info(f"Moved player {player_id} up to rank {current_entry.rank - 1}")
-
-            return True
+            return await self._move_entry(season, team_id, player_id, -1)
 
         except Exception as e:
             logger.error(f"Error moving player {player_id} up in draft list: {e}")
@@ -458,7 +574,7 @@ class DraftListService(BaseService[DraftList]):
         """
         Move player down one position in draft list (lower priority).
 
-        Uses bulk replacement pattern - swaps ranks and POSTs updated list.
+        Uses bulk replacement pattern - swaps ranks locally and POSTs updated list.
 
         Args:
             season: Draft season
@@ -469,63 +585,7 @@ class DraftListService(BaseService[DraftList]):
             True if move succeeded
         """
         try:
-            entries = await self.get_team_list(season, team_id)
-
-            # Find player's current position
-            current_entry = None
-            for entry in entries:
-                if entry.player_id == player_id:
-                    current_entry = entry
-                    break
-
-            if not current_entry:
-                logger.warning(f"Player {player_id} not found in draft list")
-                return False
-
-            if current_entry.rank == len(entries):
-                logger.debug(f"Player {player_id} already at bottom of draft list")
-                return False
-
-            # Find entry below (rank + 1)
-            below_entry = next((e for e in entries if e.rank == current_entry.rank + 1), None)
-            if not below_entry:
-                logger.error(f"Could not find entry below rank {current_entry.rank}")
-                return False
-
-            # Build new list with swapped ranks
-            draft_list_entries = []
-            for entry in entries:
-                if entry.player_id == current_entry.player_id:
-                    # Move this player down
-                    new_rank = current_entry.rank + 1
-                elif entry.player_id == below_entry.player_id:
-                    # Move below player up
-                    new_rank = below_entry.rank - 1
-                else:
-                    # Keep existing rank
-                    new_rank = entry.rank
-
-                draft_list_entries.append({
-                    'season': entry.season,
-                    'team_id': entry.team_id,
-                    'player_id': entry.player_id,
-                    'rank': new_rank
-                })
-
-            # Sort by rank
-            draft_list_entries.sort(key=lambda x: x['rank'])
-
-            # POST updated list (bulk replacement)
-            client = await self.get_client()
-            payload = {
-                'count': len(draft_list_entries),
-                'draft_list': draft_list_entries
-            }
-
-            await client.post(self.endpoint, payload)
-            logger.info(f"Moved player {player_id} down to rank {current_entry.rank + 1}")
-
-            return True
+            return await self._move_entry(season, team_id, player_id, 1)
 
         except Exception as e:
             logger.error(f"Error moving player {player_id} down in draft list: {e}")
@@ -534,3 +594,6 @@ class DraftListService(BaseService[DraftList]):
 
 # Global service instance
 draft_list_service = DraftListService()
+
+# Picks change lists server-side; never bulk-replace from a copy older than the last pick
+draft_board.add_change_callback(lambda season: draft_list_service.invalidate(season))
@@ -7,7 +7,9 @@ import logging
 from typing import Optional, List
 
 from services.base_service import BaseService
+from services.draft_board import draft_board
 from models.draft_pick import DraftPick
+from models.player import Player
 from exceptions import APIException
 
 logger = logging.getLogger(f'{__name__}.DraftPickService')
@@ -357,7 +359,8 @@ class DraftPickService(BaseService[DraftPick]):
     async def update_pick_selection(
         self,
         pick_id: int,
-        player_id: int
+        player_id: int,
+        player: Optional[Player] = None
     ) -> Optional[DraftPick]:
         """
         Update a pick with player selection.
@@ -365,9 +368,12 @@ class DraftPickService(BaseService[DraftPick]):
         NOTE: The API PATCH endpoint requires the full DraftPickModel body,
         so we must first GET the pick, then send the complete model back.
 
+        The selection is also recorded on the in-memory draft board.
+
         Args:
             pick_id: Draft pick database ID
             player_id: Player ID being selected
+            player: Selected player, kept on the draft board for announcements
 
         Returns:
             Updated DraftPick instance or None if update failed
@@ -392,6 +398,7 @@ class DraftPickService(BaseService[DraftPick]):
 
             if updated_pick:
                 logger.info(f"Updated pick #{pick_id} with player {player_id}")
+                draft_board.apply_pick(updated_pick, player)
             else:
                 logger.error(f"Failed to update pick #{pick_id}")
 
@@ -408,6 +415,8 @@ class DraftPickService(BaseService[DraftPick]):
         NOTE: The API PATCH endpoint requires the full DraftPickModel body,
         so we must first GET the pick, then send the complete model back.
 
+        The cleared pick is also recorded on the in-memory draft board.
+
         Args:
             pick_id: Draft pick database ID
 
@@ -434,6 +443,7 @@ class DraftPickService(BaseService[DraftPick]):
 
             if updated_pick:
                 logger.info(f"Cleared player selection from pick #{pick_id}")
+                draft_board.apply_pick(updated_pick)
             else:
                 logger.error(f"Failed to clear pick #{pick_id}")
 
@@ -4,10 +4,11 @@ Draft service for Discord Bot v2.0
 Core draft business logic and state management. NO CACHING - draft state changes constantly.
 """
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List
 from datetime import datetime, timedelta
 
 from services.base_service import BaseService
+from services.draft_board import draft_board
 from models.draft_data import DraftData
 from exceptions import APIException
 
@@ -26,13 +27,40 @@ class DraftService(BaseService[DraftData]):
     - Timer management (start/stop)
     - Pick advancement
     - Draft state validation
+    - Update listeners (e.g. the draft monitor re-arms its deadline timers)
     """
 
     def __init__(self):
         """Initialize draft service."""
         super().__init__(DraftData, 'draftdata')
+        self._update_listeners: List[Callable[[DraftData], None]] = []
         logger.debug("DraftService initialized")
 
+    def add_update_listener(self, listener: Callable[[DraftData], None]) -> None:
+        """
+        Register a callback invoked with the new DraftData after every successful update.
+
+        Picks, pauses, resumes, timer and deadline changes all go through
+        update_draft_data(), so listeners see every state change made by the bot.
+
+        Args:
+            listener: Synchronous callable; must not block
+        """
+        if listener not in self._update_listeners:
+            self._update_listeners.append(listener)
+
+    def remove_update_listener(self, listener: Callable[[DraftData], None]) -> None:
+        """Unregister a callback added with add_update_listener()."""
+        if listener in self._update_listeners:
+            self._update_listeners.remove(listener)
+
+    def _notify_update(self, draft_data: DraftData) -> None:
+        for listener in list(self._update_listeners):
+            try:
+                listener(draft_data)
+            except Exception as e:
+                logger.error(f"Draft update listener failed: {e}")
+
     async def get_draft_data(self) -> Optional[DraftData]:
         """
         Get current draft configuration and state.
@@ -83,6 +111,7 @@ class DraftService(BaseService[DraftData]):
 
             if updated:
                 logger.info(f"Updated draft data: {updates}")
+                self._notify_update(updated)
             else:
                 logger.error(f"Failed to update draft data with {updates}")
 
@@ -154,7 +183,8 @@ class DraftService(BaseService[DraftData]):
         """
         Advance to next pick in draft.
 
-        Automatically skips picks that have already been filled (player selected).
+        Automatically skips picks that have already been filled (player selected),
+        using the in-memory draft board rather than one API read per pick.
         Posts round announcement when entering new round.
 
         Args:
@@ -165,32 +195,18 @@ class DraftService(BaseService[DraftData]):
             Updated DraftData with new currentpick
         """
         try:
-            from services.draft_pick_service import draft_pick_service
             from config import get_config
 
             config = get_config()
             season = config.sba_season
             total_picks = config.draft_total_picks
 
-            # Start with next pick
-            next_pick = current_pick + 1
-
-            # Keep advancing until we find an unfilled pick or reach end
-            while next_pick <= total_picks:
-                pick = await draft_pick_service.get_pick(season, next_pick)
-
-                if not pick:
-                    logger.error(f"Pick #{next_pick} not found in database")
-                    break
-
-                # If pick has no player, this is the next pick to make
-                if pick.player_id is None:
-                    logger.info(f"Advanced to pick #{next_pick}")
-                    break
-
-                # Pick already filled, continue to next
-                logger.debug(f"Pick #{next_pick} already filled, skipping")
-                next_pick += 1
+            # Find the next unfilled pick on the in-memory board; fall back to
+            # walking pick by pick if the board can't be loaded
+            if await draft_board.ensure_loaded(season):
+                next_pick = await self._next_unfilled_from_board(season, current_pick, total_picks)
+            else:
+                next_pick = await self._next_unfilled_from_api(season, current_pick, total_picks)
 
             # Check if draft is complete
             if next_pick > total_picks:
@@ -220,6 +236,64 @@ class DraftService(BaseService[DraftData]):
             logger.error(f"Error advancing draft pick: {e}")
             return None
 
+    async def _next_unfilled_from_board(self, season: int, current_pick: int, total_picks: int) -> int:
+        """
+        Get the next unfilled overall pick from the draft board.
+
+        The candidate is confirmed with a single API read, so a pick filled
+        outside the bot is recorded on the board and skipped.
+
+        Returns:
+            Next unfilled overall pick, or total_picks + 1 if the draft is complete
+        """
+        from services.draft_pick_service import draft_pick_service
+
+        after = current_pick
+        while True:
+            candidate = draft_board.next_unfilled(after)
+            if candidate is None or candidate.overall > total_picks:
+                return total_picks + 1
+
+            confirmed = await draft_pick_service.get_pick(season, candidate.overall)
+            if confirmed is None or confirmed.player_id is None:
+                logger.info(f"Advanced to pick #{candidate.overall}")
+                return candidate.overall
+
+            logger.debug(f"Pick #{candidate.overall} was filled outside the board, skipping")
+            draft_board.apply_pick(confirmed)
+            after = candidate.overall
+
+    async def _next_unfilled_from_api(self, season: int, current_pick: int, total_picks: int) -> int:
+        """
+        Get the next unfilled overall pick by querying picks one at a time.
+
+        Returns:
+            Next unfilled overall pick, or total_picks + 1 if the draft is complete
+        """
+        from services.draft_pick_service import draft_pick_service
+
+        # Start with next pick
+        next_pick = current_pick + 1
+
+        # Keep advancing until we find an unfilled pick or reach end
+        while next_pick <= total_picks:
+            pick = await draft_pick_service.get_pick(season, next_pick)
+
+            if not pick:
+                logger.error(f"Pick #{next_pick} not found in database")
+                break
+
+            # If pick has no player, this is the next pick to make
+            if pick.player_id is None:
+                logger.info(f"Advanced to pick #{next_pick}")
+                break
+
+            # Pick already filled, continue to next
+            logger.debug(f"Pick #{next_pick} already filled, skipping")
+            next_pick += 1
+
+        return next_pick
+
     async def set_current_pick(
         self,
         draft_id: int,
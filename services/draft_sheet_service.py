@@ -3,9 +3,19 @@ Draft Sheet Service
 
 Handles writing draft picks to Google Sheets for public tracking.
 Extends SheetsService to reuse authentication and async patterns.
+
+Picks made during the draft go through a write-behind queue: enqueue_pick()
+returns immediately, and a background flusher writes pending picks as
+contiguous row ranges after a short delay (or as soon as enough picks are
+waiting). Failed writes are retried with backoff. The queue is saved to a
+JSON file so picks not yet written survive a restart.
 """
 import asyncio
-from typing import List, Optional, Tuple
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from config import get_config
 from exceptions import SheetsException
@@ -13,21 +23,342 @@ from services.sheets_service import SheetsService
 from utils.logging import get_contextual_logger
 
 
+FailureCallback = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class PendingPickWrite:
+    """A draft pick row waiting to be written to the sheet."""
+    season: int
+    overall: int
+    orig_owner_abbrev: str
+    owner_abbrev: str
+    player_name: str
+    swar: float
+    attempts: int = 0
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        return (self.season, self.overall)
+
+    def values(self) -> List[Any]:
+        """Row values for columns D-G."""
+        return [self.orig_owner_abbrev, self.owner_abbrev, self.player_name, self.swar]
+
+
 class DraftSheetService(SheetsService):
     """Service for writing draft picks to Google Sheets."""
 
-    def __init__(self, credentials_path: Optional[str] = None):
+    # Seconds to gather picks before a queued flush
+    FLUSH_DELAY = 2.0
+    # Pending picks that trigger an immediate flush
+    FLUSH_THRESHOLD = 16
+    # Backoff after each failed attempt; picks are dropped after the last one
+    RETRY_DELAYS = (5.0, 15.0, 60.0)
+
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        queue_file: Optional[str] = "data/draft_sheet_queue.json"
+    ):
         """
         Initialize draft sheet service.
 
         Args:
             credentials_path: Path to service account credentials JSON
                              If None, will use path from config
+            queue_file: JSON file holding unwritten queued picks (None disables persistence)
         """
         super().__init__(credentials_path)
         self.logger = get_contextual_logger(f'{__name__}.DraftSheetService')
         self._config = get_config()
 
+        # Open worksheet handles by sheet key
+        self._worksheets: Dict[str, Any] = {}
+
+        # Write-behind queue
+        self.queue_file = Path(queue_file) if queue_file else None
+        self._pending: Dict[Tuple[int, int], PendingPickWrite] = {}
+        self._failure_callbacks: Dict[Tuple[int, int], FailureCallback] = {}
+        self._flush_due: Optional[float] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._load_queue()
+
+    async def _get_worksheet(self, sheet_key: str):
+        """
+        Get the draft worksheet for a sheet key, opening it on first use.
+
+        Handles are kept open between writes; callers drop them with
+        `self._worksheets.pop(sheet_key, None)` when a write fails.
+        """
+        worksheet = self._worksheets.get(sheet_key)
+        if worksheet is not None:
+            return worksheet
+
+        loop = asyncio.get_event_loop()
+
+        # Get pygsheets client
+        sheets = await loop.run_in_executor(None, self._get_client)
+
+        # Open the draft sheet by key
+        spreadsheet = await loop.run_in_executor(
+            None,
+            sheets.open_by_key,
+            sheet_key
+        )
+
+        # Get the worksheet
+        worksheet = await loop.run_in_executor(
+            None,
+            spreadsheet.worksheet_by_title,
+            self._config.draft_sheet_worksheet
+        )
+
+        self._worksheets[sheet_key] = worksheet
+        return worksheet
+
+    # ==================== Write-behind queue ====================
+
+    @property
+    def pending_count(self) -> int:
+        """Number of picks waiting to be written."""
+        return len(self._pending)
+
+    def enqueue_pick(
+        self,
+        season: int,
+        overall: int,
+        orig_owner_abbrev: str,
+        owner_abbrev: str,
+        player_name: str,
+        swar: float,
+        on_failure: Optional[FailureCallback] = None
+    ) -> bool:
+        """
+        Queue a draft pick for writing without waiting on Google Sheets.
+
+        A later pick for the same overall replaces the queued row.
+
+        Args:
+            season: Draft season number
+            overall: Overall pick number
+            orig_owner_abbrev: Original owner team abbreviation
+            owner_abbrev: Current owner team abbreviation
+            player_name: Name of the drafted player
+            swar: Player's sWAR value
+            on_failure: Coroutine function awaited if the pick is dropped after all retries
+
+        Returns:
+            True if the pick was queued, False if sheet writes are disabled or unconfigured
+        """
+        if not self._config.draft_sheet_enabled:
+            self.logger.debug("Draft sheet writes are disabled")
+            return False
+
+        if not self._config.get_draft_sheet_key(season):
+            self.logger.warning(f"No draft sheet configured for season {season}")
+            return False
+
+        row = PendingPickWrite(season, overall, orig_owner_abbrev, owner_abbrev, player_name, swar)
+        self._pending[row.key] = row
+        if on_failure is not None:
+            self._failure_callbacks[row.key] = on_failure
+        else:
+            self._failure_callbacks.pop(row.key, None)
+        self._save_queue()
+
+        immediate = len(self._pending) >= self.FLUSH_THRESHOLD
+        self._schedule_flush(0 if immediate else self.FLUSH_DELAY)
+        self.logger.debug(f"Queued pick {overall} for draft sheet", season=season, pending=len(self._pending))
+        return True
+
+    def resume_pending(self) -> None:
+        """Schedule a flush for picks loaded from the queue file at startup."""
+        if self._pending:
+            self.logger.info(f"Resuming {len(self._pending)} queued draft sheet writes")
+            self._schedule_flush(0)
+
+    def _schedule_flush(self, delay: float) -> None:
+        """Bring the next flush forward to `delay` seconds from now and make sure the flusher is running."""
+        due = time.monotonic() + delay
+        if self._flush_due is None or due < self._flush_due:
+            self._flush_due = due
+        self._wake.set()
+
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run_flusher())
+
+    async def _run_flusher(self) -> None:
+        """Flush pending picks whenever a flush falls due, until the queue is empty."""
+        while self._pending:
+            if self._flush_due is None:
+                self._flush_due = time.monotonic() + self.FLUSH_DELAY
+
+            delay = self._flush_due - time.monotonic()
+            if delay > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self._flush_due = None
+            all_written = await self.flush()
+            if not all_written and self._pending:
+                retry_at = time.monotonic() + self._retry_delay()
+                self._flush_due = max(self._flush_due or 0.0, retry_at)
+
+    def _retry_delay(self) -> float:
+        attempts = max((row.attempts for row in self._pending.values()), default=1)
+        return self.RETRY_DELAYS[min(max(attempts, 1), len(self.RETRY_DELAYS)) - 1]
+
+    @staticmethod
+    def coalesce_runs(rows: List[PendingPickWrite]) -> List[List[PendingPickWrite]]:
+        """
+        Split pending rows into runs of consecutive picks within a season.
+
+        Each run is written with one update_values call.
+
+        Args:
+            rows: Pending rows in any order
+
+        Returns:
+            Runs ordered by season and overall
+        """
+        runs: List[List[PendingPickWrite]] = []
+        for row in sorted(rows, key=lambda r: r.key):
+            previous = runs[-1][-1] if runs else None
+            if previous is not None and previous.season == row.season and previous.overall + 1 == row.overall:
+                runs[-1].append(row)
+            else:
+                runs.append([row])
+        return runs
+
+    async def flush(self) -> bool:
+        """
+        Write every pending pick now.
+
+        Picks that fail stay queued (with their attempt count raised) until the
+        retry limit, after which they are dropped and their failure callbacks run.
+
+        Returns:
+            True if every pending pick was written
+        """
+        async with self._flush_lock:
+            rows = list(self._pending.values())
+            if not rows:
+                return True
+
+            all_written = True
+            exhausted: List[PendingPickWrite] = []
+            for run in self.coalesce_runs(rows):
+                written = await self._write_run(run)
+                all_written = all_written and written
+
+                for row in run:
+                    # Skip rows replaced by a newer enqueue while writing
+                    if self._pending.get(row.key) is not row:
+                        continue
+                    if written:
+                        del self._pending[row.key]
+                        self._failure_callbacks.pop(row.key, None)
+                        continue
+                    row.attempts += 1
+                    if row.attempts > len(self.RETRY_DELAYS):
+                        del self._pending[row.key]
+                        exhausted.append(row)
+
+            self._save_queue()
+            callbacks = [(row, self._failure_callbacks.pop(row.key, None)) for row in exhausted]
+
+        for row, callback in callbacks:
+            self.logger.error(
+                f"Giving up on draft sheet write for pick {row.overall} after {row.attempts} attempts",
+                season=row.season,
+                player=row.player_name
+            )
+            if callback is None:
+                continue
+            try:
+                await callback()
+            except Exception as e:
+                self.logger.error(f"Draft sheet failure callback raised: {e}", season=row.season)
+
+        return all_written
+
+    async def _write_run(self, run: List[PendingPickWrite]) -> bool:
+        """Write one run of consecutive picks as a single range."""
+        season = run[0].season
+        sheet_key = self._config.get_draft_sheet_key(season)
+        if not sheet_key:
+            self.logger.warning(f"No draft sheet configured for season {season}")
+            return False
+
+        start_column = self._config.draft_sheet_start_column
+        end_column = chr(ord(start_column) + 3)  # 4 columns: D -> G
+        cell_range = f'{start_column}{run[0].overall + 1}:{end_column}{run[-1].overall + 1}'
+        values = [row.values() for row in run]
+
+        try:
+            loop = asyncio.get_event_loop()
+            worksheet = await self._get_worksheet(sheet_key)
+            await loop.run_in_executor(
+                None,
+                lambda: worksheet.update_values(crange=cell_range, values=values)
+            )
+            self.logger.info(
+                f"Wrote {len(run)} queued picks to draft sheet range {cell_range}",
+                season=season
+            )
+            return True
+
+        except Exception as e:
+            self._worksheets.pop(sheet_key, None)
+            self.logger.warning(
+                f"Failed to write queued picks to draft sheet range {cell_range}: {e}",
+                season=season
+            )
+            return False
+
+    async def close(self) -> None:
+        """Stop the flusher after a final flush; unwritten picks stay in the queue file."""
+        if self._flusher is not None and not self._flusher.done():
+            self._flusher.cancel()
+        self._flusher = None
+        if self._pending:
+            await self.flush()
+
+    def _load_queue(self) -> None:
+        """Load unwritten picks saved by a previous run."""
+        if self.queue_file is None or not self.queue_file.exists():
+            return
+        try:
+            with open(self.queue_file, 'r') as f:
+                data = json.load(f)
+            for item in data.get('pending', []):
+                row = PendingPickWrite(**item)
+                self._pending[row.key] = row
+            if self._pending:
+                self.logger.info(f"Loaded {len(self._pending)} queued draft sheet writes")
+        except Exception as e:
+            self.logger.error(f"Failed to load draft sheet queue: {e}")
+
+    def _save_queue(self) -> None:
+        """Save unwritten picks so they survive a restart."""
+        if self.queue_file is None:
+            return
+        try:
+            self.queue_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.queue_file, 'w') as f:
+                json.dump({'pending': [asdict(row) for row in self._pending.values()]}, f, indent=2)
+        except Exception as e:
+            self.logger.error(f"Failed to save draft sheet queue: {e}")
+
+    # ==================== Direct writes ====================
+
     async def write_pick(
         self,
         season: int,
@@ -70,23 +401,7 @@ class DraftSheetService(SheetsService):
 
         try:
             loop = asyncio.get_event_loop()
-
-            # Get pygsheets client
-            sheets = await loop.run_in_executor(None, self._get_client)
-
-            # Open the draft sheet by key
-            spreadsheet = await loop.run_in_executor(
-                None,
-                sheets.open_by_key,
-                sheet_key
-            )
-
-            # Get the worksheet
-            worksheet = await loop.run_in_executor(
-                None,
-                spreadsheet.worksheet_by_title,
-                self._config.draft_sheet_worksheet
-            )
+            worksheet = await self._get_worksheet(sheet_key)
 
             # Prepare pick data (4 columns: orig_owner, owner, player, swar)
             pick_data = [[orig_owner_abbrev, owner_abbrev, player_name, swar]]
@@ -112,6 +427,7 @@ class DraftSheetService(SheetsService):
             return True
 
         except Exception as e:
+            self._worksheets.pop(sheet_key, None)
             self.logger.error(
                 f"Failed to write pick to draft sheet: {e}",
                 season=season,
@@ -153,23 +469,7 @@ class DraftSheetService(SheetsService):
 
         try:
             loop = asyncio.get_event_loop()
-
-            # Get pygsheets client
-            sheets = await loop.run_in_executor(None, self._get_client)
-
-            # Open the draft sheet by key
-            spreadsheet = await loop.run_in_executor(
-                None,
-                sheets.open_by_key,
-                sheet_key
-            )
-
-            # Get the worksheet
-            worksheet = await loop.run_in_executor(
-                None,
-                spreadsheet.worksheet_by_title,
-                self._config.draft_sheet_worksheet
-            )
+            worksheet = await self._get_worksheet(sheet_key)
 
             # Sort picks by overall to find range bounds
             sorted_picks = sorted(picks, key=lambda p: p[0])
@@ -215,6 +515,7 @@ class DraftSheetService(SheetsService):
             return (len(picks), 0)
 
         except Exception as e:
+            self._worksheets.pop(sheet_key, None)
             self.logger.error(f"Failed batch write: {e}", season=season)
             return (0, len(picks))
 
@@ -248,23 +549,7 @@ class DraftSheetService(SheetsService):
 
         try:
             loop = asyncio.get_event_loop()
-
-            # Get pygsheets client
-            sheets = await loop.run_in_executor(None, self._get_client)
-
-            # Open the draft sheet by key
-            spreadsheet = await loop.run_in_executor(
-                None,
-                sheets.open_by_key,
-                sheet_key
-            )
-
-            # Get the worksheet
-            worksheet = await loop.run_in_executor(
-                None,
-                spreadsheet.worksheet_by_title,
-                self._config.draft_sheet_worksheet
-            )
+            worksheet = await self._get_worksheet(sheet_key)
 
             # Calculate range (4 columns: D through G)
             start_row = start_overall + 1
@@ -296,6 +581,7 @@ class DraftSheetService(SheetsService):
             return True
 
         except Exception as e:
+            self._worksheets.pop(sheet_key, None)
             self.logger.error(f"Failed to clear draft sheet: {e}", season=season)
             return False
 
@@ -3,7 +3,9 @@ League service for Discord Bot v2.0
 
 Handles league-wide operations including current state, standings, and season information.
 """
+import asyncio
 import logging
+import time
 from typing import Optional, List, Dict, Any
 
 from config import get_config
@@ -27,15 +29,63 @@ class LeagueService(BaseService[Current]):
     def __init__(self):
         """Initialize league service."""
         super().__init__(Current, 'current')
+
+        # Stale-while-revalidate snapshot of the Current row
+        self._current_snapshot: Optional[Current] = None
+        self._current_fetched_at: float = 0.0
+        self._current_generation = 0
+        self._current_refresh: Optional[asyncio.Task] = None
+        self._clock = time.monotonic
         logger.debug("LeagueService initialized")
-    
-    async def get_current_state(self) -> Optional[Current]:
+
+    async def get_current_state(self, force_refresh: bool = False) -> Optional[Current]:
         """
         Get the current league state including week, season, and settings.
 
+        Served from an in-process snapshot. A snapshot younger than
+        `current_state_ttl` is returned as-is; an older one is still returned
+        immediately while a background refresh runs, unless it is older than
+        `current_state_max_stale`, in which case the caller waits for the refresh.
+
+        Args:
+            force_refresh: Skip the snapshot and wait for a fresh API read
+
         Returns:
             Current league state or None if not available
         """
+        snapshot = self._current_snapshot
+        if snapshot is not None and not force_refresh:
+            config = get_config()
+            age = self._clock() - self._current_fetched_at
+            if age < config.current_state_ttl:
+                return snapshot
+            if age < config.current_state_max_stale:
+                self._schedule_current_refresh()
+                return snapshot
+
+        current = await self._schedule_current_refresh()
+        # Fall back to the last known state if the API is unavailable
+        return current if current is not None else self._current_snapshot
+
+    def _schedule_current_refresh(self) -> 'asyncio.Task':
+        """Start a snapshot refresh, or join the one already in flight."""
+        if self._current_refresh is None or self._current_refresh.done():
+            self._current_refresh = asyncio.ensure_future(
+                self._refresh_current_state(self._current_generation)
+            )
+        return asyncio.shield(self._current_refresh)
+
+    async def _refresh_current_state(self, generation: int) -> Optional[Current]:
+        """
+        Fetch the Current row from the API and store it as the snapshot.
+
+        Args:
+            generation: Snapshot generation when the refresh started; a result is
+                discarded if a write invalidated the snapshot in the meantime
+
+        Returns:
+            Freshly fetched state or None if not available
+        """
         try:
             client = await self.get_client()
             data = await client.get('current')
@@ -43,6 +93,8 @@ class LeagueService(BaseService[Current]):
             if data:
                 current = Current.from_api_data(data)
                 logger.debug(f"Retrieved current state: Week {current.week}, Season {current.season}")
+                if generation == self._current_generation:
+                    self._store_current_snapshot(current)
                 return current
 
             logger.debug("No current state data found")
@@ -52,6 +104,29 @@ class LeagueService(BaseService[Current]):
             logger.error(f"Failed to get current league state: {e}")
             return None
 
+    def _store_current_snapshot(self, current: Current) -> None:
+        """Replace the snapshot and reset its age."""
+        self._current_snapshot = current
+        self._current_fetched_at = self._clock()
+
+    def invalidate_current_state(self, current: Optional[Current] = None) -> None:
+        """
+        Invalidate the Current snapshot after a write.
+
+        Any refresh already in flight is ignored when it lands, so it cannot
+        overwrite the newer state.
+
+        Args:
+            current: Known-good state to install as the new snapshot (None to drop it)
+        """
+        self._current_generation += 1
+        self._current_refresh = None
+        if current is not None:
+            self._store_current_snapshot(current)
+        else:
+            self._current_snapshot = None
+            self._current_fetched_at = 0.0
+
     async def update_current_state(
         self,
         week: Optional[int] = None,
@@ -100,12 +175,16 @@ class LeagueService(BaseService[Current]):
 
             if updated_current:
                 logger.info(f"Updated current state id={current_id}: {update_data}")
+                self.invalidate_current_state(updated_current)
                 return updated_current
             else:
                 logger.error(f"Failed to update current state id={current_id} - patch returned None")
+                self.invalidate_current_state()
                 return None
 
         except Exception as e:
+            # The write may have partially applied - force the next read to the API
+            self.invalidate_current_state()
             logger.error(f"Error updating current state: {e}")
             raise APIException(f"Failed to update current state: {e}")
 
@@ -0,0 +1,197 @@
+"""
+Organization registry for Discord Bot v2.0
+
+Maps every team abbreviation in a season (ML, MiL and IL) to its organization,
+built from a single get_teams_by_season fetch. Affiliate resolution becomes a
+local dictionary lookup instead of one API call per affiliate.
+
+The registry is refreshed explicitly: team updates (e.g. branding changes)
+replace the team in place, and refresh() rebuilds a season from the API.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from models.team import RosterType, Team
+
+logger = logging.getLogger(f'{__name__}.OrganizationRegistry')
+
+TeamLoader = Callable[[int], Awaitable[List[Team]]]
+
+
+@dataclass
+class Organization:
+    """The ML, MiL and IL teams sharing one base abbreviation."""
+    base_abbrev: str
+    major_league: Optional[Team] = None
+    minor_league: Optional[Team] = None
+    injured_list: Optional[Team] = None
+
+    def team_for(self, roster_type: RosterType) -> Optional[Team]:
+        """Get this organization's team for a roster type."""
+        if roster_type == RosterType.MINOR_LEAGUE:
+            return self.minor_league
+        if roster_type == RosterType.INJURED_LIST:
+            return self.injured_list
+        return self.major_league
+
+    def _assign(self, team: Team) -> None:
+        roster_type = team.roster_type()
+        if roster_type == RosterType.MINOR_LEAGUE:
+            self.minor_league = team
+        elif roster_type == RosterType.INJURED_LIST:
+            self.injured_list = team
+        else:
+            self.major_league = team
+
+
+def _default_loader(season: int) -> Awaitable[List[Team]]:
+    from services.team_service import team_service
+    return team_service.get_teams_by_season(season)
+
+
+class OrganizationRegistry:
+    """Season-scoped abbreviation -> Organization lookup."""
+
+    # Minimum gap between load attempts after a failed load
+    RETRY_INTERVAL = 60
+
+    def __init__(self, loader: Optional[TeamLoader] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty registry.
+
+        Args:
+            loader: Coroutine function returning a season's teams
+                    (defaults to team_service.get_teams_by_season)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._loader = loader or _default_loader
+        self._clock = clock
+        self._seasons: Dict[int, Dict[str, Organization]] = {}
+        self._failed_at: Dict[int, float] = {}
+
+    def clear(self) -> None:
+        """Forget every season."""
+        self._seasons.clear()
+        self._failed_at.clear()
+
+    def is_loaded(self, season: int) -> bool:
+        """Check whether a season's mapping is held locally."""
+        return season in self._seasons
+
+    async def refresh(self, season: int) -> int:
+        """
+        Rebuild a season from the API.
+
+        Args:
+            season: Season to load
+
+        Returns:
+            Number of teams registered (0 if the load failed)
+        """
+        try:
+            teams = await self._loader(season)
+        except Exception as e:
+            logger.warning(f"Failed to load teams for organization registry (season {season}): {e}")
+            teams = []
+
+        if not teams:
+            self._failed_at[season] = self._clock()
+            return 0
+
+        by_abbrev: Dict[str, Organization] = {}
+        organizations: Dict[str, Organization] = {}
+        for team in teams:
+            self._register(team, by_abbrev, organizations)
+
+        self._seasons[season] = by_abbrev
+        self._failed_at.pop(season, None)
+        logger.info(f"Organization registry season {season}: {len(organizations)} organizations, {len(teams)} teams")
+        return len(teams)
+
+    @staticmethod
+    def _register(team: Team, by_abbrev: Dict[str, Organization], organizations: Dict[str, Organization]) -> None:
+        base_abbrev = team._get_base_abbrev().upper()
+        organization = organizations.get(base_abbrev)
+        if organization is None:
+            organization = organizations[base_abbrev] = Organization(base_abbrev=base_abbrev)
+        organization._assign(team)
+        by_abbrev[team.abbrev.upper()] = organization
+
+    async def _season_map(self, season: int) -> Optional[Dict[str, Organization]]:
+        """Get a season's mapping, loading it on first use."""
+        by_abbrev = self._seasons.get(season)
+        if by_abbrev is not None:
+            return by_abbrev
+
+        failed_at = self._failed_at.get(season)
+        if failed_at is not None and self._clock() - failed_at < self.RETRY_INTERVAL:
+            return None
+
+        await self.refresh(season)
+        return self._seasons.get(season)
+
+    async def get_organization(self, abbrev: str, season: int) -> Optional[Organization]:
+        """
+        Get the organization a team abbreviation belongs to.
+
+        Args:
+            abbrev: Any ML, MiL or IL abbreviation
+            season: Season number
+
+        Returns:
+            Organization or None if the abbreviation is unknown
+        """
+        by_abbrev = await self._season_map(season)
+        if by_abbrev is None:
+            return None
+        return by_abbrev.get(abbrev.upper())
+
+    async def get_organizations(self, season: int) -> List[Organization]:
+        """
+        Get every organization in a season.
+
+        Args:
+            season: Season number
+
+        Returns:
+            Organizations ordered by base abbreviation (empty if the season couldn't be loaded)
+        """
+        by_abbrev = await self._season_map(season)
+        if by_abbrev is None:
+            return []
+        unique = {organization.base_abbrev: organization for organization in by_abbrev.values()}
+        return [unique[base_abbrev] for base_abbrev in sorted(unique)]
+
+    def update_team(self, team: Team) -> None:
+        """
+        Replace a team in its loaded season after an update (e.g. new branding).
+
+        An abbreviation change alters organization membership, so the season is
+        dropped instead and rebuilt on next use. Seasons that are not loaded are
+        left alone.
+        """
+        by_abbrev = self._seasons.get(team.season)
+        if by_abbrev is None:
+            return
+
+        organization = by_abbrev.get(team.abbrev.upper())
+        current = organization.team_for(team.roster_type()) if organization else None
+        if current is None or current.id != team.id:
+            self.invalidate(team.season)
+            return
+
+        organization._assign(team)
+
+    def invalidate(self, season: Optional[int] = None) -> None:
+        """Drop one season (or all seasons) so the next lookup reloads from the API."""
+        if season is None:
+            self.clear()
+        else:
+            self._seasons.pop(season, None)
+            self._failed_at.pop(season, None)
+
+
+# Global registry instance
+organization_registry = OrganizationRegistry()
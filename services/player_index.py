@@ -0,0 +1,420 @@
+"""
+Player index for Discord Bot v2.0
+
+Season-wide in-memory index of players for autocomplete and name resolution.
+Loaded once per season from the (cached) season player list, then kept current
+by incremental upserts from player updates and periodic background re-syncs
+that only touch players whose data changed.
+
+Lookups are local: exact name, prefix (full name or any later word, so "trout"
+finds "Mike Trout"), substring (candidates from the trigram postings), and
+trigram similarity for typos.
+"""
+import asyncio
+import bisect
+import logging
+import re
+import time
+import unicodedata
+from array import array
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from models.player import Player
+from models.team import Team
+
+logger = logging.getLogger(f'{__name__}.PlayerIndex')
+
+PlayerLoader = Callable[[int], Awaitable[List[Player]]]
+
+_NON_ALNUM = re.compile(r'[^a-z0-9 ]+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a player name for matching.
+
+    Lowercases, strips accents and punctuation, and collapses whitespace, so
+    "José Ramírez" and "jose ramirez" (or "J.D. Martinez" and "jd martinez") match.
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    ascii_name = decomposed.encode('ascii', 'ignore').decode('ascii').lower()
+    ascii_name = _NON_ALNUM.sub('', ascii_name.replace('-', ' '))
+    return _WHITESPACE.sub(' ', ascii_name).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Get the set of padded character trigrams for a normalized string."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _default_loader(season: int) -> Awaitable[List[Player]]:
+    from services.player_service import player_service
+    return player_service.get_players_by_season(season)
+
+
+class PlayerIndex:
+    """
+    In-memory name index over one season's players.
+
+    Players live in slots; the lookup structures store slot numbers only
+    (trigram postings as 4-byte arrays), so the index adds little on top of
+    the player objects themselves. Updated or removed players leave a dead
+    slot behind that is skipped at lookup time and reclaimed by compaction.
+    """
+
+    # Background re-sync interval (matches the season player list cache TTL)
+    REFRESH_INTERVAL = 600
+    # Minimum gap between attempts after a failed load
+    RETRY_INTERVAL = 60
+    # Minimum trigram similarity for fuzzy matches
+    FUZZY_THRESHOLD = 0.3
+
+    def __init__(self, loader: Optional[PlayerLoader] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty index.
+
+        Args:
+            loader: Coroutine function returning a season's players
+                    (defaults to player_service.get_players_by_season)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._loader = loader or _default_loader
+        self._clock = clock
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all indexed players and forget the season."""
+        self.season: Optional[int] = None
+        self.loaded = False
+        self._loaded_at = 0.0
+        self._last_attempt = 0.0
+        self._players: List[Optional[Player]] = []
+        self._names: List[str] = []
+        self._slot_by_id: Dict[int, int] = {}
+        # Normalized name -> live slots holding it; the first answers exact lookups
+        self._name_slots: Dict[str, List[int]] = {}
+        self._prefix_keys: List[str] = []
+        self._prefix_slots: List[int] = []
+        self._trigrams: Dict[str, array] = {}
+        self._teams: Dict[int, Team] = {}
+        self._dead_slots = 0
+        if self._refresh_task is not None and not self._refresh_task.done():
+            try:
+                self._refresh_task.cancel()
+            except RuntimeError:
+                # The task's event loop is already closed
+                pass
+        self._refresh_task = None
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    # Loading and incremental updates
+
+    def is_ready(self, season: int) -> bool:
+        """
+        Check whether lookups for a season can be served locally.
+
+        Also schedules a background re-sync when the index is stale (or a
+        previous load failed), so callers never wait on the network.
+
+        Args:
+            season: Season the caller wants
+
+        Returns:
+            True if the index holds that season's players
+        """
+        if self.season == season:
+            self._maybe_schedule_refresh()
+        return self.loaded and self.season == season
+
+    async def load(self, season: int) -> int:
+        """
+        Load (or re-sync) the index for a season.
+
+        Switching seasons rebuilds from scratch; re-loading the same season only
+        touches players that were added, changed or removed.
+
+        Args:
+            season: Season to index
+
+        Returns:
+            Number of players indexed
+        """
+        if self.season != season:
+            self.clear()
+            self.season = season
+
+        self._last_attempt = self._clock()
+        players = await self._loader(season)
+        if not players:
+            logger.warning(f"No players returned for season {season}; index not updated")
+            return len(self)
+
+        added, updated, removed = self.sync(players)
+        self.loaded = True
+        self._loaded_at = self._clock()
+        logger.info(
+            f"Player index season {season}: {len(self)} players "
+            f"({added} added, {updated} updated, {removed} removed)"
+        )
+        return len(self)
+
+    def _maybe_schedule_refresh(self) -> None:
+        """Start a background re-sync if the index is stale and none is running."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        now = self._clock()
+        if self.loaded:
+            if now - self._loaded_at < self.REFRESH_INTERVAL:
+                return
+        elif now - self._last_attempt < self.RETRY_INTERVAL:
+            return
+
+        try:
+            self._refresh_task = asyncio.ensure_future(self._background_load(self.season))
+        except RuntimeError:
+            # No running event loop - the next async caller will pick it up
+            pass
+
+    async def _background_load(self, season: int) -> None:
+        try:
+            await self.load(season)
+        except Exception as e:
+            logger.warning(f"Player index refresh for season {season} failed: {e}")
+
+    def sync(self, players: Iterable[Player]) -> Tuple[int, int, int]:
+        """
+        Bring the index in line with a full player list.
+
+        Args:
+            players: Every player in the indexed season
+
+        Returns:
+            Tuple of (added, updated, removed) counts
+        """
+        added = updated = 0
+        seen: Set[int] = set()
+
+        for player in players:
+            seen.add(player.id)
+            slot = self._slot_by_id.get(player.id)
+            if slot is None:
+                self._insert(player)
+                added += 1
+            elif self._players[slot] != player:
+                self._remove_slot(slot)
+                self._insert(player)
+                updated += 1
+
+        stale_ids = [player_id for player_id in self._slot_by_id if player_id not in seen]
+        for player_id in stale_ids:
+            self._remove_slot(self._slot_by_id[player_id])
+
+        self._maybe_compact()
+        return added, updated, len(stale_ids)
+
+    def upsert(self, player: Player) -> None:
+        """
+        Add or replace a single player (e.g. after an update).
+
+        Players from other seasons are ignored.
+        """
+        if not self.loaded or player.season != self.season:
+            return
+
+        slot = self._slot_by_id.get(player.id)
+        if slot is not None:
+            self._remove_slot(slot)
+        self._insert(player)
+        self._maybe_compact()
+
+    def remove(self, player_id: int) -> bool:
+        """Remove a player from the index; returns True if they were indexed."""
+        slot = self._slot_by_id.get(player_id)
+        if slot is None:
+            return False
+        self._remove_slot(slot)
+        self._maybe_compact()
+        return True
+
+    def _insert(self, player: Player) -> None:
+        slot = len(self._players)
+        name = normalize_name(player.name)
+
+        self._players.append(player)
+        self._names.append(name)
+        self._slot_by_id[player.id] = slot
+        self._name_slots.setdefault(name, []).append(slot)
+
+        if player.team is not None and player.team.id is not None:
+            self._teams[player.team.id] = player.team
+
+        # Full name plus every later word start ("mike trout", "trout")
+        words = name.split(' ')
+        for i in range(len(words)):
+            key = ' '.join(words[i:])
+            if not key:
+                continue
+            position = bisect.bisect_left(self._prefix_keys, key)
+            self._prefix_keys.insert(position, key)
+            self._prefix_slots.insert(position, slot)
+
+        for gram in trigrams(name):
+            postings = self._trigrams.get(gram)
+            if postings is None:
+                postings = self._trigrams[gram] = array('I')
+            postings.append(slot)
+
+    def _remove_slot(self, slot: int) -> None:
+        player = self._players[slot]
+        if player is None:
+            return
+
+        self._players[slot] = None
+        self._dead_slots += 1
+        del self._slot_by_id[player.id]
+
+        # Another live player with the same name (if any) takes over exact lookups
+        name = self._names[slot]
+        slots = self._name_slots[name]
+        slots.remove(slot)
+        if not slots:
+            del self._name_slots[name]
+
+    def _maybe_compact(self) -> None:
+        """Rebuild the structures once dead slots make up a quarter of the index."""
+        if self._dead_slots and self._dead_slots * 4 >= len(self._players):
+            live = [player for player in self._players if player is not None]
+            season, loaded, loaded_at, last_attempt = self.season, self.loaded, self._loaded_at, self._last_attempt
+            refresh_task, self._refresh_task = self._refresh_task, None
+            self.clear()
+            self.season, self.loaded, self._loaded_at, self._last_attempt = season, loaded, loaded_at, last_attempt
+            self._refresh_task = refresh_task
+            for player in live:
+                self._insert(player)
+
+    # Lookups
+
+    def get(self, player_id: int) -> Optional[Player]:
+        """Get an indexed player by ID."""
+        slot = self._slot_by_id.get(player_id)
+        return self._players[slot] if slot is not None else None
+
+    def team_for(self, player: Player) -> Optional[Team]:
+        """Get the owning team for a player from the index's team cache."""
+        if player.team is not None:
+            return player.team
+        return self._teams.get(player.team_id) if player.team_id is not None else None
+
+    def find_exact(self, name: str) -> Optional[Player]:
+        """Get the player whose normalized name matches exactly."""
+        slots = self._name_slots.get(normalize_name(name))
+        return self._players[slots[0]] if slots else None
+
+    def search(self, query: str, limit: int = 25, fuzzy: bool = True) -> List[Player]:
+        """
+        Search players by name.
+
+        Results are ranked exact match, full-name prefix, word prefix, substring,
+        then (if `fuzzy` and slots remain) trigram similarity. Ties sort by name.
+
+        Args:
+            query: Partial or misspelled player name
+            limit: Maximum number of results
+            fuzzy: Include trigram matches for typo tolerance
+
+        Returns:
+            Matching players, best first
+        """
+        needle = normalize_name(query)
+        if not needle or limit <= 0:
+            return []
+
+        ranked: Dict[int, Tuple[float, str]] = {}
+
+        def rank(slot: int, score: float) -> None:
+            if self._players[slot] is None:
+                return
+            current = ranked.get(slot)
+            if current is None or score < current[0]:
+                ranked[slot] = (score, self._names[slot])
+
+        for exact_slot in self._name_slots.get(needle, ()):
+            rank(exact_slot, 0)
+
+        position = bisect.bisect_left(self._prefix_keys, needle)
+        while position < len(self._prefix_keys) and self._prefix_keys[position].startswith(needle):
+            slot = self._prefix_slots[position]
+            rank(slot, 1 if self._names[slot].startswith(needle) else 2)
+            position += 1
+
+        if len(ranked) < limit:
+            for slot in self._substring_matches(needle):
+                if slot not in ranked:
+                    rank(slot, 3)
+
+        if fuzzy and len(ranked) < limit and len(needle) >= 3:
+            for slot, similarity in self._trigram_matches(needle):
+                rank(slot, 4 + (1 - similarity))
+
+        ordered = sorted(ranked.items(), key=lambda item: item[1])
+        return [self._players[slot] for slot, _ in ordered[:limit]]
+
+    def _substring_matches(self, needle: str) -> List[int]:
+        """Get slots whose name contains the query."""
+        if len(needle) < 3:
+            # Too short to have a trigram of its own
+            return [slot for slot, name in enumerate(self._names) if needle in name]
+
+        # Every trigram of the query occurs in a name that contains it, so
+        # intersecting their postings (shortest first) narrows the candidates
+        postings = []
+        for gram in {needle[i:i + 3] for i in range(len(needle) - 2)}:
+            slots = self._trigrams.get(gram)
+            if slots is None:
+                return []
+            postings.append(slots)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for slots in postings[1:]:
+            candidates.intersection_update(slots)
+            if not candidates:
+                return []
+        return [slot for slot in sorted(candidates) if needle in self._names[slot]]
+
+    def _trigram_matches(self, needle: str) -> List[Tuple[int, float]]:
+        """Get (slot, similarity) for players sharing enough trigrams with the query."""
+        query_grams = trigrams(needle)
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for slot in self._trigrams.get(gram, ()):
+                shared[slot] = shared.get(slot, 0) + 1
+
+        matches = []
+        for slot, count in shared.items():
+            name_grams = len(self._names[slot]) + 2
+            similarity = count / (len(query_grams) + name_grams - count)
+            if similarity >= self.FUZZY_THRESHOLD:
+                matches.append((slot, similarity))
+        return matches
+
+    def stats(self) -> Dict[str, Any]:
+        """Index size information for logging and health checks."""
+        return {
+            'season': self.season,
+            'players': len(self),
+            'slots': len(self._players),
+            'prefix_keys': len(self._prefix_keys),
+            'trigrams': len(self._trigrams),
+            'teams': len(self._teams),
+        }
+
+
+# Global index instance
+player_index = PlayerIndex()
@@ -4,12 +4,14 @@ Player service for Discord Bot v2.0
 Handles player-related operations with team population and search functionality.
 """
 import logging
-from typing import Optional, List, TYPE_CHECKING
+from typing import Any, Callable, Optional, List, TYPE_CHECKING
 
 from config import get_config
 from services.base_service import BaseService
+from services.player_index import player_index
 from models.player import Player
 from exceptions import APIException
+from utils.decorators import cached_api_call, cached_single_item, cache_invalidate
 
 if TYPE_CHECKING:
     from services.team_service import TeamService
@@ -35,9 +37,12 @@ class PlayerService(BaseService[Player]):
         self._team_service = team_service
         logger.debug("PlayerService initialized")
     
+    @cached_single_item(ttl=300, tags=("player:{player_id}",))  # 5-minute cache
     async def get_player(self, player_id: int) -> Optional[Player]:
         """
         Get player by ID with error handling.
+
+        Cached for 5 minutes; update_player invalidates the entry.
         
         Args:
             player_id: Unique player identifier
@@ -90,6 +95,30 @@ class PlayerService(BaseService[Player]):
             logger.error(f"Failed to get players for team {team_id}: {e}")
             return []
     
+    @cached_api_call(ttl=600, tags=("season:{season}",))  # 10-minute cache
+    async def get_players_by_season(self, season: int) -> List[Player]:
+        """
+        Get every player in a season.
+
+        Cached for 10 minutes under the season tag only; player writes patch
+        the cached list in place (see record_player_update) instead of
+        dropping it.
+
+        Args:
+            season: Season number (required)
+
+        Returns:
+            List of all players in the season
+        """
+        try:
+            players = await self.get_all_items(params=[('season', str(season))])
+            logger.debug(f"Retrieved {len(players)} players for season {season}")
+            return players
+
+        except Exception as e:
+            logger.error(f"Failed to get players for season {season}: {e}")
+            return []
+
     async def get_players_by_name(self, name: str, season: int) -> List[Player]:
         """
         Search for players by name (partial match).
@@ -118,6 +147,10 @@ class PlayerService(BaseService[Player]):
     async def get_player_by_name_exact(self, name: str, season: int) -> Optional[Player]:
         """
         Get player by exact name match (case-insensitive).
+
+        Resolved from the in-memory player index when it holds the season; a
+        miss there falls back to the API, since players added since the last
+        index refresh aren't indexed yet.
         
         Args:
             name: Exact player name
@@ -127,6 +160,11 @@ class PlayerService(BaseService[Player]):
             Player instance or None if not found
         """
         try:
+            if player_index.is_ready(season):
+                player = player_index.find_exact(name)
+                if player is not None:
+                    return player
+
             players = await self.get_players_by_name(name, season)
             
             # Look for exact case-insensitive match
@@ -182,6 +220,9 @@ class PlayerService(BaseService[Player]):
         """
         Fuzzy search for players by name with limit using existing name search functionality.
 
+        Served from the in-memory player index (which adds typo-tolerant
+        trigram matches) when it holds the season.
+
         Args:
             query: Search query
             limit: Maximum results to return
@@ -194,6 +235,9 @@ class PlayerService(BaseService[Player]):
             if season is None:
                 season = get_config().sba_season
 
+            if player_index.is_ready(season):
+                return player_index.search(query, limit=limit)
+
             # Use the existing name-based search that actually works
             players = await self.get_players_by_name(query, season)
 
@@ -297,10 +341,14 @@ class PlayerService(BaseService[Player]):
             return []
     
     
+    @cache_invalidate("player:{player_id}")
     async def update_player(self, player_id: int, updates: dict) -> Optional[Player]:
         """
         Update player information.
 
+        Invalidates every cached entry tagged with this player and refreshes
+        the player's entry in the player index and cached season list.
+
         Args:
             player_id: Player ID to update
             updates: Dictionary of fields to update
@@ -313,11 +361,57 @@ class PlayerService(BaseService[Player]):
             so we pass use_query_params=True to the patch method.
         """
         try:
-            return await self.patch(player_id, updates, use_query_params=True)
+            updated_player = await self.patch(player_id, updates, use_query_params=True)
+            if updated_player:
+                await self.record_player_update(updated_player)
+            return updated_player
         except Exception as e:
             logger.error(f"Failed to update player {player_id}: {e}")
             return None
 
+    async def record_player_update(self, player: Player) -> None:
+        """
+        Put an updated player into the player index and the cached season list.
+
+        Patching the season list in place keeps one write from evicting (and
+        forcing a re-fetch of) every player in the season.
+
+        Args:
+            player: Player as returned by the update
+        """
+        player_index.upsert(player)
+        if player.season is None:
+            return
+
+        cache_key = self._generate_cache_key('get_players_by_season', [('season', player.season)])
+
+        local = self.cache.local
+        if local is not None:
+            players = local.get(cache_key)
+            if players is not None:
+                local.update(cache_key, self._with_player(players, player.model_copy(deep=True), lambda p: p.id))
+
+        try:
+            cached_data, remaining_ttl = await self.cache.get_with_ttl(cache_key)
+            if isinstance(cached_data, list) and remaining_ttl:
+                await self.cache.set(
+                    cache_key,
+                    self._with_player(cached_data, player.model_dump(), lambda p: p.get('id')),
+                    remaining_ttl,
+                    (f"season:{player.season}",)
+                )
+        except Exception as e:
+            logger.warning(f"Could not update cached season {player.season} player list: {e}")
+
+    @staticmethod
+    def _with_player(players: List[Any], replacement: Any, id_of: Callable[[Any], Any]) -> List[Any]:
+        """Copy of a season list with one player replaced, or appended if new."""
+        player_id = id_of(replacement)
+        updated = [replacement if id_of(p) == player_id else p for p in players]
+        if not any(id_of(p) == player_id for p in players):
+            updated.append(replacement)
+        return updated
+
     async def update_player_team(self, player_id: int, new_team_id: int) -> Optional[Player]:
         """
         Update a player's team assignment (for real-time IL moves).
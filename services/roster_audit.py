@@ -0,0 +1,217 @@
+"""
+League roster audit for Discord Bot v2.0
+
+Checks every organization's roster legality in one pass. All current rosters
+and the week's pending transactions are fetched concurrently, the pending moves
+are applied in memory to project next week's rosters, and both the current and
+projected roster of each organization go through RosterService.check_roster.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from models.roster import TeamRoster
+from models.team import RosterType, Team
+from models.transaction import RosterValidation, Transaction
+
+logger = logging.getLogger(f'{__name__}.RosterAuditService')
+
+
+@dataclass
+class TeamAudit:
+    """Audit result for one organization."""
+    team: Team
+    current: Optional[RosterValidation] = None
+    projected: Optional[RosterValidation] = None
+    pending_moves: int = 0
+    error: Optional[str] = None
+
+    @property
+    def is_legal(self) -> bool:
+        """Whether the current roster, and the projected roster if one was built, are legal."""
+        if self.error or self.current is None:
+            return False
+        return self.current.is_legal and (self.projected is None or self.projected.is_legal)
+
+
+@dataclass
+class LeagueAuditReport:
+    """Roster legality of every organization for a season and week."""
+    season: int
+    week: int
+    teams: List[TeamAudit] = field(default_factory=list)
+    transactions_applied: int = 0
+    unmatched_moves: List[str] = field(default_factory=list)
+    transactions_error: Optional[str] = None
+
+    @property
+    def projection_available(self) -> bool:
+        """Whether pending transactions were loaded, i.e. the projected rosters can be trusted."""
+        return self.transactions_error is None
+
+    @property
+    def illegal_teams(self) -> List[TeamAudit]:
+        """Organizations with an illegal (or unavailable) current or projected roster."""
+        return [audit for audit in self.teams if not audit.is_legal]
+
+    @property
+    def legal_count(self) -> int:
+        return len(self.teams) - len(self.illegal_teams)
+
+
+_SECTION_BY_ROSTER_TYPE = {
+    RosterType.MAJOR_LEAGUE: 'active_players',
+    RosterType.MINOR_LEAGUE: 'minor_league_players',
+    RosterType.INJURED_LIST: 'il_players',
+}
+
+
+class RosterAuditService:
+    """Builds league-wide roster legality reports."""
+
+    def __init__(self, max_concurrency: int = 8):
+        """
+        Initialize the audit service.
+
+        Args:
+            max_concurrency: Maximum roster requests in flight at once
+        """
+        self.max_concurrency = max_concurrency
+
+    async def audit_league(self, season: int, week: int) -> LeagueAuditReport:
+        """
+        Audit every organization's current roster and its projection for `week`.
+
+        Args:
+            season: Season number
+            week: Week whose pending transactions are applied to the projection
+                  (normally current week + 1)
+
+        Returns:
+            LeagueAuditReport covering every organization. If the pending
+            transactions can't be loaded, `transactions_error` is set and no
+            projected roster is reported.
+        """
+        from services.organization_registry import organization_registry
+        from services.transaction_service import transaction_service
+
+        organizations = await organization_registry.get_organizations(season)
+        teams = [
+            organization.major_league for organization in organizations
+            if organization.major_league is not None and organization.base_abbrev != 'FA'
+        ]
+
+        rosters, transactions = await asyncio.gather(
+            self._fetch_rosters(teams),
+            transaction_service.get_pending_transactions_by_week(season, week),
+            return_exceptions=True
+        )
+
+        report = LeagueAuditReport(season=season, week=week)
+        projected: Dict[str, TeamRoster] = {}
+        pending_counts: Dict[str, int] = {}
+        if isinstance(rosters, BaseException):
+            raise rosters
+        if isinstance(transactions, BaseException):
+            # Without the pending moves a projection would just repeat the current roster,
+            # so only current rosters are checked and the report says why
+            report.transactions_error = str(transactions) or type(transactions).__name__
+            logger.warning(
+                f"Roster audit season {season} week {week}: pending transactions unavailable, "
+                f"checking current rosters only: {report.transactions_error}"
+            )
+        else:
+            projected = {abbrev: self._copy_roster(roster) for abbrev, roster in rosters.items()}
+            self._apply_moves(transactions, projected, pending_counts, report)
+
+        from services.roster_service import roster_service
+        for team in teams:
+            base_abbrev = team._get_base_abbrev().upper()
+            roster = rosters.get(base_abbrev)
+            audit = TeamAudit(team=team, pending_moves=pending_counts.get(base_abbrev, 0))
+            if roster is None:
+                audit.error = "Roster unavailable"
+            else:
+                audit.current = roster_service.check_roster(roster)
+                if base_abbrev in projected:
+                    audit.projected = roster_service.check_roster(projected[base_abbrev])
+            report.teams.append(audit)
+
+        logger.info(
+            f"Roster audit season {season} week {week}: {report.legal_count}/{len(report.teams)} legal, "
+            f"{report.transactions_applied} moves applied, {len(report.unmatched_moves)} unmatched"
+        )
+        return report
+
+    async def _fetch_rosters(self, teams: List[Team]) -> Dict[str, TeamRoster]:
+        """Fetch every organization's current roster, keyed by uppercase ML abbreviation."""
+        from services.roster_service import roster_service
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(team: Team) -> Optional[TeamRoster]:
+            async with semaphore:
+                try:
+                    return await roster_service.get_current_roster(team.id)
+                except Exception as e:
+                    logger.warning(f"Could not load roster for {team.abbrev}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(fetch(team) for team in teams))
+        return {
+            team._get_base_abbrev().upper(): roster
+            for team, roster in zip(teams, results) if roster is not None
+        }
+
+    @staticmethod
+    def _copy_roster(roster: TeamRoster) -> TeamRoster:
+        return roster.model_copy(update={
+            'active_players': list(roster.active_players),
+            'il_players': list(roster.il_players),
+            'minor_league_players': list(roster.minor_league_players),
+        })
+
+    @staticmethod
+    def _apply_moves(
+        transactions: List[Transaction],
+        projected: Dict[str, TeamRoster],
+        pending_counts: Dict[str, int],
+        report: LeagueAuditReport
+    ) -> None:
+        """Move each pending transaction's player between the projected rosters, in transaction order."""
+        for transaction in sorted(transactions, key=lambda t: (t.id is None, t.id or 0)):
+            player = transaction.player
+            old_abbrev = transaction.oldteam._get_base_abbrev().upper()
+            new_abbrev = transaction.newteam._get_base_abbrev().upper()
+
+            old_roster = projected.get(old_abbrev)
+            if old_roster is not None:
+                pending_counts[old_abbrev] = pending_counts.get(old_abbrev, 0) + 1
+                removed = False
+                for section in _SECTION_BY_ROSTER_TYPE.values():
+                    players = getattr(old_roster, section)
+                    remaining = [p for p in players if p.id != player.id]
+                    if len(remaining) != len(players):
+                        setattr(old_roster, section, remaining)
+                        removed = True
+                if not removed:
+                    report.unmatched_moves.append(
+                        f"{player.name}: not on {transaction.oldteam.abbrev} roster ({transaction.moveid})"
+                    )
+
+            new_roster = projected.get(new_abbrev)
+            if new_roster is not None:
+                if new_abbrev != old_abbrev:
+                    pending_counts[new_abbrev] = pending_counts.get(new_abbrev, 0) + 1
+                section = _SECTION_BY_ROSTER_TYPE.get(transaction.newteam.roster_type(), 'active_players')
+                setattr(new_roster, section, getattr(new_roster, section) + [player])
+
+            report.transactions_applied += 1
+
+        for roster in projected.values():
+            roster.total_wara = sum(player.wara or 0.0 for player in roster.active_players)
+
+
+# Global service instance
+roster_audit_service = RosterAuditService()
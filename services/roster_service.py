@@ -85,6 +85,20 @@ class RosterService:
         Args:
             roster: TeamRoster to validate
             
+        Returns:
+            RosterValidation with results
+        """
+        return self.check_roster(roster)
+
+    def check_roster(self, roster: TeamRoster) -> RosterValidation:
+        """
+        Run the roster legality checks on an in-memory roster.
+
+        Used directly by the league roster audit to check every team in one pass.
+
+        Args:
+            roster: TeamRoster to validate
+
         Returns:
             RosterValidation with results
         """
@@ -95,7 +109,7 @@ class RosterService:
                 active_players=roster.active_count,
                 il_players=roster.il_count,
                 minor_league_players=roster.minor_league_count,
-                total_wara=roster.total_wara
+                total_sWAR=roster.total_wara
             )
             
             # Validate active roster size (typical limits)
@@ -123,10 +137,10 @@ class RosterService:
                 validation.warnings.append(f"Fewer than 10 pitchers on active roster: {pitcher_count}")
             
             # WARA validation (if there are limits)
-            if validation.total_wara > 100:  # Adjust based on league rules
-                validation.warnings.append(f"High WARA total: {validation.total_wara:.2f}")
-            elif validation.total_wara < 20:
-                validation.warnings.append(f"Low WARA total: {validation.total_wara:.2f}")
+            if validation.total_sWAR > 100:  # Adjust based on league rules
+                validation.warnings.append(f"High WARA total: {validation.total_sWAR:.2f}")
+            elif validation.total_sWAR < 20:
+                validation.warnings.append(f"Low WARA total: {validation.total_sWAR:.2f}")
             
             logger.debug(f"Validated roster: legal={validation.is_legal}, {len(validation.errors)} errors, {len(validation.warnings)} warnings")
             return validation
@@ -4,13 +4,22 @@ Scorebug Service
 Handles reading live game data from Google Sheets scorecards for real-time score displays.
 """
 import asyncio
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, Iterable, List, Any, Optional
 import pygsheets
 
 from utils.logging import get_contextual_logger
 from exceptions import SheetsException
 from services.sheets_service import SheetsService
 
+_SHEET_KEY_PATTERN = re.compile(r'/spreadsheets/d/([a-zA-Z0-9_-]+)')
+
+
+def sheet_key(sheet_url_or_key: str) -> str:
+    """Normalize a Google Sheets URL or bare key to the sheet key."""
+    match = _SHEET_KEY_PATTERN.search(sheet_url_or_key)
+    return match.group(1) if match else sheet_url_or_key.strip()
+
 
 class ScorebugData:
     """Data class for scorebug information."""
@@ -80,6 +89,46 @@ class ScorebugService(SheetsService):
         """
         super().__init__(credentials_path)
         self.logger = get_contextual_logger(f'{__name__}.ScorebugService')
+        # Scorebug worksheet handles by sheet key, so repeat reads are one API call
+        self._worksheets: Dict[str, pygsheets.Worksheet] = {}
+
+    async def _get_scorebug_tab(self, sheet_url_or_key: str) -> pygsheets.Worksheet:
+        """
+        Get the Scorebug worksheet for a scorecard, opening it on first use.
+
+        Cached handles are dropped when a read fails or by `retain_worksheets`.
+        """
+        scorebug_tab = self._worksheets.get(sheet_key(sheet_url_or_key))
+        if scorebug_tab is not None:
+            return scorebug_tab
+
+        scorecard = await self.open_scorecard(sheet_url_or_key)
+        self.logger.debug(f"   ✅ Scorecard opened successfully")
+
+        loop = asyncio.get_event_loop()
+        scorebug_tab = await loop.run_in_executor(
+            None,
+            scorecard.worksheet_by_title,
+            'Scorebug'
+        )
+        self._worksheets[sheet_key(sheet_url_or_key)] = scorebug_tab
+        return scorebug_tab
+
+    def retain_worksheets(self, sheet_urls_or_keys: Iterable[str]) -> int:
+        """
+        Drop worksheet handles for every scorecard not in the given set.
+
+        Args:
+            sheet_urls_or_keys: Scorecards still published
+
+        Returns:
+            Number of handles dropped
+        """
+        keep = {sheet_key(sheet) for sheet in sheet_urls_or_keys}
+        stale = [key for key in self._worksheets if key not in keep]
+        for key in stale:
+            del self._worksheets[key]
+        return len(stale)
 
     async def read_scorebug_data(
         self,
@@ -103,19 +152,11 @@ class ScorebugService(SheetsService):
         self.logger.debug(f"   Full length mode: {full_length}")
 
         try:
-            # Open scorecard
-            scorecard = await self.open_scorecard(sheet_url_or_key)
-            self.logger.debug(f"   ✅ Scorecard opened successfully")
+            # Get Scorebug tab (opens the scorecard on first read)
+            scorebug_tab = await self._get_scorebug_tab(sheet_url_or_key)
 
             loop = asyncio.get_event_loop()
 
-            # Get Scorebug tab
-            scorebug_tab = await loop.run_in_executor(
-                None,
-                scorecard.worksheet_by_title,
-                'Scorebug'
-            )
-
             # Read all data from B2:S20 for efficiency
             all_data = await loop.run_in_executor(
                 None,
@@ -346,5 +387,6 @@ class ScorebugService(SheetsService):
             self.logger.error(f"Scorebug tab not found in scorecard")
             raise SheetsException("Scorebug tab not found. Is this a valid scorecard?")
         except Exception as e:
+            self._worksheets.pop(sheet_key(sheet_url_or_key), None)
             self.logger.error(f"Failed to read scorebug data: {e}")
             raise SheetsException(f"Unable to read scorebug data: {str(e)}")
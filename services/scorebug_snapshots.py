@@ -0,0 +1,146 @@
+"""
+Scorebug snapshot store
+
+Holds the last ScorebugData read from each scorecard, keyed by sheet key, so
+/scorebug, /publish-scorecard and the live scorebug tracker share reads. A
+snapshot younger than `scorebug_snapshot_ttl` is served as-is; otherwise the
+caller joins the read already in flight for that sheet or starts one. The
+live tracker refreshes snapshots in place every cycle.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+from config import get_config
+from services.scorebug_service import ScorebugData, ScorebugService, sheet_key
+
+logger = logging.getLogger(f'{__name__}.ScorebugSnapshotStore')
+
+
+@dataclass
+class ScorebugSnapshot:
+    """Last scorebug read from a scorecard and when it was fetched."""
+    data: ScorebugData
+    fetched_at: float
+
+
+class ScorebugSnapshotStore:
+    """Per-scorecard scorebug snapshots with single-flight reads."""
+
+    def __init__(
+        self,
+        service: Optional[ScorebugService] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize an empty store.
+
+        Args:
+            service: Scorebug reader (created on first read if None)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._service = service
+        self._clock = clock
+        self._snapshots: Dict[str, ScorebugSnapshot] = {}
+        self._reads: Dict[str, asyncio.Task] = {}
+
+    @property
+    def service(self) -> ScorebugService:
+        """Scorebug reader shared by every caller (and its worksheet cache)."""
+        if self._service is None:
+            self._service = ScorebugService()
+        return self._service
+
+    def peek(self, sheet_url_or_key: str) -> Optional[ScorebugSnapshot]:
+        """Get the stored snapshot for a scorecard without reading the sheet."""
+        return self._snapshots.get(sheet_key(sheet_url_or_key))
+
+    async def get(self, sheet_url_or_key: str, max_age: Optional[float] = None) -> ScorebugData:
+        """
+        Get a scorecard's scorebug, reading the sheet only if the snapshot is too old.
+
+        Args:
+            sheet_url_or_key: Full URL or Google Sheets key
+            max_age: Oldest snapshot to accept in seconds (defaults to `scorebug_snapshot_ttl`)
+
+        Returns:
+            ScorebugData, including the play-by-play summary
+
+        Raises:
+            SheetsException: If the scorecard cannot be read
+        """
+        if max_age is None:
+            max_age = get_config().scorebug_snapshot_ttl
+
+        snapshot = self.peek(sheet_url_or_key)
+        if snapshot is not None and self._clock() - snapshot.fetched_at < max_age:
+            logger.debug(f"Serving scorebug snapshot for {sheet_key(sheet_url_or_key)}")
+            return snapshot.data
+
+        return await self.refresh(sheet_url_or_key)
+
+    async def refresh(self, sheet_url_or_key: str) -> ScorebugData:
+        """
+        Read a scorecard and replace its snapshot, joining a read already in flight.
+
+        Args:
+            sheet_url_or_key: Full URL or Google Sheets key
+
+        Returns:
+            Freshly read ScorebugData
+
+        Raises:
+            SheetsException: If the scorecard cannot be read
+        """
+        key = sheet_key(sheet_url_or_key)
+        read = self._reads.get(key)
+        if read is None or read.done():
+            read = asyncio.ensure_future(self._read(key, sheet_url_or_key))
+            # Mark a failure as retrieved even if every caller gave up waiting
+            read.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._reads[key] = read
+        # Shielded so a caller timing out doesn't cancel the read for everyone else
+        return await asyncio.shield(read)
+
+    async def _read(self, key: str, sheet_url_or_key: str) -> ScorebugData:
+        try:
+            # Always read the full scorebug; compact embeds simply ignore the summary
+            data = await self.service.read_scorebug_data(sheet_url_or_key, full_length=True)
+            self._snapshots[key] = ScorebugSnapshot(data=data, fetched_at=self._clock())
+            return data
+        finally:
+            if self._reads.get(key) is asyncio.current_task():
+                del self._reads[key]
+
+    def invalidate(self, sheet_url_or_key: str) -> None:
+        """Drop a scorecard's snapshot (e.g. when it is unpublished)."""
+        self._snapshots.pop(sheet_key(sheet_url_or_key), None)
+
+    def retain(self, sheet_urls_or_keys: Iterable[str]) -> int:
+        """
+        Drop snapshots (and open worksheet handles) for every scorecard not in the given set.
+
+        Args:
+            sheet_urls_or_keys: Scorecards still published
+
+        Returns:
+            Number of snapshots dropped
+        """
+        keep = {sheet_key(sheet) for sheet in sheet_urls_or_keys}
+        stale = [key for key in self._snapshots if key not in keep]
+        for key in stale:
+            del self._snapshots[key]
+        if self._service is not None:
+            self._service.retain_worksheets(keep)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every snapshot and forget in-flight reads."""
+        self._snapshots.clear()
+        self._reads.clear()
+
+
+# Global scorebug snapshot store
+scorebug_snapshots = ScorebugSnapshotStore()
@@ -4,13 +4,61 @@ Google Sheets Service
 Handles reading data from Google Sheets scorecards for game submission.
 """
 import asyncio
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 import pygsheets
 
 from utils.logging import get_contextual_logger
+from utils.rate_limit import TokenBucket
 from exceptions import SheetsException
 
 
+# Playtable columns B:BW, in order (from old bot lines 1621-1632)
+PLAY_KEYS = [
+    'play_num', 'batter_id', 'batter_pos', 'pitcher_id',
+    'on_base_code', 'inning_half', 'inning_num', 'batting_order',
+    'starting_outs', 'away_score', 'home_score', 'on_first_id',
+    'on_first_final', 'on_second_id', 'on_second_final',
+    'on_third_id', 'on_third_final', 'batter_final', 'pa', 'ab',
+    'run', 'e_run', 'hit', 'rbi', 'double', 'triple', 'homerun',
+    'bb', 'so', 'hbp', 'sac', 'ibb', 'gidp', 'bphr', 'bpfo',
+    'bp1b', 'bplo', 'sb', 'cs', 'outs', 'pitcher_rest_outs',
+    'wpa', 'catcher_id', 'defender_id', 'runner_id', 'check_pos',
+    'error', 'wild_pitch', 'passed_ball', 'pick_off', 'balk',
+    'is_go_ahead', 'is_tied', 'is_new_inning', 'inherited_runners',
+    'inherited_scored', 'on_hook_for_loss', 'run_differential',
+    'unused-manager', 'unused-pitcherpow', 'unused-pitcherrestip',
+    'unused-runners', 'unused-fatigue', 'unused-roundedip',
+    'unused-elitestart', 'unused-scenario', 'unused-winxaway',
+    'unused-winxhome', 'unused-pinchrunner', 'unused-order',
+    'hand_batting', 'hand_pitching', 're24_primary', 're24_running'
+]
+
+# Pitcherstats columns B:O, in order (from old bot lines 1688-1691)
+PITCHING_KEYS = [
+    'pitcher_id', 'rest_ip', 'is_start', 'base_rest',
+    'extra_rest', 'rest_required', 'win', 'loss', 'is_save',
+    'hold', 'b_save', 'irunners', 'irunners_scored', 'team_id'
+]
+
+# Ranges read for a scorecard submission
+SETUP_VERSION_RANGE = "'Setup'!V35"
+SETUP_GAME_RANGE = "'Setup'!C3:D7"
+PLAYTABLE_RANGE = "'Playtable'!B3:BW300"
+PITCHING_RANGE = "'Pitcherstats'!B3:O30"
+# Box score lives on the Scorecard tab, or the Box Score tab on older cards
+BOX_SCORE_RANGES = (("Scorecard", "'Scorecard'!BW8:BY9"), ("Box Score", "'Box Score'!T6:V7"))
+
+
+@dataclass
+class ScorecardBundle:
+    """Everything /submit-scorecard reads from a scorecard, fetched in one request."""
+    setup: Dict[str, Any]
+    plays: List[Dict[str, Any]]
+    box_score: Dict[str, List[int]]
+    decisions: List[Dict[str, Any]]
+
+
 class SheetsService:
     """Google Sheets integration for scorecard reading."""
 
@@ -73,6 +121,137 @@ class SheetsService:
                 "Unable to access scorecard. Is it publicly readable?"
             ) from e
 
+    async def read_scorecard_bundle(
+        self,
+        scorecard: pygsheets.Spreadsheet
+    ) -> ScorecardBundle:
+        """
+        Read setup data, plays, box score and pitching decisions in one request.
+
+        All ranges across the Setup, Playtable, Scorecard/Box Score and
+        Pitcherstats tabs are fetched with a single values batchGet. The box
+        score tab is picked from the worksheet list loaded when the scorecard
+        was opened, so no extra lookup is needed.
+
+        Returns:
+            ScorecardBundle with the same data as read_setup_data,
+            read_playtable_data, read_box_score and read_pitching_decisions
+
+        Raises:
+            SheetsException: If the scorecard cannot be read
+        """
+        titles = {worksheet.title for worksheet in scorecard.worksheets()}
+        box_score_range = next(
+            (cell_range for title, cell_range in BOX_SCORE_RANGES if title in titles),
+            None
+        )
+        if box_score_range is None:
+            raise SheetsException("Unable to read box score")
+
+        ranges = [SETUP_VERSION_RANGE, SETUP_GAME_RANGE, PLAYTABLE_RANGE, box_score_range, PITCHING_RANGE]
+
+        try:
+            loop = asyncio.get_event_loop()
+            value_ranges = await loop.run_in_executor(
+                None,
+                scorecard.client.sheet.values_batch_get,
+                scorecard.id,
+                ranges
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to read scorecard ranges: {e}")
+            raise SheetsException("Unable to read scorecard data") from e
+
+        # Empty ranges come back without a 'values' key
+        version_rows, game_rows, play_rows, box_rows, pitching_rows = (
+            value_range.get('values', []) for value_range in value_ranges
+        )
+
+        try:
+            setup = self._parse_setup_data(
+                version_rows[0][0] if version_rows and version_rows[0] else '',
+                self._pad_rows(game_rows, 5, 2)
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to read setup data: {e}")
+            raise SheetsException("Unable to read game setup data") from e
+
+        try:
+            box_score = self._parse_box_score(self._pad_rows(box_rows, 2, 3))
+        except Exception as e:
+            self.logger.error(f"Failed to read box score: {e}")
+            raise SheetsException("Unable to read box score") from e
+
+        plays = self._parse_playtable_data(play_rows)
+        decisions = self._parse_pitching_decisions(pitching_rows)
+        self.logger.info(
+            f"Read scorecard {scorecard.title} in one request: "
+            f"{len(plays)} plays, {len(decisions)} pitching decisions"
+        )
+
+        return ScorecardBundle(setup=setup, plays=plays, box_score=box_score, decisions=decisions)
+
+    @staticmethod
+    def _pad_rows(rows: List[List[str]], height: int, width: int) -> List[List[str]]:
+        """Pad a values response to a fixed range size (the API drops trailing blanks)."""
+        padded = [list(row) + [''] * (width - len(row)) for row in rows[:height]]
+        return padded + [[''] * width for _ in range(height - len(padded))]
+
+    @staticmethod
+    def _parse_setup_data(version: str, g_data: List[List[str]]) -> Dict[str, Any]:
+        """Map the Setup tab version (V35) and game data (C3:D7) to setup fields."""
+        return {
+            'version': version,
+            'week': int(g_data[1][0]),
+            'game_num': int(g_data[2][0]),
+            'away_team_abbrev': g_data[3][0],
+            'home_team_abbrev': g_data[4][0],
+            'away_manager_name': g_data[3][1],
+            'home_manager_name': g_data[4][1]
+        }
+
+    @staticmethod
+    def _parse_playtable_data(all_plays: List[List[str]]) -> List[Dict[str, Any]]:
+        """Map Playtable rows to play dictionaries, skipping rows with 5 or fewer fields."""
+        p_data = []
+        for line in all_plays:
+            this_data = {}
+            for count, value in enumerate(line):
+                if value != '' and count < len(PLAY_KEYS):
+                    this_data[PLAY_KEYS[count]] = value
+
+            # Only include rows with meaningful data (>5 fields)
+            if len(this_data.keys()) > 5:
+                p_data.append(this_data)
+
+        return p_data
+
+    @staticmethod
+    def _parse_pitching_decisions(all_decisions: List[List[str]]) -> List[Dict[str, Any]]:
+        """Map Pitcherstats rows to decision dictionaries, skipping empty rows."""
+        pit_data = []
+        for line in all_decisions:
+            if not line:  # Skip empty rows
+                continue
+
+            this_data = {}
+            for count, value in enumerate(line):
+                if value != '' and count < len(PITCHING_KEYS):
+                    this_data[PITCHING_KEYS[count]] = value
+
+            if this_data:  # Only include non-empty rows
+                pit_data.append(this_data)
+
+        return pit_data
+
+    @staticmethod
+    def _parse_box_score(score_table: List[List[str]]) -> Dict[str, List[int]]:
+        """Map the two box score rows to away/home [runs, hits, errors]."""
+        return {
+            'away': [int(x) for x in score_table[0]],  # [R, H, E]
+            'home': [int(x) for x in score_table[1]]   # [R, H, E]
+        }
+
     async def read_setup_data(
         self,
         scorecard: pygsheets.Spreadsheet
@@ -119,15 +298,7 @@ class SheetsService:
                 'D7'
             )
 
-            return {
-                'version': version,
-                'week': int(g_data[1][0]),
-                'game_num': int(g_data[2][0]),
-                'away_team_abbrev': g_data[3][0],
-                'home_team_abbrev': g_data[4][0],
-                'away_manager_name': g_data[3][1],
-                'home_manager_name': g_data[4][1]
-            }
+            return self._parse_setup_data(version, g_data)
 
         except Exception as e:
             self.logger.error(f"Failed to read setup data: {e}")
@@ -164,37 +335,7 @@ class SheetsService:
                 'BW300'
             )
 
-            # Field names in order (from old bot lines 1621-1632)
-            play_keys = [
-                'play_num', 'batter_id', 'batter_pos', 'pitcher_id',
-                'on_base_code', 'inning_half', 'inning_num', 'batting_order',
-                'starting_outs', 'away_score', 'home_score', 'on_first_id',
-                'on_first_final', 'on_second_id', 'on_second_final',
-                'on_third_id', 'on_third_final', 'batter_final', 'pa', 'ab',
-                'run', 'e_run', 'hit', 'rbi', 'double', 'triple', 'homerun',
-                'bb', 'so', 'hbp', 'sac', 'ibb', 'gidp', 'bphr', 'bpfo',
-                'bp1b', 'bplo', 'sb', 'cs', 'outs', 'pitcher_rest_outs',
-                'wpa', 'catcher_id', 'defender_id', 'runner_id', 'check_pos',
-                'error', 'wild_pitch', 'passed_ball', 'pick_off', 'balk',
-                'is_go_ahead', 'is_tied', 'is_new_inning', 'inherited_runners',
-                'inherited_scored', 'on_hook_for_loss', 'run_differential',
-                'unused-manager', 'unused-pitcherpow', 'unused-pitcherrestip',
-                'unused-runners', 'unused-fatigue', 'unused-roundedip',
-                'unused-elitestart', 'unused-scenario', 'unused-winxaway',
-                'unused-winxhome', 'unused-pinchrunner', 'unused-order',
-                'hand_batting', 'hand_pitching', 're24_primary', 're24_running'
-            ]
-
-            p_data = []
-            for line in all_plays:
-                this_data = {}
-                for count, value in enumerate(line):
-                    if value != '' and count < len(play_keys):
-                        this_data[play_keys[count]] = value
-
-                # Only include rows with meaningful data (>5 fields)
-                if len(this_data.keys()) > 5:
-                    p_data.append(this_data)
+            p_data = self._parse_playtable_data(all_plays)
 
             self.logger.info(f"Read {len(p_data)} plays from scorecard")
             return p_data
@@ -234,25 +375,7 @@ class SheetsService:
                 'O30'
             )
 
-            # Field names in order (from old bot lines 1688-1691)
-            pit_keys = [
-                'pitcher_id', 'rest_ip', 'is_start', 'base_rest',
-                'extra_rest', 'rest_required', 'win', 'loss', 'is_save',
-                'hold', 'b_save', 'irunners', 'irunners_scored', 'team_id'
-            ]
-
-            pit_data = []
-            for line in all_decisions:
-                if not line:  # Skip empty rows
-                    continue
-
-                this_data = {}
-                for count, value in enumerate(line):
-                    if value != '' and count < len(pit_keys):
-                        this_data[pit_keys[count]] = value
-
-                if this_data:  # Only include non-empty rows
-                    pit_data.append(this_data)
+            pit_data = self._parse_pitching_decisions(all_decisions)
 
             self.logger.info(f"Read {len(pit_data)} pitching decisions")
             return pit_data
@@ -305,11 +428,22 @@ class SheetsService:
                     'V7'
                 )
 
-            return {
-                'away': [int(x) for x in score_table[0]],  # [R, H, E]
-                'home': [int(x) for x in score_table[1]]   # [R, H, E]
-            }
+            return self._parse_box_score(score_table)
 
         except Exception as e:
             self.logger.error(f"Failed to read box score: {e}")
             raise SheetsException("Unable to read box score") from e
+
+
+# Global Google Sheets rate limiter, shared by background sheet readers
+_sheets_rate_limiter: Optional[TokenBucket] = None
+
+
+def get_sheets_rate_limiter() -> TokenBucket:
+    """Get the token bucket that paces background Google Sheets reads."""
+    global _sheets_rate_limiter
+    if _sheets_rate_limiter is None:
+        from config import get_config
+        config = get_config()
+        _sheets_rate_limiter = TokenBucket(config.sheets_rate_limit, config.sheets_rate_burst)
+    return _sheets_rate_limiter
@@ -9,6 +9,7 @@ from typing import Optional, List, Dict
 from services.base_service import BaseService
 from models.standings import TeamStandings
 from exceptions import APIException
+from utils.cache import CacheManager
 
 logger = logging.getLogger(f'{__name__}.StandingsService')
 
@@ -22,12 +23,17 @@ class StandingsService:
     - Division-based filtering
     - Season-specific data
     - Playoff positioning
+    - Two-tier (in-process + Redis) caching of league standings
     """
-    
-    def __init__(self):
+
+    # Standings only change when games are submitted (which recalculates them)
+    STANDINGS_TTL = 300
+
+    def __init__(self, cache_manager: Optional[CacheManager] = None):
         """Initialize standings service."""
         from api.client import get_global_client
         self._get_client = get_global_client
+        self.cache = cache_manager or CacheManager()
         logger.debug("StandingsService initialized")
     
     async def get_client(self):
@@ -44,6 +50,22 @@ class StandingsService:
         Returns:
             List of TeamStandings ordered by record
         """
+        cache_key = self.cache.cache_key("sba", f"standings_s{season}")
+        tags = (f"standings:{season}",)
+        cached = self.cache.get_local(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            cached_data, remaining_ttl = await self.cache.get_with_ttl(cache_key)
+            if cached_data and isinstance(cached_data, list):
+                standings = [TeamStandings.from_api_data(item) for item in cached_data]
+                # Promote to L1 so it expires together with the Redis entry
+                self.cache.set_local(cache_key, standings, remaining_ttl, tags)
+                return standings
+        except Exception as e:
+            logger.warning(f"Error deserializing cached standings for season {season}: {e}")
+
         try:
             client = await self.get_client()
             
@@ -70,6 +92,11 @@ class StandingsService:
                     continue
             
             logger.info(f"Retrieved standings for {len(standings)} teams in season {season}")
+            self.cache.set_local(cache_key, standings, self.STANDINGS_TTL, tags)
+            try:
+                await self.cache.set(cache_key, [item.model_dump() for item in standings], self.STANDINGS_TTL, tags)
+            except Exception as e:
+                logger.warning(f"Error caching standings for season {season}: {e}")
             return standings
             
         except Exception as e:
@@ -148,6 +175,22 @@ class StandingsService:
             logger.error(f"Error getting standings for team {team_abbrev}: {e}")
             return None
     
+    async def get_win_percentages(self, season: int) -> Dict[str, float]:
+        """
+        Get every team's winning percentage from a single standings fetch.
+
+        Args:
+            season: Season number
+
+        Returns:
+            Dictionary mapping uppercase team abbreviation to winning percentage
+        """
+        all_standings = await self.get_league_standings(season)
+        return {
+            team_standings.team.abbrev.upper(): team_standings.winning_percentage
+            for team_standings in all_standings
+        }
+
     async def get_playoff_picture(self, season: int) -> Dict[str, List[TeamStandings]]:
         """
         Get playoff picture with division leaders and wild card contenders.
@@ -224,6 +267,7 @@ class StandingsService:
             )
 
             logger.info(f"Recalculated standings for season {season}")
+            await self.cache.invalidate_tags(f"standings:{season}")
             return True
 
         except Exception as e:
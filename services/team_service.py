@@ -8,9 +8,10 @@ from typing import Optional, List, Dict, Any
 
 from config import get_config
 from services.base_service import BaseService
+from services.organization_registry import organization_registry
 from models.team import Team, RosterType
 from exceptions import APIException
-from utils.decorators import cached_single_item
+from utils.decorators import cached_api_call, cached_single_item, cache_invalidate
 
 logger = logging.getLogger(f'{__name__}.TeamService')
 
@@ -33,7 +34,7 @@ class TeamService(BaseService[Team]):
         super().__init__(Team, 'teams')
         logger.debug("TeamService initialized")
     
-    @cached_single_item(ttl=1800)  # 30-minute cache
+    @cached_single_item(ttl=1800, tags=("team:{team_id}",))  # 30-minute cache
     async def get_team(self, team_id: int) -> Optional[Team]:
         """
         Get team by ID with error handling.
@@ -41,7 +42,7 @@ class TeamService(BaseService[Team]):
         Cached for 30 minutes since team details rarely change.
         Uses @cached_single_item because returns Optional[Team].
 
-        Cache key: team:id:{team_id}
+        Cache tags: team:{team_id}
 
         Args:
             team_id: Unique team identifier
@@ -103,7 +104,7 @@ class TeamService(BaseService[Team]):
         logger.debug(f"No teams found for owner {owner_id} in season {season}")
         return []
 
-    @cached_single_item(ttl=1800)  # 30-minute cache
+    @cached_single_item(ttl=1800, tags=("owner:{owner_id}", "season:{season}", "team:{result.id}"))  # 30-minute cache
     async def get_team_by_owner(self, owner_id: int, season: Optional[int] = None) -> Optional[Team]:
         """
         Get the primary (Major League) team owned by a Discord user.
@@ -115,7 +116,7 @@ class TeamService(BaseService[Team]):
         Cached for 30 minutes since GM assignments rarely change.
         Uses @cached_single_item because returns Optional[Team].
 
-        Cache key: team:owner:{season}:{owner_id}
+        Cache tags: owner:{owner_id}, season:{season}, team:{team.id}
 
         Args:
             owner_id: Discord user ID
@@ -159,9 +160,12 @@ class TeamService(BaseService[Team]):
             logger.error(f"Error getting team by abbreviation '{abbrev}': {e}")
             return None
     
+    @cached_api_call(ttl=1800, tags=("season:{season}", "team:{item.id}"))  # 30-minute cache
     async def get_teams_by_season(self, season: int) -> List[Team]:
         """
         Get all teams for a specific season.
+
+        Cached for 30 minutes; update_team invalidates the entry via its team tags.
         
         Args:
             season: Season number
@@ -270,10 +274,14 @@ class TeamService(BaseService[Team]):
             logger.error(f"Failed to get roster for team {team_id}: {e}")
             return None
     
+    @cache_invalidate("team:{team_id}")
     async def update_team(self, team_id: int, updates: dict) -> Optional[Team]:
         """
         Update team information.
 
+        Invalidates every cached entry tagged with this team and refreshes the
+        team in the organization registry.
+
         Args:
             team_id: Team ID to update
             updates: Dictionary of fields to update
@@ -283,7 +291,10 @@ class TeamService(BaseService[Team]):
         """
         try:
             # Use PATCH with query parameters (database API expects this)
-            return await self.patch(team_id, updates, use_query_params=True)
+            updated_team = await self.patch(team_id, updates, use_query_params=True)
+            if updated_team:
+                organization_registry.update_team(updated_team)
+            return updated_team
         except Exception as e:
             logger.error(f"Failed to update team {team_id}: {e}")
             return None
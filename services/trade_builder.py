@@ -12,10 +12,19 @@ from config import get_config
 from models.trade import Trade, TradeParticipant, TradeMove, TradeStatus
 from models.team import Team, RosterType
 from models.player import Player
-from services.transaction_builder import TransactionBuilder, RosterValidationResult, TransactionMove
+from services.transaction_builder import (
+    APPROX_BUILDER_BYTES,
+    APPROX_PLAYER_BYTES,
+    RosterValidationResult,
+    TransactionBuilder,
+    TransactionMove,
+    approx_builder_size,
+    validation_context,
+)
 from services.team_service import team_service
 from services.roster_service import roster_service
 from services.league_service import league_service
+from utils.builder_registry import BuilderRegistry, EvictionCallback
 
 logger = logging.getLogger(f'{__name__}.TradeBuilder')
 
@@ -120,6 +129,11 @@ class TradeBuilder:
         """Get total number of moves in trade."""
         return self.trade.total_moves
 
+    @property
+    def awaiting_acceptance(self) -> bool:
+        """Check if the trade has been proposed or accepted and is waiting on the other GMs."""
+        return self.trade.status in (TradeStatus.PROPOSED, TradeStatus.ACCEPTED)
+
     @property
     def all_teams_accepted(self) -> bool:
         """Check if all participating teams have accepted the trade."""
@@ -455,6 +469,9 @@ class TradeBuilder:
             result.is_legal = False
             result.trade_errors.extend(balance_errors)
 
+        # Load every participant's missing roster data at once, then validate each team
+        await self._load_validation_data(next_week)
+
         # Validate each team's roster after the trade
         for participant in self.trade.participants:
             team_id = participant.team.id
@@ -477,6 +494,15 @@ class TradeBuilder:
         logger.debug(f"Trade validation for {self.trade_id}: Legal={result.is_legal}, Errors={len(result.all_errors)}")
         return result
 
+    async def _load_validation_data(self, next_week: Optional[int]) -> None:
+        """Fetch the validation data of every participant that hasn't loaded it, concurrently."""
+        teams = [
+            builder.team for builder in self._team_builders.values()
+            if not builder._roster_loaded or (next_week is not None and not builder._existing_transactions_loaded)
+        ]
+        if teams:
+            await validation_context.load(teams, next_week, self.trade.season)
+
     def _get_or_create_builder(self, team: Team) -> TransactionBuilder:
         """Get or create a transaction builder for a team."""
         if team.id not in self._team_builders:
@@ -500,13 +526,51 @@ class TradeBuilder:
         return self.trade.get_trade_summary()
 
 
-# Global cache for active trade builders
-_active_trade_builders: Dict[str, TradeBuilder] = {}
+def approx_trade_size(builder: TradeBuilder) -> int:
+    """Approximate memory held by a trade builder and its per-team transaction builders."""
+    return (
+        APPROX_BUILDER_BYTES
+        + builder.move_count * APPROX_PLAYER_BYTES
+        + sum(approx_builder_size(team_builder) for team_builder in builder._team_builders.values())
+    )
+
+
+def _new_trade_registry() -> BuilderRegistry[str, TradeBuilder]:
+    config = get_config()
+    return BuilderRegistry(
+        name='trade builder',
+        idle_ttl=config.builder_idle_ttl,
+        max_entries=config.builder_max_entries,
+        max_bytes=config.builder_max_bytes,
+        sizer=approx_trade_size,
+        # Acceptance buttons and channel chat don't touch the registry, so a
+        # proposed trade must not expire while the other GMs decide
+        pinned=lambda builder: builder.awaiting_acceptance
+    )
+
+
+# Global registry of active trade builders (trade key -> builder)
+_active_trade_builders: BuilderRegistry[str, TradeBuilder] = _new_trade_registry()
 
 # Secondary index: maps team_id -> trade_key for multi-GM access
 _team_to_trade_key: Dict[int, str] = {}
 
 
+def _remove_team_mappings(trade_key: str, builder: TradeBuilder) -> None:
+    """Remove the team index entries that point at a trade."""
+    for team in builder.participating_teams:
+        if _team_to_trade_key.get(team.id) == trade_key:
+            del _team_to_trade_key[team.id]
+
+
+def _on_trade_evicted(trade_key: str, builder: TradeBuilder, reason: str) -> None:
+    _remove_team_mappings(trade_key, builder)
+    logger.info(f"Trade {builder.trade_id} evicted ({reason})")
+
+
+_active_trade_builders.add_eviction_callback(_on_trade_evicted)
+
+
 def get_trade_builder(user_id: int, initiating_team: Team) -> TradeBuilder:
     """
     Get or create a trade builder for a user.
@@ -520,13 +584,14 @@ def get_trade_builder(user_id: int, initiating_team: Team) -> TradeBuilder:
     """
     trade_key = f"{user_id}:trade"
 
-    if trade_key not in _active_trade_builders:
+    builder = _active_trade_builders.get(trade_key)
+    if builder is None:
         builder = TradeBuilder(user_id, initiating_team)
-        _active_trade_builders[trade_key] = builder
+        _active_trade_builders.set(trade_key, builder)
         # Register initiating team in secondary index for multi-GM access
         _team_to_trade_key[initiating_team.id] = trade_key
 
-    return _active_trade_builders[trade_key]
+    return builder
 
 
 def get_trade_builder_by_team(team_id: int) -> Optional[TradeBuilder]:
@@ -551,14 +616,10 @@ def get_trade_builder_by_team(team_id: int) -> Optional[TradeBuilder]:
 def clear_trade_builder(user_id: int) -> None:
     """Clear trade builder for a user and remove all team mappings."""
     trade_key = f"{user_id}:trade"
-    if trade_key in _active_trade_builders:
+    builder = _active_trade_builders.pop(trade_key)
+    if builder is not None:
         # Remove all team mappings for this trade
-        builder = _active_trade_builders[trade_key]
-        for team in builder.participating_teams:
-            if team.id in _team_to_trade_key:
-                del _team_to_trade_key[team.id]
-
-        del _active_trade_builders[trade_key]
+        _remove_team_mappings(trade_key, builder)
         logger.info(f"Cleared trade builder for user {user_id}")
 
 
@@ -578,14 +639,10 @@ def clear_trade_builder_by_team(team_id: int) -> bool:
     if not trade_key:
         return False
 
-    if trade_key in _active_trade_builders:
-        builder = _active_trade_builders[trade_key]
+    builder = _active_trade_builders.pop(trade_key)
+    if builder is not None:
         # Remove all team mappings
-        for team in builder.participating_teams:
-            if team.id in _team_to_trade_key:
-                del _team_to_trade_key[team.id]
-
-        del _active_trade_builders[trade_key]
+        _remove_team_mappings(trade_key, builder)
         logger.info(f"Cleared trade builder via team {team_id}")
         return True
 
@@ -594,4 +651,19 @@ def clear_trade_builder_by_team(team_id: int) -> bool:
 
 def get_active_trades() -> Dict[str, TradeBuilder]:
     """Get all active trade builders (for debugging/admin purposes)."""
-    return _active_trade_builders.copy()
\ No newline at end of file
+    return dict(_active_trade_builders.items())
+
+
+def get_trade_builder_stats() -> Dict[str, int]:
+    """Live trade builders, approximate bytes held and eviction count."""
+    return _active_trade_builders.stats()
+
+
+def add_trade_eviction_callback(callback: EvictionCallback) -> None:
+    """Register a callback run with (trade key, builder, reason) after each trade builder eviction."""
+    _active_trade_builders.add_eviction_callback(callback)
+
+
+def remove_trade_eviction_callback(callback: EvictionCallback) -> None:
+    """Unregister a trade builder eviction callback."""
+    _active_trade_builders.remove_eviction_callback(callback)
@@ -2,11 +2,17 @@
 Transaction Builder Service
 
 Handles the complex logic for building multi-move transactions interactively.
+
+Validation reads each team's roster and pending transactions through a shared,
+short-lived ValidationContext keyed by (team_id, week), and each builder keeps
+its last validation result until a move is added or removed.
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple, Set
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Set
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 from config import get_config
@@ -20,6 +26,7 @@ from services.roster_service import roster_service
 from services.transaction_service import transaction_service
 from services.league_service import league_service
 from models.team import RosterType
+from utils.builder_registry import BuilderRegistry
 
 logger = logging.getLogger(f'{__name__}.TransactionBuilder')
 
@@ -133,6 +140,218 @@ class RosterValidationResult:
             return f"ℹ️ **Pre-existing Moves**: {self.pre_existing_transaction_count} scheduled moves ({total_swar_change:.2f} sWAR)"
 
 
+@dataclass
+class RosterTotals:
+    """Player counts, sWAR and position counts for the ML and MiL rosters (or changes to them)."""
+    ml_count: int = 0
+    mil_count: int = 0
+    ml_swar: float = 0.0
+    mil_swar: float = 0.0
+    ml_positions: Dict[str, int] = field(default_factory=dict)
+    mil_positions: Dict[str, int] = field(default_factory=dict)
+    transaction_count: int = 0
+
+    def apply(self, roster_type: RosterType, player: Player, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a player on a roster level. IL and FA are not counted."""
+        if roster_type == RosterType.MAJOR_LEAGUE:
+            self.ml_count += sign
+            self.ml_swar += sign * player.wara
+            positions = self.ml_positions
+        elif roster_type == RosterType.MINOR_LEAGUE:
+            self.mil_count += sign
+            self.mil_swar += sign * player.wara
+            positions = self.mil_positions
+        else:
+            return
+        position = player.primary_position
+        positions[position] = positions.get(position, 0) + sign
+
+    def apply_move(self, move: 'TransactionMove', sign: int) -> None:
+        """Apply a move's change (sign=1) or undo it (sign=-1)."""
+        self.apply(move.from_roster, move.player, -sign)
+        self.apply(move.to_roster, move.player, sign)
+
+    def combined(self, *others: 'RosterTotals') -> 'RosterTotals':
+        """Sum these totals with others into a new RosterTotals."""
+        result = RosterTotals(
+            ml_count=self.ml_count,
+            mil_count=self.mil_count,
+            ml_swar=self.ml_swar,
+            mil_swar=self.mil_swar,
+            ml_positions=dict(self.ml_positions),
+            mil_positions=dict(self.mil_positions),
+            transaction_count=self.transaction_count
+        )
+        for other in others:
+            result.ml_count += other.ml_count
+            result.mil_count += other.mil_count
+            result.ml_swar += other.ml_swar
+            result.mil_swar += other.mil_swar
+            result.transaction_count += other.transaction_count
+            for position, count in other.ml_positions.items():
+                result.ml_positions[position] = result.ml_positions.get(position, 0) + count
+            for position, count in other.mil_positions.items():
+                result.mil_positions[position] = result.mil_positions.get(position, 0) + count
+        return result
+
+    @classmethod
+    def from_roster(cls, roster: TeamRoster) -> 'RosterTotals':
+        """Totals of a current roster."""
+        totals = cls()
+        for player in roster.active_players:
+            totals.apply(RosterType.MAJOR_LEAGUE, player, 1)
+        for player in roster.minor_league_players:
+            totals.apply(RosterType.MINOR_LEAGUE, player, 1)
+        return totals
+
+    @classmethod
+    def from_transactions(cls, transactions: List[Transaction], team: Team) -> 'RosterTotals':
+        """Changes a team's organization gets from already-scheduled transactions."""
+        totals = cls()
+        for transaction in transactions:
+            if transaction.cancelled:
+                continue
+            totals.transaction_count += 1
+            # Leaving our organization (from any roster)
+            if transaction.oldteam.is_same_organization(team):
+                totals.apply(transaction.oldteam.roster_type(), transaction.player, -1)
+            # Joining our organization (to any roster)
+            if transaction.newteam.is_same_organization(team):
+                totals.apply(transaction.newteam.roster_type(), transaction.player, 1)
+        return totals
+
+
+@dataclass
+class TeamValidationData:
+    """A team's roster and pending transactions for one week."""
+    team: Team
+    week: Optional[int]
+    roster: Optional[TeamRoster]
+    transactions: List[Transaction] = field(default_factory=list)
+    loaded_at: float = 0.0
+
+
+class ValidationContext:
+    """
+    Shared (team_id, week) -> TeamValidationData store for builder validation.
+
+    Every TransactionBuilder (including each participant builder of a trade)
+    reads through the same context, so the teams missing from it are fetched
+    together and concurrently, and teams already loaded cost no API calls.
+    Entries expire after `validation_context_ttl` seconds and are dropped as
+    soon as transactions are created for the team's organization.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty context.
+
+        Args:
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._clock = clock
+        self._entries: Dict[Tuple[int, Optional[int]], TeamValidationData] = {}
+
+    def clear(self) -> None:
+        """Forget every team."""
+        self._entries.clear()
+
+    def get_cached(self, team_id: int, week: Optional[int]) -> Optional[TeamValidationData]:
+        """Get a team's data if it is loaded and not expired."""
+        data = self._entries.get((team_id, week))
+        if data is None:
+            return None
+        if self._clock() - data.loaded_at >= get_config().validation_context_ttl:
+            del self._entries[(team_id, week)]
+            return None
+        return data
+
+    async def load(self, teams: Iterable[Team], week: Optional[int], season: int) -> Dict[int, TeamValidationData]:
+        """
+        Get validation data for several teams, fetching the missing ones concurrently.
+
+        Args:
+            teams: Teams to load
+            week: Week whose pending transactions are included (None for roster only)
+            season: Season number
+
+        Returns:
+            Dictionary of team ID -> TeamValidationData. A team whose roster could not
+            be loaded has roster=None and is not kept, so the next load retries it.
+        """
+        result: Dict[int, TeamValidationData] = {}
+        missing: Dict[int, Team] = {}
+        for team in teams:
+            cached = self.get_cached(team.id, week)
+            if cached is not None:
+                result[team.id] = cached
+            else:
+                missing[team.id] = team
+
+        if missing:
+            loaded = await asyncio.gather(*(self._fetch(team, week, season) for team in missing.values()))
+            for data in loaded:
+                result[data.team.id] = data
+                if data.roster is not None:
+                    self._entries[(data.team.id, week)] = data
+            logger.debug(f"Loaded validation data for {len(missing)} teams (week {week})")
+
+        return result
+
+    async def _fetch(self, team: Team, week: Optional[int], season: int) -> TeamValidationData:
+        """Fetch one team's roster and pending transactions at the same time."""
+        # A roster loaded without transactions is reused when the week's moves are needed
+        roster_only = self.get_cached(team.id, None) if week is not None else None
+
+        async def fetch_roster() -> Optional[TeamRoster]:
+            if roster_only is not None:
+                return roster_only.roster
+            try:
+                return await roster_service.get_current_roster(team.id)
+            except Exception as e:
+                logger.error(f"Failed to load roster data for {team.abbrev}: {e}")
+                return None
+
+        async def fetch_transactions() -> List[Transaction]:
+            if week is None:
+                return []
+            try:
+                return await transaction_service.get_team_transactions(
+                    team_abbrev=team.abbrev,
+                    season=season,
+                    cancelled=False,
+                    week_start=week
+                ) or []
+            except Exception as e:
+                logger.error(f"Failed to load existing transactions for {team.abbrev}: {e}")
+                return []
+
+        roster, transactions = await asyncio.gather(fetch_roster(), fetch_transactions())
+        return TeamValidationData(
+            team=team,
+            week=week,
+            roster=roster,
+            transactions=transactions,
+            loaded_at=self._clock()
+        )
+
+    def invalidate(self, team: Team) -> None:
+        """Drop every week's data for a team's organization (ML, MiL and IL)."""
+        stale = [key for key, data in self._entries.items() if data.team.is_same_organization(team)]
+        for key in stale:
+            del self._entries[key]
+
+    def invalidate_transactions(self, transactions: Iterable[Transaction]) -> None:
+        """Drop the data of every organization a batch of new transactions touches."""
+        for transaction in transactions:
+            self.invalidate(transaction.oldteam)
+            self.invalidate(transaction.newteam)
+
+
+# Global validation context shared by every builder
+validation_context = ValidationContext()
+
+
 class TransactionBuilder:
     """Interactive transaction builder for complex multi-move transactions."""
     
@@ -159,40 +378,53 @@ class TransactionBuilder:
         self._existing_transactions: Optional[List[Transaction]] = None
         self._existing_transactions_loaded = False
 
+        # Running totals: the current roster and pre-existing transactions are summed once
+        # per load, and each added or removed move adjusts the move totals in O(1)
+        self._move_totals = RosterTotals()
+        self._roster_totals: Optional[Tuple[TeamRoster, RosterTotals]] = None
+        self._existing_totals: Optional[Tuple[List[Transaction], RosterTotals]] = None
+
+        # Last validation result, reused until the moves, loaded data or roster limits change
+        self._moves_version = 0
+        self._data_version = 0
+        self._validation_cache: Optional[Tuple[Tuple[int, int, Optional[int], int, int], RosterValidationResult]] = None
+
         logger.info(f"TransactionBuilder initialized for {team.abbrev} by user {user_id}")
     
     async def load_roster_data(self) -> None:
         """Load current roster data for the team."""
-        if self._roster_loaded:
-            return
-
-        try:
-            self._current_roster = await roster_service.get_current_roster(self.team.id)
-            self._roster_loaded = True
-            logger.debug(f"Loaded roster data for team {self.team.abbrev}")
-        except Exception as e:
-            logger.error(f"Failed to load roster data: {e}")
-            self._current_roster = None
-            self._roster_loaded = True
+        await self.load_validation_data()
 
     async def load_existing_transactions(self, next_week: int) -> None:
         """Load pre-existing transactions for next week."""
-        if self._existing_transactions_loaded:
+        await self.load_validation_data(next_week)
+
+    async def load_validation_data(self, next_week: Optional[int] = None) -> None:
+        """
+        Load whatever validation data this builder is still missing.
+
+        The roster (and next week's transactions, when `next_week` is given) come
+        from the shared validation context, which fetches them concurrently.
+
+        Args:
+            next_week: Week to load pre-existing transactions for (optional)
+        """
+        need_transactions = next_week is not None and not self._existing_transactions_loaded
+        if self._roster_loaded and not need_transactions:
             return
 
-        try:
-            self._existing_transactions = await transaction_service.get_team_transactions(
-                team_abbrev=self.team.abbrev,
-                season=self.season,
-                cancelled=False,
-                week_start=next_week
-            )
-            self._existing_transactions_loaded = True
-            logger.debug(f"Loaded {len(self._existing_transactions or [])} existing transactions for {self.team.abbrev} week {next_week}")
-        except Exception as e:
-            logger.error(f"Failed to load existing transactions: {e}")
-            self._existing_transactions = []
+        week = next_week if need_transactions else None
+        data = (await validation_context.load([self.team], week, self.season))[self.team.id]
+
+        if not self._roster_loaded and data.roster is not None:
+            self._current_roster = data.roster
+            self._roster_loaded = True
+            logger.debug(f"Loaded roster data for team {self.team.abbrev}")
+        if need_transactions:
+            self._existing_transactions = data.transactions
             self._existing_transactions_loaded = True
+            logger.debug(f"Loaded {len(data.transactions)} existing transactions for {self.team.abbrev} week {next_week}")
+        self._data_version += 1
     
     async def add_move(
         self,
@@ -251,6 +483,8 @@ class TransactionBuilder:
                 return False, error_msg
 
         self.moves.append(move)
+        self._move_totals.apply_move(move, 1)
+        self._moves_version += 1
         logger.info(f"Added move: {move.description}")
         return True, ""
     
@@ -264,11 +498,14 @@ class TransactionBuilder:
         Returns:
             True if move was removed
         """
-        original_count = len(self.moves)
+        removed_moves = [move for move in self.moves if move.player.id == player_id]
         self.moves = [move for move in self.moves if move.player.id != player_id]
         
-        removed = len(self.moves) < original_count
+        removed = bool(removed_moves)
         if removed:
+            for move in removed_moves:
+                self._move_totals.apply_move(move, -1)
+            self._moves_version += 1
             logger.info(f"Removed move for player {player_id}")
         
         return removed
@@ -290,11 +527,16 @@ class TransactionBuilder:
         Returns:
             RosterValidationResult with validation details
         """
-        await self.load_roster_data()
+        # Limits move with the week (and the offseason flag), so they are part of the key
+        ml_limit, mil_limit = await self._roster_limits()
 
-        # Load existing transactions if next_week is provided
-        if next_week is not None:
-            await self.load_existing_transactions(next_week)
+        # Unchanged moves, data and limits: reuse the last result
+        cache_key = (self._moves_version, self._data_version, next_week, ml_limit, mil_limit)
+        if self._validation_cache is not None and self._validation_cache[0] == cache_key:
+            return self._validation_cache[1]
+
+        await self.load_validation_data(next_week)
+        cache_key = (self._moves_version, self._data_version, next_week, ml_limit, mil_limit)
         
         if not self._current_roster:
             return RosterValidationResult(
@@ -306,132 +548,24 @@ class TransactionBuilder:
                 suggestions=[]
             )
         
-        # Calculate roster changes from moves
-        ml_changes = 0
-        mil_changes = 0
         errors = []
         warnings = []
         suggestions = []
 
-        # Calculate current sWAR for each roster
-        current_ml_swar = sum(player.wara for player in self._current_roster.active_players)
-        current_mil_swar = sum(player.wara for player in self._current_roster.minor_league_players)
-
-        # Track sWAR changes from moves
-        ml_swar_changes = 0.0
-        mil_swar_changes = 0.0
-
-        # Track pre-existing transaction changes separately
-        pre_existing_ml_swar_change = 0.0
-        pre_existing_mil_swar_change = 0.0
-        pre_existing_count = 0
-
-        # Process existing transactions first
-        if self._existing_transactions:
-            for transaction in self._existing_transactions:
-                # Skip if this transaction was already processed or cancelled
-                if transaction.cancelled:
-                    continue
-
-                pre_existing_count += 1
-
-                # Determine roster changes from existing transaction
-                # Use Team.is_same_organization() to check if transaction affects our organization
-
-                # Leaving our organization (from any roster)
-                if transaction.oldteam.is_same_organization(self.team):
-                    # Player leaving our organization - determine which roster they're leaving from
-                    from_roster_type = transaction.oldteam.roster_type()
-
-                    if from_roster_type == RosterType.MAJOR_LEAGUE:
-                        ml_changes -= 1
-                        ml_swar_changes -= transaction.player.wara
-                        pre_existing_ml_swar_change -= transaction.player.wara
-                    elif from_roster_type == RosterType.MINOR_LEAGUE:
-                        mil_changes -= 1
-                        mil_swar_changes -= transaction.player.wara
-                        pre_existing_mil_swar_change -= transaction.player.wara
-                    # Note: IL players don't count toward roster limits, so no changes needed
-
-                # Joining our organization (to any roster)
-                if transaction.newteam.is_same_organization(self.team):
-                    # Player joining our organization - determine which roster they're joining
-                    to_roster_type = transaction.newteam.roster_type()
-
-                    if to_roster_type == RosterType.MAJOR_LEAGUE:
-                        ml_changes += 1
-                        ml_swar_changes += transaction.player.wara
-                        pre_existing_ml_swar_change += transaction.player.wara
-                    elif to_roster_type == RosterType.MINOR_LEAGUE:
-                        mil_changes += 1
-                        mil_swar_changes += transaction.player.wara
-                        pre_existing_mil_swar_change += transaction.player.wara
-                    # Note: IL players don't count toward roster limits, so no changes needed
-
-        for move in self.moves:
-            # Log move being processed for diagnostics
-            logger.debug(f"🔍 VALIDATION: Processing move - {move.player.name} (ID={move.player.id})")
-            logger.debug(f"🔍 VALIDATION: from_roster={move.from_roster.value}, to_roster={move.to_roster.value}")
-
-            # Calculate roster changes based on from/to locations
-            if move.from_roster == RosterType.MAJOR_LEAGUE:
-                ml_changes -= 1
-                ml_swar_changes -= move.player.wara
-                logger.debug(f"🔍 VALIDATION: ML decrement - ml_changes now {ml_changes}")
-            elif move.from_roster == RosterType.MINOR_LEAGUE:
-                mil_changes -= 1
-                mil_swar_changes -= move.player.wara
-                logger.debug(f"🔍 VALIDATION: MiL decrement - mil_changes now {mil_changes}")
-            # Note: INJURED_LIST and FREE_AGENCY don't count toward ML roster limit
-
-            if move.to_roster == RosterType.MAJOR_LEAGUE:
-                ml_changes += 1
-                ml_swar_changes += move.player.wara
-                logger.debug(f"🔍 VALIDATION: ML increment - ml_changes now {ml_changes}")
-            elif move.to_roster == RosterType.MINOR_LEAGUE:
-                mil_changes += 1
-                mil_swar_changes += move.player.wara
-                logger.debug(f"🔍 VALIDATION: MiL increment - mil_changes now {mil_changes}")
-            # Note: INJURED_LIST and FREE_AGENCY don't count toward ML roster limit
-        
-        # Calculate projected roster sizes and sWAR
-        # Only Major League players count toward ML roster limit (IL and MiL are separate)
-        current_ml_size = len(self._current_roster.active_players)
-        current_mil_size = len(self._current_roster.minor_league_players)
-
-        logger.debug(f"🔍 VALIDATION: Current roster - ML:{current_ml_size}, MiL:{current_mil_size}")
-        logger.debug(f"🔍 VALIDATION: Changes calculated - ml_changes:{ml_changes}, mil_changes:{mil_changes}")
+        # Current roster + pre-existing transactions + this builder's moves, from running totals
+        current = self._current_roster_totals()
+        existing = self._existing_transaction_totals()
+        projected = current.combined(existing, self._move_totals)
 
-        projected_ml_size = current_ml_size + ml_changes
-        projected_mil_size = current_mil_size + mil_changes
-        projected_ml_swar = current_ml_swar + ml_swar_changes
-        projected_mil_swar = current_mil_swar + mil_swar_changes
+        projected_ml_size = projected.ml_count
+        projected_mil_size = projected.mil_count
+        projected_ml_swar = projected.ml_swar
+        projected_mil_swar = projected.mil_swar
 
+        logger.debug(f"🔍 VALIDATION: Current roster - ML:{current.ml_count}, MiL:{current.mil_count}")
         logger.debug(f"🔍 VALIDATION: Projected roster - ML:{projected_ml_size}, MiL:{projected_mil_size}")
         logger.debug(f"🔍 VALIDATION: Projected sWAR - ML:{projected_ml_swar:.2f}, MiL:{projected_mil_swar:.2f}")
         
-        # Get current week and config to determine roster limits
-        config = get_config()
-        try:
-            current_state = await league_service.get_current_state()
-            current_week = current_state.week if current_state else 1
-        except Exception as e:
-            logger.warning(f"Could not get current week, using default limits: {e}")
-            current_week = 1
-
-        # Determine roster limits based on week and offseason flag
-        # During offseason, limits are relaxed to allow roster building
-        if config.offseason_flag:
-            ml_limit = config.ml_roster_limit_offseason
-            mil_limit = config.mil_roster_limit_offseason
-            logger.debug("🔍 VALIDATION: Offseason mode - using relaxed roster limits")
-        elif current_week < config.expand_mil_week:
-            ml_limit = config.ml_roster_limit_early
-            mil_limit = config.mil_roster_limit_early
-        else:
-            ml_limit = config.ml_roster_limit_late
-            mil_limit = config.mil_roster_limit_late
-        
         # Validate roster limits
         is_legal = True
         if projected_ml_size > ml_limit:
@@ -454,7 +588,7 @@ class TransactionBuilder:
         if not self.moves:
             suggestions.append("Add player moves to build your transaction")
         
-        return RosterValidationResult(
+        result = RosterValidationResult(
             is_legal=is_legal,
             major_league_count=projected_ml_size,
             minor_league_count=projected_mil_size,
@@ -465,11 +599,57 @@ class TransactionBuilder:
             minor_league_limit=mil_limit,
             major_league_swar=projected_ml_swar,
             minor_league_swar=projected_mil_swar,
-            pre_existing_ml_swar_change=pre_existing_ml_swar_change,
-            pre_existing_mil_swar_change=pre_existing_mil_swar_change,
-            pre_existing_transaction_count=pre_existing_count
+            pre_existing_ml_swar_change=existing.ml_swar,
+            pre_existing_mil_swar_change=existing.mil_swar,
+            pre_existing_transaction_count=existing.transaction_count
         )
+        self._validation_cache = (cache_key, result)
+        return result
+
+    async def _roster_limits(self) -> Tuple[int, int]:
+        """ML and MiL roster limits for the current week and offseason flag."""
+        config = get_config()
+        try:
+            current_state = await league_service.get_current_state()
+            current_week = current_state.week if current_state else 1
+        except Exception as e:
+            logger.warning(f"Could not get current week, using default limits: {e}")
+            current_week = 1
+
+        # During offseason, limits are relaxed to allow roster building
+        if config.offseason_flag:
+            logger.debug("🔍 VALIDATION: Offseason mode - using relaxed roster limits")
+            return config.ml_roster_limit_offseason, config.mil_roster_limit_offseason
+        if current_week < config.expand_mil_week:
+            return config.ml_roster_limit_early, config.mil_roster_limit_early
+        return config.ml_roster_limit_late, config.mil_roster_limit_late
     
+    def _current_roster_totals(self) -> RosterTotals:
+        """Totals of the loaded roster, summed once per roster."""
+        if self._roster_totals is None or self._roster_totals[0] is not self._current_roster:
+            self._roster_totals = (self._current_roster, RosterTotals.from_roster(self._current_roster))
+        return self._roster_totals[1]
+
+    def _existing_transaction_totals(self) -> RosterTotals:
+        """Changes from the loaded pre-existing transactions, summed once per load."""
+        transactions = self._existing_transactions or []
+        if self._existing_totals is None or self._existing_totals[0] is not transactions:
+            self._existing_totals = (transactions, RosterTotals.from_transactions(transactions, self.team))
+        return self._existing_totals[1]
+
+    def recompute_totals(self) -> RosterTotals:
+        """
+        Recompute the projected totals from scratch.
+
+        Validation uses the running totals; this full pass over the roster,
+        pre-existing transactions and moves exists to verify them.
+        """
+        totals = RosterTotals.from_roster(self._current_roster)
+        totals = totals.combined(RosterTotals.from_transactions(self._existing_transactions or [], self.team))
+        for move in self.moves:
+            totals.apply_move(move, 1)
+        return totals
+
     async def submit_transaction(self, week: int, check_existing_transactions: bool = True) -> List[Transaction]:
         """
         Submit the transaction by creating individual Transaction models.
@@ -564,6 +744,8 @@ class TransactionBuilder:
     def clear_moves(self) -> None:
         """Clear all moves from the transaction builder."""
         self.moves.clear()
+        self._move_totals = RosterTotals()
+        self._moves_version += 1
         logger.info("Cleared all moves from transaction builder")
     
     @property
@@ -577,8 +759,32 @@ class TransactionBuilder:
         return len(self.moves)
 
 
-# Global cache for active transaction builders
-_active_builders: Dict[int, TransactionBuilder] = {}
+# Rough per-object sizes for the builder registry's memory estimate
+APPROX_BUILDER_BYTES = 4 * 1024
+APPROX_PLAYER_BYTES = 2 * 1024
+
+
+def approx_builder_size(builder: TransactionBuilder) -> int:
+    """Approximate memory held by a transaction builder (roster, pending transactions, moves)."""
+    players = len(builder.moves) + len(builder._existing_transactions or [])
+    if builder._current_roster is not None:
+        players += builder._current_roster.total_players
+    return APPROX_BUILDER_BYTES + players * APPROX_PLAYER_BYTES
+
+
+def _new_builder_registry() -> BuilderRegistry[int, TransactionBuilder]:
+    config = get_config()
+    return BuilderRegistry(
+        name='transaction builder',
+        idle_ttl=config.builder_idle_ttl,
+        max_entries=config.builder_max_entries,
+        max_bytes=config.builder_max_bytes,
+        sizer=approx_builder_size
+    )
+
+
+# Global registry of active transaction builders (user ID -> builder)
+_active_builders: BuilderRegistry[int, TransactionBuilder] = _new_builder_registry()
 
 
 def get_transaction_builder(user_id: int, team: Team) -> TransactionBuilder:
@@ -592,14 +798,20 @@ def get_transaction_builder(user_id: int, team: Team) -> TransactionBuilder:
     Returns:
         TransactionBuilder instance
     """
-    if user_id not in _active_builders:
-        _active_builders[user_id] = TransactionBuilder(team, user_id)
+    builder = _active_builders.get(user_id)
+    if builder is None:
+        builder = TransactionBuilder(team, user_id)
+        _active_builders.set(user_id, builder)
     
-    return _active_builders[user_id]
+    return builder
 
 
 def clear_transaction_builder(user_id: int) -> None:
     """Clear transaction builder for a user."""
-    if user_id in _active_builders:
-        del _active_builders[user_id]
-        logger.info(f"Cleared transaction builder for user {user_id}")
\ No newline at end of file
+    if _active_builders.pop(user_id) is not None:
+        logger.info(f"Cleared transaction builder for user {user_id}")
+
+
+def get_transaction_builder_stats() -> Dict[str, int]:
+    """Live transaction builders, approximate bytes held and eviction count."""
+    return _active_builders.stats()
@@ -0,0 +1,265 @@
+"""
+Transaction executor for Discord Bot v2.0
+
+Applies a week's player moves (one PATCH per player) for the freeze/thaw task
+and /admin-process-transactions. Updates run concurrently up to a limit and
+are paced by a token bucket so processing doesn't starve the rest of the bot's
+API traffic. Moves on the same player always run in their original order, and
+failures are reported grouped by moveid.
+
+Runs can be journaled (see TransactionJournal) so an interrupted week resumes
+from the updates already applied.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from models.transaction import Transaction
+from services.transaction_journal import TransactionJournal
+from utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(f'{__name__}.TransactionExecutor')
+
+# Applies one move; returns False (or raises) when the update did not happen
+MoveUpdate = Callable[[Transaction], Awaitable[bool]]
+
+# Fetches the moves to apply when there is no run to resume
+MoveFetch = Callable[[], Awaitable[List[Transaction]]]
+
+
+@dataclass
+class MoveFailure:
+    """A move whose player update failed."""
+    transaction: Transaction
+    error: str
+
+
+@dataclass
+class ExecutionReport:
+    """Outcome of executing a batch of moves."""
+    total: int
+    succeeded: int = 0
+    skipped: int = 0
+    resumed: bool = False
+    failures: Dict[str, List[MoveFailure]] = field(default_factory=dict)
+
+    @property
+    def failed(self) -> int:
+        """Number of moves that failed."""
+        return sum(len(moves) for moves in self.failures.values())
+
+    @property
+    def completed(self) -> int:
+        """Number of moves handled so far (including moves already applied by an earlier run)."""
+        return self.succeeded + self.skipped + self.failed
+
+    @property
+    def failed_move_ids(self) -> List[str]:
+        """Moveids with at least one failed move, in the order they first failed."""
+        return list(self.failures)
+
+    def record_failure(self, transaction: Transaction, error: str) -> None:
+        self.failures.setdefault(transaction.moveid, []).append(MoveFailure(transaction, error))
+
+
+ProgressCallback = Callable[[ExecutionReport], Awaitable[None]]
+
+
+class TransactionExecutor:
+    """Runs per-player move updates with bounded concurrency and rate limiting."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        rate: float = 10.0,
+        burst: int = 5,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_concurrency: Maximum player updates in flight at once
+            rate: Sustained player updates per second
+            burst: Updates allowed back-to-back before the rate applies
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self._bucket = TokenBucket(rate, burst, clock=clock)
+
+    @classmethod
+    def from_config(cls, config) -> 'TransactionExecutor':
+        """Build an executor from the transaction processing settings in BotConfig."""
+        return cls(
+            max_concurrency=config.transaction_max_concurrency,
+            rate=config.transaction_rate_limit,
+            burst=config.transaction_rate_burst
+        )
+
+    async def execute(
+        self,
+        transactions: List[Transaction],
+        update: MoveUpdate,
+        progress: Optional[ProgressCallback] = None,
+        journal: Optional[TransactionJournal] = None
+    ) -> ExecutionReport:
+        """
+        Apply every move's player update.
+
+        Args:
+            transactions: Moves to apply, in processing order
+            update: Coroutine function applying one move
+            progress: Awaited with the running report after each move completes
+            journal: Journal to record results in; moves it lists as applied are skipped
+
+        Returns:
+            ExecutionReport with success count and failures grouped by moveid
+        """
+        report = ExecutionReport(total=len(transactions))
+        if not transactions:
+            return report
+
+        # Moves on the same player run sequentially in their original order
+        chains: Dict[int, List[Transaction]] = OrderedDict()
+        for transaction in transactions:
+            chains.setdefault(transaction.player.id, []).append(transaction)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_chain(chain: List[Transaction]) -> None:
+            for transaction in chain:
+                if journal is not None and journal.is_applied(transaction):
+                    report.skipped += 1
+                    continue
+
+                async with semaphore:
+                    await self._bucket.acquire()
+                    try:
+                        if await update(transaction):
+                            error = None
+                        else:
+                            error = "Player update returned no response"
+                    except Exception as e:
+                        error = str(e)
+
+                if error is None:
+                    report.succeeded += 1
+                else:
+                    report.record_failure(transaction, error)
+                if journal is not None:
+                    await self._journal_result(journal, transaction, error)
+
+                if progress is not None:
+                    try:
+                        await progress(report)
+                    except Exception as e:
+                        logger.warning(f"Transaction progress callback failed: {e}")
+
+        await asyncio.gather(*(run_chain(chain) for chain in chains.values()))
+
+        logger.info(
+            f"Executed {report.total} moves: {report.succeeded} succeeded, {report.skipped} already applied, "
+            f"{report.failed} failed across {len(report.failures)} transactions"
+        )
+        return report
+
+    @staticmethod
+    async def _journal_result(journal: TransactionJournal, transaction: Transaction, error: Optional[str]) -> None:
+        # A journal write failure must not abort the run; the update itself already happened
+        try:
+            if error is None:
+                journal.record_applied(transaction)
+            else:
+                journal.record_failed(transaction, error)
+            await journal.flush()
+        except Exception as e:
+            logger.error(f"Failed to journal move {transaction.moveid} (player {transaction.player.id}): {e}")
+
+    async def execute_journaled(
+        self,
+        journal: TransactionJournal,
+        fetch: MoveFetch,
+        update: MoveUpdate,
+        progress: Optional[ProgressCallback] = None,
+        resume: bool = True
+    ) -> ExecutionReport:
+        """
+        Apply a week's moves, resuming an interrupted run from its journal.
+
+        If `resume` is set and the journal holds a run that was cut off before
+        completing, its planned moves are replayed (skipping updates already
+        applied) without calling `fetch`. Otherwise the moves are fetched and a
+        new run is journaled, carrying over updates an earlier run applied.
+        Every run that finishes is marked complete, with its failure count, so
+        only runs that were actually interrupted are ever resumed. The journal's
+        lock is held throughout.
+
+        The journal is best-effort: if the new run's plan cannot be written
+        (e.g. the journal directory is read-only) the moves are applied
+        unjournaled, and a failure to write the completion marker is only logged.
+
+        Args:
+            journal: The week's journal
+            fetch: Coroutine function returning the week's moves
+            update: Coroutine function applying one move
+            progress: Awaited with the running report after each move completes
+            resume: Replay an interrupted run's plan instead of fetching
+
+        Returns:
+            ExecutionReport (resumed=True when replaying a journaled run)
+        """
+        async with journal.lock:
+            # Another run may have written the journal while we waited
+            journal.reload()
+
+            if resume and journal.is_resumable:
+                transactions = journal.planned_transactions()
+                logger.info(
+                    f"Resuming journaled run for season {journal.season} week {journal.week}: "
+                    f"{journal.applied_count}/{len(transactions)} moves already applied"
+                )
+                resumed = True
+            else:
+                transactions = await fetch()
+                if not transactions:
+                    return ExecutionReport(total=0)
+                resumed = False
+                try:
+                    journal.start(transactions)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to journal run for season {journal.season} week {journal.week}, "
+                        f"applying moves unjournaled: {e}"
+                    )
+                    return await self.execute(transactions, update, progress=progress)
+
+            report = await self.execute(transactions, update, progress=progress, journal=journal)
+            report.resumed = resumed
+
+            try:
+                await journal.flush()
+                journal.mark_complete(failed=report.failed)
+            except Exception as e:
+                logger.error(f"Failed to mark journaled run for season {journal.season} week {journal.week} complete: {e}")
+            if report.failed:
+                logger.warning(
+                    f"Journaled run for season {journal.season} week {journal.week} completed "
+                    f"with {report.failed} failed updates"
+                )
+            return report
+
+
+# Global executor instance - lazily initialized from config
+_transaction_executor: Optional[TransactionExecutor] = None
+
+
+def get_transaction_executor() -> TransactionExecutor:
+    """Get the shared transaction executor instance."""
+    global _transaction_executor
+    if _transaction_executor is None:
+        from config import get_config
+        _transaction_executor = TransactionExecutor.from_config(get_config())
+    return _transaction_executor
@@ -0,0 +1,285 @@
+"""
+Transaction journal for Discord Bot v2.0
+
+Append-only JSON-lines record of a week's player updates. Each processing run
+writes the moves it plans to apply, then one line per applied or failed update
+(keyed by moveid and player), and finally a completion marker recording how
+many updates failed. Only a run cut off before its marker (e.g. by a restart)
+is resumable: the next run for that week replays the planned moves from the
+journal, skipping every update already applied, instead of re-reading the week
+from the API and re-patching every player. A new run started over an earlier
+one carries over the updates that run already applied.
+
+Per-move results are queued in memory and written by `flush()`, which syncs
+each batch to disk in a worker thread so the event loop never blocks on fsync.
+The journal directory comes from `transaction_journal_dir` and must be
+writable; callers treat the journal as best-effort.
+"""
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config import get_config
+from models.transaction import Transaction
+
+logger = logging.getLogger(f'{__name__}.TransactionJournal')
+
+MoveKey = Tuple[str, int]
+
+# One lock per journal file, shared by every TransactionJournal opened on it
+_journal_locks: Dict[str, asyncio.Lock] = {}
+
+
+def move_key(transaction: Transaction) -> MoveKey:
+    """Identify one player update within a transaction."""
+    return (transaction.moveid, transaction.player.id)
+
+
+class TransactionJournal:
+    """Journal of one season/week's player updates."""
+
+    def __init__(self, path: Path, season: int, week: int):
+        """
+        Open a journal, loading any entries already written.
+
+        Args:
+            path: JSON-lines journal file
+            season: Season the journal covers
+            week: Week the journal covers
+        """
+        self.path = path
+        self.season = season
+        self.week = week
+        self._planned: List[Dict[str, Any]] = []
+        self._applied: Set[MoveKey] = set()
+        self._failed: Dict[MoveKey, str] = {}
+        self._complete = False
+        self._completed_failures = 0
+        # Entries recorded but not yet written, and the lock serializing writes
+        self._pending: List[Dict[str, Any]] = []
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._load()
+
+    @classmethod
+    def for_week(cls, season: int, week: int, directory: Optional[str] = None) -> 'TransactionJournal':
+        """Open the journal for a season and week (in `transaction_journal_dir` by default)."""
+        directory = directory or get_config().transaction_journal_dir
+        return cls(Path(directory) / f"season-{season}-week-{week}.jsonl", season, week)
+
+    @classmethod
+    def incomplete(cls, directory: Optional[str] = None) -> List['TransactionJournal']:
+        """Find journals whose runs were cut off before completing."""
+        directory = directory or get_config().transaction_journal_dir
+        journals = []
+        for path in sorted(Path(directory).glob("season-*-week-*.jsonl")):
+            try:
+                _, season, _, week = path.stem.split("-")
+                journal = cls(path, int(season), int(week))
+            except ValueError:
+                continue
+            if journal.is_resumable:
+                journals.append(journal)
+        return journals
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Lock held while a run is applied, so two runs never process this journal at once."""
+        key = str(self.path.resolve())
+        if key not in _journal_locks:
+            _journal_locks[key] = asyncio.Lock()
+        return _journal_locks[key]
+
+    def reload(self) -> None:
+        """Re-read the journal file, picking up entries written by another run."""
+        self._planned = []
+        self._applied = set()
+        self._failed = {}
+        self._complete = False
+        self._completed_failures = 0
+        self._pending = []
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                lines = f.readlines()
+        except Exception as e:
+            logger.error(f"Failed to read transaction journal {self.path}: {e}")
+            return
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn final line from a crash mid-write
+                logger.warning(f"Skipping unreadable line in transaction journal {self.path}")
+                continue
+            self._apply_entry(entry)
+
+    def _apply_entry(self, entry: Dict[str, Any]) -> None:
+        event = entry.get('event')
+        if event == 'planned':
+            self._planned.append(entry['transaction'])
+        elif event == 'applied':
+            key = (entry['moveid'], entry['player_id'])
+            self._applied.add(key)
+            self._failed.pop(key, None)
+        elif event == 'failed':
+            self._failed[(entry['moveid'], entry['player_id'])] = entry.get('error', '')
+        elif event == 'completed':
+            self._complete = True
+            self._completed_failures = entry.get('failed', 0)
+
+    def _record(self, entry: Dict[str, Any]) -> None:
+        """Queue an entry for the next flush; it takes effect in memory immediately."""
+        self._pending.append({'at': datetime.now(UTC).isoformat(), **entry})
+        self._apply_entry(entry)
+
+    def _append(self, entries: List[Dict[str, Any]]) -> None:
+        """Append entries (after any still queued) and sync them to disk before returning."""
+        timestamp = datetime.now(UTC).isoformat()
+        lines = self._pending + [{'at': timestamp, **entry} for entry in entries]
+        self._pending = []
+        self._write(lines)
+        for entry in entries:
+            self._apply_entry(entry)
+
+    def _write(self, entries: List[Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def flush(self) -> None:
+        """
+        Write queued entries in a worker thread.
+
+        Entries recorded while a write is in progress go out together in the
+        next batch.
+
+        Raises:
+            OSError: If the journal file cannot be written (the batch is dropped)
+        """
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        async with self._write_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            await asyncio.get_running_loop().run_in_executor(None, self._write, batch)
+
+    @property
+    def has_plan(self) -> bool:
+        """Check whether a run has recorded its planned moves."""
+        return bool(self._planned)
+
+    @property
+    def is_complete(self) -> bool:
+        """Check whether the last run finished (possibly with failed updates)."""
+        return self._complete
+
+    @property
+    def completed_with_failures(self) -> bool:
+        """Check whether the last run finished with updates still failed."""
+        return self._complete and self._completed_failures > 0
+
+    @property
+    def is_resumable(self) -> bool:
+        """Check whether a run was planned but cut off before completing."""
+        return self.has_plan and not self._complete
+
+    @property
+    def applied_count(self) -> int:
+        """Number of player updates already applied."""
+        return len(self._applied)
+
+    def is_applied(self, transaction: Transaction) -> bool:
+        """Check whether a move's player update was already applied."""
+        return move_key(transaction) in self._applied
+
+    def failed_moves(self) -> Dict[MoveKey, str]:
+        """Get the latest error for each update that failed and was not applied since."""
+        return dict(self._failed)
+
+    def planned_transactions(self) -> List[Transaction]:
+        """Rebuild the planned moves without calling the API."""
+        return [Transaction.model_validate(data) for data in self._planned]
+
+    def start(self, transactions: List[Transaction]) -> None:
+        """
+        Begin a new run, recording the moves it will apply.
+
+        A previous journal for the week is kept alongside with a timestamp suffix.
+        Updates it already applied that are planned again are recorded as
+        applied, so the new run doesn't re-patch them.
+
+        Args:
+            transactions: Moves to apply, in processing order
+        """
+        planned_keys = {move_key(transaction) for transaction in transactions}
+        carried_over = self._applied & planned_keys
+
+        if self.path.exists():
+            archived = self.path.with_name(f"{self.path.stem}.{datetime.now(UTC):%Y%m%dT%H%M%S}.jsonl")
+            self.path.rename(archived)
+            logger.info(f"Archived previous transaction journal to {archived}")
+
+        self._planned = []
+        self._applied = set()
+        self._failed = {}
+        self._complete = False
+        self._completed_failures = 0
+        self._pending = []
+        self._append([
+            {
+                'event': 'planned',
+                'moveid': transaction.moveid,
+                'player_id': transaction.player.id,
+                'transaction': transaction.model_dump(mode='json')
+            }
+            for transaction in transactions
+        ] + [
+            {'event': 'applied', 'moveid': moveid, 'player_id': player_id, 'carried_over': True}
+            for moveid, player_id in sorted(carried_over)
+        ])
+        logger.info(
+            f"Journaled {len(transactions)} planned moves for season {self.season} week {self.week} "
+            f"({len(carried_over)} already applied by an earlier run)"
+        )
+
+    def record_applied(self, transaction: Transaction) -> None:
+        """Record a successful player update (written on the next flush)."""
+        self._record({
+            'event': 'applied',
+            'moveid': transaction.moveid,
+            'player_id': transaction.player.id,
+            'new_team_id': transaction.newteam.id
+        })
+
+    def record_failed(self, transaction: Transaction, error: str) -> None:
+        """Record a failed player update (written on the next flush)."""
+        self._record({
+            'event': 'failed',
+            'moveid': transaction.moveid,
+            'player_id': transaction.player.id,
+            'new_team_id': transaction.newteam.id,
+            'error': error
+        })
+
+    def mark_complete(self, failed: int = 0) -> None:
+        """
+        Record that the run finished, so it is never resumed.
+
+        Args:
+            failed: Number of updates that still failed
+        """
+        self._append([{'event': 'completed', 'applied': len(self._applied), 'failed': failed}])
+
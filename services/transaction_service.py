@@ -421,6 +421,43 @@ class TransactionService(BaseService[Transaction]):
             logger.error(f"Error getting regular transactions for week {week}: {e}")
             return []
 
+    async def get_pending_transactions_by_week(
+        self,
+        season: int,
+        week: int
+    ) -> List[Transaction]:
+        """
+        Get every non-cancelled transaction for a week (all teams, frozen or not).
+
+        Used by the league roster audit to project next week's rosters.
+
+        Args:
+            season: Season number
+            week: Week number the transactions take effect
+
+        Returns:
+            List of pending transactions for the week
+
+        Raises:
+            APIException: If the transactions cannot be retrieved
+        """
+        try:
+            params = [
+                ('season', str(season)),
+                ('week_start', str(week)),
+                ('week_end', str(week)),
+                ('cancelled', 'false')
+            ]
+
+            transactions = await self.get_all_items(params=params)
+
+            logger.debug(f"Retrieved {len(transactions)} pending transactions for week {week}")
+            return transactions
+
+        except Exception as e:
+            logger.error(f"Error getting pending transactions for week {week}: {e}")
+            raise APIException(f"Failed to retrieve pending transactions: {e}")
+
     async def get_contested_transactions(self, season: int, week: int) -> List[Transaction]:
         """
         Get transactions that may be contested (multiple teams want same player).
@@ -2,18 +2,21 @@
 Draft Monitor Task for Discord Bot v2.0
 
 Automated background task for draft timer monitoring, warnings, and auto-draft.
-Self-terminates when draft timer is disabled to conserve resources.
+Warnings and expiry fire from timers armed on pick_deadline rather than a tight
+polling loop. Self-terminates when draft timer is disabled to conserve resources.
 """
 import asyncio
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional, Set, Tuple
 
 import discord
 from discord.ext import commands, tasks
 
+from models.draft_data import DraftData
 from services.draft_service import draft_service
+from services.draft_board import draft_board
 from services.draft_pick_service import draft_pick_service
-from services.draft_list_service import draft_list_service
+from services.auto_draft_planner import auto_draft_planner
 from services.draft_sheet_service import get_draft_sheet_service
 from services.player_service import player_service
 from services.team_service import team_service
@@ -30,113 +33,203 @@ class DraftMonitorTask:
     Automated monitoring task for draft operations.
 
     Features:
-    - Monitors draft timer every 15 seconds
-    - Sends warnings at 60s and 30s remaining
+    - Arms timers from pick_deadline for the 60s/30s warnings and expiry
+    - Re-arms on every draft update made by the bot (pick, pause, resume, timer)
+    - Reconciliation poll every 2 minutes for changes made outside the bot
     - Triggers auto-draft when deadline passes
     - Respects global pick lock
     - Self-terminates when timer disabled
     """
 
+    # Seconds before the deadline at which warnings are posted
+    WARNING_THRESHOLDS = (60, 30)
+
+    # Retry delay when an expired pick could not be handled (e.g. pick lock held)
+    EXPIRY_RETRY_DELAY = 5
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.logger = get_contextual_logger(f'{__name__}.DraftMonitorTask')
 
-        # Warning flags (reset each pick)
-        self.warning_60s_sent = False
-        self.warning_30s_sent = False
+        # Timer state for the pick currently armed: (currentpick, pick_deadline)
+        self._armed_key: Optional[Tuple[int, datetime]] = None
+        self._deadline_task: Optional[asyncio.Task] = None
+        self._action_tasks: Set[asyncio.Task] = set()
+        self._warnings_sent: Set[Tuple[int, datetime, int]] = set()
+        self._expiry_attempted: Optional[Tuple[int, datetime]] = None
 
         self.logger.info("Draft monitor task initialized")
 
-        # Start the monitor task
+        # Re-arm whenever the bot changes draft state, then start the safety-net poll
+        draft_service.add_update_listener(self.schedule)
         self.monitor_loop.start()
 
     def cog_unload(self):
         """Stop the task when cog is unloaded."""
+        self.stop()
+        for task in list(self._action_tasks):
+            task.cancel()
+
+    def stop(self) -> None:
+        """Cancel the deadline timers and reconciliation poll and stop listening for updates."""
+        self._disarm()
+        draft_service.remove_update_listener(self.schedule)
         self.monitor_loop.cancel()
 
-    def _get_poll_interval(self, time_remaining: float) -> int:
-        """
-        Get the appropriate polling interval based on time remaining.
-
-        Args:
-            time_remaining: Seconds until deadline
-
-        Returns:
-            Poll interval in seconds:
-            - 30s when > 60s remaining
-            - 15s when 30-60s remaining
-            - 5s when < 30s remaining
-        """
-        if time_remaining > 60:
-            return 30
-        elif time_remaining > 30:
-            return 15
-        else:
-            return 5
-
-    @tasks.loop(seconds=30)
+    @tasks.loop(minutes=2)
     async def monitor_loop(self):
         """
-        Main monitoring loop - checks draft state with dynamic intervals.
-
-        Polling frequency increases as deadline approaches:
-        - Every 30s when > 60s remaining
-        - Every 15s when 30-60s remaining
-        - Every 5s when < 30s remaining
+        Reconciliation poll - re-arms the deadline timers from the API.
 
-        Self-terminates when draft timer is disabled.
+        Bot-initiated changes re-arm immediately through the draft service
+        listener; this loop only catches changes made elsewhere (e.g. the
+        database edited directly). Self-terminates when draft timer is disabled.
         """
         try:
-            # Get current draft state
             draft_data = await draft_service.get_draft_data()
 
             if not draft_data:
                 self.logger.warning("No draft data found")
                 return
 
-            # CRITICAL: Stop loop if timer disabled
-            if not draft_data.timer:
-                self.logger.info("Draft timer disabled - stopping monitor")
-                self.monitor_loop.cancel()
-                return
+            self.schedule(draft_data)
 
-            # CRITICAL: Skip auto-draft if paused (but keep monitoring)
-            if draft_data.paused:
-                self.logger.debug("Draft is paused - skipping auto-draft actions")
-                return
+        except Exception as e:
+            self.logger.error("Error in draft monitor loop", error=e)
 
-            # Check if we need to take action
-            now = datetime.now()
-            deadline = draft_data.pick_deadline
+    @monitor_loop.before_loop
+    async def before_monitor(self):
+        """Wait for bot to be ready before starting - REQUIRED FOR SAFE STARTUP."""
+        await self.bot.wait_until_ready()
+        self.logger.info("Bot is ready, draft monitor starting")
 
-            if not deadline:
-                self.logger.warning("Draft timer active but no deadline set")
-                return
+    def schedule(self, draft_data: DraftData) -> None:
+        """
+        Arm the warning and expiry timers for the current pick.
+
+        Safe to call repeatedly: timers already armed for the same pick and
+        deadline are left running.
 
-            # Calculate time remaining
-            time_remaining = (deadline - now).total_seconds()
+        Args:
+            draft_data: Latest draft configuration
+        """
+        # CRITICAL: Stop monitor if timer disabled
+        if not draft_data.timer:
+            self.logger.info("Draft timer disabled - stopping monitor")
+            self.stop()
+            return
 
-            # Adjust polling interval based on time remaining
-            new_interval = self._get_poll_interval(time_remaining)
-            if self.monitor_loop.seconds != new_interval:
-                self.monitor_loop.change_interval(seconds=new_interval)
-                self.logger.debug(f"Adjusted poll interval to {new_interval}s (time remaining: {time_remaining:.0f}s)")
+        # CRITICAL: Nothing to arm while paused
+        if draft_data.paused:
+            self.logger.debug("Draft is paused - deadline timers disarmed")
+            self._disarm()
+            return
 
-            if time_remaining <= 0:
-                # Timer expired - auto-draft
-                await self._handle_expired_timer(draft_data)
+        if not draft_data.pick_deadline:
+            self.logger.warning("Draft timer active but no deadline set")
+            self._disarm()
+            return
+
+        key = (draft_data.currentpick, draft_data.pick_deadline)
+        if key == self._armed_key and self._deadline_task and not self._deadline_task.done():
+            return
+
+        self._disarm()
+        self._warnings_sent = {w for w in self._warnings_sent if w[0] == draft_data.currentpick}
+        self._armed_key = key
+        self._deadline_task = asyncio.create_task(self._run_deadline(draft_data))
+        self._spawn(self._plan_auto_draft(draft_data))
+        self.logger.debug(f"Armed deadline timers for pick #{draft_data.currentpick} ({draft_data.pick_deadline})")
+
+    def _disarm(self) -> None:
+        if self._deadline_task and not self._deadline_task.done():
+            self._deadline_task.cancel()
+        self._deadline_task = None
+        self._armed_key = None
+
+    def _pending_events(self, draft_data: DraftData, now: datetime) -> List[Tuple[datetime, int]]:
+        """
+        Get the events still due for a pick, in firing order.
+
+        Returns:
+            (fire_at, seconds_before_deadline) pairs; 0 is the expiry itself
+        """
+        deadline = draft_data.pick_deadline
+        events = []
+        for seconds in self.WARNING_THRESHOLDS:
+            fire_at = deadline - timedelta(seconds=seconds)
+            if fire_at > now and (draft_data.currentpick, deadline, seconds) not in self._warnings_sent:
+                events.append((fire_at, seconds))
+
+        # Expiry always fires; back off if this pick already expired once without advancing
+        fire_at = deadline
+        if self._expiry_attempted == (draft_data.currentpick, deadline):
+            fire_at = max(deadline, now + timedelta(seconds=self.EXPIRY_RETRY_DELAY))
+        events.append((fire_at, 0))
+        return events
+
+    async def _run_deadline(self, draft_data: DraftData) -> None:
+        """Sleep until each pending event and hand it off to its handler."""
+        for fire_at, seconds in self._pending_events(draft_data, datetime.now()):
+            delay = (fire_at - datetime.now()).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            # Handlers run outside this task so re-arming (which cancels it) can't interrupt them
+            if seconds:
+                self._warnings_sent.add((draft_data.currentpick, draft_data.pick_deadline, seconds))
+                self._spawn(self._send_warning(draft_data, seconds))
+                # Refresh the plan so list edits made on the clock are picked up
+                self._spawn(self._plan_auto_draft(draft_data, refresh=True))
             else:
-                # Send warnings at intervals
-                await self._send_warnings_if_needed(draft_data, time_remaining)
+                self._spawn(self._on_deadline_expired(draft_data))
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._action_tasks.add(task)
+        task.add_done_callback(self._action_tasks.discard)
 
+    async def _plan_auto_draft(self, draft_data: DraftData, refresh: bool = False) -> None:
+        """Rank the current team's auto-draft candidates ahead of the deadline."""
+        try:
+            config = get_config()
+            current_pick = await draft_board.get_pick(config.sba_season, draft_data.currentpick)
+            if current_pick and current_pick.owner_id:
+                await auto_draft_planner.get_plan(config.sba_season, current_pick, refresh=refresh)
         except Exception as e:
-            self.logger.error("Error in draft monitor loop", error=e)
+            self.logger.warning(f"Could not plan auto-draft for pick #{draft_data.currentpick}: {e}")
 
-    @monitor_loop.before_loop
-    async def before_monitor(self):
-        """Wait for bot to be ready before starting - REQUIRED FOR SAFE STARTUP."""
-        await self.bot.wait_until_ready()
-        self.logger.info("Bot is ready, draft monitor starting")
+    async def _on_deadline_expired(self, draft_data: DraftData) -> None:
+        """
+        Confirm the deadline against the API, auto-draft, then re-arm.
+
+        Args:
+            draft_data: Draft configuration the expiry timer was armed with
+        """
+        try:
+            key = (draft_data.currentpick, draft_data.pick_deadline)
+            self._expiry_attempted = key
+
+            latest = await draft_service.get_draft_data()
+            if not latest:
+                self.logger.warning("No draft data found at pick deadline")
+                self.schedule(draft_data)
+                return
+
+            # State changed since the timer was armed (pick made, draft paused, ...)
+            if (latest.currentpick, latest.pick_deadline) != key or not latest.timer or latest.paused:
+                self.schedule(latest)
+                return
+
+            await self._handle_expired_timer(latest)
+
+            # Re-arm from the post-pick state (a no-op if advance_pick already did);
+            # if the pick didn't advance this retries after EXPIRY_RETRY_DELAY
+            latest = await draft_service.get_draft_data()
+            self.schedule(latest or draft_data)
+
+        except Exception as e:
+            self.logger.error("Error handling pick deadline", error=e)
 
     async def _handle_expired_timer(self, draft_data):
         """
@@ -172,7 +265,7 @@ class DraftMonitorTask:
 
             # Check if lock is available
             if draft_picks_cog.pick_lock.locked():
-                self.logger.debug("Pick lock is held, skipping auto-draft this cycle")
+                self.logger.debug("Pick lock is held, retrying auto-draft shortly")
                 return
 
             # Acquire lock
@@ -207,13 +300,10 @@ class DraftMonitorTask:
                 self.logger.error(f"Could not find ping channel {draft_data.ping_channel}")
                 return
 
-            # Get team's draft list
-            draft_list = await draft_list_service.get_team_list(
-                config.sba_season,
-                current_pick.owner.id
-            )
+            # Candidates were ranked while the team was on the clock
+            plan = await auto_draft_planner.get_plan(config.sba_season, current_pick)
 
-            if not draft_list:
+            if plan is not None and plan.list_size == 0:
                 self.logger.warning(f"Team {current_pick.owner.abbrev} has no draft list")
                 await ping_channel.send(
                     content=f"⏰ {current_pick.owner.abbrev} time expired with no draft list - pick skipped"
@@ -222,35 +312,11 @@ class DraftMonitorTask:
                 await draft_service.advance_pick(draft_data.id, draft_data.currentpick)
                 # Post on-clock announcement for next team
                 await self._post_on_clock_announcement(ping_channel, draft_data)
-                # Reset warning flags
-                self.warning_60s_sent = False
-                self.warning_30s_sent = False
                 return
 
-            # Try each player in order
-            for entry in draft_list:
-                if not entry.player:
-                    self.logger.debug(f"Draft list entry has no player, skipping")
-                    continue
-
-                player = entry.player
-
-                # Debug: Log player team_id for troubleshooting
-                self.logger.debug(
-                    f"Checking player {player.name}: team_id={player.team_id}, "
-                    f"FA team_id={config.free_agent_team_id}, "
-                    f"team.id={player.team.id if player.team else 'None'}"
-                )
-
-                # Check if player is still available
-                if player.team_id != config.free_agent_team_id:
-                    self.logger.debug(
-                        f"Player {player.name} no longer available "
-                        f"(team_id={player.team_id} != FA={config.free_agent_team_id}), skipping"
-                    )
-                    continue
-
-                # Attempt to draft this player
+            # Try each legal candidate in order, skipping players drafted since planning
+            candidates = plan.available_candidates(draft_board.drafted_player_ids()) if plan else []
+            for player in candidates:
                 success = await self._attempt_draft_player(
                     current_pick,
                     player,
@@ -267,9 +333,6 @@ class DraftMonitorTask:
                     await draft_service.advance_pick(draft_data.id, draft_data.currentpick)
                     # Post on-clock announcement for next team
                     await self._post_on_clock_announcement(ping_channel, draft_data)
-                    # Reset warning flags
-                    self.warning_60s_sent = False
-                    self.warning_30s_sent = False
                     return
 
             # No players successfully drafted
@@ -281,9 +344,6 @@ class DraftMonitorTask:
             await draft_service.advance_pick(draft_data.id, draft_data.currentpick)
             # Post on-clock announcement for next team
             await self._post_on_clock_announcement(ping_channel, draft_data)
-            # Reset warning flags
-            self.warning_60s_sent = False
-            self.warning_30s_sent = False
 
         except Exception as e:
             self.logger.error("Error auto-drafting player", error=e)
@@ -297,7 +357,10 @@ class DraftMonitorTask:
         guild
     ) -> bool:
         """
-        Attempt to draft a specific player.
+        Draft a specific player.
+
+        Availability and cap space were already checked by the auto-draft
+        planner, so this only performs the writes and announcements.
 
         Args:
             draft_pick: DraftPick to update
@@ -310,30 +373,11 @@ class DraftMonitorTask:
             True if draft succeeded
         """
         try:
-            from utils.draft_helpers import validate_cap_space
-            from services.team_service import team_service
-
-            # Get team roster for cap validation
-            roster = await team_service.get_team_roster(draft_pick.owner.id, 'current')
-
-            if not roster:
-                self.logger.error(f"Could not get roster for team {draft_pick.owner.id}")
-                return False
-
-            # Validate cap space
-            is_valid, projected_total, cap_limit = await validate_cap_space(roster, player.wara)
-
-            if not is_valid:
-                self.logger.debug(
-                    f"Cannot auto-draft {player.name} - would exceed cap "
-                    f"(projected: {projected_total:.2f})"
-                )
-                return False
-
             # Update draft pick
             updated_pick = await draft_pick_service.update_pick_selection(
                 draft_pick.id,
-                player.id
+                player.id,
+                player=player
             )
 
             if not updated_pick:
@@ -351,7 +395,7 @@ class DraftMonitorTask:
                 self.logger.error(f"Failed to update player {player.id} team")
                 return False
 
-            # Write pick to Google Sheets (fire-and-forget)
+            # Queue pick for Google Sheets (written in the background)
             await self._write_pick_to_sheets(draft_pick, player, ping_channel)
 
             # Post to ping channel
@@ -402,7 +446,7 @@ class DraftMonitorTask:
                 return
 
             # Get the new current pick
-            next_pick = await draft_pick_service.get_pick(
+            next_pick = await draft_board.get_pick(
                 config.sba_season,
                 updated_draft_data.currentpick
             )
@@ -412,9 +456,9 @@ class DraftMonitorTask:
                 return
 
             # Get recent picks (last 5 completed)
-            recent_picks = await draft_pick_service.get_recent_picks(
+            recent_picks = await draft_board.get_recent_picks(
                 config.sba_season,
-                updated_draft_data.currentpick - 1,  # Start from previous pick
+                updated_draft_data.currentpick,  # Picks before the new current pick
                 limit=5
             )
 
@@ -455,21 +499,16 @@ class DraftMonitorTask:
             await ping_channel.send(content=team_mention, embed=embed)
             self.logger.info(f"Posted on-clock announcement for pick #{updated_draft_data.currentpick}")
 
-            # Reset poll interval to 30s for new pick
-            if self.monitor_loop.seconds != 30:
-                self.monitor_loop.change_interval(seconds=30)
-                self.logger.debug("Reset poll interval to 30s for new pick")
-
         except Exception as e:
             self.logger.error("Error posting on-clock announcement", error=e)
 
-    async def _send_warnings_if_needed(self, draft_data, time_remaining: float):
+    async def _send_warning(self, draft_data, seconds: int):
         """
-        Send warnings at 60s and 30s remaining.
+        Post a time-remaining warning for the current pick.
 
         Args:
-            draft_data: Current draft configuration
-            time_remaining: Seconds remaining until deadline
+            draft_data: Draft configuration the timer was armed with
+            seconds: Seconds remaining until deadline
         """
         try:
             config = get_config()
@@ -483,7 +522,7 @@ class DraftMonitorTask:
                 return
 
             # Get current pick for mention
-            current_pick = await draft_pick_service.get_pick(
+            current_pick = await draft_board.get_pick(
                 config.sba_season,
                 draft_data.currentpick
             )
@@ -491,37 +530,18 @@ class DraftMonitorTask:
             if not current_pick or not current_pick.owner:
                 return
 
-            # 60-second warning
-            if 55 <= time_remaining <= 60 and not self.warning_60s_sent:
-                await ping_channel.send(
-                    content=f"⏰ {current_pick.owner.abbrev} - **60 seconds remaining** "
-                            f"for pick #{current_pick.overall}!"
-                )
-                self.warning_60s_sent = True
-                self.logger.debug(f"Sent 60s warning for pick #{current_pick.overall}")
-
-            # 30-second warning
-            elif 25 <= time_remaining <= 30 and not self.warning_30s_sent:
-                await ping_channel.send(
-                    content=f"⏰ {current_pick.owner.abbrev} - **30 seconds remaining** "
-                            f"for pick #{current_pick.overall}!"
-                )
-                self.warning_30s_sent = True
-                self.logger.debug(f"Sent 30s warning for pick #{current_pick.overall}")
-
-            # Reset warnings if time goes back above 60s
-            elif time_remaining > 60:
-                if self.warning_60s_sent or self.warning_30s_sent:
-                    self.warning_60s_sent = False
-                    self.warning_30s_sent = False
-                    self.logger.debug("Reset warning flags - pick deadline extended")
+            await ping_channel.send(
+                content=f"⏰ {current_pick.owner.abbrev} - **{seconds} seconds remaining** "
+                        f"for pick #{current_pick.overall}!"
+            )
+            self.logger.debug(f"Sent {seconds}s warning for pick #{current_pick.overall}")
 
         except Exception as e:
             self.logger.error("Error sending warnings", error=e)
 
     async def _write_pick_to_sheets(self, draft_pick, player, ping_channel) -> None:
         """
-        Write pick to Google Sheets (fire-and-forget with notification on failure).
+        Queue pick for Google Sheets (write-behind, with notification on failure).
 
         Args:
             draft_pick: The draft pick being used
@@ -530,32 +550,32 @@ class DraftMonitorTask:
         """
         config = get_config()
 
+        async def notify_failure():
+            await self._notify_sheet_failure(
+                ping_channel=ping_channel,
+                pick_overall=draft_pick.overall,
+                player_name=player.name
+            )
+
         try:
             draft_sheet_service = get_draft_sheet_service()
-            success = await draft_sheet_service.write_pick(
+            queued = draft_sheet_service.enqueue_pick(
                 season=config.sba_season,
                 overall=draft_pick.overall,
                 orig_owner_abbrev=draft_pick.origowner.abbrev if draft_pick.origowner else draft_pick.owner.abbrev,
                 owner_abbrev=draft_pick.owner.abbrev,
                 player_name=player.name,
-                swar=player.wara
+                swar=player.wara,
+                on_failure=notify_failure
             )
 
-            if not success:
-                # Write failed - notify in ping channel
-                await self._notify_sheet_failure(
-                    ping_channel=ping_channel,
-                    pick_overall=draft_pick.overall,
-                    player_name=player.name
-                )
+            if not queued:
+                # Sheet writes unavailable - notify in ping channel
+                await notify_failure()
 
         except Exception as e:
-            self.logger.warning(f"Failed to write pick to sheets: {e}")
-            await self._notify_sheet_failure(
-                ping_channel=ping_channel,
-                pick_overall=draft_pick.overall,
-                player_name=player.name
-            )
+            self.logger.warning(f"Failed to queue pick for sheets: {e}")
+            await notify_failure()
 
     async def _notify_sheet_failure(self, ping_channel, pick_overall: int, player_name: str) -> None:
         """
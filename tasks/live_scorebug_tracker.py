@@ -4,7 +4,7 @@ Live Scorebug Tracker
 Background task that monitors published scorecards and updates live score displays.
 """
 import asyncio
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import discord
 from discord.ext import tasks, commands
 
@@ -12,7 +12,11 @@ from models.team import Team
 from utils.logging import get_contextual_logger
 from utils.scorebug_helpers import create_scorebug_embed
 from utils.discord_helpers import set_channel_visibility
-from services.scorebug_service import ScorebugData, ScorebugService
+from utils.managed_messages import ManagedMessageTracker
+from utils.scorebug_schedule import ScorebugPollSchedule
+from services.scorebug_service import ScorebugData
+from services.scorebug_snapshots import scorebug_snapshots
+from services.sheets_service import get_sheets_rate_limiter
 from services.team_service import team_service
 from commands.gameplay.scorecard_tracker import ScorecardTracker
 from commands.voice.tracker import VoiceChannelTracker
@@ -26,8 +30,10 @@ class LiveScorebugTracker:
     Manages live scorebug updates for active games.
 
     Features:
-    - Updates live scores channel every 3 minutes
+    - Polls each game on its own interval (see ScorebugPollSchedule)
     - Updates voice channel descriptions with live scores
+    - Reads scorecards concurrently under the shared Google Sheets rate limit
+    - Edits its own messages in place, only when a scorebug changed
     - Clears displays when no active games
     - Error resilient with graceful degradation
     """
@@ -41,9 +47,13 @@ class LiveScorebugTracker:
         """
         self.bot = bot
         self.logger = get_contextual_logger(f'{__name__}.LiveScorebugTracker')
-        self.scorebug_service = ScorebugService()
         self.scorecard_tracker = ScorecardTracker()
         self.voice_tracker = VoiceChannelTracker()
+        self.managed_messages = ManagedMessageTracker("data/live_scores_messages.json")
+        # Last status set on each voice channel, so unchanged scores aren't re-sent
+        self._voice_statuses: Dict[int, str] = {}
+        # Per-game polling intervals; the loop ticks often and reads only due games
+        self.schedule = ScorebugPollSchedule()
 
         # Start the monitoring loop
         self.update_loop.start()
@@ -54,10 +64,10 @@ class LiveScorebugTracker:
         self.update_loop.cancel()
         self.logger.info("Live scorebug tracker stopped")
 
-    @tasks.loop(minutes=3)
+    @tasks.loop(seconds=30)
     async def update_loop(self):
         """
-        Main update loop - runs every 3 minutes.
+        Main update loop - ticks every 30 seconds, reading only games that are due.
 
         Updates:
         - Live scores channel with all active scorebugs
@@ -95,6 +105,8 @@ class LiveScorebugTracker:
 
             if not all_scorecards:
                 # No active scorebugs - clear the channel and hide it
+                scorebug_snapshots.retain([])
+                self.schedule.clear()
                 await self._clear_live_scores_channel(live_scores_channel)
                 await set_channel_visibility(
                     live_scores_channel,
@@ -103,24 +115,42 @@ class LiveScorebugTracker:
                 )
                 return
 
-            # Read all scorebugs and create embeds
+            sheet_urls = [sheet_url for _, sheet_url in all_scorecards]
+            scorebug_snapshots.retain(sheet_urls)
+            self.schedule.retain(sheet_urls)
+
+            # Read only the games whose polling interval has elapsed, concurrently
+            due = [(channel_id, sheet_url) for channel_id, sheet_url in all_scorecards if self.schedule.is_due(sheet_url)]
+            if not due:
+                self.logger.debug(f"No scorecards due this tick ({len(all_scorecards)} published)")
+                return
+
+            fresh: Dict[str, Optional[ScorebugData]] = {}
+            for (_, sheet_url), scorebug_data in zip(due, await self._read_scorecards(due)):
+                self.schedule.record(sheet_url, scorebug_data)
+                fresh[sheet_url] = scorebug_data
+            self.logger.debug(f"Read {len(due)} of {len(all_scorecards)} scorecards")
+
+            # Render every game in publish order; games not due keep their last snapshot
+            team_map = await self._load_team_map()
+
             active_scorebugs = []
             for text_channel_id, sheet_url in all_scorecards:
-                try:
-                    scorebug_data = await self.scorebug_service.read_scorebug_data(
-                        sheet_url,
-                        full_length=False  # Compact view for live channel
-                    )
+                scorebug_data = fresh.get(sheet_url) or self._snapshot_data(sheet_url)
 
-                    # Only include active (non-final) games
-                    if scorebug_data.is_active:
-                        # Get team data
-                        away_team = await team_service.get_team(scorebug_data.away_team_id)
-                        home_team = await team_service.get_team(scorebug_data.home_team_id)
+                # A final game is rendered (voice status) once, on the read that found it final
+                if scorebug_data is None or (scorebug_data.is_final and sheet_url not in fresh):
+                    continue
 
-                        if away_team is None or home_team is None:
-                            raise ValueError(f'Error looking up teams in scorecard; IDs provided: {scorebug_data.away_team_id} & {scorebug_data.home_team_id}')
+                try:
+                    away_team = await self._lookup_team(team_map, scorebug_data.away_team_id)
+                    home_team = await self._lookup_team(team_map, scorebug_data.home_team_id)
 
+                    if away_team is None or home_team is None:
+                        raise ValueError(f'Error looking up teams in scorecard; IDs provided: {scorebug_data.away_team_id} & {scorebug_data.home_team_id}')
+
+                    # Only active (non-final) games go in the live scores channel
+                    if scorebug_data.is_active:
                         # Create compact embed using shared utility
                         embed = create_scorebug_embed(
                             scorebug_data,
@@ -131,18 +161,14 @@ class LiveScorebugTracker:
 
                         active_scorebugs.append(embed)
 
-                        # Update associated voice channel if it exists
-                        await self._update_voice_channel_description(
-                            text_channel_id,
-                            scorebug_data,
-                            away_team,
-                            home_team
-                        )
-
-                    await asyncio.sleep(1)  # Rate limit between reads
+                    # Update associated voice channel if it exists
+                    await self._update_voice_channel_description(
+                        text_channel_id,
+                        scorebug_data,
+                        away_team,
+                        home_team
+                    )
 
-                except SheetsException as e:
-                    self.logger.warning(f"Could not read scorecard {sheet_url}: {e}")
                 except Exception as e:
                     self.logger.error(f"Error processing scorecard {sheet_url}: {e}")
 
@@ -163,6 +189,72 @@ class LiveScorebugTracker:
                     reason="No active games"
                 )
 
+    async def _read_scorecards(
+        self,
+        scorecards: List[Tuple[int, str]]
+    ) -> List[Optional[ScorebugData]]:
+        """
+        Read every published scorecard concurrently.
+
+        Reads share the global Google Sheets rate limiter, at most
+        `scorebug_max_concurrency` are in flight, and each one is abandoned
+        after `scorebug_read_timeout` seconds so a slow sheet can't hold up
+        the rest.
+
+        Args:
+            scorecards: (text_channel_id, sheet_url) pairs
+
+        Returns:
+            ScorebugData per scorecard in the same order, None where the read failed
+        """
+        config = get_config()
+        rate_limiter = get_sheets_rate_limiter()
+        semaphore = asyncio.Semaphore(max(1, config.scorebug_max_concurrency))
+
+        async def read_one(sheet_url: str) -> Optional[ScorebugData]:
+            async with semaphore:
+                await rate_limiter.acquire()
+                try:
+                    # Refreshes the shared snapshot that /scorebug also serves from
+                    return await asyncio.wait_for(
+                        scorebug_snapshots.refresh(sheet_url),
+                        timeout=config.scorebug_read_timeout
+                    )
+                except asyncio.TimeoutError:
+                    self.logger.warning(
+                        f"Timed out reading scorecard {sheet_url} after {config.scorebug_read_timeout}s"
+                    )
+                except SheetsException as e:
+                    self.logger.warning(f"Could not read scorecard {sheet_url}: {e}")
+                except Exception as e:
+                    self.logger.error(f"Error processing scorecard {sheet_url}: {e}")
+                return None
+
+        return list(await asyncio.gather(*(read_one(sheet_url) for _, sheet_url in scorecards)))
+
+    def _snapshot_data(self, sheet_url: str) -> Optional[ScorebugData]:
+        """Last scorebug read for a scorecard, if any."""
+        snapshot = scorebug_snapshots.peek(sheet_url)
+        return snapshot.data if snapshot is not None else None
+
+    async def _load_team_map(self) -> Dict[int, Team]:
+        """Map team ID to Team for the current season (served from the team cache)."""
+        try:
+            teams = await team_service.get_teams_by_season(get_config().sba_season)
+        except Exception as e:
+            self.logger.warning(f"Could not load season teams for scorebugs: {e}")
+            return {}
+        return {team.id: team for team in teams}
+
+    async def _lookup_team(self, team_map: Dict[int, Team], team_id: int) -> Optional[Team]:
+        """Get a team from the season map, falling back to the API for unknown IDs."""
+        team = team_map.get(team_id)
+        if team is None:
+            team = await team_service.get_team(team_id)
+            if team is not None:
+                team_map[team_id] = team
+        return team
+
     async def _post_scorebugs_to_channel(
         self,
         channel: discord.TextChannel,
@@ -176,20 +268,14 @@ class LiveScorebugTracker:
             embeds: List of scorebug embeds
         """
         try:
-            # Clear old messages
-            async for message in channel.history(limit=25):
-                await message.delete()
-
-            # Post new scorebugs (Discord allows up to 10 embeds per message)
-            if len(embeds) <= 10:
-                await channel.send(embeds=embeds)
-            else:
-                # Split into multiple messages if more than 10 embeds
-                for i in range(0, len(embeds), 10):
-                    batch = embeds[i:i+10]
-                    await channel.send(embeds=batch)
+            # Edit only messages whose scorebugs changed; create/delete only when the game count changes
+            counts = await self.managed_messages.sync(channel, embeds)
 
-            self.logger.info(f"Posted {len(embeds)} scorebugs to live-sba-scores")
+            self.logger.info(
+                f"Synced {len(embeds)} scorebugs to live-sba-scores "
+                f"({counts['edited']} edited, {counts['created']} created, "
+                f"{counts['deleted']} deleted, {counts['unchanged']} unchanged)"
+            )
 
         except discord.Forbidden:
             self.logger.error("Missing permissions to update live-sba-scores channel")
@@ -204,11 +290,11 @@ class LiveScorebugTracker:
             channel: Discord text channel
         """
         try:
-            # Clear all messages
-            async for message in channel.history(limit=25):
-                await message.delete()
+            # Delete the scorebug messages this tracker owns
+            deleted = await self.managed_messages.clear(channel)
 
-            self.logger.info("Cleared live-sba-scores channel (no active games)")
+            if deleted:
+                self.logger.info("Cleared live-sba-scores channel (no active games)")
 
         except discord.Forbidden:
             self.logger.error("Missing permissions to clear live-sba-scores channel")
@@ -261,8 +347,13 @@ class LiveScorebugTracker:
             else:
                 description = f"{away_abbrev} {scorebug_data.away_score} @ {scorebug_data.home_score} {home_abbrev}"
 
+            # Skip the edit when the score text hasn't changed
+            if self._voice_statuses.get(voice_channel_id) == description:
+                return
+
             # Update voice channel description (topic)
             await voice_channel.edit(status=description)
+            self._voice_statuses[voice_channel_id] = description
 
             self.logger.debug(f"Updated voice channel {voice_channel.name} description to: {description}")
 
@@ -4,19 +4,23 @@ Transaction Freeze/Thaw Task for Discord Bot v2.0
 Automated weekly system for freezing and processing transactions.
 Runs on a schedule to increment weeks and process contested transactions.
 """
-import asyncio
 import random
 from datetime import datetime, UTC
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
 
 import discord
 from discord.ext import commands, tasks
 
 from services.league_service import league_service
+from services.player_index import player_index
+from services.player_service import player_service
 from services.transaction_service import transaction_service
 from services.standings_service import standings_service
+from services.transaction_executor import get_transaction_executor
+from services.transaction_journal import TransactionJournal
 from models.current import Current
+from models.player import Player
 from models.transaction import Transaction
 from utils.logging import get_contextual_logger
 from views.embeds import EmbedTemplate, EmbedColors
@@ -40,7 +44,8 @@ class TransactionPriority:
 
 async def resolve_contested_transactions(
     transactions: List[Transaction],
-    season: int
+    season: int,
+    win_percentages: Optional[Dict[str, float]] = None
 ) -> Tuple[List[str], List[str]]:
     """
     Resolve contested transactions where multiple teams want the same player.
@@ -50,6 +55,8 @@ async def resolve_contested_transactions(
     Args:
         transactions: List of all frozen transactions for the week
         season: Current season number
+        win_percentages: Standings snapshot mapping uppercase team abbreviation
+                         to win%. Fetched once (only if a contest exists) when not given.
 
     Returns:
         Tuple of (winning_move_ids, losing_move_ids)
@@ -80,6 +87,14 @@ async def resolve_contested_transactions(
             # Non-contested, automatically wins
             non_contested_moves.add(player_transactions_list[0].moveid)
 
+    # One standings snapshot for every contest
+    if contested_players and win_percentages is None:
+        try:
+            win_percentages = await standings_service.get_win_percentages(season)
+        except Exception as e:
+            logger.error(f"Error loading standings for contested transactions: {e}")
+            win_percentages = {}
+
     # Resolve contests using team priority (win% + random tiebreaker)
     winning_move_ids: Set[str] = set()
     losing_move_ids: Set[str] = set()
@@ -95,35 +110,19 @@ async def resolve_contested_transactions(
             else:
                 team_abbrev = transaction.newteam.abbrev
 
-            try:
-                # Get team standings to calculate win percentage
-                standings = await standings_service.get_team_standings(team_abbrev, season)
-
-                if standings and standings.wins is not None and standings.losses is not None:
-                    total_games = standings.wins + standings.losses
-                    win_pct = standings.wins / total_games if total_games > 0 else 0.0
-                else:
-                    win_pct = 0.0
-                    logger.warning(f"Could not get standings for {team_abbrev}, using 0.0 win%")
+            win_pct = win_percentages.get(team_abbrev.upper())
+            if win_pct is None:
+                win_pct = 0.0
+                logger.warning(f"Could not get standings for {team_abbrev}, using 0.0 win%")
 
-                # Add small random component for tiebreaking (5 decimal precision)
-                random_component = random.randint(10000, 99999) * 0.00000001
-                tiebreaker = win_pct + random_component
+            # Add small random component for tiebreaking (5 decimal precision)
+            random_component = random.randint(10000, 99999) * 0.00000001
 
-                priorities.append(TransactionPriority(
-                    transaction=transaction,
-                    team_win_percentage=win_pct,
-                    tiebreaker=tiebreaker
-                ))
-
-            except Exception as e:
-                logger.error(f"Error calculating priority for {team_abbrev}: {e}")
-                # Give them 0.0 priority on error
-                priorities.append(TransactionPriority(
-                    transaction=transaction,
-                    team_win_percentage=0.0,
-                    tiebreaker=random.randint(10000, 99999) * 0.00000001
-                ))
+            priorities.append(TransactionPriority(
+                transaction=transaction,
+                team_win_percentage=win_pct,
+                tiebreaker=win_pct + random_component
+            ))
 
         # Sort by tiebreaker (lowest win% wins - worst teams get priority)
         priorities.sort()
@@ -258,6 +257,56 @@ class TransactionFreezeTask:
         """Wait for bot to be ready before starting."""
         await self.bot.wait_until_ready()
         self.logger.info("Bot is ready, transaction freeze/thaw task starting")
+        await self._resume_interrupted_runs()
+
+    async def _resume_interrupted_runs(self):
+        """
+        Finish the current week's journaled transaction run if it was cut off (e.g. by a restart).
+
+        Interrupted runs from earlier weeks are left alone: their moves may have
+        been superseded, so they're only reported for an admin to review.
+        """
+        try:
+            current = await league_service.get_current_state()
+        except Exception as e:
+            self.logger.error(f"Could not load current state to resume transaction runs: {e}", exc_info=True)
+            return
+        if not current:
+            return
+
+        for journal in TransactionJournal.incomplete():
+            if (journal.season, journal.week) != (current.season, current.week):
+                self.logger.warning(
+                    f"Not resuming interrupted transaction run for past week {journal.week}",
+                    season=journal.season,
+                    already_applied=journal.applied_count
+                )
+                continue
+
+            try:
+                self.logger.warning(
+                    f"Resuming interrupted transaction run for week {journal.week}",
+                    season=journal.season,
+                    already_applied=journal.applied_count
+                )
+                report = await get_transaction_executor().execute_journaled(
+                    journal,
+                    self._no_transactions,
+                    self._execute_transaction
+                )
+                self.logger.info(
+                    f"Resumed transaction run for week {journal.week} finished",
+                    success=report.succeeded,
+                    already_applied=report.skipped,
+                    failures=report.failed
+                )
+            except Exception as e:
+                self.logger.error(f"Error resuming transaction run for week {journal.week}: {e}", exc_info=True)
+
+    @staticmethod
+    async def _no_transactions() -> List[Transaction]:
+        # Resumed runs replay their journaled plan and never fetch
+        return []
 
     async def _begin_freeze(self, current: Current):
         """
@@ -348,49 +397,47 @@ class TransactionFreezeTask:
         and should take effect immediately when the new week starts.
         """
         try:
-            # Get non-frozen, non-cancelled transactions for current week via service
-            transactions = await transaction_service.get_regular_transactions_by_week(
-                season=current.season,
-                week=current.week
+            journal = TransactionJournal.for_week(current.season, current.week)
+
+            async def fetch_transactions() -> List[Transaction]:
+                # Get non-frozen, non-cancelled transactions for current week via service
+                transactions = await transaction_service.get_regular_transactions_by_week(
+                    season=current.season,
+                    week=current.week
+                )
+                if transactions:
+                    self.logger.info(f"Processing {len(transactions)} regular transactions for week {current.week}")
+                return transactions or []
+
+            # Execute player roster updates (bounded concurrency, rate limited, journaled)
+            report = await get_transaction_executor().execute_journaled(
+                journal,
+                fetch_transactions,
+                self._execute_transaction
             )
 
-            if not transactions:
+            if report.total == 0:
                 self.logger.info(f"No regular transactions to process for week {current.week}")
                 return
 
-            self.logger.info(f"Processing {len(transactions)} regular transactions for week {current.week}")
-
-            # Execute player roster updates for all transactions
-            success_count = 0
-            failure_count = 0
-
-            for transaction in transactions:
-                try:
-                    # Update player's team via PATCH /players/{player_id}?team_id={new_team_id}
-                    await self._execute_player_update(
-                        player_id=transaction.player.id,
-                        new_team_id=transaction.newteam.id,
-                        player_name=transaction.player.name
-                    )
-                    success_count += 1
-
-                    # Rate limiting: 100ms delay between requests to avoid API overload
-                    await asyncio.sleep(0.1)
-
-                except Exception as e:
+            for moveid, failures in report.failures.items():
+                for failure in failures:
                     self.logger.error(
-                        f"Failed to execute transaction for {transaction.player.name}",
-                        player_id=transaction.player.id,
-                        new_team_id=transaction.newteam.id,
-                        error=str(e)
+                        f"Failed to execute transaction for {failure.transaction.player.name}",
+                        moveid=moveid,
+                        player_id=failure.transaction.player.id,
+                        new_team_id=failure.transaction.newteam.id,
+                        error=failure.error
                     )
-                    failure_count += 1
 
             self.logger.info(
                 f"Transaction execution complete for week {current.week}",
-                success=success_count,
-                failures=failure_count,
-                total=len(transactions)
+                success=report.succeeded,
+                already_applied=report.skipped,
+                failures=report.failed,
+                failed_moves=len(report.failures),
+                total=report.total,
+                resumed=report.resumed
             )
 
         except Exception as e:
@@ -489,6 +536,29 @@ class TransactionFreezeTask:
             self.logger.error(f"Error during freeze processing: {e}", exc_info=True)
             raise
 
+    async def _execute_transaction(self, transaction: Transaction) -> bool:
+        """Apply one move's player update (TransactionExecutor callback)."""
+        return await self._execute_player_update(
+            player_id=transaction.player.id,
+            new_team_id=transaction.newteam.id,
+            player_name=transaction.player.name
+        )
+
+    async def _record_player_move(self, player_id: int, new_team_id: int, response) -> None:
+        """Keep the player index and cached season list in step with a direct PATCH."""
+        try:
+            if isinstance(response, dict) and response.get('id') == player_id:
+                player = Player.from_api_data(response)
+            else:
+                # PATCH didn't echo the player; move the indexed copy instead
+                indexed = player_index.get(player_id)
+                if indexed is None:
+                    return
+                player = indexed.model_copy(update={'team_id': new_team_id, 'team': None})
+            await player_service.record_player_update(player)
+        except Exception as e:
+            self.logger.warning(f"Could not refresh cached player {player_id} after update: {e}")
+
     async def _execute_player_update(
         self,
         player_id: int,
@@ -523,11 +593,15 @@ class TransactionFreezeTask:
             # Execute PATCH request to update player's team
             response = await client.patch(
                 f'players/{player_id}',
-                params=[('team_id', str(new_team_id))]
+                data={'team_id': new_team_id},
+                use_query_params=True
             )
 
             # Verify response (200 or 204 indicates success)
             if response is not None:
+                # Direct PATCH bypasses player_service.update_player, so drop cached entries here
+                await transaction_service.cache.invalidate_tags(f"player:{player_id}")
+                await self._record_player_move(player_id, new_team_id, response)
                 self.logger.info(
                     f"Successfully updated player roster",
                     player_id=player_id,
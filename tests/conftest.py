@@ -26,18 +26,102 @@ def reset_singleton_state():
     # Cleanup after test
     # Reset transaction builder caches
     try:
-        from services.transaction_builder import _transaction_builders
-        _transaction_builders.clear()
+        from services.transaction_builder import _active_builders
+        _active_builders.clear()
     except ImportError:
         pass
 
     try:
-        from services.trade_builder import _trade_builders, _team_to_trade_key
-        _trade_builders.clear()
+        from services.trade_builder import _active_trade_builders, _team_to_trade_key
+        _active_trade_builders.clear()
         _team_to_trade_key.clear()
     except ImportError:
         pass
 
+    # Drop rosters and pending moves cached for builder validation
+    try:
+        from services.transaction_builder import validation_context
+        validation_context.clear()
+    except ImportError:
+        pass
+
+    # Reset in-process (L1) cache so cached models don't leak between tests
+    try:
+        from utils.cache import clear_local_cache
+        clear_local_cache()
+    except ImportError:
+        pass
+
+    # Drop the league Current snapshot held by the global league service
+    try:
+        from services.league_service import league_service
+        league_service.invalidate_current_state()
+    except ImportError:
+        pass
+
+    # Empty the season player index
+    try:
+        from services.player_index import player_index
+        player_index.clear()
+    except ImportError:
+        pass
+
+    # Forget organization mappings built during the test
+    try:
+        from services.organization_registry import organization_registry
+        organization_registry.clear()
+    except ImportError:
+        pass
+
+    # Drop the in-memory draft board
+    try:
+        from services.draft_board import draft_board
+        draft_board.clear()
+    except ImportError:
+        pass
+
+    # Drop local draft list copies
+    try:
+        from services.draft_list_service import draft_list_service
+        draft_list_service.invalidate()
+    except ImportError:
+        pass
+
+    # Forget any auto-draft plan
+    try:
+        from services.auto_draft_planner import auto_draft_planner
+        auto_draft_planner.clear()
+    except ImportError:
+        pass
+
+    # Rebuild the transaction executor from the current config on next use
+    try:
+        import services.transaction_executor as transaction_executor_module
+        transaction_executor_module._transaction_executor = None
+    except ImportError:
+        pass
+
+    # Drop transaction journal locks (bound to the test's event loop)
+    try:
+        from services.transaction_journal import _journal_locks
+        _journal_locks.clear()
+    except ImportError:
+        pass
+
+    # Forget scorebug snapshots read during the test
+    try:
+        from services.scorebug_snapshots import scorebug_snapshots
+        scorebug_snapshots.clear()
+    except ImportError:
+        pass
+
+    # Rebuild the Google Sheets rate limiter (and its lock) on next use
+    try:
+        import services.sheets_service as sheets_service_module
+        sheets_service_module._sheets_rate_limiter = None
+    except ImportError:
+        pass
+
     # Reset config singleton to ensure clean state
     try:
         from config import _config
@@ -47,6 +131,22 @@ def reset_singleton_state():
         pass
 
 
+class FakeClock:
+    """Manually advanced monotonic clock for anything taking an injectable `clock`."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Fake monotonic clock starting at 0; tests set or advance `clock.now`."""
+    return FakeClock()
+
+
 @pytest.fixture(scope="session")
 def event_loop_policy():
     """Use default event loop policy."""
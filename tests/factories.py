@@ -148,9 +148,9 @@ class TransactionFactory:
     @staticmethod
     def create(
         id: int = 1,
-        transaction_type: str = "Drop/Add",
-        player_id: int = 1,
-        team_id: int = 1,
+        player: Optional[Player] = None,
+        oldteam: Optional[Team] = None,
+        newteam: Optional[Team] = None,
         season: int = 12,
         week: int = 1,
         **kwargs
@@ -158,11 +158,12 @@ class TransactionFactory:
         """Create a Transaction instance with sensible defaults."""
         defaults = {
             "id": id,
-            "transaction_type": transaction_type,
-            "player_id": player_id,
-            "team_id": team_id,
-            "season": season,
             "week": week,
+            "season": season,
+            "moveid": f"move-{id}",
+            "player": player or PlayerFactory.create(id=id, name=f"Player {id}"),
+            "oldteam": oldteam or TeamFactory.create(id=999, abbrev="FA", sname="Free Agents", lname="Free Agents"),
+            "newteam": newteam or TeamFactory.west_virginia(),
         }
         defaults.update(kwargs)
         return Transaction(**defaults)
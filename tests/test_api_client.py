@@ -20,6 +20,8 @@ class TestAPIClientWithAioresponses:
         config = MagicMock()
         config.db_url = "https://api.example.com"
         config.api_token = "test-token"
+        config.max_retries = 0
+        config.default_timeout = 10
         return config
     
     @pytest.fixture
@@ -223,6 +225,8 @@ class TestAPIClientHelpers:
         config = MagicMock()
         config.db_url = "https://api.example.com"
         config.api_token = "test-token"
+        config.max_retries = 0
+        config.default_timeout = 10
         return config
     
     @pytest.mark.asyncio
@@ -273,6 +277,8 @@ class TestIntegrationScenarios:
         config = MagicMock()
         config.db_url = "https://api.example.com"
         config.api_token = "test-token"
+        config.max_retries = 0
+        config.default_timeout = 10
         return config
     
     @pytest.mark.asyncio
@@ -430,6 +436,146 @@ class TestIntegrationScenarios:
                 await client.close()
 
 
+class TestGetCoalescing:
+    """Test single-flight coalescing of identical concurrent GET requests."""
+    
+    @pytest.fixture
+    def mock_config(self):
+        """Mock configuration for testing."""
+        config = MagicMock()
+        config.db_url = "https://api.example.com"
+        config.api_token = "test-token"
+        config.max_retries = 0
+        config.default_timeout = 10
+        return config
+    
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_gets_share_one_request(self, mock_config):
+        """Test identical concurrent GETs are served by a single HTTP request."""
+        with patch('api.client.get_config', return_value=mock_config):
+            with aioresponses() as m:
+                # Registered once - a second HTTP request would fail to match
+                m.get(
+                    "https://api.example.com/v3/teams?season=13",
+                    payload={"count": 1, "teams": [{"id": 1}]},
+                    status=200
+                )
+                
+                client = APIClient()
+                results = await asyncio.gather(*[
+                    client.get("teams", params=[("season", 13)]) for _ in range(5)
+                ])
+                
+                assert all(r == {"count": 1, "teams": [{"id": 1}]} for r in results)
+                assert client.get_request_stats() == {'issued': 1, 'coalesced': 4, 'in_flight': 0, 'retries': 0}
+                
+                # Each caller owns its result
+                results[1]["teams"].append({"id": 2})
+                assert len(results[0]["teams"]) == 1
+                
+                await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_sequential_gets_are_not_coalesced(self, mock_config):
+        """Test coalescing only applies while a request is in flight."""
+        with patch('api.client.get_config', return_value=mock_config):
+            with aioresponses() as m:
+                m.get("https://api.example.com/v3/current", payload={"week": 1}, repeat=True)
+                
+                client = APIClient()
+                await client.get("current")
+                await client.get("current")
+                
+                assert client.issued_requests == 2
+                assert client.coalesced_requests == 0
+                
+                await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_all_receive_error(self, mock_config):
+        """Test a failed shared request raises for every waiting caller."""
+        with patch('api.client.get_config', return_value=mock_config):
+            with aioresponses() as m:
+                m.get("https://api.example.com/v3/current", status=500, body="boom")
+                
+                client = APIClient()
+                results = await asyncio.gather(
+                    client.get("current"),
+                    client.get("current"),
+                    return_exceptions=True
+                )
+                
+                assert all(isinstance(r, APIException) for r in results)
+                assert client.issued_requests == 1
+                assert client._inflight_gets == {}
+                
+                await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self, mock_config):
+        """Test cancelling the first caller leaves the shared request running."""
+        with patch('api.client.get_config', return_value=mock_config):
+            client = APIClient()
+            release = asyncio.Event()
+            
+            async def slow_get(*args, **kwargs):
+                await release.wait()
+                return {"week": 5}
+            
+            with patch.object(client, '_execute_get', side_effect=slow_get):
+                leader = asyncio.create_task(client.get("current"))
+                await asyncio.sleep(0)
+                follower = asyncio.create_task(client.get("current"))
+                await asyncio.sleep(0)
+                
+                leader.cancel()
+                release.set()
+                
+                assert await follower == {"week": 5}
+                assert leader.cancelled()
+    
+    @pytest.mark.asyncio
+    async def test_leader_mutation_does_not_reach_followers(self, mock_config):
+        """Test followers' copies are taken before the leader resumes and mutates the response."""
+        with patch('api.client.get_config', return_value=mock_config):
+            client = APIClient()
+            release = asyncio.Event()
+            
+            async def slow_get(*args, **kwargs):
+                await release.wait()
+                return {"teams": [{"id": 1}]}
+            
+            async def mutating_leader():
+                data = await client.get("teams")
+                data["teams"].append({"id": 2})
+                return data
+            
+            with patch.object(client, '_execute_get', side_effect=slow_get):
+                leader = asyncio.create_task(mutating_leader())
+                await asyncio.sleep(0)
+                followers = [asyncio.create_task(client.get("teams")) for _ in range(2)]
+                await asyncio.sleep(0)
+                release.set()
+                
+                assert len((await leader)["teams"]) == 2
+                assert [await follower for follower in followers] == [{"teams": [{"id": 1}]}] * 2
+    
+    @pytest.mark.asyncio
+    async def test_coalescing_can_be_disabled(self, mock_config):
+        """Test coalesce_gets=False issues one request per call."""
+        with patch('api.client.get_config', return_value=mock_config):
+            with aioresponses() as m:
+                m.get("https://api.example.com/v3/current", payload={"week": 1}, repeat=True)
+                
+                client = APIClient(coalesce_gets=False)
+                await asyncio.gather(client.get("current"), client.get("current"))
+                
+                assert client.issued_requests == 2
+                assert client.coalesced_requests == 0
+                
+                await client.close()
+
+
 class TestAPIClientCoverageExtras:
     """Additional coverage tests for API client edge cases."""
     
@@ -439,6 +585,8 @@ class TestAPIClientCoverageExtras:
         config = MagicMock()
         config.db_url = "https://api.example.com"
         config.api_token = "test-token"
+        config.max_retries = 0
+        config.default_timeout = 10
         return config
     
     @pytest.mark.asyncio
@@ -0,0 +1,223 @@
+"""
+Tests for API request policies (retry/backoff and circuit breakers)
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from aioresponses import aioresponses
+
+from api.client import APIClient
+from api.policy import RetryPolicy, CircuitBreaker, CircuitState, RequestPolicy
+from exceptions import APIException, APIUnavailableException, CircuitOpenException
+
+
+class TestRetryPolicy:
+    """Test retry decisions and backoff delays."""
+
+    def test_only_idempotent_methods_retry(self):
+        """Test GET/PUT/DELETE are retried and POST/PATCH are not."""
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.should_retry('GET', 0)
+        assert policy.should_retry('put', 1)
+        assert policy.should_retry('DELETE', 0)
+        assert not policy.should_retry('POST', 0)
+        assert not policy.should_retry('PATCH', 0)
+        assert not policy.should_retry('GET', 2)
+
+    def test_backoff_delay_is_jittered_and_capped(self):
+        """Test delays stay within the exponential ceiling and the max cap."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=3.0)
+
+        for attempt in range(6):
+            ceiling = min(3.0, 0.5 * (2 ** attempt))
+            for _ in range(20):
+                assert 0 <= policy.backoff_delay(attempt) <= ceiling
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def test_opens_after_threshold(self, clock):
+        """Test consecutive failures open the circuit."""
+        breaker = CircuitBreaker('players', failure_threshold=3, clock=clock)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self, clock):
+        """Test a success between failures keeps the circuit closed."""
+        breaker = CircuitBreaker('players', failure_threshold=2, clock=clock)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_single_probe(self, clock):
+        """Test the breaker half-opens after the recovery timeout with one probe."""
+        breaker = CircuitBreaker('players', failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 29
+        assert not breaker.allow_request()
+
+        clock.now = 30
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # Probe already in flight
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self, clock):
+        """Test a failed half-open probe re-opens the circuit."""
+        breaker = CircuitBreaker('players', failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.retry_after() == 10
+        assert breaker.status()['times_opened'] == 2
+
+
+class TestRequestPolicy:
+    """Test policy execution around request operations."""
+
+    @pytest.fixture
+    def policy(self, clock):
+        return RequestPolicy(
+            retry_policy=RetryPolicy(max_retries=2),
+            failure_threshold=3,
+            sleep=AsyncMock(),
+            clock=clock
+        )
+
+    def test_endpoint_family(self):
+        """Test endpoints are grouped by their first path segment."""
+        assert RequestPolicy.endpoint_family('players') == 'players'
+        assert RequestPolicy.endpoint_family('players/search') == 'players'
+        assert RequestPolicy.endpoint_family('https://other.example.com/api/x') == 'external'
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self, policy):
+        """Test a GET succeeds after transient failures."""
+        operation = AsyncMock(side_effect=[
+            APIUnavailableException("503"),
+            APIUnavailableException("503"),
+            {"ok": True}
+        ])
+
+        result = await policy.execute('GET', 'players', operation)
+
+        assert result == {"ok": True}
+        assert operation.await_count == 3
+        assert policy.retries == 2
+        assert policy._sleep.await_count == 2
+        assert policy.breaker_for('players').state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried(self, policy):
+        """Test non-idempotent methods fail on the first transient error."""
+        operation = AsyncMock(side_effect=APIUnavailableException("503"))
+
+        with pytest.raises(APIUnavailableException):
+            await policy.execute('POST', 'transactions', operation)
+
+        assert operation.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, policy):
+        """Test non-transient errors pass straight through without tripping the breaker."""
+        operation = AsyncMock(side_effect=APIException("400 bad request"))
+
+        with pytest.raises(APIException, match="400"):
+            await policy.execute('GET', 'players', operation)
+
+        assert operation.await_count == 1
+        assert policy.get_breaker_states()['players']['consecutive_failures'] == 0
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, policy):
+        """Test an open breaker rejects requests without calling the API."""
+        failing = AsyncMock(side_effect=APIUnavailableException("down"))
+        with pytest.raises(APIUnavailableException):
+            await policy.execute('GET', 'players', failing)
+
+        operation = AsyncMock(return_value={"ok": True})
+        with pytest.raises(CircuitOpenException):
+            await policy.execute('GET', 'players/search', operation)
+
+        operation.assert_not_awaited()
+        # Other endpoint families are unaffected
+        assert await policy.execute('GET', 'teams', operation) == {"ok": True}
+        assert policy.get_breaker_states()['players']['state'] == 'open'
+
+
+class TestAPIClientPolicyIntegration:
+    """Test APIClient requests run through the policy."""
+
+    @pytest.fixture
+    def mock_config(self):
+        config = MagicMock()
+        config.db_url = "https://api.example.com"
+        config.api_token = "test-token"
+        config.max_retries = 2
+        config.default_timeout = 10
+        return config
+
+    @pytest.mark.asyncio
+    async def test_get_retries_on_503(self, mock_config):
+        """Test a GET recovers from a transient 503."""
+        with patch('api.client.get_config', return_value=mock_config):
+            policy = RequestPolicy(retry_policy=RetryPolicy(max_retries=2), sleep=AsyncMock())
+            client = APIClient(policy=policy)
+
+            with aioresponses() as m:
+                m.get("https://api.example.com/v3/current", status=503, body="unavailable")
+                m.get("https://api.example.com/v3/current", payload={"week": 3})
+
+                result = await client.get("current")
+
+            assert result == {"week": 3}
+            assert client.get_request_stats()['retries'] == 1
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_post_500_not_retried(self, mock_config):
+        """Test a POST fails immediately on a server error."""
+        with patch('api.client.get_config', return_value=mock_config):
+            policy = RequestPolicy(retry_policy=RetryPolicy(max_retries=2), sleep=AsyncMock())
+            client = APIClient(policy=policy)
+
+            with aioresponses() as m:
+                m.post("https://api.example.com/v3/transactions", status=500, body="boom")
+
+                with pytest.raises(APIUnavailableException, match="POST request failed with status 500"):
+                    await client.post("transactions", {"moves": []})
+
+            assert policy.retries == 0
+            assert client.get_circuit_states()['transactions']['consecutive_failures'] == 1
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_404_is_not_transient(self, mock_config):
+        """Test a 404 returns None without counting as a failure."""
+        with patch('api.client.get_config', return_value=mock_config):
+            client = APIClient()
+
+            with aioresponses() as m:
+                m.get("https://api.example.com/v3/players/999", status=404)
+
+                assert await client.get("players", object_id=999) is None
+
+            assert client.get_circuit_states()['players']['state'] == 'closed'
+            await client.close()
@@ -0,0 +1,126 @@
+"""
+Tests for the auto-draft planner
+
+Validates candidate ranking (availability and cap space from one roster fetch),
+plan reuse, shared builds and invalidation on draft list edits.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from models.draft_list import DraftList
+from models.draft_pick import DraftPick
+from services.auto_draft_planner import AutoDraftPlanner
+from tests.factories import PlayerFactory, TeamFactory
+
+FA_TEAM_ID = 498
+
+
+def make_entry(rank: int, player_id: int, wara: float, team_id: int = FA_TEAM_ID) -> DraftList:
+    player = PlayerFactory.create(id=player_id, name=f"Player {player_id}", wara=wara, team_id=team_id)
+    return DraftList(season=12, rank=rank, team=TeamFactory.create(salary_cap=9.0), player=player)
+
+
+def make_pick(overall: int = 25) -> DraftPick:
+    team = TeamFactory.create(salary_cap=9.0)
+    return DraftPick(id=overall, season=12, overall=overall, round=2, origowner_id=1, owner_id=1,
+                     origowner=team, owner=team)
+
+
+@pytest.fixture
+def planner(clock):
+    return AutoDraftPlanner(clock=clock)
+
+
+@pytest.fixture
+def services():
+    """Patch the services the planner reads from."""
+    # 20 players: 15 of the 21 cheapest count toward the 9.0 cap after a pick
+    roster = {'active': {'players': [{'id': i, 'wara': 0.5 if i < 14 else 5.0} for i in range(20)]}}
+    draft_list = [
+        make_entry(1, 101, 1.0, team_id=7),      # already on a team
+        make_entry(2, 102, 6.0),                  # drafted on the board since the list was read
+        make_entry(3, 103, 9.0),                  # over cap
+        make_entry(4, 104, 1.0),
+        make_entry(5, 105, 1.5),
+    ]
+    with patch('services.draft_list_service.draft_list_service') as list_service, \
+            patch('services.team_service.team_service') as team_service, \
+            patch('services.draft_board.draft_board') as board, \
+            patch('config.get_config') as mock_config:
+        list_service.get_team_list = AsyncMock(return_value=draft_list)
+        list_service.list_version = MagicMock(return_value=0)
+        team_service.get_team_roster = AsyncMock(return_value=roster)
+        board.drafted_player_ids = MagicMock(return_value={102})
+        config = MagicMock()
+        config.free_agent_team_id = FA_TEAM_ID
+        config.cap_player_count = 26
+        config.swar_cap_limit = 32.0
+        mock_config.return_value = config
+        yield list_service, team_service, board
+
+
+class TestAutoDraftPlanner:
+
+    @pytest.mark.asyncio
+    async def test_build_plan_ranks_legal_candidates(self, planner, services):
+        plan = await planner.get_plan(12, make_pick())
+
+        assert [p.id for p in plan.candidates] == [104, 105]
+        assert plan.skipped == {101: "not available", 102: "not available", 103: "over cap (12.00)"}
+        assert plan.list_size == 5
+        services[1].get_team_roster.assert_awaited_once_with(1, 'current')
+
+    @pytest.mark.asyncio
+    async def test_cap_is_the_owning_teams_own(self, planner, services):
+        """A team without a custom cap is checked against the league default, like /draft."""
+        pick = make_pick()
+        default_cap_team = TeamFactory.create()
+        pick = pick.model_copy(update={'owner': default_cap_team, 'origowner': default_cap_team})
+
+        plan = await planner.get_plan(12, pick)
+
+        assert [p.id for p in plan.candidates] == [103, 104, 105]
+        assert 103 not in plan.skipped
+
+    @pytest.mark.asyncio
+    async def test_available_candidates_drop_players_taken_since(self, planner, services):
+        plan = await planner.get_plan(12, make_pick())
+        assert [p.id for p in plan.available_candidates({104})] == [105]
+
+    @pytest.mark.asyncio
+    async def test_plan_reused_until_stale_or_list_edited(self, planner, services, clock):
+        list_service, team_service, _ = services
+        pick = make_pick()
+
+        first = await planner.get_plan(12, pick)
+        assert await planner.get_plan(12, pick) is first
+        assert team_service.get_team_roster.await_count == 1
+
+        # Draft list edited through the bot
+        list_service.list_version.return_value = 1
+        assert await planner.get_plan(12, pick) is not first
+
+        # Plan aged out
+        second = await planner.get_plan(12, pick)
+        clock.now += AutoDraftPlanner.MAX_AGE
+        assert await planner.get_plan(12, pick) is not second
+
+        # Different pick
+        assert (await planner.get_plan(12, make_pick(26))).overall == 26
+        assert team_service.get_team_roster.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_build(self, planner, services):
+        _, team_service, _ = services
+        pick = make_pick()
+
+        plans = await asyncio.gather(planner.get_plan(12, pick), planner.get_plan(12, pick, refresh=True))
+
+        assert plans[0] is plans[1]
+        assert team_service.get_team_roster.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_roster_returns_none(self, planner, services):
+        services[1].get_team_roster.return_value = None
+        assert await planner.get_plan(12, make_pick()) is None
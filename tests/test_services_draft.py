@@ -278,6 +278,29 @@ class TestDraftService:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_update_draft_data_notifies_listeners(self, service, mock_client):
+        """
+        Test that update listeners receive the new state after a successful update only.
+
+        Verifies a failing listener doesn't break the update or other listeners.
+        """
+        received = []
+        service.add_update_listener(MagicMock(side_effect=Exception("listener bug")))
+        service.add_update_listener(received.append)
+
+        mock_client.patch.return_value = create_draft_data(currentpick=50)
+        result = await service.update_draft_data(draft_id=1, updates={'currentpick': 50})
+
+        mock_client.patch.return_value = None
+        await service.update_draft_data(draft_id=1, updates={'currentpick': 51})
+
+        assert result is not None
+        assert [d.currentpick for d in received] == [50]
+
+        service.remove_update_listener(received.append)
+        assert len(service._update_listeners) == 1
+
     # -------------------------------------------------------------------------
     # set_timer() tests
     # -------------------------------------------------------------------------
@@ -426,6 +449,52 @@ class TestDraftService:
                 patch_call = mock_client.patch.call_args
                 assert patch_call[0][1]['currentpick'] == 29
 
+    @pytest.mark.asyncio
+    async def test_advance_pick_uses_draft_board(self, service, mock_client):
+        """
+        Test that advance_pick jumps straight to the next unfilled pick on the board.
+
+        Verifies only the board's candidate is confirmed against the API, and a
+        candidate filled outside the bot is recorded and skipped.
+        """
+        with patch('config.get_config') as mock_config:
+            config = MagicMock()
+            config.sba_season = 12
+            config.draft_total_picks = 512
+            mock_config.return_value = config
+
+            with patch('services.draft_pick_service.draft_pick_service') as mock_pick_service:
+                # Board: 26-28 filled, 29 and 30 unfilled
+                board_picks = [
+                    DraftPick(**create_draft_pick_data(
+                        pick_id=overall, overall=overall,
+                        player_id=overall * 10 if overall <= 28 else None,
+                        include_nested=False
+                    ))
+                    for overall in range(26, 31)
+                ]
+                mock_pick_service.get_picks_with_players = AsyncMock(return_value=board_picks)
+
+                # Pick 29 was filled since the board loaded; 30 is open
+                async def get_pick_side_effect(season, overall):
+                    return DraftPick(**create_draft_pick_data(
+                        pick_id=overall, overall=overall,
+                        player_id=290 if overall == 29 else None,
+                        include_nested=False
+                    ))
+
+                mock_pick_service.get_pick = AsyncMock(side_effect=get_pick_side_effect)
+
+                current_data = create_draft_data(currentpick=25, timer=True)
+                mock_client.get.return_value = {'count': 1, 'draftdata': [current_data]}
+                mock_client.patch.return_value = create_draft_data(currentpick=30)
+
+                await service.advance_pick(draft_id=1, current_pick=25)
+
+                patch_call = mock_client.patch.call_args
+                assert patch_call[0][1]['currentpick'] == 30
+                assert [c.args[1] for c in mock_pick_service.get_pick.call_args_list] == [29, 30]
+
     # -------------------------------------------------------------------------
     # update_channels() tests
     # -------------------------------------------------------------------------
@@ -1399,6 +1468,138 @@ class TestDraftListService:
         assert result is False
         mock_client.post.assert_not_called()
 
+    # -------------------------------------------------------------------------
+    # Local list state tests
+    # -------------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_consecutive_edits_reuse_local_list(self, service, mock_client):
+        """
+        Test that edits after the first start from the local list instead of re-reading it.
+
+        Verifies one GET for several edits, and ranks built from the local order.
+        """
+        existing_list = [
+            create_draft_list_data(entry_id=i, rank=i, player_id=100 + i) for i in range(1, 5)
+        ]
+        mock_client.get.return_value = {'count': 4, 'picks': existing_list}
+        mock_client.post.return_value = "Inserted 4 list values"
+
+        assert await service.move_entry_up(season=12, team_id=1, player_id=103)
+        assert await service.move_entry_up(season=12, team_id=1, player_id=103)
+        assert await service.remove_player_from_list(season=12, team_id=1, player_id=102)
+
+        assert mock_client.get.call_count == 1
+        assert mock_client.post.call_count == 3
+        payload = mock_client.post.call_args[0][1]
+        assert [e['player_id'] for e in payload['draft_list']] == [103, 101, 104]
+        assert [e['rank'] for e in payload['draft_list']] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_order_not_posted(self, service, mock_client):
+        """Test that a reorder which moves nothing makes no POST."""
+        existing_list = [
+            create_draft_list_data(entry_id=1, rank=1, player_id=101),
+            create_draft_list_data(entry_id=2, rank=2, player_id=102),
+        ]
+        mock_client.get.return_value = {'count': 2, 'picks': existing_list}
+
+        result = await service.reorder_list(season=12, team_id=1, new_order=[101, 102])
+
+        assert result is True
+        mock_client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_to_list_skips_verification_when_entry_known(self, service, mock_client):
+        """
+        Test that add_to_list doesn't read the list back when it has the new entry's objects.
+
+        Covers both a POST that echoes the list and a caller passing player/team.
+        """
+        existing_list = [create_draft_list_data(entry_id=1, rank=1, player_id=101)]
+        mock_client.get.return_value = {'count': 1, 'picks': existing_list}
+
+        # Server echoes the full list
+        echoed = existing_list + [create_draft_list_data(entry_id=2, rank=2, player_id=102)]
+        mock_client.post.return_value = {'count': 2, 'picks': echoed}
+        result = await service.add_to_list(season=12, team_id=1, player_id=102)
+        assert [e.player_id for e in result] == [101, 102]
+
+        # Caller supplies the objects
+        mock_client.post.return_value = "Inserted 3 list values"
+        player = Player(**create_player_data(103, 'New Guy'))
+        team = Team(**create_team_data(1, 'WV'))
+        result = await service.add_to_list(season=12, team_id=1, player_id=103, rank=1, player=player, team=team)
+
+        assert [(e.player_id, e.rank) for e in result] == [(103, 1), (101, 2), (102, 3)]
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_edits_during_flush_are_coalesced(self, service, mock_client):
+        """
+        Test that edits made while a POST is in flight are sent together in one follow-up POST.
+        """
+        import asyncio
+
+        existing_list = [
+            create_draft_list_data(entry_id=i, rank=i, player_id=100 + i) for i in range(1, 5)
+        ]
+        mock_client.get.return_value = {'count': 4, 'picks': existing_list}
+
+        release = asyncio.Event()
+        payloads = []
+
+        async def slow_post(endpoint, payload):
+            payloads.append([e['player_id'] for e in payload['draft_list']])
+            await release.wait()
+            return "ok"
+
+        mock_client.post.side_effect = slow_post
+
+        first = asyncio.create_task(service.move_entry_down(season=12, team_id=1, player_id=101))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        second = asyncio.create_task(service.move_entry_down(season=12, team_id=1, player_id=101))
+        third = asyncio.create_task(service.move_entry_down(season=12, team_id=1, player_id=101))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second, third) == [True, True, True]
+        assert payloads == [[102, 101, 103, 104], [102, 103, 104, 101]]
+
+
+    @pytest.mark.asyncio
+    async def test_draft_pick_drops_local_lists(self, mock_client):
+        """
+        Test that a pick made after a list was loaded forces the next mutation to reload.
+
+        The pick removes the player from lists server-side; a POST from the old
+        local copy would put them back.
+        """
+        from services.draft_board import draft_board
+
+        mock_client.get.return_value = {'count': 2, 'picks': [
+            create_draft_list_data(entry_id=1, rank=1, player_id=101),
+            create_draft_list_data(entry_id=2, rank=2, player_id=102),
+        ]}
+        mock_client.post.return_value = "ok"
+
+        with patch.object(draft_list_service, 'get_client', AsyncMock(return_value=mock_client)), \
+             patch.object(draft_list_service, '_client', mock_client):
+            await draft_list_service.get_team_list(season=12, team_id=1)
+            assert draft_list_service.list_version(12, 1) is not None
+
+            # Another team drafts player 101
+            draft_board.apply_pick(DraftPick(**create_draft_pick_data(pick_id=1, player_id=101)))
+            assert draft_list_service.list_version(12, 1) is None
+
+            mock_client.get.return_value = {'count': 1, 'picks': [
+                create_draft_list_data(entry_id=2, rank=1, player_id=102),
+            ]}
+            await draft_list_service.add_to_list(season=12, team_id=1, player_id=103)
+
+        payload = mock_client.post.call_args[0][1]
+        assert [e['player_id'] for e in payload['draft_list']] == [102, 103]
 
 # =============================================================================
 # DraftList Response Parsing Tests
@@ -0,0 +1,110 @@
+"""
+Tests for the in-memory draft board
+
+Validates loading, selection bookkeeping, next-unfilled lookups and the
+DraftPickService fallbacks.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from models.draft_pick import DraftPick
+from services.draft_board import DraftBoard
+from tests.factories import PlayerFactory, TeamFactory
+
+
+def make_pick(overall: int, player_id: int = None, round_num: int = None, nested: bool = True) -> DraftPick:
+    team = TeamFactory.create() if nested else None
+    player = PlayerFactory.create(id=player_id, name=f"Player {player_id}", team_id=1) \
+        if player_id and nested else None
+    return DraftPick(
+        id=overall, season=12, overall=overall, round=round_num or (overall - 1) // 16 + 1,
+        origowner_id=1, owner_id=1, player_id=player_id,
+        origowner=team, owner=team, player=player
+    )
+
+
+@pytest.fixture
+def board(clock):
+    """Board loaded with 32 picks: 1-20 filled, 21-32 open."""
+    board = DraftBoard(clock=clock)
+    board.season = 12
+    board._loaded_at = clock.now
+    for overall in range(1, 33):
+        board.apply_pick(make_pick(overall, player_id=overall * 10 if overall <= 20 else None))
+    return board
+
+
+@pytest.fixture
+def mock_pick_service():
+    with patch('services.draft_pick_service.draft_pick_service') as service:
+        yield service
+
+
+class TestDraftBoardLookups:
+    """Local lookups on a loaded board."""
+
+    def test_next_unfilled(self, board):
+        assert board.next_unfilled(0).overall == 21
+        assert board.next_unfilled(21).overall == 22
+        assert board.next_unfilled(32) is None
+
+    def test_apply_selection_and_clear(self, board):
+        board.apply_pick(make_pick(21, player_id=210, nested=False))
+        assert board.next_unfilled(20).overall == 22
+
+        board.apply_pick(make_pick(5, player_id=None, nested=False))
+        assert board.next_unfilled(0).overall == 5
+
+    def test_apply_keeps_nested_objects(self, board):
+        """PATCH responses without nested objects keep the board's owner and take the caller's player."""
+        player = PlayerFactory.create(id=210, name="Drafted Guy", wara=2.0, team_id=1)
+        board.apply_pick(make_pick(21, player_id=210, nested=False), player)
+
+        pick = board.get(21)
+        assert pick.owner.abbrev == "TST"
+        assert pick.player.name == "Drafted Guy"
+
+    def test_apply_ignores_other_season(self, board):
+        other = make_pick(21, player_id=210, nested=False).model_copy(update={'season': 11})
+        board.apply_pick(other)
+        assert board.get(21).player_id is None
+
+    def test_recent_upcoming_and_round(self, board):
+        assert [p.overall for p in board.recent(21, limit=3)] == [20, 19, 18]
+        assert [p.overall for p in board.upcoming(21, limit=3)] == [22, 23, 24]
+        assert [p.overall for p in board.by_round(2)] == list(range(17, 33))
+
+    def test_expires_after_max_age(self, board, clock):
+        assert board.is_loaded(12)
+        clock.now += DraftBoard.MAX_AGE
+        assert not board.is_loaded(12)
+
+
+class TestDraftBoardLoading:
+    """Loading from DraftPickService and falling back to it."""
+
+    @pytest.mark.asyncio
+    async def test_ensure_loaded_fetches_once(self, clock, mock_pick_service):
+        mock_pick_service.get_picks_with_players = AsyncMock(
+            return_value=[make_pick(1, player_id=10), make_pick(2)]
+        )
+        board = DraftBoard(clock=clock)
+
+        assert await board.ensure_loaded(12)
+        assert await board.ensure_loaded(12)
+        assert board.next_unfilled(0).overall == 2
+        mock_pick_service.get_picks_with_players.assert_awaited_once_with(12)
+
+    @pytest.mark.asyncio
+    async def test_lookups_fall_back_to_service(self, clock, mock_pick_service):
+        mock_pick_service.get_picks_with_players = AsyncMock(side_effect=Exception("API down"))
+        mock_pick_service.get_recent_picks = AsyncMock(return_value=[])
+        mock_pick_service.get_pick = AsyncMock(return_value=None)
+        board = DraftBoard(clock=clock)
+
+        assert await board.get_recent_picks(12, 25, limit=5) == []
+        assert await board.get_pick(12, 25) is None
+
+        # Recent picks keep the service's inclusive overall_end contract
+        mock_pick_service.get_recent_picks.assert_awaited_once_with(12, 24, limit=5)
+        mock_pick_service.get_pick.assert_awaited_once_with(12, 25)
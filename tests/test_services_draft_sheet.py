@@ -4,6 +4,8 @@ Tests for DraftSheetService
 Tests the Google Sheets integration for draft pick tracking.
 Uses mocked pygsheets to avoid actual API calls.
 """
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Tuple, List
@@ -77,9 +79,10 @@ class TestDraftSheetService:
         The service is set up with:
         - Mocked config
         - Mocked pygsheets client (via _get_client override)
+        - No queue file
         """
         with patch('services.draft_sheet_service.get_config', return_value=mock_config):
-            service = DraftSheetService()
+            service = DraftSheetService(queue_file=None)
             service._config = mock_config
             service._sheets_client = mock_pygsheets['client']
             return service
@@ -303,6 +306,169 @@ class TestDraftSheetService:
         assert url is None
 
 
+class TestDraftSheetWriteQueue:
+    """Test suite for the write-behind pick queue."""
+
+    @pytest.fixture
+    def mock_config(self):
+        config = MagicMock()
+        config.draft_sheet_enabled = True
+        config.draft_sheet_worksheet = "Ordered List"
+        config.draft_sheet_start_column = "D"
+        config.sheets_credentials_path = "/app/data/test-creds.json"
+        config.get_draft_sheet_key = MagicMock(return_value="test-sheet-key-123")
+        return config
+
+    @pytest.fixture
+    def mock_pygsheets(self):
+        worksheet = MagicMock()
+        spreadsheet = MagicMock()
+        spreadsheet.worksheet_by_title = MagicMock(return_value=worksheet)
+        sheets_client = MagicMock()
+        sheets_client.open_by_key = MagicMock(return_value=spreadsheet)
+        return {'client': sheets_client, 'spreadsheet': spreadsheet, 'worksheet': worksheet}
+
+    @pytest.fixture
+    def make_service(self, mock_config, mock_pygsheets, tmp_path):
+        """Build services sharing one queue file, as across a bot restart."""
+        queue_file = tmp_path / "draft_sheet_queue.json"
+
+        def _make():
+            with patch('services.draft_sheet_service.get_config', return_value=mock_config):
+                service = DraftSheetService(queue_file=str(queue_file))
+            service._config = mock_config
+            service._sheets_client = mock_pygsheets['client']
+            service.FLUSH_DELAY = 60.0
+            service.RETRY_DELAYS = (0.0, 0.0)
+            return service
+
+        return _make
+
+    @staticmethod
+    def _enqueue(service, overall, player_name=None, on_failure=None):
+        return service.enqueue_pick(
+            season=12,
+            overall=overall,
+            orig_owner_abbrev="HAM",
+            owner_abbrev="NYY",
+            player_name=player_name or f"Player {overall}",
+            swar=1.5,
+            on_failure=on_failure
+        )
+
+    @staticmethod
+    def _written_ranges(worksheet):
+        return [c.kwargs['crange'] for c in worksheet.update_values.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_flush_coalesces_contiguous_picks(self, make_service, mock_pygsheets):
+        """Consecutive picks share one update_values range; the worksheet is opened once."""
+        service = make_service()
+        for overall in (3, 1, 2, 7):
+            assert self._enqueue(service, overall) is True
+
+        assert await service.flush() is True
+        await service.close()
+
+        worksheet = mock_pygsheets['worksheet']
+        assert self._written_ranges(worksheet) == ['D2:G4', 'D8:G8']
+        assert worksheet.update_values.call_args_list[0].kwargs['values'][0] == ["HAM", "NYY", "Player 1", 1.5]
+        assert mock_pygsheets['client'].open_by_key.call_count == 1
+        assert service.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_requeued_pick_replaces_pending_row(self, make_service, mock_pygsheets):
+        service = make_service()
+        self._enqueue(service, 5, player_name="First Choice")
+        self._enqueue(service, 5, player_name="Second Choice")
+
+        await service.flush()
+        await service.close()
+
+        values = mock_pygsheets['worksheet'].update_values.call_args.kwargs['values']
+        assert values == [["HAM", "NYY", "Second Choice", 1.5]]
+
+    @pytest.mark.asyncio
+    async def test_size_threshold_triggers_flush(self, make_service, mock_pygsheets):
+        """Reaching FLUSH_THRESHOLD flushes without waiting for FLUSH_DELAY."""
+        service = make_service()
+        service.FLUSH_THRESHOLD = 3
+        for overall in (1, 2, 3):
+            self._enqueue(service, overall)
+
+        for _ in range(20):
+            if service.pending_count == 0:
+                break
+            await asyncio.sleep(0.01)
+        await service.close()
+
+        assert self._written_ranges(mock_pygsheets['worksheet']) == ['D2:G4']
+
+    @pytest.mark.asyncio
+    async def test_timer_flushes_pending_picks(self, make_service, mock_pygsheets):
+        service = make_service()
+        service.FLUSH_DELAY = 0.01
+        self._enqueue(service, 1)
+
+        await asyncio.wait_for(service._flusher, timeout=1)
+
+        assert self._written_ranges(mock_pygsheets['worksheet']) == ['D2:G2']
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_retried_and_reopens_worksheet(self, make_service, mock_pygsheets):
+        service = make_service()
+        worksheet = mock_pygsheets['worksheet']
+        worksheet.update_values.side_effect = [Exception("Rate limit"), None]
+        self._enqueue(service, 1)
+
+        assert await service.flush() is False
+        assert service.pending_count == 1
+
+        assert await service.flush() is True
+        await service.close()
+
+        assert service.pending_count == 0
+        assert worksheet.update_values.call_count == 2
+        # Handle dropped after the failure and reopened for the retry
+        assert mock_pygsheets['client'].open_by_key.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_callback_after_retries_exhausted(self, make_service, mock_pygsheets):
+        service = make_service()
+        mock_pygsheets['worksheet'].update_values.side_effect = Exception("API Error")
+        on_failure = AsyncMock()
+        self._enqueue(service, 1, on_failure=on_failure)
+
+        # One initial attempt plus one per retry delay
+        for _ in range(len(service.RETRY_DELAYS) + 1):
+            await service.flush()
+        await service.close()
+
+        on_failure.assert_awaited_once()
+        assert service.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_survives_restart(self, make_service, mock_pygsheets):
+        service = make_service()
+        service._schedule_flush = MagicMock()
+        self._enqueue(service, 4)
+        self._enqueue(service, 5)
+
+        restarted = make_service()
+        assert restarted.pending_count == 2
+
+        assert await restarted.flush() is True
+        assert self._written_ranges(mock_pygsheets['worksheet']) == ['D5:G6']
+        assert make_service().pending_count == 0
+
+    def test_enqueue_rejected_when_disabled(self, make_service, mock_config):
+        service = make_service()
+        mock_config.draft_sheet_enabled = False
+
+        assert self._enqueue(service, 1) is False
+        assert service.pending_count == 0
+
+
 class TestGlobalServiceInstance:
     """
     Test suite for the global service instance pattern.
@@ -353,4 +353,99 @@ class TestLeagueService:
     def test_league_service_global_instance(self):
         """Test that global league_service instance exists."""
         assert league_service is not None
-        assert isinstance(league_service, LeagueService)
\ No newline at end of file
+        assert isinstance(league_service, LeagueService)
+
+class TestCurrentStateSnapshot:
+    """Test the stale-while-revalidate Current snapshot."""
+
+    @pytest.fixture
+    def current_data(self) -> Dict[str, Any]:
+        return {'id': 7, 'week': 10, 'season': 13, 'freeze': False}
+
+    @pytest.fixture
+    def service(self, clock):
+        service = LeagueService()
+        service._clock = clock
+        return service
+
+    @pytest.fixture
+    def mock_api(self, service, current_data):
+        mock_api = AsyncMock()
+        mock_api.get.return_value = current_data
+        with patch.object(service, 'get_client', AsyncMock(return_value=mock_api)):
+            yield mock_api
+
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_skips_api(self, service, mock_api):
+        """Reads within the TTL are served from the snapshot."""
+        first = await service.get_current_state()
+        second = await service.get_current_state()
+
+        assert first is second
+        assert first.week == 10
+        mock_api.get.assert_called_once_with('current')
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_served_while_refreshing(self, service, mock_api, clock, current_data):
+        """A stale snapshot is returned immediately and refreshed in the background."""
+        await service.get_current_state()
+        mock_api.get.return_value = {**current_data, 'week': 11}
+        clock.now += 60
+
+        stale = await service.get_current_state()
+        assert stale.week == 10
+
+        await service._current_refresh
+        refreshed = await service.get_current_state()
+        assert refreshed.week == 11
+        assert mock_api.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_snapshot_waits_for_refresh(self, service, mock_api, clock, current_data):
+        """Snapshots older than the max staleness are refreshed before returning."""
+        await service.get_current_state()
+        mock_api.get.return_value = {**current_data, 'week': 12}
+        clock.now += 3600
+
+        result = await service.get_current_state()
+        assert result.week == 12
+
+    @pytest.mark.asyncio
+    async def test_api_failure_falls_back_to_snapshot(self, service, mock_api, clock):
+        """An unavailable API does not drop the last known state."""
+        await service.get_current_state()
+        mock_api.get.side_effect = Exception("API Error")
+        clock.now += 3600
+
+        result = await service.get_current_state()
+        assert result is not None
+        assert result.week == 10
+
+    @pytest.mark.asyncio
+    async def test_update_installs_new_snapshot(self, service, mock_api, current_data):
+        """update_current_state replaces the snapshot with the written state."""
+        await service.get_current_state()
+        updated = Current.from_api_data({**current_data, 'week': 11, 'freeze': True})
+
+        with patch.object(service, 'patch', AsyncMock(return_value=updated)) as mock_patch:
+            result = await service.update_current_state(week=11, freeze=True)
+
+        mock_patch.assert_awaited_once_with(7, {'week': 11, 'freeze': True})
+        assert result is updated
+        assert await service.get_current_state() is updated
+        mock_api.get.assert_called_once_with('current')
+
+    @pytest.mark.asyncio
+    async def test_invalidate_discards_inflight_refresh(self, service, mock_api, clock, current_data):
+        """A refresh that started before a write cannot overwrite the written state."""
+        await service.get_current_state()
+        clock.now += 60
+        mock_api.get.return_value = {**current_data, 'week': 10}
+
+        await service.get_current_state()  # Schedules a background refresh
+        inflight = service._current_refresh
+        written = Current.from_api_data({**current_data, 'week': 11})
+        service.invalidate_current_state(written)
+        await inflight
+
+        assert await service.get_current_state() is written
@@ -0,0 +1,118 @@
+"""
+Tests for the season organization registry
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from models.team import RosterType
+from services.organization_registry import OrganizationRegistry, organization_registry
+from tests.factories import TeamFactory
+
+
+@pytest.fixture
+def teams():
+    return [
+        TeamFactory.create(id=1, abbrev='NYY', sname='Yankees'),
+        TeamFactory.create(id=2, abbrev='NYYMIL', sname='RailRiders'),
+        TeamFactory.create(id=3, abbrev='NYYIL', sname='Yankees IL'),
+        TeamFactory.create(id=4, abbrev='BHM', sname='Barons'),
+        TeamFactory.create(id=5, abbrev='BHMIL', sname='Barons IL'),
+    ]
+
+
+class TestOrganizationRegistry:
+    """Test abbreviation -> organization mapping."""
+
+    @pytest.mark.asyncio
+    async def test_every_abbrev_maps_to_its_organization(self, teams):
+        registry = OrganizationRegistry(loader=AsyncMock(return_value=teams))
+
+        for abbrev in ('NYY', 'nyymil', 'NYYIL'):
+            organization = await registry.get_organization(abbrev, 12)
+            assert organization.base_abbrev == 'NYY'
+            assert organization.team_for(RosterType.MAJOR_LEAGUE).id == 1
+            assert organization.team_for(RosterType.MINOR_LEAGUE).id == 2
+            assert organization.team_for(RosterType.INJURED_LIST).id == 3
+
+        registry._loader.assert_awaited_once_with(12)
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_mil_suffix(self, teams):
+        """BHMIL is the Barons' IL, not a BH minor league team."""
+        registry = OrganizationRegistry(loader=AsyncMock(return_value=teams))
+
+        organization = await registry.get_organization('BHMIL', 12)
+        assert organization.base_abbrev == 'BHM'
+        assert organization.injured_list.id == 5
+        assert organization.minor_league is None
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_retried_after_interval(self, teams, clock):
+        registry = OrganizationRegistry(loader=AsyncMock(return_value=[]), clock=clock)
+
+        assert await registry.get_organization('NYY', 12) is None
+        registry._loader.return_value = teams
+        assert await registry.get_organization('NYY', 12) is None  # Still backing off
+
+        clock.now += registry.RETRY_INTERVAL
+        assert (await registry.get_organization('NYY', 12)).major_league.id == 1
+        assert registry._loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_team_replaces_in_place(self, teams):
+        registry = OrganizationRegistry(loader=AsyncMock(return_value=teams))
+        await registry.refresh(12)
+
+        registry.update_team(TeamFactory.create(id=2, abbrev='NYYMIL', sname='Scranton'))
+
+        organization = await registry.get_organization('NYY', 12)
+        assert organization.minor_league.sname == 'Scranton'
+        assert registry.is_loaded(12)
+
+    @pytest.mark.asyncio
+    async def test_update_team_with_new_abbrev_invalidates_season(self, teams):
+        registry = OrganizationRegistry(loader=AsyncMock(return_value=teams))
+        await registry.refresh(12)
+
+        registry.update_team(TeamFactory.create(id=2, abbrev='NYYAAA', sname='RailRiders'))
+
+        assert not registry.is_loaded(12)
+
+    @pytest.mark.asyncio
+    async def test_get_organizations_lists_each_once(self, teams):
+        registry = OrganizationRegistry(loader=AsyncMock(return_value=teams))
+
+        organizations = await registry.get_organizations(12)
+
+        assert [o.base_abbrev for o in organizations] == ['BHM', 'NYY']
+        assert organizations[1].minor_league.id == 2
+
+
+class TestTeamAffiliates:
+    """Test Team affiliate resolution through the registry."""
+
+    @pytest.mark.asyncio
+    async def test_affiliates_resolve_without_per_team_lookups(self, teams):
+        with patch.object(organization_registry, '_loader', AsyncMock(return_value=teams)), \
+             patch('services.team_service.team_service.get_team_by_abbrev', new_callable=AsyncMock) as by_abbrev:
+            ml_team = teams[0]
+
+            assert (await ml_team.minor_league_affiliate()).id == 2
+            assert (await ml_team.injured_list_affiliate()).id == 3
+            assert (await teams[2].major_league_affiliate()).id == 1
+            by_abbrev.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_affiliate_raises(self, teams):
+        with patch.object(organization_registry, '_loader', AsyncMock(return_value=teams)):
+            with pytest.raises(ValueError, match="Minor league affiliate not found"):
+                await teams[3].minor_league_affiliate()
+
+    @pytest.mark.asyncio
+    async def test_unknown_team_falls_back_to_api(self, teams):
+        expansion_mil = TeamFactory.create(id=20, abbrev='EXPMIL', sname='Expansion Minors')
+        with patch.object(organization_registry, '_loader', AsyncMock(return_value=teams)), \
+             patch('services.team_service.team_service.get_team_by_abbrev',
+                   AsyncMock(return_value=TeamFactory.create(id=19, abbrev='EXP', sname='Expansion'))) as by_abbrev:
+            assert (await expansion_mil.major_league_affiliate()).id == 19
+            by_abbrev.assert_awaited_once_with('EXP', 12)
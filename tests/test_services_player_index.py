@@ -0,0 +1,168 @@
+"""
+Tests for the in-memory season player index
+"""
+import pytest
+from unittest.mock import AsyncMock
+
+from models.player import Player
+from services.player_index import PlayerIndex, normalize_name
+
+
+def make_player(player_id: int, name: str, team_id: int = 5, season: int = 13, **kwargs) -> Player:
+    data = {
+        'id': player_id,
+        'name': name,
+        'wara': 1.5,
+        'season': season,
+        'pos_1': 'SS',
+        'team': {'id': team_id, 'abbrev': f'T{team_id}', 'sname': f'Team {team_id}',
+                 'lname': f'Team {team_id} Long', 'season': season},
+    }
+    data.update(kwargs)
+    return Player.from_api_data(data)
+
+
+@pytest.fixture
+def players():
+    return [
+        make_player(1, 'Mike Trout'),
+        make_player(2, 'Mookie Betts', team_id=6),
+        make_player(3, 'José Ramírez'),
+        make_player(4, 'J.D. Martinez'),
+        make_player(5, 'Troy Tulowitzki'),
+    ]
+
+
+@pytest.fixture
+def index(players):
+    """Index populated for season 13 without going through load()."""
+    index = PlayerIndex(loader=AsyncMock(return_value=players))
+    index.season = 13
+    index.loaded = True
+    index.sync(players)
+    return index
+
+
+class TestNormalizeName:
+    """Test name normalization."""
+
+    def test_accents_case_and_punctuation(self):
+        assert normalize_name('  José  Ramírez ') == 'jose ramirez'
+        assert normalize_name('J.D. Martinez') == 'jd martinez'
+        assert normalize_name("Ke'Bryan Hayes-Smith") == 'kebryan hayes smith'
+
+
+class TestPlayerIndexLookups:
+    """Test local name resolution."""
+
+    @pytest.mark.asyncio
+    async def test_load_and_ready(self, players):
+        index = PlayerIndex(loader=AsyncMock(return_value=players))
+        assert not index.is_ready(13)
+
+        assert await index.load(13) == 5
+        assert index.is_ready(13)
+        assert not index.is_ready(12)
+
+    @pytest.mark.asyncio
+    async def test_find_exact_normalizes(self, index):
+        assert index.find_exact('jose ramirez').id == 3
+        assert index.find_exact('JD Martinez').id == 4
+        assert index.find_exact('Mike') is None
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_prefix_before_word_prefix(self, index):
+        """Full-name prefixes rank ahead of later-word prefixes."""
+        results = index.search('tro')
+        assert [p.name for p in results[:2]] == ['Troy Tulowitzki', 'Mike Trout']
+
+    @pytest.mark.asyncio
+    async def test_search_substring(self, index):
+        assert [p.id for p in index.search('okie', fuzzy=False)] == [2]
+        # Spans a word boundary; candidates come from the trigram postings
+        assert [p.id for p in index.search('ke tro', fuzzy=False)] == [1]
+        assert index.search('okiz', fuzzy=False) == []
+
+    @pytest.mark.asyncio
+    async def test_search_substring_skips_replaced_players(self, index):
+        index.upsert(make_player(2, 'Markus Betts'))
+
+        assert index.search('okie', fuzzy=False) == []
+        assert [p.id for p in index.search('rkus', fuzzy=False)] == [2]
+
+    @pytest.mark.asyncio
+    async def test_search_fuzzy_tolerates_typos(self, index):
+        assert index.search('mokie bets')[0].id == 2
+        assert index.search('mokie bets', fuzzy=False) == []
+
+    @pytest.mark.asyncio
+    async def test_search_limit(self, index):
+        assert len(index.search('t', limit=2)) == 2
+
+    @pytest.mark.asyncio
+    async def test_team_for_uses_cached_team(self, index):
+        bare = make_player(9, 'No Team Object', team_id=6)
+        bare.team = None
+        assert index.team_for(bare).abbrev == 'T6'
+
+
+class TestPlayerIndexUpdates:
+    """Test incremental maintenance of the index."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_renames_player(self, index):
+        index.upsert(make_player(1, 'Michael Trout'))
+
+        assert index.find_exact('Mike Trout') is None
+        assert index.find_exact('Michael Trout').id == 1
+        assert [p.id for p in index.search('mike', fuzzy=False)] == []
+        assert len(index) == 5
+
+    @pytest.mark.asyncio
+    async def test_same_name_player_takes_over_exact_lookup(self, index):
+        index.upsert(make_player(7, 'Mike Trout'))
+        assert index.find_exact('Mike Trout').id == 1
+
+        index.remove(1)
+        assert index.find_exact('Mike Trout').id == 7
+        index.remove(7)
+        assert index.find_exact('Mike Trout') is None
+
+    @pytest.mark.asyncio
+    async def test_upsert_ignores_other_seasons(self, index):
+        index.upsert(make_player(99, 'Old Timer', season=12))
+        assert index.get(99) is None
+
+    @pytest.mark.asyncio
+    async def test_resync_only_touches_changes(self, index, players):
+        changed = players[1:] + [make_player(1, 'Mike Trout', team_id=7), make_player(6, 'New Guy')]
+        changed = [p for p in changed if p.id != 5]
+
+        assert index.sync(changed) == (1, 1, 1)
+        assert index.get(5) is None
+        assert index.get(1).team_id == 7
+        assert index.find_exact('New Guy').id == 6
+
+    @pytest.mark.asyncio
+    async def test_compaction_keeps_lookups_working(self, index):
+        for _ in range(3):
+            index.upsert(make_player(2, 'Mookie Betts', team_id=8))
+
+        # Dead slots were reclaimed rather than accumulating one per update
+        assert index.stats()['slots'] < len(index) + 3
+        assert index.search('mookie')[0].team_id == 8
+
+    @pytest.mark.asyncio
+    async def test_season_change_rebuilds(self, index):
+        index._loader = AsyncMock(return_value=[make_player(10, 'Next Season', season=14)])
+        await index.load(14)
+
+        assert index.is_ready(14)
+        assert len(index) == 1
+        assert index.get(1) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_load_stays_unready(self):
+        index = PlayerIndex(loader=AsyncMock(return_value=[]))
+        await index.load(13)
+        assert not index.is_ready(13)
@@ -180,6 +180,72 @@ class TestPlayerService:
         assert all(p.team_id == get_config().free_agent_team_id for p in result)
         mock_client.get.assert_called_once_with('players', params=[('team_id', get_config().free_agent_team_id), ('season', '12')])
     
+    @pytest.mark.asyncio
+    async def test_get_players_by_season_cached(self, player_service_instance, mock_client):
+        """Test the season player list is fetched once and served from cache afterwards."""
+        get_config().cache_local_enabled = True
+        mock_client.get.return_value = {
+            'count': 2,
+            'players': [self.create_player_data(1, 'Player One'), self.create_player_data(2, 'Player Two')]
+        }
+
+        first = await player_service_instance.get_players_by_season(12)
+        second = await player_service_instance.get_players_by_season(12)
+
+        assert [p.name for p in first] == ['Player One', 'Player Two']
+        assert [p.id for p in second] == [1, 2]
+        mock_client.get.assert_called_once_with('players', params=[('season', '12')])
+    
+    @pytest.mark.asyncio
+    async def test_update_player_patches_cached_season_list(self, player_service_instance, mock_client):
+        """Test a player write updates the cached season list in place instead of evicting it."""
+        get_config().cache_local_enabled = True
+        mock_client.get.return_value = {
+            'count': 2,
+            'players': [self.create_player_data(1, 'Player One'), self.create_player_data(2, 'Player Two')]
+        }
+        mock_client.patch.return_value = self.create_player_data(2, 'Player Two', team_id=9)
+
+        await player_service_instance.get_players_by_season(12)
+        await player_service_instance.update_player(2, {'team_id': 9})
+        players = await player_service_instance.get_players_by_season(12)
+
+        assert [(p.id, p.team_id) for p in players] == [(1, 5), (2, 9)]
+        mock_client.get.assert_called_once_with('players', params=[('season', '12')])
+
+    @pytest.mark.asyncio
+    async def test_name_lookups_use_player_index(self, player_service_instance, mock_client):
+        """Test exact and fuzzy name lookups resolve locally once the index holds the season."""
+        from services.player_index import player_index
+
+        players = [Player.from_api_data(self.create_player_data(1, 'Mike Trout', season=12)),
+                   Player.from_api_data(self.create_player_data(2, 'Mookie Betts', season=12))]
+        player_index.season = 12
+        player_index.loaded = True
+        player_index.sync(players)
+
+        exact = await player_service_instance.get_player_by_name_exact('mike trout', 12)
+        fuzzy = await player_service_instance.search_players_fuzzy('mokie', limit=5, season=12)
+
+        assert exact.id == 1
+        assert [p.id for p in fuzzy] == [2]
+        mock_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_exact_name_missing_from_index_falls_back_to_api(self, player_service_instance, mock_client):
+        """Test a player added since the last index refresh is still found by exact name."""
+        from services.player_index import player_index
+
+        player_index.season = 12
+        player_index.loaded = True
+        player_index.sync([Player.from_api_data(self.create_player_data(1, 'Mike Trout', season=12))])
+        mock_client.get.return_value = {'count': 1, 'players': [self.create_player_data(9, 'New Signing', season=12)]}
+
+        result = await player_service_instance.get_player_by_name_exact('New Signing', 12)
+
+        assert result.id == 9
+        mock_client.get.assert_awaited_once()
+    
     @pytest.mark.asyncio
     async def test_is_free_agent(self, player_service_instance):
         """Test free agent checking."""
@@ -0,0 +1,172 @@
+"""
+Tests for RosterAuditService
+
+Covers projecting next week's rosters from pending transactions, legality
+checks on current and projected rosters, teams whose roster can't load, and
+pending transactions that can't load.
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from exceptions import APIException
+from models.roster import TeamRoster
+from models.team import Team
+from models.transaction import Transaction
+from services.organization_registry import Organization
+from services.roster_audit import RosterAuditService
+from tests.factories import PlayerFactory, TeamFactory, TransactionFactory
+
+
+NYY = TeamFactory.create(id=1, abbrev='NYY', sname='Yankees')
+NYY_MIL = TeamFactory.create(id=2, abbrev='NYYMIL', sname='RailRiders')
+BOS = TeamFactory.create(id=3, abbrev='BOS', sname='Red Sox')
+FA = TeamFactory.create(id=99, abbrev='FA', sname='Free Agents')
+
+
+def make_roster(team: Team, active: int, first_id: int, minors: int = 0) -> TeamRoster:
+    """Build a roster of `active` ML players and `minors` MiL players, 1.0 sWAR each."""
+    return TeamRoster(
+        team_id=team.id,
+        team_abbrev=team.abbrev,
+        season=12,
+        week=10,
+        active_players=[
+            PlayerFactory.create(id=first_id + i, name=f"Player {first_id + i}", wara=1.0)
+            for i in range(active)
+        ],
+        minor_league_players=[
+            PlayerFactory.create(id=first_id + active + i, name=f"Player {first_id + active + i}", wara=1.0)
+            for i in range(minors)
+        ],
+        total_wara=float(active)
+    )
+
+
+def make_move(transaction_id: int, player_id: int, oldteam: Team, newteam: Team) -> Transaction:
+    return TransactionFactory.create(
+        id=transaction_id,
+        week=11,
+        player=PlayerFactory.create(id=player_id, name=f"Player {player_id}", wara=1.0),
+        oldteam=oldteam,
+        newteam=newteam
+    )
+
+
+@pytest.fixture
+def organizations():
+    return [
+        Organization(base_abbrev='BOS', major_league=BOS),
+        Organization(base_abbrev='FA', major_league=FA),
+        Organization(base_abbrev='NYY', major_league=NYY, minor_league=NYY_MIL),
+    ]
+
+
+def patched_sources(organizations, rosters, transactions):
+    """Patch the registry, roster and transaction services the audit reads from."""
+    async def get_current_roster(team_id):
+        roster = rosters.get(team_id)
+        if isinstance(roster, Exception):
+            raise roster
+        return roster
+
+    return (
+        patch('services.organization_registry.organization_registry.get_organizations',
+              AsyncMock(return_value=organizations)),
+        patch('services.roster_service.roster_service.get_current_roster',
+              AsyncMock(side_effect=get_current_roster)),
+        patch('services.transaction_service.transaction_service.get_pending_transactions_by_week',
+              AsyncMock(side_effect=transactions) if isinstance(transactions, Exception)
+              else AsyncMock(return_value=transactions)),
+    )
+
+
+async def run_audit(organizations, rosters, transactions):
+    registry_patch, roster_patch, transaction_patch = patched_sources(organizations, rosters, transactions)
+    with registry_patch, roster_patch as get_roster, transaction_patch as get_transactions:
+        report = await RosterAuditService().audit_league(12, 11)
+    return report, get_roster, get_transactions
+
+
+class TestRosterAuditService:
+    """Test suite for RosterAuditService.audit_league."""
+
+    @pytest.mark.asyncio
+    async def test_pending_moves_make_projection_illegal(self, organizations):
+        rosters = {1: make_roster(NYY, 25, first_id=100, minors=1), 3: make_roster(BOS, 22, first_id=200)}
+        transactions = [
+            # NYY calls up its minor leaguer: 26 active next week
+            make_move(1, player_id=125, oldteam=NYY_MIL, newteam=NYY),
+            # BOS signs a free agent
+            make_move(2, player_id=900, oldteam=FA, newteam=BOS),
+        ]
+
+        report, get_roster, get_transactions = await run_audit(organizations, rosters, transactions)
+
+        # FA is not audited
+        assert [audit.team.abbrev for audit in report.teams] == ['BOS', 'NYY']
+        get_transactions.assert_awaited_once_with(12, 11)
+        assert get_roster.await_count == 2
+        assert report.transactions_applied == 2
+        assert report.unmatched_moves == []
+
+        bos, nyy = report.teams
+        assert bos.is_legal
+        assert bos.pending_moves == 1
+        assert bos.projected.active_players == 23
+        assert bos.projected.total_sWAR == 23.0
+
+        assert nyy.current.is_legal
+        assert not nyy.projected.is_legal
+        assert nyy.projected.errors == ["Too many active players: 26/25"]
+        assert nyy.projected.minor_league_players == 0
+        assert [audit.team.abbrev for audit in report.illegal_teams] == ['NYY']
+
+    @pytest.mark.asyncio
+    async def test_current_rosters_are_not_modified(self, organizations):
+        rosters = {1: make_roster(NYY, 22, first_id=100), 3: make_roster(BOS, 22, first_id=200)}
+        transactions = [make_move(1, player_id=100, oldteam=NYY, newteam=BOS)]
+
+        report, _, _ = await run_audit(organizations, rosters, transactions)
+
+        assert rosters[1].active_count == 22
+        assert rosters[3].active_count == 22
+        bos, nyy = report.teams
+        assert (bos.current.active_players, bos.projected.active_players) == (22, 23)
+        assert (nyy.current.active_players, nyy.projected.active_players) == (22, 21)
+
+    @pytest.mark.asyncio
+    async def test_move_for_player_not_on_roster_is_reported(self, organizations):
+        rosters = {1: make_roster(NYY, 22, first_id=100), 3: make_roster(BOS, 22, first_id=200)}
+        transactions = [make_move(1, player_id=555, oldteam=NYY, newteam=FA)]
+
+        report, _, _ = await run_audit(organizations, rosters, transactions)
+
+        assert report.unmatched_moves == ["Player 555: not on NYY roster (move-1)"]
+
+    @pytest.mark.asyncio
+    async def test_unavailable_roster_is_reported_not_raised(self, organizations):
+        rosters = {1: Exception("API down"), 3: make_roster(BOS, 22, first_id=200)}
+
+        report, _, _ = await run_audit(organizations, rosters, [])
+
+        bos, nyy = report.teams
+        assert bos.is_legal
+        assert nyy.error == "Roster unavailable"
+        assert report.illegal_teams == [nyy]
+        assert report.legal_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_transaction_fetch_is_reported_not_projected(self, organizations):
+        rosters = {1: make_roster(NYY, 26, first_id=100), 3: make_roster(BOS, 22, first_id=200)}
+
+        report, _, _ = await run_audit(organizations, rosters, APIException("API down"))
+
+        assert not report.projection_available
+        assert "API down" in report.transactions_error
+        assert report.transactions_applied == 0
+        bos, nyy = report.teams
+        # Current rosters are still checked; nothing is claimed about next week
+        assert bos.projected is None and nyy.projected is None
+        assert bos.is_legal
+        assert report.illegal_teams == [nyy]
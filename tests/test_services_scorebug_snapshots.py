@@ -0,0 +1,100 @@
+"""
+Tests for ScorebugSnapshotStore
+
+Covers serving recent snapshots, sharing one in-flight read between callers,
+not caching failed reads, sheet key normalization, and pruning unpublished
+scorecards (snapshots and worksheet handles).
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from exceptions import SheetsException
+from services.scorebug_service import ScorebugData, ScorebugService
+from services.scorebug_snapshots import ScorebugSnapshotStore, sheet_key
+
+SHEET_URL = "https://docs.google.com/spreadsheets/d/abc123_-XYZ/edit#gid=0"
+
+
+def make_store(clock, read):
+    service = MagicMock(read_scorebug_data=AsyncMock(side_effect=read))
+    return ScorebugSnapshotStore(service=service, clock=clock), service
+
+
+class TestScorebugSnapshotStore:
+    """Test suite for ScorebugSnapshotStore."""
+
+    def test_url_and_key_share_a_snapshot(self):
+        assert sheet_key(SHEET_URL) == 'abc123_-XYZ'
+        assert sheet_key(' abc123_-XYZ ') == 'abc123_-XYZ'
+
+    @pytest.mark.asyncio
+    async def test_recent_snapshot_served_without_reading(self, clock):
+        store, service = make_store(clock, lambda url, full_length: ScorebugData({'away_score': clock.now}))
+
+        assert (await store.get(SHEET_URL, max_age=30)).away_score == 0.0
+        clock.now = 20.0
+        assert (await store.get('abc123_-XYZ', max_age=30)).away_score == 0.0
+        clock.now = 40.0
+        assert (await store.get(SHEET_URL, max_age=30)).away_score == 40.0
+
+        assert service.read_scorebug_data.await_count == 2
+        service.read_scorebug_data.assert_awaited_with(SHEET_URL, full_length=True)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_join_one_read(self, clock):
+        release = asyncio.Event()
+
+        async def read(url, full_length):
+            await release.wait()
+            return ScorebugData({'home_score': 3})
+
+        store, service = make_store(clock, read)
+        waiters = [asyncio.ensure_future(store.get(SHEET_URL)) for _ in range(3)]
+        waiters.append(asyncio.ensure_future(store.refresh(SHEET_URL)))
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters)
+
+        assert [result.home_score for result in results] == [3, 3, 3, 3]
+        assert service.read_scorebug_data.await_count == 1
+        assert store._reads == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_read_is_not_cached(self, clock):
+        store, service = make_store(clock, SheetsException("Unable to read scorebug data"))
+
+        with pytest.raises(SheetsException):
+            await store.get(SHEET_URL)
+        assert store.peek(SHEET_URL) is None
+
+        service.read_scorebug_data.side_effect = None
+        service.read_scorebug_data.return_value = ScorebugData({'away_score': 1})
+        assert (await store.get(SHEET_URL)).away_score == 1
+
+    @pytest.mark.asyncio
+    async def test_retain_drops_unpublished_scorecards(self, clock):
+        store, _ = make_store(clock, lambda url, full_length: ScorebugData({}))
+        await store.refresh(SHEET_URL)
+        await store.refresh('other-key')
+
+        assert store.retain(['abc123_-XYZ']) == 1
+        assert store.peek(SHEET_URL) is not None
+        assert store.peek('other-key') is None
+
+    @pytest.mark.asyncio
+    async def test_retain_drops_unpublished_worksheet_handles(self):
+        service = ScorebugService(credentials_path='unused.json')
+        service.open_scorecard = AsyncMock(return_value=MagicMock())
+        store = ScorebugSnapshotStore(service=service)
+
+        # URL and bare key share one handle
+        first = await service._get_scorebug_tab(SHEET_URL)
+        assert await service._get_scorebug_tab('abc123_-XYZ') is first
+        await service._get_scorebug_tab('other-key')
+
+        store.retain([SHEET_URL])
+
+        assert list(service._worksheets) == ['abc123_-XYZ']
+        assert service.open_scorecard.await_count == 2
@@ -0,0 +1,82 @@
+"""
+Tests for SheetsService.read_scorecard_bundle
+
+Covers reading every submission range in one batchGet, the Box Score tab
+fallback for older cards, and padding of trimmed values responses.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from exceptions import SheetsException
+from services.sheets_service import SheetsService
+
+PLAY_ROW = ['1', '101', 'CF', '201', '000', 'top', '1', '1', '0', '0', '0']
+DECISION_ROW = ['201', '6', '1', '', '', '', '1']
+
+
+def make_scorecard(tabs, value_ranges):
+    scorecard = MagicMock()
+    scorecard.id = 'sheet-key'
+    scorecard.title = 'wk3g2'
+    scorecard.worksheets.return_value = [MagicMock(title=title) for title in tabs]
+    scorecard.client.sheet.values_batch_get.return_value = value_ranges
+    return scorecard
+
+
+def value_ranges(box_rows):
+    return [
+        {'values': [['13']]},
+        # Trailing blanks are dropped: the home manager cell (D7) is empty
+        {'values': [['x'], ['3'], ['2'], ['NYY', 'Alice'], ['BOS']]},
+        {'values': [PLAY_ROW, ['', '', ''], PLAY_ROW]},
+        {'values': box_rows},
+        {'values': [DECISION_ROW, [], ['202', '', '', '', '', '', '', '1']]},
+    ]
+
+
+class TestReadScorecardBundle:
+    """Test suite for the single-request scorecard reader."""
+
+    @pytest.mark.asyncio
+    async def test_reads_all_ranges_in_one_request(self):
+        scorecard = make_scorecard(
+            ['Setup', 'Playtable', 'Scorecard', 'Pitcherstats'],
+            value_ranges([['5', '9', '1'], ['3', '7', '0']])
+        )
+
+        bundle = await SheetsService(credentials_path='creds.json').read_scorecard_bundle(scorecard)
+
+        scorecard.client.sheet.values_batch_get.assert_called_once_with('sheet-key', [
+            "'Setup'!V35", "'Setup'!C3:D7", "'Playtable'!B3:BW300",
+            "'Scorecard'!BW8:BY9", "'Pitcherstats'!B3:O30"
+        ])
+        assert bundle.setup == {
+            'version': '13', 'week': 3, 'game_num': 2,
+            'away_team_abbrev': 'NYY', 'home_team_abbrev': 'BOS',
+            'away_manager_name': 'Alice', 'home_manager_name': ''
+        }
+        assert len(bundle.plays) == 2
+        assert bundle.plays[0]['batter_pos'] == 'CF'
+        assert bundle.box_score == {'away': [5, 9, 1], 'home': [3, 7, 0]}
+        assert [d['pitcher_id'] for d in bundle.decisions] == ['201', '202']
+        assert bundle.decisions[0]['win'] == '1'
+
+    @pytest.mark.asyncio
+    async def test_older_cards_use_box_score_tab(self):
+        scorecard = make_scorecard(
+            ['Setup', 'Playtable', 'Box Score', 'Pitcherstats'],
+            value_ranges([['1', '4', '0'], ['2', '6', '1']])
+        )
+
+        bundle = await SheetsService(credentials_path='creds.json').read_scorecard_bundle(scorecard)
+
+        assert "'Box Score'!T6:V7" in scorecard.client.sheet.values_batch_get.call_args.args[1]
+        assert bundle.box_score['home'] == [2, 6, 1]
+
+    @pytest.mark.asyncio
+    async def test_missing_box_score_tab_raises(self):
+        scorecard = make_scorecard(['Setup', 'Playtable', 'Pitcherstats'], [])
+
+        with pytest.raises(SheetsException, match="box score"):
+            await SheetsService(credentials_path='creds.json').read_scorecard_bundle(scorecard)
+        scorecard.client.sheet.values_batch_get.assert_not_called()
@@ -467,6 +467,31 @@ class TestTradeBuilder:
             assert validation.is_legal
             assert len(validation.participant_validations) == 2
 
+    @pytest.mark.asyncio
+    async def test_validate_trade_loads_each_roster_once(self):
+        """Participants' rosters load together, and revalidating an unchanged trade fetches nothing."""
+        from models.roster import TeamRoster
+
+        builder = TradeBuilder(self.user_id, self.team1, season=12)
+        await builder.add_team(self.team2)
+        await builder.add_team(self.team3)
+
+        async def get_current_roster(team_id):
+            return TeamRoster(team_id=team_id, team_abbrev='T', week=10, season=12)
+
+        with patch('services.transaction_builder.roster_service') as mock_roster_service, \
+             patch('services.transaction_builder.league_service') as mock_league_service:
+            mock_roster_service.get_current_roster = AsyncMock(side_effect=get_current_roster)
+            mock_league_service.get_current_state = AsyncMock(return_value=MagicMock(week=10))
+
+            first = await builder.validate_trade()
+            second = await builder.validate_trade()
+
+        assert sorted(c.args[0] for c in mock_roster_service.get_current_roster.call_args_list) == [
+            self.team3.id, self.team2.id
+        ]
+        assert second.participant_validations == first.participant_validations
+
     def test_clear_trade(self):
         """Test clearing a trade."""
         builder = TradeBuilder(self.user_id, self.team1, season=12)
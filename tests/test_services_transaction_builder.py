@@ -3,15 +3,20 @@ Tests for TransactionBuilder service
 
 Validates transaction building, roster validation, and move management.
 """
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
+from config import get_config
 
 from services.transaction_builder import (
     TransactionBuilder,
     TransactionMove,
     RosterType,
+    RosterTotals,
     RosterValidationResult,
+    ValidationContext,
     get_transaction_builder,
     clear_transaction_builder
 )
@@ -827,4 +832,239 @@ class TestPendingTransactionValidation:
             # Verify the check was called with the explicit week
             mock_tx_service.is_player_in_pending_transaction.assert_called_once()
             call_args = mock_tx_service.is_player_in_pending_transaction.call_args
-            assert call_args.kwargs['week'] == 15
\ No newline at end of file
+            assert call_args.kwargs['week'] == 15
+
+class TestValidationContext:
+    """Test the shared validation context and per-builder validation reuse."""
+
+    @pytest.fixture
+    def roster(self):
+        return TeamRoster(
+            team_id=499,
+            team_abbrev='WV',
+            week=10,
+            season=12,
+            active_players=[PlayerFactory.create(id=100 + i, wara=1.0) for i in range(20)]
+        )
+
+    @pytest.mark.asyncio
+    async def test_revalidating_unchanged_builder_costs_no_io(self, roster):
+        builder = TransactionBuilder(TeamFactory.west_virginia(), user_id=1, season=12)
+
+        with patch('services.transaction_builder.roster_service') as mock_roster_service, \
+             patch('services.transaction_builder.transaction_service') as mock_tx_service, \
+             patch('services.transaction_builder.league_service') as mock_league_service:
+            mock_roster_service.get_current_roster = AsyncMock(return_value=roster)
+            mock_tx_service.get_team_transactions = AsyncMock(return_value=[])
+            mock_league_service.get_current_state = AsyncMock(return_value=MagicMock(week=10))
+
+            first = await builder.validate_transaction(next_week=11)
+            second = await builder.validate_transaction(next_week=11)
+
+            assert second is first
+            mock_roster_service.get_current_roster.assert_awaited_once_with(499)
+            mock_tx_service.get_team_transactions.assert_awaited_once()
+            # The week is re-read (from the league service's snapshot) to pick the limits
+            assert mock_league_service.get_current_state.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_week_rollover_revalidates_with_new_limits(self, roster):
+        builder = TransactionBuilder(TeamFactory.west_virginia(), user_id=1, season=12)
+        config = get_config()
+
+        with patch('services.transaction_builder.roster_service') as mock_roster_service, \
+             patch('services.transaction_builder.league_service') as mock_league_service:
+            mock_roster_service.get_current_roster = AsyncMock(return_value=roster)
+            mock_league_service.get_current_state = AsyncMock(
+                return_value=MagicMock(week=config.expand_mil_week - 1)
+            )
+
+            early = await builder.validate_transaction()
+            mock_league_service.get_current_state.return_value = MagicMock(week=config.expand_mil_week)
+            late = await builder.validate_transaction()
+
+            assert late is not early
+            assert early.minor_league_limit == config.mil_roster_limit_early
+            assert late.minor_league_limit == config.mil_roster_limit_late
+            # Only the limits changed; the roster was not fetched again
+            mock_roster_service.get_current_roster.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_adding_or_removing_move_revalidates_from_context(self, roster):
+        builder = TransactionBuilder(TeamFactory.west_virginia(), user_id=1, season=12)
+        move = TransactionMove(
+            player=PlayerFactory.create(id=999, wara=2.0),
+            from_roster=RosterType.FREE_AGENCY,
+            to_roster=RosterType.MAJOR_LEAGUE,
+            to_team=builder.team
+        )
+
+        with patch('services.transaction_builder.roster_service') as mock_roster_service, \
+             patch('services.transaction_builder.league_service') as mock_league_service:
+            mock_roster_service.get_current_roster = AsyncMock(return_value=roster)
+            mock_league_service.get_current_state = AsyncMock(return_value=MagicMock(week=10))
+
+            before = await builder.validate_transaction()
+            await builder.add_move(move, check_pending_transactions=False)
+            added = await builder.validate_transaction()
+            builder.remove_move(999)
+            removed = await builder.validate_transaction()
+
+            assert (before.major_league_count, added.major_league_count, removed.major_league_count) == (20, 21, 20)
+            # The roster was only fetched once; only the moves changed
+            mock_roster_service.get_current_roster.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_builders_share_loaded_rosters(self, roster):
+        team = TeamFactory.west_virginia()
+
+        with patch('services.transaction_builder.roster_service') as mock_roster_service:
+            mock_roster_service.get_current_roster = AsyncMock(return_value=roster)
+
+            await TransactionBuilder(team, user_id=1, season=12).load_roster_data()
+            second = TransactionBuilder(team, user_id=2, season=12)
+            await second.load_roster_data()
+
+            assert second._current_roster is roster
+            mock_roster_service.get_current_roster.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_load_fetches_missing_teams_concurrently(self, roster):
+        context = ValidationContext()
+        teams = [TeamFactory.west_virginia(), TeamFactory.new_york()]
+        in_flight = 0
+        peak = 0
+
+        async def get_current_roster(team_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return roster if team_id == 499 else None
+
+        with patch('services.transaction_builder.roster_service') as mock_roster_service:
+            mock_roster_service.get_current_roster = AsyncMock(side_effect=get_current_roster)
+
+            loaded = await context.load(teams, None, 12)
+
+        assert peak == 2
+        assert loaded[499].roster is roster
+        assert loaded[500].roster is None
+        # A failed roster load is retried next time; a loaded one is kept
+        assert context.get_cached(499, None) is not None
+        assert context.get_cached(500, None) is None
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_are_invalidated_by_new_transactions(self, roster, clock):
+        context = ValidationContext(clock=clock)
+        wv = TeamFactory.west_virginia()
+        wv_mil = TeamFactory.create(id=501, abbrev='WVMIL', sname='Miners')
+
+        with patch('services.transaction_builder.roster_service') as mock_roster_service:
+            mock_roster_service.get_current_roster = AsyncMock(return_value=roster)
+            await context.load([wv], None, 12)
+
+        assert context.get_cached(499, None) is not None
+        clock.now = 120.0
+        assert context.get_cached(499, None) is None
+
+        with patch('services.transaction_builder.roster_service') as mock_roster_service:
+            mock_roster_service.get_current_roster = AsyncMock(return_value=roster)
+            await context.load([wv], None, 12)
+
+        context.invalidate_transactions([Transaction(
+            id=1, week=11, season=12, moveid='move-1',
+            player=PlayerFactory.create(id=7),
+            oldteam=TeamFactory.create(id=999, abbrev='FA', sname='Free Agents'),
+            newteam=wv_mil,
+            cancelled=False, frozen=True
+        )])
+
+        assert context.get_cached(499, None) is None
+
+
+class TestRosterTotals:
+    """Test the builder's running roster totals against a full recompute."""
+
+    @pytest.fixture
+    def builder(self):
+        team = TeamFactory.west_virginia()
+        builder = TransactionBuilder(team, user_id=1, season=12)
+        builder._current_roster = TeamRoster(
+            team_id=499,
+            team_abbrev='WV',
+            week=10,
+            season=12,
+            active_players=[PlayerFactory.create(id=100 + i, wara=1.25, pos_1='SP' if i % 2 else 'C') for i in range(22)],
+            minor_league_players=[PlayerFactory.create(id=200 + i, wara=0.5) for i in range(4)]
+        )
+        builder._roster_loaded = True
+        builder._existing_transactions = [
+            Transaction(
+                id=1, week=11, season=12, moveid='existing-1',
+                player=PlayerFactory.create(id=300, wara=3.0, pos_1='SS'),
+                oldteam=TeamFactory.create(id=999, abbrev='FA', sname='Free Agents'),
+                newteam=TeamFactory.create(id=501, abbrev='WVMIL', sname='Miners'),
+                cancelled=False, frozen=True
+            )
+        ]
+        builder._existing_transactions_loaded = True
+        return builder
+
+    @staticmethod
+    def assert_matches_recompute(builder):
+        running = builder._current_roster_totals().combined(
+            builder._existing_transaction_totals(), builder._move_totals
+        )
+        full = builder.recompute_totals()
+        assert (running.ml_count, running.mil_count) == (full.ml_count, full.mil_count)
+        assert running.ml_swar == pytest.approx(full.ml_swar)
+        assert running.mil_swar == pytest.approx(full.mil_swar)
+        assert {k: v for k, v in running.ml_positions.items() if v} == {k: v for k, v in full.ml_positions.items() if v}
+        assert {k: v for k, v in running.mil_positions.items() if v} == {k: v for k, v in full.mil_positions.items() if v}
+
+    @pytest.mark.asyncio
+    async def test_running_totals_track_added_and_removed_moves(self, builder):
+        moves = [
+            TransactionMove(player=PlayerFactory.create(id=400, wara=2.0, pos_1='RP'),
+                            from_roster=RosterType.FREE_AGENCY, to_roster=RosterType.MAJOR_LEAGUE,
+                            to_team=builder.team),
+            TransactionMove(player=builder._current_roster.active_players[0],
+                            from_roster=RosterType.MAJOR_LEAGUE, to_roster=RosterType.MINOR_LEAGUE,
+                            from_team=builder.team, to_team=builder.team),
+            TransactionMove(player=builder._current_roster.minor_league_players[0],
+                            from_roster=RosterType.MINOR_LEAGUE, to_roster=RosterType.FREE_AGENCY,
+                            from_team=builder.team),
+        ]
+        for move in moves:
+            await builder.add_move(move, check_pending_transactions=False)
+            self.assert_matches_recompute(builder)
+
+        builder.remove_move(100)
+        self.assert_matches_recompute(builder)
+
+        validation = await builder.validate_transaction(next_week=11)
+        assert validation.major_league_count == 23
+        assert validation.minor_league_count == 4  # 4 + 1 pre-existing - 1 dropped
+        assert validation.major_league_swar == pytest.approx(22 * 1.25 + 2.0)
+        assert validation.pre_existing_transaction_count == 1
+        assert validation.pre_existing_mil_swar_change == pytest.approx(3.0)
+
+        builder.clear_moves()
+        self.assert_matches_recompute(builder)
+
+    @pytest.mark.asyncio
+    async def test_roster_is_summed_once_across_validations(self, builder):
+        with patch('services.transaction_builder.RosterTotals.from_roster',
+                   wraps=RosterTotals.from_roster) as from_roster:
+            for i in range(3):
+                await builder.add_move(
+                    TransactionMove(player=PlayerFactory.create(id=500 + i, wara=1.0),
+                                    from_roster=RosterType.FREE_AGENCY, to_roster=RosterType.MAJOR_LEAGUE,
+                                    to_team=builder.team),
+                    check_pending_transactions=False
+                )
+                await builder.validate_transaction(next_week=11)
+
+        assert from_roster.call_count == 1
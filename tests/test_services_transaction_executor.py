@@ -0,0 +1,137 @@
+"""
+Tests for TransactionExecutor
+
+Covers ordering of moves on the same player, the concurrency limit, the token
+bucket, progress reporting and failure grouping by moveid.
+"""
+import asyncio
+
+import pytest
+
+from services.transaction_executor import TokenBucket, TransactionExecutor
+from tests.factories import PlayerFactory, TransactionFactory
+
+
+def fast_executor(max_concurrency: int = 4) -> TransactionExecutor:
+    return TransactionExecutor(max_concurrency=max_concurrency, rate=1000.0, burst=100)
+
+
+class TestTransactionExecutor:
+    """Test suite for TransactionExecutor.execute."""
+
+    @pytest.mark.asyncio
+    async def test_moves_on_same_player_stay_ordered(self):
+        """A player's second move starts only after the first finishes, even if the first is slow."""
+        moves = [
+            TransactionFactory.create(id=1, week=10, moveid="m1", player=PlayerFactory.create(id=10, name="Player 10")),
+            TransactionFactory.create(id=2, week=10, moveid="m2", player=PlayerFactory.create(id=20, name="Player 20")),
+            TransactionFactory.create(id=3, week=10, moveid="m3", player=PlayerFactory.create(id=10, name="Player 10")),
+        ]
+        applied = []
+
+        async def update(move):
+            if move.id == 1:
+                await asyncio.sleep(0.02)
+            applied.append(move.id)
+            return True
+
+        report = await fast_executor().execute(moves, update)
+
+        assert report.succeeded == 3
+        assert applied.index(1) < applied.index(3)
+        # Player 20 did not wait for player 10's slow move
+        assert applied[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        moves = [TransactionFactory.create(id=i, week=10, moveid=f"m{i}") for i in range(1, 9)]
+        in_flight = 0
+        peak = 0
+
+        async def update(move):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        report = await fast_executor(max_concurrency=3).execute(moves, update)
+
+        assert report.succeeded == 8
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_grouped_by_moveid(self):
+        moves = [
+            TransactionFactory.create(id=1, week=10, moveid="trade-1", player=PlayerFactory.create(id=10, name="Player 10")),
+            TransactionFactory.create(id=2, week=10, moveid="trade-1", player=PlayerFactory.create(id=11, name="Player 11")),
+            TransactionFactory.create(id=3, week=10, moveid="drop-2", player=PlayerFactory.create(id=12, name="Player 12")),
+            TransactionFactory.create(id=4, week=10, moveid="add-3", player=PlayerFactory.create(id=13, name="Player 13")),
+        ]
+
+        async def update(move):
+            if move.id in (1, 2):
+                raise Exception("API error")
+            return move.id != 3
+
+        report = await fast_executor().execute(moves, update)
+
+        assert report.succeeded == 1
+        assert report.failed == 3
+        assert set(report.failed_move_ids) == {"trade-1", "drop-2"}
+        assert [f.transaction.id for f in report.failures["trade-1"]] == [1, 2]
+        assert report.failures["trade-1"][0].error == "API error"
+        assert report.failures["drop-2"][0].error == "Player update returned no response"
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_per_move(self):
+        moves = [TransactionFactory.create(id=i, week=10, moveid=f"m{i}") for i in range(1, 4)]
+        seen = []
+
+        async def update(move):
+            return True
+
+        async def progress(report):
+            seen.append(report.completed)
+            if report.completed == 2:
+                raise Exception("Discord edit failed")
+
+        report = await fast_executor().execute(moves, update, progress=progress)
+
+        # A failing progress callback doesn't stop execution
+        assert report.succeeded == 3
+        assert sorted(seen) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        async def update(move):
+            raise AssertionError("should not be called")
+
+        report = await fast_executor().execute([], update)
+
+        assert report.total == 0
+        assert report.completed == 0
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_waits_for_refill(self, clock):
+        bucket = TokenBucket(rate=100.0, capacity=2, clock=clock)
+
+        await bucket.acquire()
+        await bucket.acquire()
+
+        # Bucket empty: the next acquire waits until the (fake) clock refills it
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        clock.now = 0.01
+        await asyncio.wait_for(waiter, timeout=1)
+
+    def test_rate_must_be_positive(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
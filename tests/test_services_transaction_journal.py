@@ -0,0 +1,246 @@
+"""
+Tests for TransactionJournal
+
+Covers recording and reloading a run, resuming an interrupted run through
+TransactionExecutor.execute_journaled, completing runs with failures, the
+per-journal lock, and tolerance of a torn final line.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.transaction_executor import TransactionExecutor
+from services.transaction_journal import TransactionJournal
+from tests.factories import PlayerFactory, TransactionFactory
+
+
+@pytest.fixture
+def moves():
+    return [
+        TransactionFactory.create(id=1, week=10, moveid="move-a", player=PlayerFactory.create(id=10, name="Player 10")),
+        TransactionFactory.create(id=2, week=10, moveid="move-a", player=PlayerFactory.create(id=11, name="Player 11")),
+        TransactionFactory.create(id=3, week=10, moveid="move-b", player=PlayerFactory.create(id=12, name="Player 12")),
+    ]
+
+
+@pytest.fixture
+def executor():
+    return TransactionExecutor(max_concurrency=2, rate=1000.0, burst=10)
+
+
+class TestTransactionJournal:
+    """Test suite for TransactionJournal recording and reloading."""
+
+    @pytest.mark.asyncio
+    async def test_reload_restores_plan_and_applied_moves(self, tmp_path, moves):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+        journal.start(moves)
+        journal.record_applied(moves[0])
+        journal.record_failed(moves[2], "API error")
+        await journal.flush()
+
+        reloaded = TransactionJournal.for_week(12, 10, str(tmp_path))
+
+        assert reloaded.is_resumable
+        assert [t.id for t in reloaded.planned_transactions()] == [1, 2, 3]
+        assert reloaded.planned_transactions()[0].player.name == "Player 10"
+        assert reloaded.is_applied(moves[0])
+        assert not reloaded.is_applied(moves[1])
+        assert reloaded.failed_moves() == {("move-b", 12): "API error"}
+
+    @pytest.mark.asyncio
+    async def test_torn_final_line_is_ignored(self, tmp_path, moves):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+        journal.start(moves)
+        journal.record_applied(moves[0])
+        await journal.flush()
+        with open(journal.path, 'a') as f:
+            f.write('{"event": "applied", "movei')
+
+        reloaded = TransactionJournal.for_week(12, 10, str(tmp_path))
+
+        assert reloaded.applied_count == 1
+        assert reloaded.is_resumable
+
+    def test_incomplete_lists_only_unfinished_runs(self, tmp_path, moves):
+        finished = TransactionJournal.for_week(12, 9, str(tmp_path))
+        finished.start(moves)
+        finished.mark_complete()
+        unfinished = TransactionJournal.for_week(12, 10, str(tmp_path))
+        unfinished.start(moves)
+
+        found = TransactionJournal.incomplete(str(tmp_path))
+
+        assert [(j.season, j.week) for j in found] == [(12, 10)]
+
+    def test_start_archives_previous_run(self, tmp_path, moves):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+        journal.start(moves)
+        journal.mark_complete()
+
+        journal.start(moves[:1])
+
+        assert not journal.is_complete
+        assert len(journal.planned_transactions()) == 1
+        assert len(list(tmp_path.glob("season-12-week-10.*.jsonl"))) == 1
+        assert TransactionJournal.incomplete(str(tmp_path))[0].path == journal.path
+
+    def test_recorded_moves_are_written_on_flush(self, tmp_path, moves):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+        journal.start(moves)
+        journal.record_applied(moves[0])
+
+        assert journal.is_applied(moves[0])
+        assert not TransactionJournal.for_week(12, 10, str(tmp_path)).is_applied(moves[0])
+
+        asyncio.run(journal.flush())
+
+        assert TransactionJournal.for_week(12, 10, str(tmp_path)).is_applied(moves[0])
+
+    def test_start_carries_over_applied_moves(self, tmp_path, moves):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+        journal.start(moves)
+        journal.record_applied(moves[0])
+        journal.record_applied(moves[2])
+        journal.mark_complete(failed=1)
+
+        # moves[2] was cancelled since; only moves still planned carry over
+        journal.start(moves[:2])
+        reloaded = TransactionJournal.for_week(12, 10, str(tmp_path))
+
+        assert reloaded.is_applied(moves[0])
+        assert not reloaded.is_applied(moves[2])
+        assert reloaded.applied_count == 1
+
+
+class TestExecuteJournaled:
+    """Test suite for TransactionExecutor.execute_journaled."""
+
+    @pytest.mark.asyncio
+    async def test_new_run_is_planned_and_completed(self, tmp_path, moves, executor):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+        update = AsyncMock(return_value=True)
+
+        report = await executor.execute_journaled(journal, AsyncMock(return_value=moves), update)
+
+        assert report.succeeded == 3
+        assert not report.resumed
+        assert journal.is_complete
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_resumes_without_repatching(self, tmp_path, moves, executor):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+        journal.start(moves)
+        journal.record_applied(moves[0])
+        journal.record_applied(moves[1])
+        await journal.flush()
+
+        # Restart: reopen the journal from disk
+        reopened = TransactionJournal.for_week(12, 10, str(tmp_path))
+        fetch = AsyncMock()
+        update = AsyncMock(return_value=True)
+
+        report = await executor.execute_journaled(reopened, fetch, update)
+
+        fetch.assert_not_called()
+        assert [c.args[0].id for c in update.call_args_list] == [3]
+        assert report.resumed
+        assert report.skipped == 2
+        assert report.succeeded == 1
+        assert reopened.is_complete
+
+    @pytest.mark.asyncio
+    async def test_failed_run_completes_with_failures(self, tmp_path, moves, executor):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+
+        async def update(move):
+            return move.id != 2
+
+        report = await executor.execute_journaled(journal, AsyncMock(return_value=moves), update)
+
+        assert report.failed_move_ids == ["move-a"]
+        assert journal.is_complete
+        assert journal.completed_with_failures
+        assert not journal.is_resumable
+        assert TransactionJournal.incomplete(str(tmp_path)) == []
+
+        # A retry fetches the week fresh and only patches the failed move
+        retry_update = AsyncMock(return_value=True)
+        fetch = AsyncMock(return_value=moves)
+        retry = await executor.execute_journaled(journal, fetch, retry_update)
+
+        fetch.assert_awaited_once()
+        assert [c.args[0].id for c in retry_update.call_args_list] == [2]
+        assert retry.skipped == 2
+        assert not retry.resumed
+        assert journal.is_complete and not journal.completed_with_failures
+
+    @pytest.mark.asyncio
+    async def test_resume_false_fetches_instead_of_replaying(self, tmp_path, moves, executor):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+        journal.start(moves)
+        journal.record_applied(moves[0])
+        await journal.flush()
+
+        # moves[1] was cancelled after the run was cut off
+        fetch = AsyncMock(return_value=[moves[0], moves[2]])
+        update = AsyncMock(return_value=True)
+        report = await executor.execute_journaled(journal, fetch, update, resume=False)
+
+        assert [c.args[0].id for c in update.call_args_list] == [3]
+        assert report.skipped == 1
+        assert not report.resumed
+
+    @pytest.mark.asyncio
+    async def test_unwritable_journal_runs_unjournaled(self, tmp_path, moves, executor):
+        # A file where the journal directory should be: every write fails
+        blocker = tmp_path / "journal"
+        blocker.write_text("")
+        journal = TransactionJournal.for_week(12, 10, str(blocker))
+        update = AsyncMock(return_value=True)
+
+        report = await executor.execute_journaled(journal, AsyncMock(return_value=moves), update)
+
+        assert update.await_count == 3
+        assert report.succeeded == 3
+
+    @pytest.mark.asyncio
+    async def test_journal_write_failures_do_not_stop_the_run(self, tmp_path, moves, executor, monkeypatch):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+        update = AsyncMock(return_value=True)
+
+        async def failing_flush():
+            raise OSError("Read-only file system")
+
+        monkeypatch.setattr(journal, 'flush', failing_flush)
+        report = await executor.execute_journaled(journal, AsyncMock(return_value=moves), update)
+
+        assert report.succeeded == 3
+        assert not TransactionJournal.for_week(12, 10, str(tmp_path)).is_complete
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_do_not_overlap(self, tmp_path, moves, executor):
+        first = TransactionJournal.for_week(12, 10, str(tmp_path))
+        second = TransactionJournal.for_week(12, 10, str(tmp_path))
+        update = AsyncMock(return_value=True)
+
+        fetch = AsyncMock(return_value=moves)
+        reports = await asyncio.gather(
+            executor.execute_journaled(first, fetch, update),
+            executor.execute_journaled(second, fetch, update)
+        )
+
+        # The second run waits, sees the first run's applied updates and patches nothing again
+        assert update.await_count == 3
+        assert [report.succeeded for report in reports] == [3, 0]
+        assert reports[1].skipped == 3
+
+    @pytest.mark.asyncio
+    async def test_no_transactions_writes_no_journal(self, tmp_path, executor):
+        journal = TransactionJournal.for_week(12, 10, str(tmp_path))
+
+        report = await executor.execute_journaled(journal, AsyncMock(return_value=[]), AsyncMock())
+
+        assert report.total == 0
+        assert not journal.path.exists()
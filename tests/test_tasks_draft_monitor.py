@@ -0,0 +1,145 @@
+"""
+Tests for the Draft Monitor Task in Discord Bot v2.0
+
+Validates the deadline scheduler: which warning/expiry timers are armed,
+re-arming on draft updates, and expiry handling.
+"""
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from models.draft_data import DraftData
+from services.draft_service import draft_service
+from tasks.draft_monitor import DraftMonitorTask
+
+
+def make_draft_data(seconds_left: float, **overrides) -> DraftData:
+    data = {
+        'id': 1,
+        'currentpick': 25,
+        'timer': True,
+        'paused': False,
+        'pick_deadline': datetime.now() + timedelta(seconds=seconds_left),
+        'result_channel': 111,
+        'ping_channel': 222,
+        'pick_minutes': 2
+    }
+    data.update(overrides)
+    return DraftData(**data)
+
+
+@pytest.fixture
+def monitor():
+    """DraftMonitorTask with the reconciliation loop patched out."""
+    bot = MagicMock()
+    with patch.object(DraftMonitorTask, 'monitor_loop'):
+        task = DraftMonitorTask(bot)
+        task._plan_auto_draft = AsyncMock()
+        yield task
+        # Async tests disarm their own timers before their event loop closes
+        draft_service.remove_update_listener(task.schedule)
+
+
+class TestPendingEvents:
+    """Which timers get armed for a deadline."""
+
+    def test_all_events_ahead(self, monitor):
+        draft_data = make_draft_data(90)
+        events = monitor._pending_events(draft_data, datetime.now())
+
+        assert [seconds for _, seconds in events] == [60, 30, 0]
+        assert events[-1][0] == draft_data.pick_deadline
+
+    def test_passed_warnings_skipped(self, monitor):
+        events = monitor._pending_events(make_draft_data(45), datetime.now())
+        assert [seconds for _, seconds in events] == [30, 0]
+
+    def test_sent_warnings_skipped(self, monitor):
+        draft_data = make_draft_data(90)
+        monitor._warnings_sent.add((25, draft_data.pick_deadline, 60))
+
+        events = monitor._pending_events(draft_data, datetime.now())
+        assert [seconds for _, seconds in events] == [30, 0]
+
+    def test_expiry_retry_backs_off(self, monitor):
+        """An expired pick that didn't advance is retried after EXPIRY_RETRY_DELAY, not immediately."""
+        draft_data = make_draft_data(-10)
+        now = datetime.now()
+        assert monitor._pending_events(draft_data, now) == [(draft_data.pick_deadline, 0)]
+
+        monitor._expiry_attempted = (25, draft_data.pick_deadline)
+        fire_at, _ = monitor._pending_events(draft_data, now)[0]
+        assert fire_at == now + timedelta(seconds=DraftMonitorTask.EXPIRY_RETRY_DELAY)
+
+
+class TestScheduling:
+    """Arming, re-arming and stopping."""
+
+    def test_registers_update_listener(self, monitor):
+        assert monitor.schedule in draft_service._update_listeners
+
+        monitor.stop()
+        assert monitor.schedule not in draft_service._update_listeners
+        monitor.monitor_loop.cancel.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_schedule_is_idempotent(self, monitor):
+        draft_data = make_draft_data(120)
+        monitor.schedule(draft_data)
+        armed = monitor._deadline_task
+
+        monitor.schedule(draft_data)
+        assert monitor._deadline_task is armed
+
+        # A new pick re-arms
+        monitor.schedule(make_draft_data(120, currentpick=26))
+        await asyncio.sleep(0)
+        assert monitor._deadline_task is not armed
+        assert armed.cancelled()
+        monitor._disarm()
+
+    @pytest.mark.asyncio
+    async def test_pause_disarms_and_timer_off_stops(self, monitor):
+        monitor.schedule(make_draft_data(120))
+        armed = monitor._deadline_task
+
+        monitor.schedule(make_draft_data(120, paused=True))
+        await asyncio.sleep(0)
+        assert armed.cancelled()
+        assert monitor._deadline_task is None
+
+        monitor.schedule(make_draft_data(120, timer=False))
+        assert monitor.schedule not in draft_service._update_listeners
+
+    @pytest.mark.asyncio
+    async def test_expiry_fires_on_deadline(self, monitor):
+        """Expiry confirms the deadline against the API, then auto-drafts."""
+        draft_data = make_draft_data(0.05)
+        monitor._handle_expired_timer = AsyncMock()
+
+        with patch('tasks.draft_monitor.draft_service') as mock_draft_service:
+            mock_draft_service.get_draft_data = AsyncMock(return_value=draft_data)
+            monitor.schedule(draft_data)
+            await asyncio.sleep(0.2)
+
+        monitor._handle_expired_timer.assert_awaited_once_with(draft_data)
+        # Pick didn't advance - a retry is armed rather than firing immediately
+        assert monitor._expiry_attempted == (25, draft_data.pick_deadline)
+        assert not monitor._deadline_task.done()
+        monitor._disarm()
+
+    @pytest.mark.asyncio
+    async def test_expiry_skipped_when_pick_already_made(self, monitor):
+        draft_data = make_draft_data(0.05)
+        advanced = make_draft_data(120, currentpick=26)
+        monitor._handle_expired_timer = AsyncMock()
+
+        with patch('tasks.draft_monitor.draft_service') as mock_draft_service:
+            mock_draft_service.get_draft_data = AsyncMock(return_value=advanced)
+            monitor.schedule(draft_data)
+            await asyncio.sleep(0.2)
+
+        monitor._handle_expired_timer.assert_not_awaited()
+        assert monitor._armed_key == (26, advanced.pick_deadline)
+        monitor._disarm()
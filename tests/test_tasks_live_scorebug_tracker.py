@@ -0,0 +1,159 @@
+"""
+Tests for the Live Scorebug Tracker in Discord Bot v2.0
+
+Validates the refresh pipeline: concurrent scorecard reads with per-read
+timeouts, failed reads being skipped, team lookups from the season map,
+reading only games that are due, and skipping voice status edits when the
+score hasn't changed.
+"""
+import asyncio
+import discord
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from config import get_config
+from exceptions import SheetsException
+from services.scorebug_service import ScorebugData
+from services.scorebug_snapshots import scorebug_snapshots
+from tasks.live_scorebug_tracker import LiveScorebugTracker
+from tests.factories import TeamFactory
+
+
+def make_scorebug(away_team_id: int = 499, home_team_id: int = 500, is_final: bool = False) -> ScorebugData:
+    return ScorebugData({
+        'away_team_id': away_team_id,
+        'home_team_id': home_team_id,
+        'header': 'FINAL' if is_final else 'Top 3',
+        'is_final': is_final
+    })
+
+
+@pytest.fixture
+def tracker():
+    """LiveScorebugTracker with the update loop and JSON-backed trackers patched out."""
+    with patch.object(LiveScorebugTracker, 'update_loop'), \
+         patch('tasks.live_scorebug_tracker.ScorecardTracker'), \
+         patch('tasks.live_scorebug_tracker.VoiceChannelTracker'), \
+         patch('tasks.live_scorebug_tracker.ManagedMessageTracker'):
+        yield LiveScorebugTracker(MagicMock())
+
+
+class TestReadScorecards:
+    """Concurrent scorecard reads."""
+
+    @pytest.mark.asyncio
+    async def test_reads_overlap_and_keep_order(self, tracker):
+        in_flight = []
+        peak = [0]
+
+        async def read(sheet_url, full_length=True):
+            in_flight.append(sheet_url)
+            peak[0] = max(peak[0], len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(sheet_url)
+            return make_scorebug(away_team_id=int(sheet_url))
+
+        get_config().scorebug_max_concurrency = 2
+
+        with patch.object(scorebug_snapshots, '_service', MagicMock(read_scorebug_data=AsyncMock(side_effect=read))):
+            results = await tracker._read_scorecards([(1, '10'), (2, '20'), (3, '30')])
+
+        assert [scorebug.away_team_id for scorebug in results] == [10, 20, 30]
+        assert peak[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_and_failing_reads_do_not_block_others(self, tracker):
+        async def read(sheet_url, full_length=True):
+            if sheet_url == 'slow':
+                await asyncio.sleep(5)
+            if sheet_url == 'broken':
+                raise SheetsException("Unable to read scorebug data")
+            return make_scorebug()
+
+        get_config().scorebug_read_timeout = 0.05
+
+        with patch.object(scorebug_snapshots, '_service', MagicMock(read_scorebug_data=AsyncMock(side_effect=read))):
+            results = await tracker._read_scorecards([(1, 'slow'), (2, 'broken'), (3, 'ok')])
+            # The abandoned read keeps running for the snapshot; don't leave it behind
+            for read_task in list(scorebug_snapshots._reads.values()):
+                read_task.cancel()
+
+        assert results[0] is None
+        assert results[1] is None
+        assert results[2].away_team_id == 499
+
+
+class TestUpdateScorebugs:
+    """The full refresh cycle."""
+
+    @pytest.mark.asyncio
+    async def test_teams_come_from_season_map(self, tracker):
+        channel = MagicMock()
+        channel.name = 'live-sba-scores'
+        tracker.bot.get_guild.return_value = MagicMock(text_channels=[channel])
+        tracker.scorecard_tracker.get_all_scorecards.return_value = [(1, 'a'), (2, 'b'), (3, 'c')]
+        tracker._read_scorecards = AsyncMock(return_value=[
+            make_scorebug(), None, make_scorebug(away_team_id=500, home_team_id=499, is_final=True)
+        ])
+        tracker._update_voice_channel_description = AsyncMock()
+        tracker._post_scorebugs_to_channel = AsyncMock()
+        teams = [TeamFactory.west_virginia(), TeamFactory.new_york()]
+
+        with patch('tasks.live_scorebug_tracker.team_service') as team_service, \
+             patch('tasks.live_scorebug_tracker.set_channel_visibility', new_callable=AsyncMock), \
+             patch('tasks.live_scorebug_tracker.create_scorebug_embed', return_value='embed') as create_embed:
+            team_service.get_teams_by_season = AsyncMock(return_value=teams)
+            team_service.get_team = AsyncMock()
+
+            await tracker._update_scorebugs()
+
+        team_service.get_teams_by_season.assert_awaited_once_with(get_config().sba_season)
+        team_service.get_team.assert_not_called()
+        # Only the active game is posted; the failed read and the final game are skipped
+        assert create_embed.call_args.args[1:] == (teams[0], teams[1])
+        tracker._post_scorebugs_to_channel.assert_awaited_once_with(channel, ['embed'])
+        # The final game still gets its last voice status render
+        assert tracker._update_voice_channel_description.await_count == 2
+        assert tracker.schedule.is_finished('c')
+
+    @pytest.mark.asyncio
+    async def test_only_due_games_are_read(self, tracker):
+        channel = MagicMock()
+        channel.name = 'live-sba-scores'
+        tracker.bot.get_guild.return_value = MagicMock(text_channels=[channel])
+        tracker.scorecard_tracker.get_all_scorecards.return_value = [(1, 'a')]
+        tracker._read_scorecards = AsyncMock(return_value=[make_scorebug()])
+        tracker._post_scorebugs_to_channel = AsyncMock()
+        tracker._update_voice_channel_description = AsyncMock()
+
+        with patch('tasks.live_scorebug_tracker.team_service') as team_service, \
+             patch('tasks.live_scorebug_tracker.set_channel_visibility', new_callable=AsyncMock):
+            team_service.get_teams_by_season = AsyncMock(return_value=[TeamFactory.west_virginia(), TeamFactory.new_york()])
+
+            await tracker._update_scorebugs()
+            # A new game joins: only it is read, the first game isn't due yet
+            tracker.scorecard_tracker.get_all_scorecards.return_value = [(1, 'a'), (2, 'b')]
+            await tracker._update_scorebugs()
+
+        assert [call.args[0] for call in tracker._read_scorecards.await_args_list] == [[(1, 'a')], [(2, 'b')]]
+
+
+class TestVoiceChannelStatus:
+    """Voice channel status updates."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_score_skips_edit(self, tracker):
+        voice_channel = MagicMock(spec=discord.VoiceChannel)
+        voice_channel.edit = AsyncMock()
+        tracker.voice_tracker.get_voice_channel_for_text_channel.return_value = 55
+        tracker.bot.get_guild.return_value.get_channel.return_value = voice_channel
+        away, home = TeamFactory.west_virginia(), TeamFactory.new_york()
+        scorebug = make_scorebug()
+
+        await tracker._update_voice_channel_description(1, scorebug, away, home)
+        await tracker._update_voice_channel_description(1, scorebug, away, home)
+        scorebug.home_score = 1
+        await tracker._update_voice_channel_description(1, scorebug, away, home)
+
+        assert voice_channel.edit.await_count == 2
+        assert voice_channel.edit.await_args.kwargs['status'].endswith(f"@ 1 {home.abbrev}")
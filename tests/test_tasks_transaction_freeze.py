@@ -19,6 +19,8 @@ from tasks.transaction_freeze import (
     TransactionPriority
 )
 from models.transaction import Transaction
+from services.transaction_executor import TransactionExecutor
+from services.transaction_journal import TransactionJournal
 from models.current import Current
 from models.team import Team
 from models.player import Player
@@ -341,7 +343,7 @@ class TestResolveContestedTransactions:
         transactions = [sample_transaction]
 
         with patch('tasks.transaction_freeze.standings_service') as mock_standings:
-            mock_standings.get_team_standings = AsyncMock(return_value=None)
+            mock_standings.get_win_percentages = AsyncMock(return_value={})
 
             winning_ids, losing_ids = await resolve_contested_transactions(transactions, 12)
 
@@ -349,6 +351,9 @@ class TestResolveContestedTransactions:
             assert sample_transaction.moveid in winning_ids
             assert len(losing_ids) == 0
 
+            # No contest, so no standings needed
+            mock_standings.get_win_percentages.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_contested_transaction_resolution(
         self,
@@ -358,14 +363,10 @@ class TestResolveContestedTransactions:
     ):
         """Test contested transaction resolution with priority."""
         with patch('tasks.transaction_freeze.standings_service') as mock_standings:
-            async def get_standings(team_abbrev, season):
-                if team_abbrev == "WV":
-                    return sample_standings_wv  # 0.300 win%
-                elif team_abbrev == "NY":
-                    return sample_standings_ny  # 0.700 win%
-                return None
-
-            mock_standings.get_team_standings = AsyncMock(side_effect=get_standings)
+            mock_standings.get_win_percentages = AsyncMock(return_value={
+                "WV": sample_standings_wv.winning_percentage,  # 0.300 win%
+                "NY": sample_standings_ny.winning_percentage,  # 0.700 win%
+            })
 
             # Mock random for deterministic testing
             with patch('tasks.transaction_freeze.random.randint', return_value=50000):
@@ -434,23 +435,21 @@ class TestResolveContestedTransactions:
         transactions = [mil_transaction, ny_transaction]
 
         with patch('tasks.transaction_freeze.standings_service') as mock_standings:
-            # Should request standings for "WV" (parent), not "WVMiL"
-            mock_standings.get_team_standings = AsyncMock(return_value=sample_standings_wv)
+            # WVMiL must be ranked by "WV" (parent); an unknown team would get 0.0 and win
+            mock_standings.get_win_percentages = AsyncMock(return_value={"WV": 0.9, "NY": 0.5})
 
             # Mock random for deterministic testing
             with patch('tasks.transaction_freeze.random.randint', return_value=50000):
                 winning_ids, losing_ids = await resolve_contested_transactions(transactions, 12)
 
-                # Should have called with "WV" (stripped "MiL" suffix)
-                # Will be called twice (once for WVMiL, once for NY)
-                calls = mock_standings.get_team_standings.call_args_list
-                assert any(call[0] == ("WV", 12) for call in calls), \
-                    f"Expected call with ('WV', 12), got {calls}"
-
                 # Should have resolved (one winner, one loser)
                 assert len(winning_ids) == 1
                 assert len(losing_ids) == 1
 
+                # NY (0.500) beats WVMiL ranked by WV's 0.900
+                assert ny_transaction.moveid in winning_ids
+                assert mil_transaction.moveid in losing_ids
+
     @pytest.mark.asyncio
     async def test_fa_drops_not_contested(self, sample_player, sample_team_wv):
         """Test that FA drops are not considered for contests."""
@@ -488,7 +487,7 @@ class TestResolveContestedTransactions:
         """Test that standings errors result in 0.0 priority."""
         with patch('tasks.transaction_freeze.standings_service') as mock_standings:
             # Simulate standings service error
-            mock_standings.get_team_standings = AsyncMock(side_effect=Exception("API Error"))
+            mock_standings.get_win_percentages = AsyncMock(side_effect=Exception("API Error"))
 
             # Mock random for deterministic testing
             with patch('tasks.transaction_freeze.random.randint', return_value=50000):
@@ -530,41 +529,19 @@ class TestResolveContestedTransactions:
 
         transactions = [tx1, tx2, tx3]
 
+        # One snapshot covers every contending team (T1 .200, T2 .500, T3 .800)
+        win_percentages = {"T1": 0.2, "T2": 0.5, "T3": 0.8}
+
         with patch('tasks.transaction_freeze.standings_service') as mock_standings:
-            async def get_standings(team_abbrev, season):
-                # Create minimal team objects for standings
-                standings_map = {
-                    "T1": TeamStandings(
-                        id=1, team=team1, wins=20, losses=80, run_diff=0,
-                        home_wins=10, home_losses=40, away_wins=10, away_losses=40,
-                        last8_wins=1, last8_losses=7, streak_wl="l", streak_num=5,
-                        one_run_wins=5, one_run_losses=10, pythag_wins=22, pythag_losses=78,
-                        div1_wins=5, div1_losses=15, div2_wins=5, div2_losses=15,
-                        div3_wins=5, div3_losses=15, div4_wins=5, div4_losses=15
-                    ),
-                    "T2": TeamStandings(
-                        id=2, team=team2, wins=50, losses=50, run_diff=0,
-                        home_wins=25, home_losses=25, away_wins=25, away_losses=25,
-                        last8_wins=4, last8_losses=4, streak_wl="w", streak_num=2,
-                        one_run_wins=10, one_run_losses=10, pythag_wins=50, pythag_losses=50,
-                        div1_wins=12, div1_losses=13, div2_wins=13, div2_losses=12,
-                        div3_wins=12, div3_losses=13, div4_wins=13, div4_losses=12
-                    ),
-                    "T3": TeamStandings(
-                        id=3, team=team3, wins=80, losses=20, run_diff=0,
-                        home_wins=40, home_losses=10, away_wins=40, away_losses=10,
-                        last8_wins=7, last8_losses=1, streak_wl="w", streak_num=8,
-                        one_run_wins=15, one_run_losses=5, pythag_wins=78, pythag_losses=22,
-                        div1_wins=20, div1_losses=5, div2_wins=20, div2_losses=5,
-                        div3_wins=20, div3_losses=5, div4_wins=20, div4_losses=5
-                    ),
-                }
-                return standings_map.get(team_abbrev)
-
-            mock_standings.get_team_standings = AsyncMock(side_effect=get_standings)
+            mock_standings.get_win_percentages = AsyncMock()
 
             with patch('tasks.transaction_freeze.random.randint', return_value=50000):
-                winning_ids, losing_ids = await resolve_contested_transactions(transactions, 12)
+                winning_ids, losing_ids = await resolve_contested_transactions(
+                    transactions, 12, win_percentages=win_percentages
+                )
+
+                # Pre-built snapshot is used as-is
+                mock_standings.get_win_percentages.assert_not_called()
 
                 # Only one winner
                 assert len(winning_ids) == 1
@@ -577,6 +554,29 @@ class TestResolveContestedTransactions:
                 assert tx3.moveid in losing_ids
 
 
+    @pytest.mark.asyncio
+    async def test_single_standings_fetch_for_all_contests(self, sample_team_wv, sample_team_ny):
+        """Several contested players share one standings snapshot."""
+        fa_team = TeamFactory.create(id=999, abbrev="FA", sname="Free Agents", lname="Free Agents", season=12)
+        transactions = []
+        for index, player in enumerate([PlayerFactory.mike_trout(), PlayerFactory.ronald_acuna()]):
+            for team in (sample_team_wv, sample_team_ny):
+                transactions.append(Transaction(
+                    id=100 + len(transactions), week=10, season=12,
+                    moveid=f'move-{index}-{team.abbrev}', player=player,
+                    oldteam=fa_team, newteam=team, cancelled=False, frozen=True
+                ))
+
+        with patch('tasks.transaction_freeze.standings_service') as mock_standings:
+            mock_standings.get_win_percentages = AsyncMock(return_value={"WV": 0.3, "NY": 0.7})
+
+            winning_ids, losing_ids = await resolve_contested_transactions(transactions, 12)
+
+            mock_standings.get_win_percentages.assert_awaited_once_with(12)
+            assert sorted(winning_ids) == ['move-0-WV', 'move-1-WV']
+            assert sorted(losing_ids) == ['move-0-NY', 'move-1-NY']
+
+
 class TestTransactionFreezeTaskInitialization:
     """Test TransactionFreezeTask initialization and setup."""
 
@@ -903,6 +903,136 @@ class TestProcessFrozenTransactions:
                     task._post_transaction_to_log.assert_called_once()
 
 
+class TestRunTransactions:
+    """Test regular transaction execution."""
+
+    @pytest.mark.asyncio
+    async def test_run_transactions_uses_executor(self, mock_bot, current_state, sample_transaction, tmp_path):
+        """Each move's player update goes through the shared executor and is journaled."""
+        with patch.object(TransactionFreezeTask, 'weekly_loop'):
+            task = TransactionFreezeTask(mock_bot)
+            task._execute_player_update = AsyncMock(return_value=True)
+
+            executor = TransactionExecutor(max_concurrency=2, rate=1000.0, burst=10)
+            journal = TransactionJournal.for_week(current_state.season, current_state.week, str(tmp_path))
+            with patch('tasks.transaction_freeze.transaction_service') as mock_tx_service, \
+                    patch('tasks.transaction_freeze.get_transaction_executor', return_value=executor), \
+                    patch('tasks.transaction_freeze.TransactionJournal.for_week', return_value=journal):
+                mock_tx_service.get_regular_transactions_by_week = AsyncMock(
+                    return_value=[sample_transaction]
+                )
+
+                await task._run_transactions(current_state)
+
+            task._execute_player_update.assert_awaited_once_with(
+                player_id=sample_transaction.player.id,
+                new_team_id=sample_transaction.newteam.id,
+                player_name=sample_transaction.player.name
+            )
+            assert journal.is_complete
+
+    @pytest.mark.asyncio
+    async def test_run_transactions_resumes_interrupted_run(
+        self, mock_bot, current_state, sample_transaction, tmp_path
+    ):
+        """An interrupted run replays its journal without refetching or re-patching applied moves."""
+        with patch.object(TransactionFreezeTask, 'weekly_loop'):
+            task = TransactionFreezeTask(mock_bot)
+            task._execute_player_update = AsyncMock(return_value=True)
+
+            second_move = sample_transaction.model_copy(update={
+                'id': 27788,
+                'moveid': 'Season-012-Week-10-19-13:05:00',
+                'player': PlayerFactory.ronald_acuna()
+            })
+            journal = TransactionJournal.for_week(current_state.season, current_state.week, str(tmp_path))
+            journal.start([sample_transaction, second_move])
+            journal.record_applied(sample_transaction)
+            await journal.flush()
+
+            executor = TransactionExecutor(max_concurrency=2, rate=1000.0, burst=10)
+            with patch('tasks.transaction_freeze.transaction_service') as mock_tx_service, \
+                    patch('tasks.transaction_freeze.get_transaction_executor', return_value=executor), \
+                    patch('tasks.transaction_freeze.TransactionJournal.for_week', return_value=journal):
+                mock_tx_service.get_regular_transactions_by_week = AsyncMock()
+
+                await task._run_transactions(current_state)
+
+                mock_tx_service.get_regular_transactions_by_week.assert_not_called()
+
+            task._execute_player_update.assert_awaited_once()
+            assert task._execute_player_update.call_args.kwargs['player_id'] == second_move.player.id
+            assert journal.is_complete
+
+    @pytest.mark.asyncio
+    async def test_startup_resumes_only_current_week(
+        self, mock_bot, current_state, sample_transaction, tmp_path
+    ):
+        """Interrupted runs from past weeks are reported but never replayed."""
+        with patch.object(TransactionFreezeTask, 'weekly_loop'):
+            task = TransactionFreezeTask(mock_bot)
+            task._execute_player_update = AsyncMock(return_value=True)
+
+            stale = TransactionJournal.for_week(current_state.season, current_state.week - 1, str(tmp_path))
+            stale.start([sample_transaction])
+            interrupted = TransactionJournal.for_week(current_state.season, current_state.week, str(tmp_path))
+            interrupted.start([sample_transaction])
+
+            executor = TransactionExecutor(max_concurrency=2, rate=1000.0, burst=10)
+            with patch('tasks.transaction_freeze.league_service') as mock_league_service, \
+                    patch('tasks.transaction_freeze.get_transaction_executor', return_value=executor), \
+                    patch('tasks.transaction_freeze.TransactionJournal.incomplete',
+                          return_value=[stale, interrupted]):
+                mock_league_service.get_current_state = AsyncMock(return_value=current_state)
+
+                await task._resume_interrupted_runs()
+
+            task._execute_player_update.assert_awaited_once()
+            assert interrupted.is_complete
+            assert stale.is_resumable
+
+    @pytest.mark.asyncio
+    async def test_execute_player_update_sends_team_as_query_param(self, mock_bot):
+        """The PATCH uses APIClient.patch's query-parameter mode (it has no params argument)."""
+        with patch.object(TransactionFreezeTask, 'weekly_loop'):
+            task = TransactionFreezeTask(mock_bot)
+
+            client = MagicMock()
+            client.patch = AsyncMock(return_value={'id': 12472})
+            with patch('tasks.transaction_freeze.transaction_service') as mock_tx_service:
+                mock_tx_service.get_client = AsyncMock(return_value=client)
+                mock_tx_service.cache.invalidate_tags = AsyncMock()
+
+                result = await task._execute_player_update(12472, 499, "Mike Trout")
+
+            assert result is True
+            client.patch.assert_awaited_once_with(
+                'players/12472',
+                data={'team_id': 499},
+                use_query_params=True
+            )
+
+
+    @pytest.mark.asyncio
+    async def test_execute_player_update_refreshes_player_index(self, mock_bot):
+        """The moved player is upserted into the player index and cached season list."""
+        with patch.object(TransactionFreezeTask, 'weekly_loop'):
+            task = TransactionFreezeTask(mock_bot)
+
+            moved = PlayerFactory.mike_trout(team_id=499)
+            client = MagicMock()
+            client.patch = AsyncMock(return_value=moved.model_dump())
+            with patch('tasks.transaction_freeze.transaction_service') as mock_tx_service, \
+                    patch('tasks.transaction_freeze.player_service') as mock_player_service:
+                mock_tx_service.get_client = AsyncMock(return_value=client)
+                mock_tx_service.cache.invalidate_tags = AsyncMock()
+                mock_player_service.record_player_update = AsyncMock()
+
+                assert await task._execute_player_update(moved.id, 499, moved.name) is True
+
+            recorded = mock_player_service.record_player_update.await_args.args[0]
+            assert (recorded.id, recorded.team_id) == (moved.id, 499)
+
 class TestNotificationsAndEmbeds:
     """Test notification and embed creation."""
 
@@ -0,0 +1,173 @@
+"""
+Tests for BuilderRegistry
+
+Covers idle expiry, LRU eviction by entry count and approximate size, pinned
+sessions, eviction callbacks, and the trade registry's team-index cleanup.
+"""
+from models.trade import TradeStatus
+from utils.builder_registry import BuilderRegistry
+from services.trade_builder import (
+    _active_trade_builders,
+    _team_to_trade_key,
+    add_trade_eviction_callback,
+    get_trade_builder,
+    get_trade_builder_by_team,
+    get_trade_builder_stats,
+    remove_trade_eviction_callback,
+)
+from tests.factories import TeamFactory
+
+
+def make_registry(clock, idle_ttl=60, max_entries=3, max_bytes=1000, sizes=None, pinned=None):
+    sizes = sizes or {}
+    return BuilderRegistry(
+        name='test',
+        idle_ttl=idle_ttl,
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        sizer=lambda builder: sizes.get(builder, 10),
+        clock=clock,
+        pinned=pinned
+    )
+
+
+class TestBuilderRegistry:
+    """Test suite for BuilderRegistry eviction."""
+
+    def test_idle_sessions_expire_and_use_refreshes(self, clock):
+        registry = make_registry(clock)
+        evicted = []
+        registry.add_eviction_callback(lambda key, builder, reason: evicted.append((key, reason)))
+        registry.set('a', 'builder-a')
+        registry.set('b', 'builder-b')
+
+        clock.now = 50.0
+        assert registry.get('a') == 'builder-a'  # Refreshes a
+        clock.now = 100.0
+
+        assert 'b' not in registry
+        assert registry.get('a') == 'builder-a'
+        assert evicted == [('b', 'idle')]
+
+    def test_least_recently_used_evicted_over_capacity(self, clock):
+        registry = make_registry(clock, max_entries=2)
+        evicted = []
+        registry.add_eviction_callback(lambda key, builder, reason: evicted.append((key, reason)))
+
+        registry.set('a', 'builder-a')
+        registry.set('b', 'builder-b')
+        registry.get('a')
+        registry.set('c', 'builder-c')
+
+        assert [key for key, _ in registry.items()] == ['a', 'c']
+        assert evicted == [('b', 'capacity')]
+
+    def test_pinned_sessions_survive_idle_and_go_last_for_capacity(self, clock):
+        registry = make_registry(clock, max_entries=2, pinned=lambda builder: builder.startswith('pinned'))
+        registry.set('a', 'pinned-a')
+        registry.set('b', 'builder-b')
+
+        clock.now = 100.0
+        registry.sweep()
+        assert [key for key, _ in registry.items()] == ['a']
+
+        registry.set('c', 'builder-c')
+        registry.set('d', 'builder-d')
+        assert [key for key, _ in registry.items()] == ['a', 'd']
+
+    def test_memory_ceiling_keeps_newest(self, clock):
+        registry = make_registry(clock, max_entries=10, max_bytes=100, sizes={'small': 40, 'big': 90, 'huge': 500})
+
+        registry.set('small', 'small')
+        registry.set('big', 'big')
+        assert [key for key, _ in registry.items()] == ['big']
+
+        # A single oversized session is kept rather than leaving the registry empty
+        registry.set('huge', 'huge')
+        assert registry.stats() == {
+            'live': 1, 'approx_bytes': 500, 'max_entries': 10, 'max_bytes': 100, 'evictions': 2
+        }
+
+    def test_pop_skips_callbacks_and_failing_callback_is_contained(self, clock):
+        registry = make_registry(clock, max_entries=1)
+        calls = []
+
+        def failing(key, builder, reason):
+            calls.append(key)
+            raise RuntimeError("cleanup failed")
+
+        registry.add_eviction_callback(failing)
+        registry.set('a', 'builder-a')
+        assert registry.pop('a') == 'builder-a'
+        assert calls == []
+
+        registry.set('b', 'builder-b')
+        registry.set('c', 'builder-c')
+        assert calls == ['b']
+        assert registry.approx_bytes == 10
+
+
+class TestTradeBuilderRegistry:
+    """Test the trade builder registry's eviction cleanup."""
+
+    def test_eviction_removes_team_index(self, clock):
+        original_clock = _active_trade_builders._clock
+        _active_trade_builders._clock = clock
+        try:
+            team = TeamFactory.west_virginia()
+            builder = get_trade_builder(1, team)
+            assert get_trade_builder_by_team(team.id) is builder
+
+            clock.now = _active_trade_builders.idle_ttl + 1
+            assert get_trade_builder_by_team(team.id) is None
+            assert team.id not in _team_to_trade_key
+            assert get_trade_builder_stats()['live'] == 0
+        finally:
+            _active_trade_builders._clock = original_clock
+
+    def test_eviction_callbacks_can_be_added_and_removed(self, clock):
+        evicted = []
+        callback = lambda key, builder, reason: evicted.append((builder.trade_id, reason))
+        original_clock = _active_trade_builders._clock
+        _active_trade_builders._clock = clock
+        add_trade_eviction_callback(callback)
+        try:
+            first = get_trade_builder(1, TeamFactory.west_virginia())
+            clock.now = _active_trade_builders.idle_ttl + 1
+            _active_trade_builders.sweep()
+
+            remove_trade_eviction_callback(callback)
+            get_trade_builder(2, TeamFactory.new_york())
+            clock.now += _active_trade_builders.idle_ttl + 1
+            _active_trade_builders.sweep()
+
+            assert evicted == [(first.trade_id, 'idle')]
+        finally:
+            remove_trade_eviction_callback(callback)
+            _active_trade_builders._clock = original_clock
+
+    def test_proposed_trade_is_not_evicted_while_idle(self, clock):
+        original_clock = _active_trade_builders._clock
+        _active_trade_builders._clock = clock
+        try:
+            team = TeamFactory.west_virginia()
+            builder = get_trade_builder(1, team)
+            builder.trade.status = TradeStatus.PROPOSED
+
+            clock.now = _active_trade_builders.idle_ttl + 1
+            assert get_trade_builder_by_team(team.id) is builder
+
+            builder.reject_trade()
+            clock.now += _active_trade_builders.idle_ttl + 1
+            assert get_trade_builder_by_team(team.id) is None
+        finally:
+            _active_trade_builders._clock = original_clock
+
+    def test_stats_include_team_builders(self):
+        builder = get_trade_builder(1, TeamFactory.west_virginia())
+        empty_size = get_trade_builder_stats()['approx_bytes']
+
+        builder._get_or_create_builder(TeamFactory.new_york())
+        get_trade_builder(1, TeamFactory.west_virginia())  # Touch re-measures
+
+        assert get_trade_builder_stats()['approx_bytes'] > empty_size
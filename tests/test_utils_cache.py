@@ -0,0 +1,357 @@
+"""
+Tests for the two-tier cache (in-process L1 in front of Redis L2)
+"""
+import fnmatch
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from utils.cache import LocalCache, CacheManager
+from utils.decorators import _render_cache_tags
+from services.standings_service import StandingsService
+from services.team_service import TeamService
+from models.team import Team
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio commands CacheManager uses."""
+
+    def __init__(self):
+        self.store = {}
+        self.sets = {}
+        self.keys_called = False
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value.encode()
+
+    async def ttl(self, key):
+        return 100 if key in self.store else -2
+
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(m.encode() for m in members)
+
+    async def expire(self, key, ttl):
+        return True
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            key = key.decode() if isinstance(key, bytes) else key
+            if self.store.pop(key, None) is not None or self.sets.pop(key, None) is not None:
+                deleted += 1
+        return deleted
+
+    async def keys(self, pattern):
+        self.keys_called = True
+        return [k for k in self.store if fnmatch.fnmatch(k, pattern)]
+
+    async def scan_iter(self, match=None, count=None):
+        for key in list(self.store):
+            if fnmatch.fnmatch(key, match):
+                yield key.encode()
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis calls and runs them on execute()."""
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis_client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class TestLocalCache:
+    """Test the bounded in-process LRU tier."""
+
+    def test_get_and_set(self):
+        """Test objects are returned as-is."""
+        cache = LocalCache()
+        value = {"id": 1}
+        cache.set("sba:teams_abc", value, ttl=60)
+
+        assert cache.get("sba:teams_abc") is value
+        assert cache.get("sba:teams_missing") is None
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_entries_expire(self, clock):
+        """Test per-key TTL expiry."""
+        cache = LocalCache(clock=clock)
+        cache.set("short", "a", ttl=10)
+        cache.set("long", "b", ttl=100)
+
+        clock.now = 10
+        assert cache.get("short") is None
+        assert cache.get("long") == "b"
+
+    def test_lru_eviction(self):
+        """Test least-recently-used keys are evicted at the size limit."""
+        cache = LocalCache(max_entries=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")  # 'b' is now least recently used
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_delete_prefix(self):
+        """Test prefix invalidation only removes matching keys."""
+        cache = LocalCache()
+        cache.set("sba:teams_1", 1, ttl=60)
+        cache.set("sba:teams_2", 2, ttl=60)
+        cache.set("sba:players_1", 3, ttl=60)
+
+        assert cache.delete_prefix("sba:teams_") == 2
+        assert len(cache) == 1
+
+
+    def test_delete_tags(self):
+        """Test tag invalidation removes exactly the tagged keys."""
+        cache = LocalCache()
+        cache.set("sba:teams_a", 1, ttl=60, tags=["team:1", "season:13"])
+        cache.set("sba:teams_b", 2, ttl=60, tags=["team:2", "season:13"])
+        cache.set("sba:players_c", 3, ttl=60, tags=["player:9"])
+
+        assert cache.delete_tags(["team:1"]) == 1
+        assert cache.get("sba:teams_b") == 2
+
+        assert cache.delete_tags(["season:13"]) == 1
+        assert cache.get("sba:players_c") == 3
+        assert cache._tag_index == {"player:9": {"sba:players_c"}}
+
+    def test_evicted_keys_leave_tag_index(self):
+        """Test eviction also drops tag registrations."""
+        cache = LocalCache(max_entries=1)
+        cache.set("a", 1, ttl=60, tags=["team:1"])
+        cache.set("b", 2, ttl=60, tags=["team:2"])
+
+        assert "team:1" not in cache._tag_index
+        assert cache.delete_tags(["team:1"]) == 0
+
+
+class TestCacheManagerLocalTier:
+    """Test CacheManager integration with the L1 tier."""
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_both_tiers(self):
+        """Test delete() removes the L1 entry and the Redis key."""
+        redis_client = AsyncMock()
+        manager = CacheManager(redis_client=redis_client, local_cache=LocalCache())
+        manager.set_local("sba:teams_1", "team", ttl=60)
+
+        await manager.delete("sba:teams_1")
+
+        assert manager.get_local("sba:teams_1") is None
+        redis_client.delete.assert_awaited_once_with("sba:teams_1")
+
+    def test_local_tier_follows_redis_unless_set(self):
+        """Test the in-process tier is on with Redis configured, and cache_local_enabled overrides it."""
+        from config import get_config
+
+        config = get_config()
+        manager = CacheManager(redis_client=None)
+        manager.set_local("sba:teams_1", "team", ttl=60)
+        assert manager.local is None
+        assert manager.get_local("sba:teams_1") is None
+
+        config.redis_url = "redis://localhost:6379"
+        manager.set_local("sba:teams_1", "team", ttl=60)
+        assert manager.get_local("sba:teams_1") == "team"
+
+        config.cache_local_enabled = False
+        assert manager.local is None
+
+        config.redis_url = ""
+        config.cache_local_enabled = True
+        assert manager.get_local("sba:teams_1") == "team"
+
+    def test_local_hits_share_models_but_not_lists(self):
+        """Test hits hand out the cached models themselves, in a list the caller may change."""
+        manager = CacheManager(redis_client=None, local_cache=LocalCache())
+        teams = [Team(id=1, abbrev='NYY', sname='Yankees', lname='New York Yankees', season=12)]
+        manager.set_local("sba:teams_12", teams, ttl=60)
+        teams.append(Team(id=2, abbrev='BOS', sname='Red Sox', lname='Boston Red Sox', season=12))
+
+        first = manager.get_local("sba:teams_12")
+        first.clear()
+        second = manager.get_local("sba:teams_12")
+
+        assert len(second) == 1
+        assert second[0] is teams[0]
+
+    @pytest.mark.asyncio
+    async def test_get_with_ttl_uses_single_pipeline(self):
+        """Test L2 reads fetch the value and remaining TTL together."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[b'{"id": 1}', 42])
+        redis_client = MagicMock()
+        redis_client.pipeline.return_value = pipe
+        manager = CacheManager(redis_client=redis_client, local_cache=LocalCache())
+
+        data, ttl = await manager.get_with_ttl("sba:teams_1")
+
+        assert data == {"id": 1}
+        assert ttl == 42
+        pipe.execute.assert_awaited_once()
+
+
+class TestCacheManagerTags:
+    """Test Redis-backed tag index and SCAN-based prefix sweeps."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_deletes_registered_keys(self):
+        """Test hashed keys are found through their tags and removed from both tiers."""
+        redis_client = FakeRedis()
+        manager = CacheManager(redis_client=redis_client, local_cache=LocalCache())
+
+        await manager.set("sba:teams_1f3a", {"id": 1}, ttl=60, tags=["team:1", "owner:55"])
+        await manager.set("sba:teams_9c2e", {"id": 2}, ttl=60, tags=["team:2"])
+        manager.set_local("sba:teams_1f3a", "team-1", ttl=60, tags=["team:1", "owner:55"])
+
+        deleted = await manager.invalidate_tags("owner:55")
+
+        assert deleted == 1
+        assert "sba:teams_1f3a" not in redis_client.store
+        assert "sba:teams_9c2e" in redis_client.store
+        assert "sba:tag:owner:55" not in redis_client.sets
+        assert manager.get_local("sba:teams_1f3a") is None
+
+    @pytest.mark.asyncio
+    async def test_clear_prefix_uses_scan(self):
+        """Test prefix sweeps iterate with SCAN instead of KEYS."""
+        redis_client = FakeRedis()
+        manager = CacheManager(redis_client=redis_client, local_cache=LocalCache())
+        await manager.set("sba:teams_a", 1)
+        await manager.set("sba:teams_b", 2)
+        await manager.set("other:x", 3)
+
+        deleted = await manager.clear_prefix("sba")
+
+        assert deleted == 2
+        assert list(redis_client.store) == ["other:x"]
+        assert not redis_client.keys_called
+
+
+class TestCacheTagRendering:
+    """Test tag template rendering used by the caching decorators."""
+
+    def test_argument_and_result_templates(self):
+        """Test templates format against arguments and result attributes."""
+        team = Team(id=7, abbrev='TST', sname='Test', lname='Test Team', season=13)
+
+        tags = _render_cache_tags(("owner:{owner_id}", "team:{result.id}"), {'owner_id': 55}, team)
+
+        assert tags == ["owner:55", "team:7"]
+
+    def test_item_templates_expand_per_list_element(self):
+        """Test '{item...}' templates yield one tag per list element."""
+        teams = [
+            Team(id=1, abbrev='AAA', sname='A', lname='A Team', season=13),
+            Team(id=2, abbrev='BBB', sname='B', lname='B Team', season=13)
+        ]
+
+        tags = _render_cache_tags(("season:{season}", "team:{item.id}"), {'season': 13}, teams)
+
+        assert tags == ["season:13", "team:1", "team:2"]
+
+    def test_none_values_are_skipped(self):
+        """Test templates referencing missing values don't produce tags."""
+        tags = _render_cache_tags(("season:{season}", "team:{result.id}"), {'season': None}, None)
+
+        assert tags == []
+
+
+class TestCachedServiceMethods:
+    """Test decorated service methods are served from the L1 tier."""
+
+    @pytest.fixture
+    def service(self):
+        service = TeamService()
+        service._client = AsyncMock()
+        service._client.get.return_value = {
+            'id': 1, 'abbrev': 'TST', 'sname': 'Test', 'lname': 'Test Team', 'season': 13
+        }
+        # No Redis - L1 only
+        service.cache = CacheManager(redis_client=None, local_cache=LocalCache())
+        service.cache._get_client = AsyncMock(return_value=None)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_skips_api(self, service):
+        """Test a second get_team returns the held model without an API call."""
+        first = await service.get_team(1)
+        second = await service.get_team(1)
+
+        assert second is first
+        service._client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_update_team_invalidates_season_list(self, service):
+        """Test updating one team drops the cached season list containing it."""
+        service._client.get.return_value = {'count': 1, 'teams': [
+            {'id': 1, 'abbrev': 'TST', 'sname': 'Test', 'lname': 'Test Team', 'season': 13}
+        ]}
+        service._client.patch.return_value = {
+            'id': 1, 'abbrev': 'TST', 'sname': 'Test', 'lname': 'Renamed Team', 'season': 13
+        }
+
+        await service.get_teams_by_season(13)
+        await service.get_teams_by_season(13)
+        assert service._client.get.await_count == 1
+
+        await service.update_team(1, {'lname': 'Renamed Team'})
+        await service.get_teams_by_season(13)
+        assert service._client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_team_invalidates_cached_team(self, service):
+        """Test update_team drops the cached get_team entry."""
+        service._client.patch.return_value = {
+            'id': 1, 'abbrev': 'TST', 'sname': 'Test', 'lname': 'Renamed Team', 'season': 13
+        }
+        await service.get_team(1)
+
+        await service.update_team(1, {'lname': 'Renamed Team'})
+        await service.get_team(1)
+
+        assert service._client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_standings_are_kept_in_redis(self):
+        """Test league standings are cached in Redis when the in-process tier is off."""
+        record = {
+            'id': 1, 'wins': 10, 'losses': 5, 'run_diff': 12, 'home_wins': 6, 'home_losses': 2,
+            'away_wins': 4, 'away_losses': 3, 'last8_wins': 5, 'last8_losses': 3, 'streak_wl': 'w',
+            'streak_num': 2, 'one_run_wins': 1, 'one_run_losses': 1, 'pythag_wins': 9, 'pythag_losses': 6,
+            'div1_wins': 2, 'div1_losses': 1, 'div2_wins': 3, 'div2_losses': 1, 'div3_wins': 2,
+            'div3_losses': 2, 'div4_wins': 3, 'div4_losses': 1,
+            'team': {'id': 1, 'abbrev': 'TST', 'sname': 'Test', 'lname': 'Test Team', 'season': 13}
+        }
+        service = StandingsService(cache_manager=CacheManager(redis_client=FakeRedis()))
+        service._get_client = AsyncMock(return_value=AsyncMock(get=AsyncMock(return_value={'standings': [record]})))
+
+        first = await service.get_league_standings(13)
+        second = await service.get_league_standings(13)
+
+        assert service.cache.local is None
+        assert [s.team.abbrev for s in second] == [s.team.abbrev for s in first] == ['TST']
+        (await service._get_client()).get.assert_awaited_once()
@@ -0,0 +1,105 @@
+"""
+Tests for startup cache warm-up
+"""
+import asyncio
+
+import pytest
+
+from config import get_config
+from utils.cache_warmup import WarmupReport, default_warmup_loaders, warm_caches
+
+
+class TestWarmCaches:
+    """Test concurrent warm-up under a time budget."""
+
+    @pytest.mark.asyncio
+    async def test_runs_loaders_concurrently(self):
+        """All loaders start before any of them finishes."""
+        started = []
+        release = asyncio.Event()
+
+        def loader(name):
+            async def load():
+                started.append(name)
+                await release.wait()
+                return [1, 2, 3]
+            return load
+
+        async def release_when_all_started():
+            while len(started) < 3:
+                await asyncio.sleep(0)
+            release.set()
+
+        asyncio.ensure_future(release_when_all_started())
+        report = await warm_caches({name: loader(name) for name in ('teams', 'current', 'players')}, budget=5)
+
+        assert sorted(started) == ['current', 'players', 'teams']
+        assert report.completed == 3
+        assert report.pending == []
+        assert report.summary().startswith("3/3 loaded in")
+
+    @pytest.mark.asyncio
+    async def test_failed_step_is_reported(self):
+        """A failing loader is recorded without affecting the others."""
+        async def ok():
+            return {}
+
+        async def broken():
+            raise RuntimeError("API down")
+
+        report = await warm_caches({'teams': ok, 'standings': broken}, budget=5)
+
+        assert report.completed == 1
+        assert report.errors == {'standings': 'API down'}
+        assert "failed: standings" in report.summary()
+
+    @pytest.mark.asyncio
+    async def test_budget_leaves_slow_steps_running(self):
+        """Steps over budget are reported as pending and still finish in the background."""
+        finished = asyncio.Event()
+
+        async def fast():
+            return []
+
+        async def slow():
+            await asyncio.sleep(0.2)
+            finished.set()
+            return []
+
+        report = await warm_caches({'current': fast, 'players': slow}, budget=0.05)
+
+        assert report.completed == 1
+        assert report.pending == ['players']
+        assert "over budget: players" in report.summary()
+
+        await asyncio.wait_for(finished.wait(), timeout=1)
+        # The report is final once warm_caches returns
+        assert report.pending == ['players']
+        assert 'players' not in report.step_durations
+
+    def test_empty_report_summary(self):
+        """A report with no steps still renders."""
+        assert WarmupReport(budget=8.0).summary() == "0/0 loaded in 0.00s"
+
+
+class TestDefaultWarmupLoaders:
+    """Test the standard warm-up steps."""
+
+    def test_standings_skipped_without_a_cache(self):
+        """Standings only fill the API cache, so they are skipped when no cache tier is enabled."""
+        assert default_warmup_loaders(12)['standings'] is None
+
+        get_config().cache_local_enabled = True
+        assert default_warmup_loaders(12)['standings'] is not None
+
+    @pytest.mark.asyncio
+    async def test_skipped_steps_are_reported(self):
+        async def ok():
+            return {}
+
+        report = await warm_caches({'teams': ok, 'standings': None}, budget=5)
+
+        assert report.completed == 1
+        assert report.skipped == ['standings']
+        assert report.summary().startswith("1/2 loaded")
+        assert "skipped (no cache): standings" in report.summary()
@@ -24,6 +24,7 @@ from utils.draft_helpers import (
     calculate_pick_details,
     calculate_overall_from_round_position,
     validate_cap_space,
+    DraftCapState,
     format_pick_display,
     get_next_pick_overall,
     is_draft_complete,
@@ -489,6 +490,37 @@ class TestValidateCapSpaceTeamSpecificCaps:
         assert cap_limit == 32.0  # Default
 
 
+class TestDraftCapState:
+    """Tests for DraftCapState - repeated cap checks against one sorted roster."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("roster_size", [0, 5, 18, 25, 31, 35])
+    async def test_matches_validate_cap_space(self, roster_size):
+        """
+        DraftCapState.check() should agree with validate_cap_space() for every candidate.
+
+        Why: The auto-draft planner relies on it in place of validate_cap_space().
+        """
+        import random
+
+        rng = random.Random(roster_size)
+        players = [{'id': i, 'name': f'Player {i}', 'wara': round(rng.uniform(0, 4), 2)} for i in range(roster_size)]
+        roster = {'active': {'players': players, 'WARa': sum(p['wara'] for p in players)}}
+        team = {'abbrev': 'TST', 'salary_cap': 30.0}
+        state = DraftCapState(roster, team)
+
+        for new_player_wara in [0.0, 0.5, 1.37, 2.0, 3.99, 6.5]:
+            expected = await validate_cap_space(roster, new_player_wara, team)
+            is_valid, projected_total, cap_limit = state.check(new_player_wara)
+            assert (is_valid, cap_limit) == (expected[0], expected[2])
+            assert projected_total == pytest.approx(expected[1])
+
+    def test_invalid_roster_structure(self):
+        """Should raise ValueError like validate_cap_space()."""
+        with pytest.raises(ValueError, match="Invalid roster structure"):
+            DraftCapState({'shortil': {}})
+
+
 class TestValidateCapSpaceRealTeamModel:
     """Integration tests using the actual Team Pydantic model."""
 
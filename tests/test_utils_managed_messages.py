@@ -0,0 +1,113 @@
+"""
+Tests for ManagedMessageTracker
+
+Covers in-place edits of changed messages only, creating/deleting messages
+when the message count changes, persistence, and the first-run history cleanup.
+"""
+import discord
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from utils.managed_messages import ManagedMessageTracker
+
+
+def make_embed(title: str) -> discord.Embed:
+    return discord.Embed(title=title, description=f"{title} description")
+
+
+class FakeChannel:
+    """Text channel that records sends, edits and deletes of its messages."""
+
+    def __init__(self, channel_id: int = 1, history=()):
+        self.id = channel_id
+        self._history = list(history)
+        self._next_id = 100
+        self.messages = {}
+        self.sent = []
+        self.edited = []
+        self.deleted = []
+
+    async def send(self, embeds):
+        self._next_id += 1
+        self.messages[self._next_id] = embeds
+        self.sent.append(self._next_id)
+        return MagicMock(id=self._next_id)
+
+    def get_partial_message(self, message_id):
+        async def edit(embeds):
+            if message_id not in self.messages:
+                raise discord.NotFound(MagicMock(status=404), "Unknown Message")
+            self.messages[message_id] = embeds
+            self.edited.append(message_id)
+
+        async def delete():
+            if self.messages.pop(message_id, None) is None:
+                raise discord.NotFound(MagicMock(status=404), "Unknown Message")
+            self.deleted.append(message_id)
+
+        return MagicMock(edit=AsyncMock(side_effect=edit), delete=AsyncMock(side_effect=delete))
+
+    async def history(self, limit):
+        for message in self._history[:limit]:
+            yield message
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return ManagedMessageTracker(str(tmp_path / "managed_messages.json"))
+
+
+class TestManagedMessageTracker:
+    """Test suite for ManagedMessageTracker.sync/clear."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_message_is_edited(self, tracker):
+        channel = FakeChannel()
+        embeds = [make_embed(f"Game {i}") for i in range(12)]
+        assert await tracker.sync(channel, embeds) == {'edited': 0, 'created': 2, 'deleted': 0, 'unchanged': 0}
+
+        # Same content again: nothing touched
+        assert await tracker.sync(channel, [make_embed(f"Game {i}") for i in range(12)]) == \
+            {'edited': 0, 'created': 0, 'deleted': 0, 'unchanged': 2}
+
+        embeds[11] = make_embed("Game 11 - run scores")
+        assert await tracker.sync(channel, embeds) == {'edited': 1, 'created': 0, 'deleted': 0, 'unchanged': 1}
+        assert channel.edited == [channel.sent[1]]
+
+    @pytest.mark.asyncio
+    async def test_fewer_games_deletes_surplus_and_clear_removes_rest(self, tracker):
+        channel = FakeChannel()
+        await tracker.sync(channel, [make_embed(f"Game {i}") for i in range(11)])
+
+        counts = await tracker.sync(channel, [make_embed(f"Game {i}") for i in range(10)])
+
+        assert counts == {'edited': 0, 'created': 0, 'deleted': 1, 'unchanged': 1}
+        assert channel.deleted == [channel.sent[1]]
+        assert await tracker.clear(channel) == 1
+        assert channel.messages == {}
+        assert tracker.get_messages(channel.id) == []
+
+    @pytest.mark.asyncio
+    async def test_persisted_ids_survive_restart_and_missing_message_is_replaced(self, tracker):
+        channel = FakeChannel()
+        await tracker.sync(channel, [make_embed("Game 1")])
+
+        restarted = ManagedMessageTracker(str(tracker.data_file))
+        assert restarted.get_messages(channel.id) == tracker.get_messages(channel.id)
+
+        # Someone deleted the message by hand
+        channel.messages.clear()
+        counts = await restarted.sync(channel, [make_embed("Game 1 - final")])
+
+        assert counts['created'] == 1
+        assert restarted.get_messages(channel.id)[0]["id"] == channel.sent[-1]
+
+    @pytest.mark.asyncio
+    async def test_untracked_history_is_cleared_once(self, tracker):
+        old_message = MagicMock(delete=AsyncMock())
+        channel = FakeChannel(history=[old_message])
+
+        await tracker.sync(channel, [make_embed("Game 1")])
+        await tracker.sync(channel, [make_embed("Game 1")])
+
+        old_message.delete.assert_awaited_once()
@@ -0,0 +1,78 @@
+"""
+Tests for ScorebugPollSchedule
+
+Covers per-game back-off for unchanged games, faster polling for late close
+games, the global read budget, and final games dropping out.
+"""
+from config import get_config
+from services.scorebug_service import ScorebugData
+from utils.scorebug_schedule import ScorebugPollSchedule
+
+SHEET = "sheet-key"
+
+
+def make_scorebug(**data) -> ScorebugData:
+    return ScorebugData({'away_score': 1, 'home_score': 2, 'inning': 3, 'win_percentage': 80.0, **data})
+
+
+def make_schedule(clock, sheets=(SHEET,)):
+    schedule = ScorebugPollSchedule(clock=clock)
+    schedule.retain(sheets)
+    return schedule
+
+
+class TestScorebugPollSchedule:
+    """Test suite for ScorebugPollSchedule."""
+
+    def test_unchanged_game_backs_off(self, clock):
+        schedule = make_schedule(clock)
+        assert schedule.is_due(SHEET)
+
+        schedule.record(SHEET, make_scorebug())
+        first = schedule.interval(SHEET)
+        schedule.record(SHEET, make_scorebug())
+        schedule.record(SHEET, make_scorebug())
+
+        assert first == get_config().scorebug_poll_base_interval * 0.75
+        assert schedule.interval(SHEET) > first
+        clock.now = schedule.interval(SHEET) - 1
+        assert not schedule.is_due(SHEET)
+        clock.now += 1
+        assert schedule.is_due(SHEET)
+
+        # A change resets the back-off
+        schedule.record(SHEET, make_scorebug(home_score=3))
+        assert schedule.interval(SHEET) == first
+
+    def test_late_close_game_polls_faster_within_floor(self, clock):
+        schedule = make_schedule(clock, sheets=('blowout', 'close'))
+
+        schedule.record('blowout', make_scorebug(inning=8, win_percentage=95.0))
+        schedule.record('close', make_scorebug(inning=8, win_percentage=50.0))
+
+        assert schedule.interval('close') < schedule.interval('blowout')
+        assert schedule.interval('close') >= get_config().scorebug_poll_min_interval
+
+    def test_budget_stretches_every_interval(self, clock):
+        config = get_config()
+        config.scorebug_poll_budget = 2.0
+        schedule = make_schedule(clock, sheets=[f"sheet-{i}" for i in range(8)])
+
+        # 8 games at the base interval want 8 * 60 / 180 reads per minute
+        demand = 8 * 60 / config.scorebug_poll_base_interval
+        assert schedule.budget_scale() == demand / 2.0
+        assert schedule.interval('sheet-0') == config.scorebug_poll_base_interval * demand / 2.0
+
+    def test_final_game_drops_out_and_unpublished_is_forgotten(self, clock):
+        schedule = make_schedule(clock, sheets=(SHEET, 'other'))
+
+        schedule.record(SHEET, make_scorebug(is_final=True))
+
+        assert schedule.is_finished(SHEET)
+        assert not schedule.is_due(SHEET)
+        assert schedule.interval(SHEET) is None
+
+        schedule.retain(['other'])
+        assert not schedule.is_finished(SHEET)
+        schedule.retain([SHEET])
+        assert schedule.is_due(SHEET)
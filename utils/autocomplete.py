@@ -8,6 +8,7 @@ import discord
 from discord import app_commands
 
 from config import get_config
+from services.player_index import player_index
 from services.player_service import player_service
 from services.team_service import team_service
 from utils.team_utils import get_user_major_league_team
@@ -36,8 +37,12 @@ async def player_autocomplete(
         # Get user's team for prioritization
         user_team = await get_user_major_league_team(interaction.user.id)
 
-        # Search for players using the search endpoint
-        players = await player_service.search_players(current, limit=50, season=get_config().sba_season)
+        # Resolve locally from the player index; fall back to the search endpoint
+        season = get_config().sba_season
+        if player_index.is_ready(season):
+            players = player_index.search(current, limit=50)
+        else:
+            players = await player_service.search_players(current, limit=50, season=season)
 
         # Separate players by team (user's team vs others)
         user_team_players = []
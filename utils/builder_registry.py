@@ -0,0 +1,200 @@
+"""
+Builder registry for Discord Bot v2.0
+
+Bounded in-process store for interactive builder sessions (/dropadd, /ilmove,
+/trade). A session nobody has touched for `idle_ttl` seconds is evicted, and
+when the registry holds more than `max_entries` sessions or more than
+`max_bytes` (approximate) the least recently used sessions go first. Sessions
+the owner marks as pinned (e.g. a trade waiting on another GM) never expire
+from idleness and are the last to go for capacity. Eviction callbacks let the
+owner clean up whatever hangs off a session, such as the trade team index or a
+trade's discussion channel.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(f'{__name__}.BuilderRegistry')
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+# Called with (key, builder, reason) after a session is evicted
+EvictionCallback = Callable[[K, V, str], None]
+
+
+class BuilderRegistry(Generic[K, V]):
+    """LRU registry of builder sessions with idle expiry and a size ceiling."""
+
+    def __init__(
+        self,
+        name: str,
+        idle_ttl: float,
+        max_entries: int,
+        max_bytes: int,
+        sizer: Callable[[V], int],
+        clock: Callable[[], float] = time.monotonic,
+        pinned: Optional[Callable[[V], bool]] = None
+    ):
+        """
+        Initialize an empty registry.
+
+        Args:
+            name: Name used in log messages
+            idle_ttl: Seconds a session may go untouched before it is evicted
+            max_entries: Maximum sessions held
+            max_bytes: Approximate memory ceiling across all sessions
+            sizer: Returns a session's approximate size in bytes
+            clock: Monotonic clock (injectable for tests)
+            pinned: Returns True for sessions exempt from idle expiry
+        """
+        self.name = name
+        self.idle_ttl = idle_ttl
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self._sizer = sizer
+        self._clock = clock
+        self._pinned = pinned
+        # key -> (builder, last used, approximate bytes); least recently used first
+        self._entries: 'OrderedDict[K, Tuple[V, float, int]]' = OrderedDict()
+        self._bytes = 0
+        self._callbacks: List[EvictionCallback] = []
+        self.evictions = 0
+
+    def add_eviction_callback(self, callback: EvictionCallback) -> None:
+        """Register a callback run after each eviction."""
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def remove_eviction_callback(self, callback: EvictionCallback) -> None:
+        """Unregister an eviction callback."""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a session and mark it as used."""
+        self.sweep()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._store(key, entry[0])
+        return entry[0]
+
+    def set(self, key: K, builder: V) -> None:
+        """Store a session, evicting others if the registry is over its limits."""
+        self.sweep()
+        self._store(key, builder)
+        self._enforce_limits()
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove a session its owner is done with (no eviction callbacks)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._bytes -= entry[2]
+        return entry[0]
+
+    def sweep(self) -> int:
+        """
+        Evict every unpinned session idle for longer than the TTL.
+
+        Returns:
+            Number of sessions evicted
+        """
+        cutoff = self._clock() - self.idle_ttl
+        expired = []
+        # Entries are ordered by last use, so expired sessions are at the front
+        for key, (builder, last_used, _) in self._entries.items():
+            if last_used > cutoff:
+                break
+            if not self._is_pinned(key, builder):
+                expired.append(key)
+        for key in expired:
+            self._evict(key, 'idle')
+        return len(expired)
+
+    def clear(self) -> None:
+        """Forget every session without running callbacks."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def items(self) -> List[Tuple[K, V]]:
+        """Snapshot of (key, session) pairs, least recently used first."""
+        return [(key, entry[0]) for key, entry in self._entries.items()]
+
+    def values(self) -> List[V]:
+        """Snapshot of the sessions, least recently used first."""
+        return [entry[0] for entry in self._entries.values()]
+
+    @property
+    def approx_bytes(self) -> int:
+        """Approximate memory held by all sessions, as of their last use."""
+        return self._bytes
+
+    def stats(self) -> Dict[str, int]:
+        """Live session count, approximate bytes held, limits and eviction count."""
+        return {
+            'live': len(self._entries),
+            'approx_bytes': self._bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions
+        }
+
+    def __contains__(self, key: K) -> bool:
+        self.sweep()
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: K, builder: V) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[2]
+        try:
+            size = max(0, int(self._sizer(builder)))
+        except Exception as e:
+            logger.warning(f"Could not size {self.name} session {key}: {e}")
+            size = 0
+        self._entries[key] = (builder, self._clock(), size)
+        self._bytes += size
+
+    def _is_pinned(self, key: K, builder: V) -> bool:
+        if self._pinned is None:
+            return False
+        try:
+            return bool(self._pinned(builder))
+        except Exception as e:
+            logger.warning(f"Could not check whether {self.name} session {key} is pinned: {e}")
+            return False
+
+    def _eviction_candidate(self) -> K:
+        """Least recently used unpinned session, else the least recently used one (never the newest)."""
+        for key in list(self._entries)[:-1]:
+            if not self._is_pinned(key, self._entries[key][0]):
+                return key
+        return next(iter(self._entries))
+
+    def _enforce_limits(self) -> None:
+        # The most recently used session is always kept, even if it alone exceeds max_bytes
+        while len(self._entries) > self.max_entries:
+            self._evict(self._eviction_candidate(), 'capacity')
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            self._evict(self._eviction_candidate(), 'memory')
+
+    def _evict(self, key: K, reason: str) -> None:
+        builder = self.pop(key)
+        if builder is None:
+            return
+        self.evictions += 1
+        logger.info(
+            f"Evicted {self.name} session {key} ({reason}); "
+            f"{len(self._entries)} live, ~{self._bytes // 1024} KiB held"
+        )
+        for callback in list(self._callbacks):
+            try:
+                callback(key, builder, reason)
+            except Exception as e:
+                logger.error(f"{self.name} eviction callback failed for {key}: {e}")
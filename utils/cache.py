@@ -1,10 +1,24 @@
 """
 Redis caching utilities for Discord Bot v2.0
 
-Provides optional Redis caching functionality for API responses.
+Provides a two-tier cache for API responses: an optional bounded in-process
+LRU (L1) holding already-constructed objects, in front of optional Redis (L2)
+holding JSON-serialized data. The L1 tier follows Redis (on whenever
+`redis_url` is set) unless `cache_local_enabled` says otherwise; with neither
+tier configured nothing is cached.
+
+L1 hands out the cached objects themselves, so a hit costs a dict lookup.
+They are shared between callers and must be treated as read-only; copy one
+(`model_copy`) before changing it.
+
+Entries can be registered under tags (e.g. 'team:42', 'season:13') so writes
+invalidate exactly the entries they affect. In Redis each tag is a set of
+cache keys stored at 'sba:tag:{tag}'.
 """
 import logging
-from typing import Optional, Any
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Callable, Dict, Iterable, List, Set, Tuple
 import json
 
 try:
@@ -21,6 +35,15 @@ logger = logging.getLogger(f'{__name__}.CacheUtils')
 # Global Redis client instance
 _redis_client: Optional['redis.Redis'] = None
 
+# Global in-process (L1) cache instance
+_local_cache: Optional['LocalCache'] = None
+
+# Tag sets outlive the entries they index; stale members are harmless on delete
+TAG_TTL = 24 * 60 * 60
+
+# Keys per SCAN page / DEL batch during prefix sweeps
+SCAN_BATCH_SIZE = 500
+
 
 async def get_redis_client() -> Optional['redis.Redis']:
     """
@@ -73,21 +96,202 @@ async def close_redis_client() -> None:
             _redis_client = None
 
 
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-key TTL.
+
+    Holds Python objects as-is (no serialization or copying), so a hit costs a
+    dict lookup. Cached objects are shared and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int = 2048, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize local cache.
+
+        Args:
+            max_entries: Maximum number of keys held before least-recently-used eviction
+            clock: Monotonic clock used for expiry (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Tuple[str, ...]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached object.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached object or None if missing/expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float, tags: Iterable[str] = ()) -> None:
+        """
+        Cache an object.
+
+        Args:
+            key: Cache key
+            value: Object to hold
+            ttl: Seconds until the entry expires
+            tags: Tags the entry is registered under for invalidation
+        """
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        self._remove(key)
+        self._entries[key] = (self._clock() + ttl, value)
+
+        tags = tuple(tags)
+        if tags:
+            self._key_tags[key] = tags
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def update(self, key: str, value: Any) -> bool:
+        """
+        Replace a live entry's object, keeping its expiry and tags.
+
+        Returns:
+            True if the key was present (and not expired)
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return False
+        self._entries[key] = (entry[0], value)
+        return True
+
+    def _remove(self, key: str) -> bool:
+        """Remove a key and its tag registrations. Returns True if it was present."""
+        present = self._entries.pop(key, None) is not None
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+        return present
+
+    def delete(self, key: str) -> bool:
+        """Remove a key. Returns True if it was present."""
+        return self._remove(key)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove all keys starting with prefix. Returns number removed."""
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def delete_tags(self, tags: Iterable[str]) -> int:
+        """Remove every key registered under any of the tags. Returns number removed."""
+        keys = set()
+        for tag in tags:
+            keys.update(self._tag_index.get(tag, ()))
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self._tag_index.clear()
+        self._key_tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current size."""
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+def get_local_cache() -> Optional[LocalCache]:
+    """
+    Get the shared in-process cache if enabled.
+
+    `cache_local_enabled` turns the tier on or off explicitly; left unset, it
+    is on whenever Redis is configured.
+
+    Returns:
+        LocalCache instance or None if the in-process tier is off
+    """
+    global _local_cache
+
+    config = get_config()
+    enabled = config.cache_local_enabled
+    if enabled is None:
+        enabled = bool(config.redis_url)
+    if not enabled:
+        return None
+
+    if _local_cache is None:
+        _local_cache = LocalCache(max_entries=config.cache_local_max_entries)
+    return _local_cache
+
+
+def clear_local_cache() -> None:
+    """Drop every entry from the shared in-process cache."""
+    if _local_cache is not None:
+        _local_cache.clear()
+
+
 class CacheManager:
     """
-    Manager for Redis caching operations with fallback to no-cache behavior.
+    Manager for two-tier caching operations with fallback to no-cache behavior.
+
+    L1 (get_local/set_local) holds constructed objects in-process; L2
+    (get/set) holds JSON in Redis. delete() and clear_prefix() invalidate both.
     """
     
-    def __init__(self, redis_client: Optional['redis.Redis'] = None, ttl: int = 300):
+    def __init__(
+        self,
+        redis_client: Optional['redis.Redis'] = None,
+        ttl: int = 300,
+        local_cache: Optional[LocalCache] = None
+    ):
         """
         Initialize cache manager.
         
         Args:
             redis_client: Optional Redis client (will auto-connect if None)
             ttl: Time-to-live for cached items in seconds
+            local_cache: Optional L1 cache (uses the shared instance if None)
         """
         self.redis_client = redis_client
         self.ttl = ttl
+        self._local_cache = local_cache
         
     async def _get_client(self) -> Optional['redis.Redis']:
         """Get Redis client, initializing if needed."""
@@ -95,6 +299,57 @@ class CacheManager:
             self.redis_client = await get_redis_client()
         return self.redis_client
         
+    @property
+    def local(self) -> Optional[LocalCache]:
+        """L1 cache, or None if the in-process tier is disabled."""
+        if self._local_cache is not None:
+            return self._local_cache
+        return get_local_cache()
+
+    def get_local(self, key: str) -> Optional[Any]:
+        """
+        Get an already-constructed object from the in-process tier.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached object (shared; don't mutate it), or None if not held locally.
+            Lists come back as a new list of the shared items, so callers may
+            sort or extend them.
+        """
+        local = self.local
+        if local is None:
+            return None
+
+        value = local.get(key)
+        if value is None:
+            return None
+        logger.debug(f"L1 cache hit: {key}")
+        return list(value) if isinstance(value, list) else value
+
+    def set_local(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = ()
+    ) -> None:
+        """
+        Hold an object in the in-process tier.
+
+        Args:
+            key: Cache key
+            value: Object to hold (not copied; the caller must not mutate it afterwards)
+            ttl: Time-to-live override (uses default if None); pass the
+                 remaining Redis TTL when promoting from L2 so both tiers expire together
+            tags: Tags the entry is registered under for invalidation
+        """
+        local = self.local
+        if local is None or value is None:
+            return
+        local.set(key, list(value) if isinstance(value, list) else value, ttl or self.ttl, tags)
+
     def cache_key(self, prefix: str, identifier: str) -> str:
         """
         Generate standardized cache key.
@@ -107,6 +362,10 @@ class CacheManager:
             Formatted cache key
         """
         return f"{prefix}:{identifier}"
+
+    def tag_key(self, tag: str) -> str:
+        """Redis key of the set indexing every cache key registered under a tag."""
+        return f"sba:tag:{tag}"
         
     async def get(self, key: str) -> Optional[Any]:
         """
@@ -133,8 +392,42 @@ class CacheManager:
             
         logger.debug(f"Cache miss: {key}")
         return None
+
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[int]]:
+        """
+        Get cached data together with its remaining Redis TTL in one round trip.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (cached data or None, remaining TTL in seconds or None)
+        """
+        client = await self._get_client()
+        if not client:
+            return None, None
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.ttl(key)
+            cached, remaining = await pipe.execute()
+            if cached:
+                logger.debug(f"Cache hit: {key}")
+                return json.loads(cached), (remaining if remaining and remaining > 0 else None)
+        except Exception as e:
+            logger.warning(f"Cache read error for {key}: {e}")
+
+        logger.debug(f"Cache miss: {key}")
+        return None, None
         
-    async def set(self, key: str, data: Any, ttl: Optional[int] = None) -> None:
+    async def set(
+        self,
+        key: str,
+        data: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = ()
+    ) -> None:
         """
         Set cached data.
 
@@ -142,6 +435,7 @@ class CacheManager:
             key: Cache key
             data: Data to cache (any JSON-serializable type: dict, list, str, int, bool, None)
             ttl: Time-to-live override (uses default if None)
+            tags: Tags to register the key under (see invalidate_tags)
         """
         client = await self._get_client()
         if not client:
@@ -150,8 +444,19 @@ class CacheManager:
         try:
             cache_ttl = ttl or self.ttl
             serialized = json.dumps(data)
-            await client.setex(key, cache_ttl, serialized)
-            logger.debug(f"Cached: {key} (TTL: {cache_ttl}s)")
+            tags = tuple(tags)
+            if tags:
+                # Value and tag registrations go out in one round trip
+                pipe = client.pipeline(transaction=False)
+                pipe.setex(key, cache_ttl, serialized)
+                for tag in tags:
+                    tag_key = self.tag_key(tag)
+                    pipe.sadd(tag_key, key)
+                    pipe.expire(tag_key, max(cache_ttl, TAG_TTL))
+                await pipe.execute()
+            else:
+                await client.setex(key, cache_ttl, serialized)
+            logger.debug(f"Cached: {key} (TTL: {cache_ttl}s, tags: {list(tags)})")
         except Exception as e:
             logger.warning(f"Cache write error for {key}: {e}")
             
@@ -162,6 +467,9 @@ class CacheManager:
         Args:
             key: Cache key to delete
         """
+        if self.local is not None:
+            self.local.delete(key)
+
         client = await self._get_client()
         if not client:
             return
@@ -172,9 +480,58 @@ class CacheManager:
         except Exception as e:
             logger.warning(f"Cache delete error for {key}: {e}")
             
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every cache entry registered under any of the given tags.
+
+        Args:
+            tags: Tags to invalidate (e.g. 'team:42', 'owner:1234')
+
+        Returns:
+            Number of Redis keys deleted
+        """
+        if not tags:
+            return 0
+
+        if self.local is not None:
+            self.local.delete_tags(tags)
+
+        client = await self._get_client()
+        if not client:
+            return 0
+
+        try:
+            tag_keys = [self.tag_key(tag) for tag in tags]
+            pipe = client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            member_sets = await pipe.execute()
+
+            keys: Set[Any] = set()
+            for members in member_sets:
+                keys.update(members or ())
+
+            # Entries and their tag sets are removed in one round trip
+            pipe = client.pipeline(transaction=False)
+            if keys:
+                pipe.delete(*keys)
+            pipe.delete(*tag_keys)
+            results = await pipe.execute()
+
+            deleted = results[0] if keys else 0
+            if deleted:
+                logger.info(f"Invalidated {deleted} cache keys for tags {list(tags)}")
+            return deleted
+        except Exception as e:
+            logger.warning(f"Cache tag invalidation error for {list(tags)}: {e}")
+
+        return 0
+
     async def clear_prefix(self, prefix: str) -> int:
         """
         Clear all cache keys with given prefix.
+
+        Uses incremental SCAN rather than KEYS so large keyspaces never block Redis.
         
         Args:
             prefix: Cache key prefix to clear
@@ -182,17 +539,28 @@ class CacheManager:
         Returns:
             Number of keys deleted
         """
+        if self.local is not None:
+            self.local.delete_prefix(f"{prefix}:")
+
         client = await self._get_client()
         if not client:
             return 0
             
         try:
             pattern = f"{prefix}:*"
-            keys = await client.keys(pattern)
-            if keys:
-                deleted = await client.delete(*keys)
+            deleted = 0
+            batch: List[Any] = []
+            async for key in client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    deleted += await client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += await client.delete(*batch)
+
+            if deleted:
                 logger.info(f"Cleared {deleted} cache keys with prefix '{prefix}'")
-                return deleted
+            return deleted
         except Exception as e:
             logger.warning(f"Cache clear error for prefix {prefix}: {e}")
             
@@ -0,0 +1,155 @@
+"""
+Cache warm-up for Discord Bot v2.0
+
+Preloads the data most interactions (and autocomplete in particular) need right
+after a restart, so the first users don't pay cold-cache latency. Loaders run
+concurrently under a time budget; anything still running when the budget
+expires keeps going in the background and fills the cache when it lands.
+Steps that only fill the API cache are skipped when no cache tier is enabled.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(f'{__name__}.CacheWarmup')
+
+WarmupLoader = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class WarmupReport:
+    """Outcome of a warm-up run."""
+    budget: float
+    duration: float = 0.0
+    step_durations: Dict[str, float] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    pending: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def total_steps(self) -> int:
+        return len(self.step_durations) + len(self.errors) + len(self.pending) + len(self.skipped)
+
+    @property
+    def completed(self) -> int:
+        return len(self.step_durations)
+
+    def summary(self) -> str:
+        """One-line description for logs and /health."""
+        text = f"{self.completed}/{self.total_steps} loaded in {self.duration:.2f}s"
+        if self.errors:
+            text += f", failed: {', '.join(sorted(self.errors))}"
+        if self.pending:
+            text += f", over budget: {', '.join(self.pending)}"
+        if self.skipped:
+            text += f", skipped (no cache): {', '.join(self.skipped)}"
+        return text
+
+
+def default_warmup_loaders(season: int) -> Dict[str, Optional[WarmupLoader]]:
+    """
+    Get the standard warm-up loaders for a season.
+
+    Args:
+        season: Season to preload
+
+    Returns:
+        Mapping of step name to zero-argument loader (None for a skipped step)
+    """
+    from config import get_config
+    from services.league_service import league_service
+    from services.organization_registry import organization_registry
+    from services.player_index import player_index
+    from services.standings_service import standings_service
+    from utils.cache import REDIS_AVAILABLE, get_local_cache
+
+    # Standings are only kept in the API cache; without one, loading them is wasted
+    cache_enabled = (REDIS_AVAILABLE and bool(get_config().redis_url)) or get_local_cache() is not None
+
+    return {
+        'current': league_service.get_current_state,
+        # Loads the season's teams into the cache and builds the organization registry
+        'teams': lambda: organization_registry.refresh(season),
+        'standings': (lambda: standings_service.get_league_standings(season)) if cache_enabled else None,
+        # Loads the season player list into the cache and builds the name index
+        'players': lambda: player_index.load(season),
+    }
+
+
+async def warm_caches(
+    loaders: Dict[str, Optional[WarmupLoader]],
+    budget: float,
+    clock: Callable[[], float] = time.monotonic
+) -> WarmupReport:
+    """
+    Run warm-up loaders concurrently within a time budget.
+
+    Args:
+        loaders: Mapping of step name to zero-argument loader (None marks a skipped step)
+        budget: Seconds to wait before giving up on outstanding loaders
+        clock: Monotonic clock (injectable for tests)
+
+    Returns:
+        WarmupReport describing which steps finished, failed or ran over budget
+    """
+    report = WarmupReport(budget=budget)
+    report.skipped = [name for name, loader in loaders.items() if loader is None]
+    loaders = {name: loader for name, loader in loaders.items() if loader is not None}
+    started = clock()
+    total = len(loaders)
+    finished = False
+
+    async def run_step(name: str, loader: WarmupLoader) -> str:
+        step_started = clock()
+        try:
+            result = await loader()
+        except Exception as e:
+            if not finished:
+                report.errors[name] = str(e)
+            logger.warning(f"Cache warm-up step '{name}' failed: {e}")
+            return name
+
+        elapsed = clock() - step_started
+        if finished:
+            logger.info(f"Cache warm-up: {name} finished in background ({elapsed * 1000:.0f}ms)")
+            return name
+
+        report.step_durations[name] = elapsed
+        if isinstance(result, (list, dict)):
+            size = f", {len(result)} items"
+        elif isinstance(result, int):
+            size = f", {result} items"
+        else:
+            size = ""
+        logger.info(
+            f"Cache warm-up {len(report.step_durations) + len(report.errors)}/{total}: "
+            f"{name} ({elapsed * 1000:.0f}ms{size})"
+        )
+        return name
+
+    tasks = {asyncio.ensure_future(run_step(name, loader)): name for name, loader in loaders.items()}
+    pending = set(tasks)
+    logger.info(f"Cache warm-up started: {', '.join(loaders)} (budget {budget:.1f}s)")
+    if report.skipped:
+        logger.info(f"Cache warm-up skipping (no cache enabled): {', '.join(report.skipped)}")
+
+    while pending:
+        remaining = budget - (clock() - started)
+        if remaining <= 0:
+            break
+        _, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+
+    finished = True
+    report.duration = clock() - started
+    report.pending = [tasks[task] for task in tasks if task in pending]
+
+    if report.pending:
+        # Leave them running - their results still populate the cache
+        logger.warning(
+            f"Cache warm-up budget of {budget:.1f}s exhausted; "
+            f"continuing in background: {', '.join(report.pending)}"
+        )
+    logger.info(f"Cache warm-up finished: {report.summary()}")
+    return report
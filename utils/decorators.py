@@ -8,7 +8,7 @@ particularly for logging, error handling, and caching.
 import inspect
 import logging
 from functools import wraps
-from typing import List, Optional, Callable, Any
+from typing import List, Optional, Callable, Any, Dict, Sequence
 from utils.logging import set_discord_context, get_contextual_logger
 
 cache_logger = logging.getLogger(f'{__name__}.CacheDecorators')
@@ -179,7 +179,42 @@ def requires_draft_period(func):
     return wrapper
 
 
-def cached_api_call(ttl: Optional[int] = None, cache_key_suffix: str = ""):
+def _render_cache_tags(templates: Sequence[str], arguments: Dict[str, Any], result: Any = None) -> List[str]:
+    """
+    Render cache tag templates against a call's arguments and result.
+
+    Templates are str.format patterns over the method's parameters plus
+    'result' (e.g. "team:{team_id}", "team:{result.id}"). A template using
+    '{item...}' yields one tag per element of a list result (e.g. "team:{item.id}").
+    Templates referencing a None argument or attribute are skipped.
+    """
+    tags = []
+    for template in templates:
+        try:
+            if '{item' in template:
+                items = result if isinstance(result, list) else []
+                rendered = [template.format(**arguments, item=item) for item in items]
+            else:
+                rendered = [template.format(**arguments, result=result)]
+        except (AttributeError, KeyError, IndexError) as e:
+            cache_logger.debug(f"Skipping cache tag '{template}': {e}")
+            continue
+        tags.extend(tag for tag in rendered if 'None' not in tag.split(':'))
+    return tags
+
+
+def _call_arguments(func: Callable, self, args, kwargs) -> Dict[str, Any]:
+    """Bind a method call's arguments (with defaults), excluding self."""
+    bound_args = inspect.signature(func).bind(self, *args, **kwargs)
+    bound_args.apply_defaults()
+    return {name: value for name, value in bound_args.arguments.items() if name != 'self'}
+
+
+def cached_api_call(
+    ttl: Optional[int] = None,
+    cache_key_suffix: str = "",
+    tags: Sequence[str] = ()
+):
     """
     Decorator to add Redis caching to service methods that return List[T].
     
@@ -192,9 +227,10 @@ def cached_api_call(ttl: Optional[int] = None, cache_key_suffix: str = ""):
     Args:
         ttl: Time-to-live override in seconds (uses service default if None)
         cache_key_suffix: Additional suffix for cache key differentiation
+        tags: Cache tag templates the entry is registered under (see cache_invalidate)
         
     Usage:
-        @cached_api_call(ttl=600, cache_key_suffix="by_season")
+        @cached_api_call(ttl=600, tags=("season:{season}", "team:{item.id}"))
         async def get_teams_by_season(self, season: int) -> List[Team]:
             # Original method implementation
             
@@ -230,7 +266,10 @@ def cached_api_call(ttl: Optional[int] = None, cache_key_suffix: str = ""):
             
             # Try to get from cache
             if hasattr(self, '_get_cached_items'):
-                cached_result = await self._get_cached_items(cache_key)
+                cached_result = await self._get_cached_items(
+                    cache_key,
+                    lambda items: _render_cache_tags(tags, _call_arguments(func, self, args, kwargs), items)
+                )
                 if cached_result is not None:
                     cache_logger.debug(f"Cache hit: {method_name}")
                     return cached_result
@@ -241,7 +280,8 @@ def cached_api_call(ttl: Optional[int] = None, cache_key_suffix: str = ""):
             
             # Cache the result if we have items and caching methods
             if result and hasattr(self, '_cache_items'):
-                await self._cache_items(cache_key, result, ttl)
+                entry_tags = _render_cache_tags(tags, _call_arguments(func, self, args, kwargs), result)
+                await self._cache_items(cache_key, result, ttl, entry_tags)
                 cache_logger.debug(f"Cached {len(result)} items for {method_name}")
             
             return result
@@ -250,18 +290,25 @@ def cached_api_call(ttl: Optional[int] = None, cache_key_suffix: str = ""):
     return decorator
 
 
-def cached_single_item(ttl: Optional[int] = None, cache_key_suffix: str = ""):
+def cached_single_item(
+    ttl: Optional[int] = None,
+    cache_key_suffix: str = "",
+    tags: Sequence[str] = ()
+):
     """
     Decorator to add Redis caching to service methods that return Optional[T].
     
     Similar to cached_api_call but for methods returning a single model instance.
+    The constructed model is also held in the in-process L1 tier, so repeated
+    lookups skip both the Redis round trip and model validation.
     
     Args:
         ttl: Time-to-live override in seconds
         cache_key_suffix: Additional suffix for cache key differentiation
+        tags: Cache tag templates the entry is registered under (see cache_invalidate)
         
     Usage:
-        @cached_single_item(ttl=300, cache_key_suffix="by_id")
+        @cached_single_item(ttl=300, tags=("player:{player_id}",))
         async def get_player(self, player_id: int) -> Optional[Player]:
             # Original method implementation
     """
@@ -286,12 +333,21 @@ def cached_single_item(ttl: Optional[int] = None, cache_key_suffix: str = ""):
             
             cache_key = self._generate_cache_key(method_name, params)
             
-            # Try cache first
+            # L1: already-constructed model held in-process
+            local_item = self.cache.get_local(cache_key)
+            if local_item is not None:
+                return local_item
+            
+            # L2: Redis
             try:
-                cached_data = await self.cache.get(cache_key)
+                cached_data, remaining_ttl = await self.cache.get_with_ttl(cache_key)
                 if cached_data:
                     cache_logger.debug(f"Cache hit: {method_name}")
-                    return self.model_class.from_api_data(cached_data)
+                    model = self.model_class.from_api_data(cached_data)
+                    # Promote to L1 so it expires together with the Redis entry
+                    entry_tags = _render_cache_tags(tags, _call_arguments(func, self, args, kwargs), model)
+                    self.cache.set_local(cache_key, model, remaining_ttl, entry_tags)
+                    return model
             except Exception as e:
                 cache_logger.warning(f"Error reading single item cache for {cache_key}: {e}")
             
@@ -299,11 +355,13 @@ def cached_single_item(ttl: Optional[int] = None, cache_key_suffix: str = ""):
             cache_logger.debug(f"Cache miss: {method_name}")
             result = await func(self, *args, **kwargs)
             
-            # Cache the single result
+            # Cache the single result in both tiers
             if result:
+                entry_tags = _render_cache_tags(tags, _call_arguments(func, self, args, kwargs), result)
+                self.cache.set_local(cache_key, result, ttl, entry_tags)
                 try:
                     cache_data = result.model_dump()
-                    await self.cache.set(cache_key, cache_data, ttl)
+                    await self.cache.set(cache_key, cache_data, ttl, entry_tags)
                     cache_logger.debug(f"Cached single item for {method_name}")
                 except Exception as e:
                     cache_logger.warning(f"Error caching single item for {cache_key}: {e}")
@@ -314,15 +372,19 @@ def cached_single_item(ttl: Optional[int] = None, cache_key_suffix: str = ""):
     return decorator
 
 
-def cache_invalidate(*cache_patterns: str):
+def cache_invalidate(*tag_templates: str):
     """
     Decorator to invalidate cache entries when data is modified.
     
+    Each template is rendered against the call's arguments and result (same
+    syntax as the `tags` argument of cached_api_call/cached_single_item), and
+    every entry registered under a rendered tag is dropped from both cache tiers.
+    
     Args:
-        cache_patterns: Cache key patterns to invalidate (supports prefix matching)
+        tag_templates: Cache tag templates to invalidate
         
     Usage:
-        @cache_invalidate("players_by_team", "teams_by_season")
+        @cache_invalidate("player:{player_id}")
         async def update_player(self, player_id: int, updates: dict) -> Optional[Player]:
             # Original method implementation
     """
@@ -332,17 +394,17 @@ def cache_invalidate(*cache_patterns: str):
             # Execute original method first
             result = await func(self, *args, **kwargs)
             
-            # Invalidate specified cache patterns
+            # Invalidate entries registered under the rendered tags
             if hasattr(self, 'cache'):
-                for pattern in cache_patterns:
-                    try:
-                        cleared = await self.cache.clear_prefix(f"sba:{self.endpoint}_{pattern}")
-                        if cleared > 0:
-                            cache_logger.info(f"Invalidated {cleared} cache entries for pattern: {pattern}")
-                    except Exception as e:
-                        cache_logger.warning(f"Error invalidating cache pattern {pattern}: {e}")
+                tags = _render_cache_tags(tag_templates, _call_arguments(func, self, args, kwargs), result)
+                try:
+                    cleared = await self.cache.invalidate_tags(*tags)
+                    if cleared > 0:
+                        cache_logger.info(f"Invalidated {cleared} cache entries for tags: {tags}")
+                except Exception as e:
+                    cache_logger.warning(f"Error invalidating cache tags {tags}: {e}")
             
             return result
             
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -144,6 +144,10 @@ async def set_channel_visibility(
         guild = channel.guild
         everyone_role = guild.default_role
 
+        # Skip the API call when @everyone already has the requested access
+        if channel.overwrites_for(everyone_role).view_channel is visible:
+            return True
+
         if visible:
             # Grant @everyone permission to view channel
             default_reason = "Channel made visible to all members"
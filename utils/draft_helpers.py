@@ -3,8 +3,10 @@ Draft utility functions for Discord Bot v2.0
 
 Provides helper functions for draft order calculation and cap space validation.
 """
+import bisect
 import math
-from typing import Tuple
+from itertools import accumulate
+from typing import List, Tuple
 from utils.logging import get_contextual_logger
 from config import get_config
 
@@ -167,9 +169,7 @@ async def validate_cap_space(
     # - players_counted = 26 - 13 = 13 (only 13 cheapest current players count)
     #
     # Post-draft (32 players): max_zeroes = 0, players_counted = 26 (normal cap rules)
-    max_roster_size = 32  # Maximum players during draft
-    max_zeroes = max(0, max_roster_size - projected_roster_size)
-    players_counted = max(0, cap_player_count - max_zeroes)
+    players_counted = _draft_players_counted(projected_roster_size, cap_player_count)
 
     # Sort all players (including new) by sWAR ASCENDING (cheapest first)
     all_players_wara = [p['wara'] for p in current_players] + [new_player_wara]
@@ -194,6 +194,69 @@ async def validate_cap_space(
     return is_valid, projected_total, cap_limit
 
 
+def _draft_players_counted(projected_roster_size: int, cap_player_count: int) -> int:
+    """Number of cheapest players counting toward the cap during the draft (see validate_cap_space)."""
+    max_roster_size = 32  # Maximum players during draft
+    max_zeroes = max(0, max_roster_size - projected_roster_size)
+    return max(0, cap_player_count - max_zeroes)
+
+
+class DraftCapState:
+    """
+    A roster's sWAR values kept sorted for repeated cap checks.
+
+    Gives the same answer as validate_cap_space() for each candidate, but the
+    roster is sorted once: each check is a binary search plus a prefix sum
+    lookup instead of a re-sort.
+    """
+
+    def __init__(self, roster: dict, team=None):
+        """
+        Build cap state from a roster.
+
+        Args:
+            roster: Roster dictionary from API (same structure as validate_cap_space)
+            team: Optional team object/dict for team-specific salary cap
+
+        Raises:
+            ValueError: If roster structure is invalid
+        """
+        from utils.helpers import get_team_salary_cap
+
+        if not roster or not roster.get('active'):
+            raise ValueError("Invalid roster structure - missing 'active' key")
+
+        self.cap_limit = get_team_salary_cap(team)
+        self._cap_player_count = get_config().cap_player_count
+        self._wara: List[float] = sorted(p['wara'] for p in roster['active'].get('players', []))
+        self._prefix: List[float] = list(accumulate(self._wara, initial=0.0))
+
+    @property
+    def roster_size(self) -> int:
+        return len(self._wara)
+
+    def check(self, new_player_wara: float) -> Tuple[bool, float, float]:
+        """
+        Validate cap space for one candidate.
+
+        Returns:
+            (valid, projected_total, cap_limit), as validate_cap_space()
+        """
+        from utils.helpers import SALARY_CAP_TOLERANCE
+
+        players_counted = _draft_players_counted(len(self._wara) + 1, self._cap_player_count)
+
+        # Sum of the cheapest players_counted values with the new player merged in
+        position = bisect.bisect_right(self._wara, new_player_wara)
+        if players_counted <= position:
+            projected_total = self._prefix[players_counted]
+        else:
+            projected_total = self._prefix[players_counted - 1] + new_player_wara
+
+        is_valid = projected_total <= (self.cap_limit + SALARY_CAP_TOLERANCE)
+        return is_valid, projected_total, self.cap_limit
+
+
 def format_pick_display(overall: int) -> str:
     """
     Format pick number for display.
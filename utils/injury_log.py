@@ -14,6 +14,7 @@ from config import get_config
 from models.player import Player
 from models.team import Team
 from services.injury_service import injury_service
+from services.organization_registry import organization_registry
 from services.team_service import team_service
 from views.embeds import EmbedTemplate, EmbedColors
 from utils.logging import get_contextual_logger
@@ -50,9 +51,13 @@ async def get_major_league_team_name(team_data: dict, season: int) -> str:
     else:
         return team_data.get('sname', abbrev)
 
-    # Look up the ML team
+    # Look up the ML team (organization registry first, API if it doesn't know the team)
     try:
-        ml_team = await team_service.get_team_by_abbrev(base_abbrev, season)
+        organization = await organization_registry.get_organization(abbrev, season)
+        if organization is not None:
+            ml_team = organization.major_league
+        else:
+            ml_team = await team_service.get_team_by_abbrev(base_abbrev, season)
         if ml_team:
             return ml_team.sname
     except Exception as e:
@@ -0,0 +1,172 @@
+"""
+Managed Messages
+
+Keeps a channel's bot-owned embed messages in sync with a list of rendered
+embeds. The IDs of the messages owned in each channel, and a fingerprint of
+every embed they hold, are persisted to JSON so a restart picks up where it
+left off. On each sync only messages whose embeds changed are edited; messages
+are created or deleted only when the number of messages needed changes.
+"""
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+import discord
+
+logger = logging.getLogger(f'{__name__}.ManagedMessageTracker')
+
+# Discord allows up to 10 embeds per message
+EMBEDS_PER_MESSAGE = 10
+
+
+def embed_fingerprint(embed: discord.Embed) -> str:
+    """Stable hash of an embed's rendered content."""
+    payload = json.dumps(embed.to_dict(), sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ManagedMessageTracker:
+    """
+    Tracks the embed messages the bot owns in each channel.
+
+    Features:
+    - Persistent message IDs and embed fingerprints across bot restarts
+    - Edits only messages whose content changed
+    - Creates/deletes messages only when the message count changes
+    - One-time cleanup of untracked history the first time a channel is managed
+    """
+
+    def __init__(self, data_file: str = "data/managed_messages.json"):
+        """
+        Initialize the managed message tracker.
+
+        Args:
+            data_file: Path to the JSON data file
+        """
+        self.data_file = Path(data_file)
+        self.data_file.parent.mkdir(exist_ok=True)
+        self._data: Dict[str, Any] = {}
+        self.load_data()
+
+    def load_data(self) -> None:
+        """Load managed message data from JSON file."""
+        try:
+            if self.data_file.exists():
+                with open(self.data_file, 'r') as f:
+                    self._data = json.load(f)
+                    logger.debug(f"Loaded managed messages for {len(self._data.get('channels', {}))} channels")
+            else:
+                self._data = {"channels": {}}
+        except Exception as e:
+            logger.error(f"Failed to load managed message data: {e}")
+            self._data = {"channels": {}}
+
+    def save_data(self) -> None:
+        """Save managed message data to JSON file."""
+        try:
+            with open(self.data_file, 'w') as f:
+                json.dump(self._data, f, indent=2)
+            logger.debug("Managed message data saved successfully")
+        except Exception as e:
+            logger.error(f"Failed to save managed message data: {e}")
+
+    def get_messages(self, channel_id: int) -> List[Dict[str, Any]]:
+        """
+        Get the messages owned in a channel.
+
+        Returns:
+            List of {"id": message ID, "fingerprints": [embed fingerprints]} in display order
+        """
+        return list(self._data.setdefault("channels", {}).get(str(channel_id), []))
+
+    async def sync(self, channel: discord.TextChannel, embeds: List[discord.Embed]) -> Dict[str, int]:
+        """
+        Make the channel's owned messages show exactly these embeds.
+
+        Args:
+            channel: Discord text channel
+            embeds: Rendered embeds in display order
+
+        Returns:
+            Counts of messages 'edited', 'created', 'deleted' and 'unchanged'
+        """
+        counts = {'edited': 0, 'created': 0, 'deleted': 0, 'unchanged': 0}
+        await self._adopt_channel(channel)
+        owned = self.get_messages(channel.id)
+        synced: List[Dict[str, Any]] = []
+        deleted_ids = set()
+
+        batches = [embeds[i:i + EMBEDS_PER_MESSAGE] for i in range(0, len(embeds), EMBEDS_PER_MESSAGE)]
+        try:
+            for index, batch in enumerate(batches):
+                fingerprints = [embed_fingerprint(embed) for embed in batch]
+                existing = owned[index] if index < len(owned) else None
+
+                if existing is not None and existing["fingerprints"] == fingerprints:
+                    synced.append(existing)
+                    counts['unchanged'] += 1
+                    continue
+
+                if existing is not None:
+                    try:
+                        await channel.get_partial_message(existing["id"]).edit(embeds=batch)
+                        synced.append({"id": existing["id"], "fingerprints": fingerprints})
+                        counts['edited'] += 1
+                        continue
+                    except discord.NotFound:
+                        logger.info(f"Managed message {existing['id']} was deleted, posting a replacement")
+
+                message = await channel.send(embeds=batch)
+                synced.append({"id": message.id, "fingerprints": fingerprints})
+                counts['created'] += 1
+
+            for surplus in owned[len(batches):]:
+                await self._delete(channel, surplus["id"])
+                deleted_ids.add(surplus["id"])
+                counts['deleted'] += 1
+        finally:
+            # Keep tracking messages not reached if a send/edit failed, so nothing is orphaned
+            leftover = [entry for entry in owned[len(synced):] if entry["id"] not in deleted_ids]
+            self._set_messages(channel.id, synced + leftover)
+
+        return counts
+
+    async def clear(self, channel: discord.TextChannel) -> int:
+        """
+        Delete every message owned in a channel.
+
+        Returns:
+            Number of messages deleted
+        """
+        await self._adopt_channel(channel)
+        owned = self.get_messages(channel.id)
+        for entry in owned:
+            await self._delete(channel, entry["id"])
+        self._set_messages(channel.id, [])
+        return len(owned)
+
+    async def _adopt_channel(self, channel: discord.TextChannel) -> None:
+        """The first time a channel is managed, remove the history posted before tracking began."""
+        channels = self._data.setdefault("channels", {})
+        if str(channel.id) in channels:
+            return
+
+        async for message in channel.history(limit=25):
+            await message.delete()
+        self._set_messages(channel.id, [])
+        logger.info(f"Now managing messages in channel {channel.id}")
+
+    async def _delete(self, channel: discord.TextChannel, message_id: int) -> None:
+        try:
+            await channel.get_partial_message(message_id).delete()
+        except discord.NotFound:
+            pass
+
+    def _set_messages(self, channel_id: int, messages: List[Dict[str, Any]]) -> None:
+        channels = self._data.setdefault("channels", {})
+        if channels.get(str(channel_id)) == messages:
+            return
+        channels[str(channel_id)] = messages
+        self.save_data()
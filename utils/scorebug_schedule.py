@@ -0,0 +1,149 @@
+"""
+Scorebug Poll Schedule
+
+Decides when each published scorecard is next read by the live scorebug
+tracker. Every game gets its own interval, derived from how recently its
+scorebug changed, the inning and how close the game is (win probability).
+Quiet games back off towards the maximum interval; late, close games are
+polled more often. When the combined poll rate would exceed the global Sheets
+budget, every interval is stretched proportionally. A final game is dropped
+once it has been read (and rendered) as final.
+"""
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+from config import get_config
+from services.scorebug_service import ScorebugData
+from services.scorebug_snapshots import sheet_key
+
+logger = logging.getLogger(f'{__name__}.ScorebugPollSchedule')
+
+
+def scorebug_fingerprint(scorebug_data: ScorebugData) -> str:
+    """Serialize the scorebug state so consecutive reads can be compared."""
+    return json.dumps(vars(scorebug_data), sort_keys=True, default=str)
+
+
+@dataclass
+class GamePollState:
+    """Polling state for one published scorecard."""
+    interval: float
+    last_polled: Optional[float] = None
+    fingerprint: Optional[str] = None
+    unchanged_polls: int = 0
+    finished: bool = False
+
+
+class ScorebugPollSchedule:
+    """Per-scorecard polling intervals under a global read budget."""
+
+    # Late innings, where a game can swing on any at-bat
+    LATE_INNING = 7
+    # Win probability band (percent) treated as a close game
+    CLOSE_GAME = (35.0, 65.0)
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty schedule.
+
+        Args:
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._clock = clock
+        self._games: Dict[str, GamePollState] = {}
+
+    def retain(self, sheet_urls_or_keys: Iterable[str]) -> None:
+        """Track exactly these scorecards; new ones are due immediately."""
+        keys = {sheet_key(sheet) for sheet in sheet_urls_or_keys}
+        for key in list(self._games):
+            if key not in keys:
+                del self._games[key]
+        for key in keys:
+            if key not in self._games:
+                self._games[key] = GamePollState(interval=get_config().scorebug_poll_base_interval)
+
+    def is_due(self, sheet_url_or_key: str) -> bool:
+        """Whether a scorecard should be read on this tick."""
+        state = self._games.get(sheet_key(sheet_url_or_key))
+        if state is None or state.finished:
+            return False
+        if state.last_polled is None:
+            return True
+        return self._clock() - state.last_polled >= state.interval * self.budget_scale()
+
+    def is_finished(self, sheet_url_or_key: str) -> bool:
+        """Whether a scorecard's game is final and no longer polled."""
+        state = self._games.get(sheet_key(sheet_url_or_key))
+        return state is not None and state.finished
+
+    def record(self, sheet_url_or_key: str, scorebug_data: Optional[ScorebugData]) -> None:
+        """
+        Record a poll result and derive the game's next interval.
+
+        Args:
+            sheet_url_or_key: Scorecard that was read
+            scorebug_data: Scorebug read, or None if the read failed
+        """
+        state = self._games.get(sheet_key(sheet_url_or_key))
+        if state is None:
+            return
+        state.last_polled = self._clock()
+
+        if scorebug_data is None:
+            # Failed reads back off like a game that hasn't changed
+            state.unchanged_polls += 1
+            state.interval = self._interval(state, None)
+            return
+
+        if scorebug_data.is_final:
+            state.finished = True
+            logger.info(f"Game in scorecard {sheet_key(sheet_url_or_key)} is final; no longer polling")
+            return
+
+        fingerprint = scorebug_fingerprint(scorebug_data)
+        if fingerprint == state.fingerprint:
+            state.unchanged_polls += 1
+        else:
+            state.unchanged_polls = 0
+        state.fingerprint = fingerprint
+        state.interval = self._interval(state, scorebug_data)
+
+    def interval(self, sheet_url_or_key: str) -> Optional[float]:
+        """Effective seconds between reads of a scorecard (including the budget scale)."""
+        state = self._games.get(sheet_key(sheet_url_or_key))
+        if state is None or state.finished:
+            return None
+        return state.interval * self.budget_scale()
+
+    def budget_scale(self) -> float:
+        """Factor every interval is stretched by to keep total reads within budget."""
+        budget = get_config().scorebug_poll_budget
+        demand = sum(60.0 / state.interval for state in self._games.values() if not state.finished)
+        if budget <= 0 or demand <= budget:
+            return 1.0
+        return demand / budget
+
+    def clear(self) -> None:
+        """Forget every scorecard."""
+        self._games.clear()
+
+    def _interval(self, state: GamePollState, scorebug_data: Optional[ScorebugData]) -> float:
+        config = get_config()
+        interval = float(config.scorebug_poll_base_interval)
+
+        if state.unchanged_polls == 0:
+            interval *= 0.75  # Just changed: likely to change again soon
+        else:
+            interval *= 1.5 ** min(state.unchanged_polls, 4)
+
+        if scorebug_data is not None:
+            if scorebug_data.inning >= self.LATE_INNING:
+                interval *= 0.67
+            low, high = self.CLOSE_GAME
+            if low <= scorebug_data.win_percentage <= high:
+                interval *= 0.75
+
+        return min(max(interval, config.scorebug_poll_min_interval), config.scorebug_poll_max_interval)
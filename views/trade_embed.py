@@ -449,6 +449,7 @@ class TradeAcceptanceView(discord.ui.View):
         from services.league_service import league_service
         from services.transaction_service import transaction_service
         from services.trade_builder import clear_trade_builder_by_team
+        from services.transaction_builder import validation_context
         from models.transaction import Transaction
         from models.trade import TradeStatus
         from utils.transaction_logging import post_trade_to_log
@@ -583,7 +584,8 @@ class TradeAcceptanceView(discord.ui.View):
                 f"Trade ID: `{self.builder.trade_id}`"
             )
 
-            # Clear the trade builder
+            # Clear the trade builder and the participants' cached validation data
+            validation_context.invalidate_transactions(created_transactions)
             for team in self.builder.participating_teams:
                 clear_trade_builder_by_team(team.id)
 
@@ -311,7 +311,8 @@ class SubmitConfirmationModal(discord.ui.Modal):
                 await interaction.followup.send(success_msg, ephemeral=True)
 
             # Clear the builder after successful submission
-            from services.transaction_builder import clear_transaction_builder
+            from services.transaction_builder import clear_transaction_builder, validation_context
+            validation_context.invalidate_transactions(created_transactions)
             clear_transaction_builder(interaction.user.id)
 
             # Update the original embed to show completion